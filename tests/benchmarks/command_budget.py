@@ -0,0 +1,84 @@
+"""
+========================================================================================
+Name: command_budget.py
+Author: Mauricio Gonzalez Soto
+Updated Date: 10-16-2026
+
+Copyright (C) 2024 Mauricio Gonzalez Soto. All rights reserved.
+========================================================================================
+"""
+
+from __future__ import annotations
+
+import argparse
+
+from tests.support import get_emulator
+
+EMULATOR = get_emulator()
+
+from texture_connector.core import CreateMaterialNetworkRedshift
+from texture_connector.core import CreateMaterialNetworkArnold
+from texture_connector.core import CreateMaterialNetworkVRay
+from texture_connector.config import UVTilingModes
+from texture_connector.config import TextureMaps
+from tests.support.material_networks import create_material_network_batch
+from tests.support.command_recorder import CommandRecorder
+
+MATERIAL_COUNT = 50
+
+MATERIAL_NETWORK_CLASSES = (
+    CreateMaterialNetworkArnold,
+    CreateMaterialNetworkRedshift,
+    CreateMaterialNetworkVRay,
+)
+
+TEXTURE_MAPS = (
+    TextureMaps.BASE_COLOR,
+    TextureMaps.ROUGHNESS,
+    TextureMaps.METALNESS,
+    TextureMaps.NORMAL,
+    TextureMaps.HEIGHT,
+    TextureMaps.EMISSIVE,
+    TextureMaps.OPACITY,
+)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--materials", type=int, default=MATERIAL_COUNT)
+    parser.add_argument("--triplanar", action="store_true")
+    parser.add_argument("--uv-tiling-mode", default=UVTilingModes.OFF)
+    parser.add_argument("--latency-scale", type=float, default=1.0)
+    args = parser.parse_args()
+
+    EMULATOR.latency.set_realistic()
+    EMULATOR.latency.set_scale(args.latency_scale)
+
+    for material_network_class in MATERIAL_NETWORK_CLASSES:
+        EMULATOR.reset()
+
+        material_network_batch = create_material_network_batch(
+            material_network_class, args.materials, TEXTURE_MAPS
+        )
+
+        with CommandRecorder() as command_recorder:
+            material_network_batch.create(
+                use_maya_color_space_rules=False,
+                use_triplanar=args.triplanar,
+                uv_tiling_mode=args.uv_tiling_mode,
+            )
+
+        elapsed_time = material_network_batch.get_elapsed_time()
+
+        print(f"{material_network_class.__name__}")
+        print(f"Materials:        {args.materials}")
+        print(f"Commands:         {command_recorder.get_count()}")
+        print(f"Elapsed:          {elapsed_time:.3f}s")
+        print(f"Per material:     {elapsed_time / args.materials * 1000:.2f}ms")
+        print(f"Dominant method:  {command_recorder.get_dominant_method()}")
+        print()
+        print(command_recorder.get_report(args.materials))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,114 @@
+"""
+========================================================================================
+Name: import_time.py
+Author: Mauricio Gonzalez Soto
+Updated Date: 10-17-2026
+
+Copyright (C) 2024 Mauricio Gonzalez Soto. All rights reserved.
+========================================================================================
+"""
+
+from __future__ import annotations
+
+import subprocess
+import sys
+import os
+
+ROOT_PATH = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+RUNS = 5
+
+IMPORT_TIME_BUDGET_MS = 50.0
+MODULES = (
+    "texture_connector",
+    "texture_connector.config",
+    "texture_connector.core",
+    "texture_connector.utils",
+)
+
+FORBIDDEN_MODULE_PREFIXES = (
+    "PySide2",
+    "PySide6",
+    "shiboken2",
+    "shiboken6",
+    "maya",
+    "texture_connector.gui",
+)
+
+
+def measure_import(module: str) -> tuple[float, list[str], str]:
+    environment = dict(os.environ)
+    environment["PYTHONPATH"] = os.pathsep.join(
+        filter(None, (ROOT_PATH, environment.get("PYTHONPATH")))
+    )
+
+    process = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        env=environment,
+        text=True,
+    )
+
+    if process.returncode:
+        return 0.0, [], process.stderr.strip().splitlines()[-1]
+
+    cumulative_time = 0.0
+    imported_modules = []
+
+    for line in process.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+
+        _, cumulative, name = line.split("|")
+
+        try:
+            cumulative_us = int(cumulative)
+        except ValueError:
+            continue
+
+        name = name.strip()
+        imported_modules.append(name)
+
+        if name == module:
+            cumulative_time = cumulative_us / 1000.0
+
+    return cumulative_time, imported_modules, ""
+
+
+def main() -> int:
+    failed = False
+
+    print(f"Budget: {IMPORT_TIME_BUDGET_MS:.1f}ms, best of {RUNS} runs")
+
+    for module in MODULES:
+        results = [measure_import(module) for _ in range(RUNS)]
+        import_time = min(cumulative_time for cumulative_time, _, _ in results)
+        error = results[0][2]
+        forbidden_modules = sorted(
+            {
+                name
+                for name in results[0][1]
+                if name.startswith(FORBIDDEN_MODULE_PREFIXES)
+            }
+        )
+
+        status = "ok"
+
+        if import_time > IMPORT_TIME_BUDGET_MS:
+            status = "over budget"
+            failed = True
+
+        if forbidden_modules:
+            status = f"imports {', '.join(forbidden_modules)}"
+            failed = True
+
+        if error:
+            status = f"failed: {error}"
+            failed = True
+
+        print(f"{module:<28} {import_time:7.2f}ms  {status}")
+
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,95 @@
+"""
+========================================================================================
+Name: parallel_texture_scanner.py
+Author: Mauricio Gonzalez Soto
+Updated Date: 10-17-2026
+
+Copyright (C) 2024 Mauricio Gonzalez Soto. All rights reserved.
+========================================================================================
+"""
+
+from __future__ import annotations
+
+import contextlib
+import tempfile
+import time
+import os
+
+from texture_connector.core import TextureScanner
+from texture_connector.config import TextureMaps
+
+DIRECTORY_COUNT = 200
+FILES_PER_DIRECTORY = 20
+LATENCY = 0.005
+WORKERS = (1, 2, 4, 8, 16)
+
+TEXTURE_MAPS_SUFFIX = (
+    (TextureMaps.BASE_COLOR, "basecolor"),
+    (TextureMaps.ROUGHNESS, "roughness"),
+    (TextureMaps.NORMAL, "normal"),
+)
+
+
+def create_texture_library(root_path: str) -> None:
+    suffixes = [suffix for _, suffix in TEXTURE_MAPS_SUFFIX]
+
+    for i in range(DIRECTORY_COUNT):
+        directory_path = os.path.join(
+            root_path, f"category_{i % 10:02d}", f"asset_{i:04d}"
+        )
+        os.makedirs(directory_path)
+
+        for j in range(FILES_PER_DIRECTORY):
+            suffix = suffixes[j % len(suffixes)]
+            file_name = f"asset_{i:04d}_{j // len(suffixes):02d}_{suffix}.png"
+
+            with open(os.path.join(directory_path, file_name), "wb"):
+                pass
+
+
+@contextlib.contextmanager
+def network_latency(seconds: float):
+    scandir = os.scandir
+
+    def slow_scandir(*args, **kwargs):
+        time.sleep(seconds)
+        return scandir(*args, **kwargs)
+
+    os.scandir = slow_scandir
+
+    try:
+        yield
+    finally:
+        os.scandir = scandir
+
+
+def main():
+    with tempfile.TemporaryDirectory() as root_path:
+        create_texture_library(root_path)
+
+        scanner = TextureScanner()
+        scanner.set_folder_path(root_path)
+        scanner.set_texture_maps_suffix(TEXTURE_MAPS_SUFFIX)
+
+        expected = None
+
+        print(f"Directories: {DIRECTORY_COUNT}, latency: {LATENCY * 1000:.1f}ms")
+
+        with network_latency(LATENCY):
+            for workers in WORKERS:
+                scanner.set_workers(workers)
+
+                start_time = time.perf_counter()
+                material_texture_paths = scanner.get_material_texture_paths()
+                elapsed_time = time.perf_counter() - start_time
+
+                if expected is None:
+                    expected = material_texture_paths
+
+                assert list(material_texture_paths.items()) == list(expected.items())
+
+                print(f"Workers: {workers:>2}  {elapsed_time:.3f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,199 @@
+"""
+========================================================================================
+Name: scan_pipeline.py
+Author: Mauricio Gonzalez Soto
+Updated Date: 10-16-2026
+
+Copyright (C) 2024 Mauricio Gonzalez Soto. All rights reserved.
+========================================================================================
+"""
+
+from __future__ import annotations
+
+import argparse
+import platform
+import tempfile
+import datetime
+import json
+import time
+import sys
+import os
+
+from tests.support import get_emulator
+
+get_emulator()
+
+from texture_connector.core import TextureMapMatcher
+from texture_connector.core import TextureScanner
+from texture_connector.config import UVTilingModes
+from tests.support.texture_library import TextureLibraryGenerator
+
+try:
+    from texture_connector.gui.material_scan_worker import MaterialScanWorker
+    from texture_connector.gui.material_list_model import MaterialListModel
+except ImportError:
+    MaterialScanWorker = None
+    MaterialListModel = None
+
+
+SCALES = (1_000, 10_000, 100_000)
+MAPS_PER_MATERIAL = 4
+REPEAT = 3
+
+
+def time_best(function, repeat: int):
+    best_time = None
+    result = None
+
+    for _ in range(repeat):
+        start_time = time.perf_counter()
+        result = function()
+        elapsed_time = time.perf_counter() - start_time
+
+        if best_time is None or elapsed_time < best_time:
+            best_time = elapsed_time
+
+    return best_time, result
+
+
+def create_scanner(
+    root_path: str,
+    texture_maps_suffix: tuple[tuple[str, str], ...],
+    uv_tiling_mode: str,
+    workers: int,
+) -> TextureScanner:
+
+    scanner = TextureScanner()
+    scanner.set_folder_path(root_path)
+    scanner.set_texture_maps_suffix(texture_maps_suffix)
+    scanner.set_uv_tiling_mode(uv_tiling_mode)
+    scanner.set_workers(workers)
+
+    return scanner
+
+
+def build_model(textures: list[tuple[str, str, str]]) -> int:
+    model = MaterialListModel()
+    batch_size = MaterialScanWorker.BATCH_SIZE
+
+    for i in range(0, len(textures), batch_size):
+        model.add_textures(textures[i : i + batch_size])
+
+    return model.rowCount()
+
+
+def run_scale(scale: int, args: argparse.Namespace) -> dict:
+    generator = TextureLibraryGenerator(
+        material_count=max(1, scale // (args.maps * args.tiles)),
+        maps_per_material=args.maps,
+        tile_count=args.tiles,
+        uv_tiling_mode=args.uv_tiling_mode,
+        depth=args.depth,
+        materials_per_directory=args.materials_per_directory,
+        junk_per_directory=args.junk,
+        symlink_count=args.symlinks,
+    )
+    texture_maps_suffix = generator.get_texture_maps_suffix()
+    uv_tiling_mode = args.uv_tiling_mode if args.tiles > 1 else UVTilingModes.OFF
+
+    with tempfile.TemporaryDirectory() as root_path:
+        start_time = time.perf_counter()
+        library = generator.generate(root_path)
+        generation_time = time.perf_counter() - start_time
+
+        stages = {}
+
+        # Discovery walks the tree without classifying anything.
+        scanner = create_scanner(root_path, (), UVTilingModes.OFF, args.workers)
+        stages["discovery"], image_paths = time_best(
+            lambda: list(scanner.iter_image_paths()), args.repeat
+        )
+
+        matcher = TextureMapMatcher(texture_maps_suffix)
+        file_names = [os.path.basename(image_path) for image_path in image_paths]
+        stages["classification"], matches = time_best(
+            lambda: [matcher.match_file_name(file_name) for file_name in file_names],
+            args.repeat,
+        )
+
+        scanner = create_scanner(
+            root_path, texture_maps_suffix, uv_tiling_mode, args.workers
+        )
+        stages["material_texture_paths"], material_texture_paths = time_best(
+            scanner.get_material_texture_paths, args.repeat
+        )
+
+        if MaterialListModel is not None:
+            textures = list(scanner.iter_textures())
+            stages["model"], _ = time_best(lambda: build_model(textures), args.repeat)
+        else:
+            stages["model"] = None
+
+        assert len(material_texture_paths) == len(library.materials)
+
+        return {
+            "scale": scale,
+            "materials": len(library.materials),
+            "images": library.image_count,
+            "junk_files": library.junk_count,
+            "directories": library.directory_count,
+            "symlinks": library.symlink_count,
+            "discovered_images": len(image_paths),
+            "classified_images": sum(1 for match in matches if match),
+            "generation": generation_time,
+            "stages": stages,
+        }
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--scales", type=int, nargs="+", default=SCALES)
+    parser.add_argument("--maps", type=int, default=MAPS_PER_MATERIAL)
+    parser.add_argument("--tiles", type=int, default=1)
+    parser.add_argument("--uv-tiling-mode", default=UVTilingModes.MARI)
+    parser.add_argument("--depth", type=int, default=2)
+    parser.add_argument("--materials-per-directory", type=int, default=1)
+    parser.add_argument("--junk", type=int, default=2)
+    parser.add_argument("--symlinks", type=int, default=0)
+    parser.add_argument("--workers", type=int, default=1)
+    parser.add_argument("--repeat", type=int, default=REPEAT)
+    parser.add_argument("--output", default="")
+    args = parser.parse_args()
+
+    results = {
+        "date": datetime.datetime.now().isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "platform": sys.platform,
+        "settings": {
+            key: value for key, value in vars(args).items() if key != "output"
+        },
+        "results": [],
+    }
+
+    print(
+        f"{'Images':>8} {'Materials':>10} {'Discovery':>10} {'Classify':>10} "
+        f"{'Materials':>10} {'Model':>10}"
+    )
+
+    for scale in args.scales:
+        result = run_scale(scale, args)
+        results["results"].append(result)
+
+        stages = result["stages"]
+        model_time = "-" if stages["model"] is None else f"{stages['model']:.3f}s"
+
+        print(
+            f"{result['images']:>8} {result['materials']:>10} "
+            f"{stages['discovery']:>9.3f}s {stages['classification']:>9.3f}s "
+            f"{stages['material_texture_paths']:>9.3f}s {model_time:>10}"
+        )
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(results, f, indent=4)
+
+        print(f"Results written to {args.output!r}.")
+
+
+if __name__ == "__main__":
+    main()
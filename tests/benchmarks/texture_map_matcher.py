@@ -0,0 +1,100 @@
+"""
+========================================================================================
+Name: texture_map_matcher.py
+Author: Mauricio Gonzalez Soto
+Updated Date: 10-17-2026
+
+Copyright (C) 2024 Mauricio Gonzalez Soto. All rights reserved.
+========================================================================================
+"""
+
+from __future__ import annotations
+
+import pathlib
+import random
+import timeit
+import re
+
+from texture_connector.core import TextureMapMatcher
+from texture_connector.config import TextureMaps
+
+FILE_COUNT = 100_000
+REPEAT = 3
+
+TEXTURE_MAPS_SUFFIX = (
+    (TextureMaps.BASE_COLOR, "basecolor"),
+    (TextureMaps.ROUGHNESS, "roughness"),
+    (TextureMaps.METALNESS, "metallic"),
+    (TextureMaps.NORMAL, "normal"),
+    (TextureMaps.HEIGHT, "height"),
+    (TextureMaps.EMISSIVE, "emissive"),
+    (TextureMaps.OPACITY, "opacity"),
+)
+
+
+def create_file_paths(count: int) -> list[str]:
+    rng = random.Random(0)
+    suffixes = [suffix for _, suffix in TEXTURE_MAPS_SUFFIX] + ["ao", "preview"]
+    file_paths = []
+
+    for i in range(count):
+        folder = f"/library/category_{i % 50:02d}/asset_{i // 70:05d}"
+        suffix = rng.choice(suffixes)
+        extension = rng.choice((".png", ".exr", ".tif", ".jpg"))
+
+        file_paths.append(f"{folder}/asset_{i // 7:05d}_{suffix}_4k{extension}")
+
+    return file_paths
+
+
+def match_per_suffix(stems: list[str]) -> list[tuple[str, str]]:
+    matches = []
+
+    for stem in stems:
+        for texture_map, suffix in TEXTURE_MAPS_SUFFIX:
+            pattern = rf"(.+?)(?=_{suffix})(?=_.*$|$)"
+            match = re.search(pattern, stem, re.IGNORECASE)
+
+            if match:
+                matches.append((match.group(1), texture_map))
+
+    return matches
+
+
+def match_single_pass(stems: list[str]) -> list[tuple[str, str]]:
+    matcher = TextureMapMatcher(TEXTURE_MAPS_SUFFIX)
+    matches = []
+
+    for stem in stems:
+        match = matcher.match(stem)
+
+        if match:
+            matches.append(match)
+
+    return matches
+
+
+def main():
+    stems = [pathlib.PurePosixPath(path).stem for path in create_file_paths(FILE_COUNT)]
+
+    per_suffix_matches = match_per_suffix(stems)
+    single_pass_matches = match_single_pass(stems)
+
+    assert per_suffix_matches == single_pass_matches
+
+    per_suffix_time = min(
+        timeit.repeat(lambda: match_per_suffix(stems), number=1, repeat=REPEAT)
+    )
+    single_pass_time = min(
+        timeit.repeat(lambda: match_single_pass(stems), number=1, repeat=REPEAT)
+    )
+
+    print(f"Files:            {len(stems)}")
+    print(f"Matches:          {len(single_pass_matches)}")
+    print(f"Per-suffix loop:  {per_suffix_time:.3f}s")
+    print(f"Single pass:      {single_pass_time:.3f}s")
+    print(f"Speedup:          {per_suffix_time / single_pass_time:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,36 @@
+"""
+========================================================================================
+Name: conftest.py
+Author: Mauricio Gonzalez Soto
+Updated Date: 10-16-2026
+
+Copyright (C) 2024 Mauricio Gonzalez Soto. All rights reserved.
+========================================================================================
+"""
+
+from __future__ import annotations
+
+import pytest
+
+from tests.support import MayaEmulator
+from tests.support import get_emulator
+
+# Installed before any test module imports texture_connector, since the core and
+# utils modules import maya at the top level.
+get_emulator()
+
+
+@pytest.fixture(autouse=True)
+def maya_emulator() -> MayaEmulator:
+    from texture_connector.core.uv_tiles import UVTiles
+    from texture_connector.utils import ColorSpaceCatalog
+
+    emulator = get_emulator()
+    emulator.reset()
+    emulator.latency.set_latencies({})
+    emulator.latency.set_scale(1.0)
+
+    ColorSpaceCatalog.invalidate()
+    UVTiles.invalidate()
+
+    return emulator
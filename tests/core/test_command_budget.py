@@ -0,0 +1,174 @@
+"""
+========================================================================================
+Name: test_command_budget.py
+Author: Mauricio Gonzalez Soto
+Updated Date: 10-16-2026
+
+Copyright (C) 2024 Mauricio Gonzalez Soto. All rights reserved.
+========================================================================================
+"""
+
+from __future__ import annotations
+
+import math
+
+import pytest
+
+from texture_connector.core import CreateMaterialNetworkRedshift
+from texture_connector.core import CreateMaterialNetworkArnold
+from texture_connector.core import CreateMaterialNetworkVRay
+from texture_connector.config import RenderPlugins
+from texture_connector.config import UVTilingModes
+from texture_connector.config import TextureMaps
+from tests.support.material_networks import create_material_network_batch
+from tests.support.command_recorder import CommandRecorder
+
+MATERIAL_COUNT = 10
+
+MATERIAL_NETWORK_CLASSES = {
+    RenderPlugins.ARNOLD.value[0]: CreateMaterialNetworkArnold,
+    RenderPlugins.REDSHIFT.value[0]: CreateMaterialNetworkRedshift,
+    RenderPlugins.V_RAY.value[0]: CreateMaterialNetworkVRay,
+}
+
+TEXTURE_MAPS = (
+    TextureMaps.BASE_COLOR,
+    TextureMaps.ROUGHNESS,
+    TextureMaps.METALNESS,
+    TextureMaps.NORMAL,
+    TextureMaps.EMISSIVE,
+    TextureMaps.OPACITY,
+)
+
+# Maya commands and shading nodes per material, for every texture map but height
+# plus the height map when it is on. Lower these when an optimization lands, a
+# higher count is a regression.
+BUDGETS = {
+    # render engine, triplanar, bump2d node, height
+    ("Arnold", False, False, False): (152, 8),
+    ("Arnold", False, False, True): (178, 10),
+    ("Arnold", False, True, False): (155, 9),
+    ("Arnold", False, True, True): (181, 11),
+    ("Arnold", True, False, False): (189, 15),
+    ("Arnold", True, False, True): (221, 18),
+    ("Arnold", True, True, False): (192, 16),
+    ("Arnold", True, True, True): (224, 19),
+    ("Redshift", False, False, False): (152, 8),
+    ("Redshift", False, False, True): (178, 10),
+    ("Redshift", False, True, False): (155, 9),
+    ("Redshift", False, True, True): (181, 11),
+    ("Redshift", True, False, False): (189, 15),
+    ("Redshift", True, False, True): (221, 18),
+    ("Redshift", True, True, False): (192, 16),
+    ("Redshift", True, True, True): (224, 19),
+    ("V-Ray", False, False, False): (154, 8),
+    ("V-Ray", False, False, True): (180, 10),
+    ("V-Ray", False, True, False): (157, 9),
+    ("V-Ray", False, True, True): (183, 11),
+    ("V-Ray", True, False, False): (179, 15),
+    ("V-Ray", True, False, True): (209, 18),
+    ("V-Ray", True, True, False): (182, 16),
+    ("V-Ray", True, True, True): (212, 19),
+}
+
+
+@pytest.mark.parametrize(
+    "uv_tiling_mode", (UVTilingModes.OFF, UVTilingModes.ZBRUSH, UVTilingModes.MARI)
+)
+@pytest.mark.parametrize("height", (False, True), ids=("no_height", "height"))
+@pytest.mark.parametrize("use_bump_2d_node", (False, True), ids=("no_bump", "bump"))
+@pytest.mark.parametrize("use_triplanar", (False, True), ids=("uv", "triplanar"))
+@pytest.mark.parametrize("render_engine", tuple(MATERIAL_NETWORK_CLASSES))
+def test_command_budget(
+    monkeypatch,
+    maya_emulator,
+    render_engine,
+    use_triplanar,
+    use_bump_2d_node,
+    height,
+    uv_tiling_mode,
+):
+    material_network_class = MATERIAL_NETWORK_CLASSES[render_engine]
+    monkeypatch.setattr(material_network_class, "USE_BUMP_2D_NODE", use_bump_2d_node)
+
+    texture_maps = TEXTURE_MAPS + ((TextureMaps.HEIGHT,) if height else ())
+    material_network_batch = create_material_network_batch(
+        material_network_class, MATERIAL_COUNT, texture_maps
+    )
+
+    with CommandRecorder() as command_recorder:
+        created = material_network_batch.create(
+            use_maya_color_space_rules=False,
+            use_triplanar=use_triplanar,
+            uv_tiling_mode=uv_tiling_mode,
+        )
+
+    assert created == MATERIAL_COUNT
+
+    command_budget, node_budget = BUDGETS[
+        (render_engine, use_triplanar, use_bump_2d_node, height)
+    ]
+    command_count = math.ceil(command_recorder.get_count() / MATERIAL_COUNT)
+    node_count = math.ceil(command_recorder.get_count("shadingNode") / MATERIAL_COUNT)
+    report = command_recorder.get_report(MATERIAL_COUNT)
+
+    assert command_count <= command_budget, report
+    assert node_count <= node_budget, report
+
+
+def test_update_budget(maya_emulator):
+    texture_maps = TEXTURE_MAPS + (TextureMaps.HEIGHT,)
+    create_material_network_batch(
+        CreateMaterialNetworkArnold, MATERIAL_COUNT, texture_maps
+    ).create(False, False, UVTilingModes.OFF)
+
+    material_network_batch = create_material_network_batch(
+        CreateMaterialNetworkArnold, MATERIAL_COUNT, texture_maps
+    )
+    material_network_batch.set_update_existing_materials(True)
+
+    with CommandRecorder() as command_recorder:
+        material_network_batch.create(False, False, UVTilingModes.OFF)
+
+    report = command_recorder.get_report(MATERIAL_COUNT)
+
+    # An update without changes only reads the scene.
+    assert material_network_batch.get_updated_count() == MATERIAL_COUNT, report
+    assert command_recorder.get_count("setAttr") == 0, report
+    assert command_recorder.get_count("shadingNode") == 0, report
+    assert command_recorder.get_count("connectAttr") == 0, report
+
+
+def test_command_recorder(maya_emulator):
+    material_network_batch = create_material_network_batch(
+        CreateMaterialNetworkArnold, 1, (TextureMaps.BASE_COLOR,)
+    )
+
+    with CommandRecorder() as command_recorder:
+        material_network_batch.create(False, False, UVTilingModes.OFF)
+
+    counts = command_recorder.get_counts()
+
+    assert counts == {
+        command: count
+        for command, count in maya_emulator.call_counts.items()
+        if command in counts
+    }
+    assert command_recorder.get_method_counts() == {
+        "create": 3,
+        "_load_plugins": 1,
+        "_create_material": 3,
+        "_create_place_2d_texture_node": 1,
+        "_create_file_node_network": 19,
+        "_create_standard_network": 1,
+        "_set_texture_file_node_settings": 3,
+    }
+    assert command_recorder.inclusive_methods["create"].count == sum(
+        stats.count
+        for method, stats in command_recorder.methods.items()
+        if method != CommandRecorder.NO_METHOD
+    )
+
+    import maya.cmds as cmds
+
+    assert not hasattr(cmds.connectAttr, "__wrapped__")
@@ -0,0 +1,307 @@
+"""
+========================================================================================
+Name: test_create_material_network.py
+Author: Mauricio Gonzalez Soto
+Updated Date: 10-17-2026
+
+Copyright (C) 2024 Mauricio Gonzalez Soto. All rights reserved.
+========================================================================================
+"""
+
+from __future__ import annotations
+
+import pytest
+
+from texture_connector.core import CreateMaterialNetworkRedshift
+from texture_connector.core import CreateMaterialNetworkBatch
+from texture_connector.core import CreateMaterialNetworkArnold
+from texture_connector.core import CreateMaterialNetworkVRay
+from texture_connector.core import CreateMaterialNetwork
+from texture_connector.config import PlacementScopes
+from texture_connector.config import UVTilingModes
+
+MATERIAL_NETWORK_CLASSES = (
+    CreateMaterialNetworkArnold,
+    CreateMaterialNetworkRedshift,
+    CreateMaterialNetworkVRay,
+)
+
+
+def create_material_network(
+    material_network_class: type,
+    base_color: str = "/textures/wood_basecolor.png",
+    roughness: str = "/textures/wood_roughness.png",
+    normal: str = "/textures/wood_normal.png",
+    height: str = "",
+) -> CreateMaterialNetwork:
+
+    material_network = material_network_class()
+    material_network.set_base_color_settings("sRGB", base_color, "basecolor")
+    material_network.set_roughness_settings("Raw", roughness, "roughness")
+    material_network.set_normal_settings("Raw", normal, "normal")
+    material_network.set_height_settings("Raw", height, "height")
+
+    return material_network
+
+
+def create_batch(
+    material_networks: dict[str, CreateMaterialNetwork],
+    use_triplanar: bool = False,
+    update_existing_materials: bool = False,
+    placement_scope: str = PlacementScopes.MATERIAL,
+    uv_tiling_mode: str = UVTilingModes.OFF,
+) -> CreateMaterialNetworkBatch:
+
+    material_network_batch = CreateMaterialNetworkBatch()
+    material_network_batch.set_update_existing_materials(update_existing_materials)
+
+    for name, material_network in material_networks.items():
+        material_network.set_placement_scope(placement_scope)
+        material_network_batch.add_material_network(name, material_network)
+
+    material_network_batch.create(
+        use_maya_color_space_rules=False,
+        use_triplanar=use_triplanar,
+        uv_tiling_mode=uv_tiling_mode,
+    )
+
+    return material_network_batch
+
+
+def get_undo_history(scene) -> list[tuple[str, object]]:
+    # Leaves out the chunks opened inside another chunk, Maya merges them into it.
+    undo_history = []
+    depth = 0
+
+    for flag, value in scene.undo_history:
+        if flag == "closeChunk":
+            depth -= 1
+
+        if not depth:
+            undo_history.append((flag, value))
+
+        if flag == "openChunk":
+            depth += 1
+
+    return undo_history
+
+
+@pytest.mark.parametrize("material_network_class", MATERIAL_NETWORK_CLASSES)
+def test_create(maya_emulator, material_network_class):
+    scene = maya_emulator.scene
+    material_network = create_material_network(material_network_class)
+    material = f"wood_{material_network_class.MATERIAL_NODE}"
+
+    material_network_batch = create_batch({"wood": material_network})
+
+    assert material_network_batch.get_material_network_count() == 1
+    assert scene.nodes[material].node_type == material_network_class.MATERIAL_NODE
+    assert scene.connections["woodSG.surfaceShader"] == f"{material}.outColor"
+    assert (
+        scene.connections[
+            f"{material}.{material_network_class.BASE_COLOR_MATERIAL_INPUT_NAME}"
+        ]
+        == "wood_basecolor_file.outColor"
+    )
+    assert scene.get_attr("wood_basecolor_file.fileTextureName") == (
+        "/textures/wood_basecolor.png"
+    )
+    assert scene.get_attr("wood_roughness_file.colorSpace") == "Raw"
+    assert material_network.material_exists("wood")
+
+    assert not scene.undo_chunks
+    assert scene.undo_state
+    assert not scene.refresh_suspended
+
+
+@pytest.mark.parametrize("material_network_class", MATERIAL_NETWORK_CLASSES)
+def test_create_triplanar(maya_emulator, material_network_class):
+    scene = maya_emulator.scene
+    scene.unload_plugin("lookdevKit")
+
+    create_batch(
+        {"wood": create_material_network(material_network_class)}, use_triplanar=True
+    )
+
+    triplanar_nodes = scene.list_nodes((), material_network_class.TRIPLANAR_NODE)
+
+    assert "lookdevKit" in scene.loaded_plugins
+    assert len(triplanar_nodes) == 3
+    assert scene.list_nodes((), "floatConstant") == ["wood_floatConstant"]
+
+
+@pytest.mark.parametrize("material_network_class", MATERIAL_NETWORK_CLASSES)
+def test_create_height(maya_emulator, material_network_class):
+    scene = maya_emulator.scene
+
+    create_batch(
+        {
+            "wood": create_material_network(
+                material_network_class, height="/textures/wood_height.exr"
+            )
+        }
+    )
+
+    assert scene.connections["woodSG.displacementShader"] == (
+        "wood_height_displacementShader.displacement"
+    )
+    assert scene.get_attr("wood_height_file.alphaIsLuminance") is True
+
+
+def test_create_shares_no_names(maya_emulator):
+    create_batch(
+        {
+            "wood": create_material_network(CreateMaterialNetworkArnold),
+            "stone": create_material_network(
+                CreateMaterialNetworkArnold,
+                base_color="/textures/stone_basecolor.png",
+                roughness="",
+                normal="",
+            ),
+        }
+    )
+
+    assert maya_emulator.scene.list_nodes((), "place2dTexture") == [
+        "wood_place2dTexture",
+        "stone_place2dTexture",
+    ]
+
+
+def test_create_undo_chunk(maya_emulator):
+    create_batch(
+        {
+            "wood": create_material_network(CreateMaterialNetworkArnold),
+            "stone": create_material_network(CreateMaterialNetworkArnold),
+        }
+    )
+
+    assert get_undo_history(maya_emulator.scene) == [
+        ("openChunk", CreateMaterialNetworkBatch.CHUNK_NAME),
+        ("closeChunk", CreateMaterialNetworkBatch.CHUNK_NAME),
+    ]
+
+
+@pytest.mark.parametrize("undo_state", (True, False))
+def test_create_undo_disabled(maya_emulator, undo_state):
+    scene = maya_emulator.scene
+    scene.undo_state = undo_state
+
+    material_network_batch = CreateMaterialNetworkBatch()
+    material_network_batch.set_undo_enabled(False)
+    material_network_batch.add_material_network(
+        "wood", create_material_network(CreateMaterialNetworkArnold)
+    )
+    material_network_batch.create(
+        use_maya_color_space_rules=False,
+        use_triplanar=False,
+        uv_tiling_mode=UVTilingModes.OFF,
+    )
+
+    assert "wood_aiStandardSurface" in scene.nodes
+    assert scene.undo_state is undo_state
+
+    if undo_state:
+        assert get_undo_history(scene)[0] == ("stateWithoutFlush", False)
+        assert get_undo_history(scene)[-1] == ("stateWithoutFlush", True)
+    else:
+        assert ("stateWithoutFlush", True) not in scene.undo_history
+
+
+def test_create_closes_undo_chunk_on_error(maya_emulator, monkeypatch):
+    material_network = create_material_network(CreateMaterialNetworkArnold)
+
+    def create(**kwargs) -> bool:
+        raise RuntimeError("Failed to create the material.")
+
+    monkeypatch.setattr(material_network, "create", create)
+
+    with pytest.raises(RuntimeError):
+        create_batch({"wood": material_network})
+
+    assert get_undo_history(maya_emulator.scene) == [
+        ("openChunk", CreateMaterialNetworkBatch.CHUNK_NAME),
+        ("closeChunk", CreateMaterialNetworkBatch.CHUNK_NAME),
+    ]
+    assert not maya_emulator.scene.undo_chunks
+
+
+@pytest.mark.parametrize(
+    "placement_scope, counts",
+    (
+        (PlacementScopes.MATERIAL, (2, 4)),
+        (PlacementScopes.UDIM_SET, (2, 2)),
+        (PlacementScopes.SHARED, (1, 1)),
+    ),
+)
+def test_create_placement_scope(maya_emulator, tmp_path, placement_scope, counts):
+    # Both tile sets start at 1001 and end at 1003.
+    tile_sets = {"wood": ("1001", "1002", "1003"), "stone": ("1001", "1003")}
+
+    for name, tiles in tile_sets.items():
+        for tile in tiles:
+            (tmp_path / f"{name}_basecolor.{tile}.png").touch()
+
+    def create(suffix: str) -> int:
+        create_batch(
+            {
+                f"{name}{suffix}": create_material_network(
+                    CreateMaterialNetworkArnold,
+                    base_color=str(tmp_path / f"{name}_basecolor.1001.png"),
+                    roughness="",
+                    normal="",
+                )
+                for name in tile_sets
+            },
+            placement_scope=placement_scope,
+            uv_tiling_mode=UVTilingModes.MARI,
+        )
+
+        return len(maya_emulator.scene.list_nodes((), "place2dTexture"))
+
+    # Creating again reuses the shared and per UDIM set placement nodes.
+    assert (create(""), create("_v2")) == counts
+
+
+@pytest.mark.parametrize("material_network_class", MATERIAL_NETWORK_CLASSES)
+def test_update_without_changes(maya_emulator, material_network_class):
+    scene = maya_emulator.scene
+
+    create_batch({"wood": create_material_network(material_network_class)})
+
+    nodes = set(scene.nodes)
+    connections = dict(scene.connections)
+    maya_emulator.call_counts.clear()
+
+    material_network_batch = create_batch(
+        {"wood": create_material_network(material_network_class)},
+        update_existing_materials=True,
+    )
+
+    assert material_network_batch.get_updated_count() == 1
+    assert set(scene.nodes) == nodes
+    assert scene.connections == connections
+    assert "setAttr" not in maya_emulator.call_counts
+    assert "shadingNode" not in maya_emulator.call_counts
+
+
+@pytest.mark.parametrize("material_network_class", MATERIAL_NETWORK_CLASSES)
+def test_update_with_changes(maya_emulator, material_network_class):
+    scene = maya_emulator.scene
+
+    create_batch({"wood": create_material_network(material_network_class)})
+    create_batch(
+        {
+            "wood": create_material_network(
+                material_network_class,
+                base_color="/textures/wood_basecolor_v2.png",
+                roughness="",
+            )
+        },
+        update_existing_materials=True,
+    )
+
+    assert scene.get_attr("wood_basecolor_file.fileTextureName") == (
+        "/textures/wood_basecolor_v2.png"
+    )
+    assert "wood_roughness_file" not in scene.nodes
+    assert "wood_basecolor_file1" not in scene.nodes
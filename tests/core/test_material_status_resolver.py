@@ -0,0 +1,73 @@
+"""
+========================================================================================
+Name: test_material_status_resolver.py
+Author: Mauricio Gonzalez Soto
+Updated Date: 10-16-2026
+
+Copyright (C) 2024 Mauricio Gonzalez Soto. All rights reserved.
+========================================================================================
+"""
+
+from __future__ import annotations
+
+from texture_connector.core.material_status_resolver import MaterialStatusResolver
+from texture_connector.config import RenderPlugins
+
+
+def create_resolver(changed: list[str]) -> MaterialStatusResolver:
+    material_status_resolver = MaterialStatusResolver()
+    material_status_resolver.set_changed_callback(changed.append)
+    material_status_resolver.set_render_engine(RenderPlugins.ARNOLD.value[0])
+    material_status_resolver.create_call_backs()
+
+    return material_status_resolver
+
+
+def test_exists(maya_emulator):
+    scene = maya_emulator.scene
+    scene.create_node("aiStandardSurface", "wood_aiStandardSurface")
+
+    material_status_resolver = create_resolver([])
+
+    assert material_status_resolver.exists("wood")
+    assert not material_status_resolver.exists("stone")
+
+
+def test_tracks_nodes(maya_emulator):
+    scene = maya_emulator.scene
+    changed = []
+
+    material_status_resolver = create_resolver(changed)
+    assert not material_status_resolver.exists("wood")
+
+    scene.create_node("aiStandardSurface", "wood_aiStandardSurface")
+    scene.create_node("VRayMtl", "stone_VRayMtl")
+    assert material_status_resolver.exists("wood")
+
+    scene.rename("wood_aiStandardSurface", "oak_aiStandardSurface")
+    assert not material_status_resolver.exists("wood")
+    assert material_status_resolver.exists("oak")
+
+    scene.delete(["oak_aiStandardSurface"])
+    assert not material_status_resolver.exists("oak")
+
+    assert changed == ["wood", "wood", "oak", "oak"]
+
+
+def test_delete_call_backs(maya_emulator):
+    scene = maya_emulator.scene
+
+    material_status_resolver = create_resolver([])
+    material_status_resolver.delete_call_backs()
+
+    assert not scene.call_backs
+
+
+def test_untracked_render_plugin(maya_emulator):
+    scene = maya_emulator.scene
+    scene.unload_plugin("mtoa")
+
+    material_status_resolver = create_resolver([])
+
+    assert not material_status_resolver.call_backs
+    assert not material_status_resolver.exists("wood")
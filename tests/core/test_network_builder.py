@@ -0,0 +1,178 @@
+"""
+========================================================================================
+Name: test_network_builder.py
+Author: Mauricio Gonzalez Soto
+Updated Date: 10-17-2026
+
+Copyright (C) 2024 Mauricio Gonzalez Soto. All rights reserved.
+========================================================================================
+"""
+
+from __future__ import annotations
+
+import pytest
+
+from texture_connector.core import CreateMaterialNetworkRedshift
+from texture_connector.core import CreateMaterialNetworkBatch
+from texture_connector.core import CreateMaterialNetworkArnold
+from texture_connector.core import CreateMaterialNetworkVRay
+from texture_connector.core import ModifierNetworkBuilder
+from texture_connector.core import NetworkBuilder
+from texture_connector.config import UVTilingModes
+from texture_connector.config import TextureMaps
+from tests.support.material_networks import TEXTURE_MAPS_SETTINGS
+from tests.support.maya_emulator import Scene
+
+MATERIAL_NETWORK_CLASSES = (
+    CreateMaterialNetworkArnold,
+    CreateMaterialNetworkRedshift,
+    CreateMaterialNetworkVRay,
+)
+
+
+def create_material_network(material_network_class: type, name: str):
+    material_network = material_network_class()
+
+    for texture_map, setter, color_space in TEXTURE_MAPS_SETTINGS:
+        getattr(material_network, setter)(
+            color_space=color_space,
+            file_path=f"/textures/{name}_{texture_map}.png",
+            suffix=texture_map,
+        )
+
+    return material_network
+
+
+def get_graph(scene: Scene) -> tuple[dict, dict]:
+    def get_plug(plug: str) -> str:
+        # Maya resolves "node.parent.child" and "node.child" to the same plug.
+        node_name, _, attr = plug.partition(".")
+
+        return f"{node_name}.{attr.rsplit('.', 1)[-1]}"
+
+    nodes = {
+        name: (node.node_type, node.attrs)
+        for name, node in scene.nodes.items()
+        if name not in Scene.DEFAULT_NODES
+    }
+    connections = {
+        get_plug(destination): get_plug(source)
+        for destination, source in scene.connections.items()
+        if destination.partition(".")[0] not in Scene.DEFAULT_NODES
+        and source.partition(".")[0] not in Scene.DEFAULT_NODES
+    }
+
+    return nodes, connections
+
+
+def create_batch(builder: NetworkBuilder, material_network_class: type, **kwargs):
+    material_network_batch = CreateMaterialNetworkBatch(builder)
+
+    for name in ("wood", "stone"):
+        material_network_batch.add_material_network(
+            name, create_material_network(material_network_class, name)
+        )
+
+    material_network_batch.create(
+        use_maya_color_space_rules=False,
+        use_triplanar=kwargs.get("use_triplanar", False),
+        uv_tiling_mode=UVTilingModes.OFF,
+    )
+
+    return material_network_batch
+
+
+@pytest.mark.parametrize("use_triplanar", (False, True), ids=("uv", "triplanar"))
+@pytest.mark.parametrize("material_network_class", MATERIAL_NETWORK_CLASSES)
+def test_modifier_builds_same_graph(
+    maya_emulator, material_network_class, use_triplanar
+):
+    scene = maya_emulator.scene
+
+    create_batch(NetworkBuilder(), material_network_class, use_triplanar=use_triplanar)
+    command_graph = get_graph(scene)
+
+    maya_emulator.reset()
+    create_batch(
+        ModifierNetworkBuilder(), material_network_class, use_triplanar=use_triplanar
+    )
+
+    assert get_graph(scene) == command_graph
+    assert maya_emulator.call_counts[ModifierNetworkBuilder.COMMAND_NAME] == 1
+    assert "shadingNode" not in maya_emulator.call_counts
+    assert not scene.undo_chunks
+
+
+def test_modifier_connects_default_nodes(maya_emulator):
+    scene = maya_emulator.scene
+
+    create_batch(ModifierNetworkBuilder(), CreateMaterialNetworkArnold)
+
+    default_connections = {
+        source.partition(".")[0]: destination.partition(".")[0]
+        for destination, source in scene.connections.items()
+        if destination.partition(".")[0] in Scene.DEFAULT_NODES
+    }
+
+    assert default_connections["wood_aiStandardSurface"] == "defaultShaderList1"
+    assert default_connections["wood_basecolor_file"] == "defaultTextureList1"
+    assert default_connections["wood_place2dTexture"] == "defaultRenderUtilityList1"
+    assert default_connections["woodSG"] == "renderPartition"
+    assert (
+        scene.connections["wood_basecolor_file.colorManagementEnabled"]
+        == "defaultColorMgtGlobals.cmEnabled"
+    )
+    # A material and a displacement shader for each of the two materials.
+    assert scene.get_array_indices("defaultShaderList1.shaders") == [0, 1, 2, 3]
+
+
+def test_modifier_without_batch(maya_emulator):
+    scene = maya_emulator.scene
+    material_network = CreateMaterialNetworkArnold(ModifierNetworkBuilder())
+    material_network.set_base_color_settings(
+        "sRGB", "/textures/wood_basecolor.png", TextureMaps.BASE_COLOR
+    )
+
+    assert material_network.create("wood", False, False, UVTilingModes.OFF)
+    assert scene.connections["wood_aiStandardSurface.baseColor"] == (
+        "wood_basecolor_file.outColor"
+    )
+    assert scene.get_attr("wood_basecolor_file.fileTextureName") == (
+        "/textures/wood_basecolor.png"
+    )
+
+
+def test_modifier_update(maya_emulator):
+    scene = maya_emulator.scene
+
+    create_batch(ModifierNetworkBuilder(), CreateMaterialNetworkArnold)
+
+    material_network_batch = CreateMaterialNetworkBatch(ModifierNetworkBuilder())
+    material_network_batch.set_update_existing_materials(True)
+    material_network = create_material_network(CreateMaterialNetworkArnold, "wood")
+    material_network.set_roughness_settings("Raw", "", TextureMaps.ROUGHNESS)
+    material_network_batch.add_material_network("wood", material_network)
+    material_network_batch.create(False, False, UVTilingModes.OFF)
+
+    assert material_network_batch.get_updated_count() == 1
+    assert "wood_roughness_file" not in scene.nodes
+    assert "stone_roughness_file" in scene.nodes
+
+
+def test_modifier_undo(maya_emulator):
+    scene = maya_emulator.scene
+    nodes = set(scene.nodes)
+    builder = ModifierNetworkBuilder()
+    node = builder.create_node(
+        "place2dTexture", "wood_place2dTexture", NetworkBuilder.UTILITY
+    )
+    builder.set_attr(node, "rotateUV", 45)
+    modifier = builder.modifier
+    builder.commit()
+
+    assert "wood_place2dTexture" in scene.nodes
+
+    modifier.undoIt()
+
+    assert set(scene.nodes) == nodes
+    assert not scene.connections
@@ -0,0 +1,257 @@
+"""
+========================================================================================
+Name: test_scan_cache.py
+Author: Mauricio Gonzalez Soto
+Updated Date: 10-17-2026
+
+Copyright (C) 2024 Mauricio Gonzalez Soto. All rights reserved.
+========================================================================================
+"""
+
+from __future__ import annotations
+
+import json
+import os
+
+import pytest
+
+from texture_connector.core import TextureScanner
+from texture_connector.core import ScanCache
+from texture_connector.config import TextureMaps
+import texture_connector.utils as utils
+
+TEXTURE_MAPS_SUFFIX = (
+    (TextureMaps.BASE_COLOR, "basecolor"),
+    (TextureMaps.ROUGHNESS, "roughness"),
+)
+
+# Old enough for the cache to trust the directory listings.
+MTIME_NS = 1_000_000_000_000_000_000
+
+
+def create_files(root_path: str, file_paths: tuple[str, ...]) -> None:
+    for file_path in file_paths:
+        file_path = os.path.join(root_path, file_path)
+        os.makedirs(os.path.dirname(file_path), exist_ok=True)
+
+        with open(file_path, "wb"):
+            pass
+
+    set_mtimes(root_path)
+
+
+def set_mtimes(root_path: str, mtime_ns: int = MTIME_NS) -> None:
+    for directory_path, _, _ in os.walk(root_path):
+        os.utime(directory_path, ns=(mtime_ns, mtime_ns))
+
+
+@pytest.fixture
+def listed_directories(monkeypatch) -> list[str]:
+    listed_directories = []
+    list_directory = TextureScanner._list_directory
+
+    def spy(self, directory_path: str):
+        listed_directories.append(os.path.relpath(directory_path, self.folder_path))
+
+        return list_directory(self, directory_path)
+
+    monkeypatch.setattr(TextureScanner, "_list_directory", spy)
+
+    return listed_directories
+
+
+def scan(
+    root_path: str,
+    scan_cache: ScanCache,
+    texture_maps_suffix: tuple[tuple[str, str], ...] = TEXTURE_MAPS_SUFFIX,
+) -> dict[str, list[tuple[str, str]]]:
+
+    scanner = TextureScanner()
+    scanner.set_folder_path(root_path)
+    scanner.set_texture_maps_suffix(texture_maps_suffix)
+    scanner.set_scan_cache(scan_cache)
+
+    return scanner.get_material_texture_paths()
+
+
+def test_reuses_unchanged_directories(tmp_path, listed_directories):
+    root_path = str(tmp_path / "textures")
+    cache_path = str(tmp_path / "cache" / "scanCache.json")
+    create_files(root_path, ("wood_basecolor.png", "stone/stone_roughness.png"))
+
+    materials = scan(root_path, ScanCache(cache_path))
+
+    assert sorted(listed_directories) == [".", "stone"]
+
+    listed_directories.clear()
+
+    # A new instance reads the listings back from disk.
+    assert scan(root_path, ScanCache(cache_path)) == materials
+    assert listed_directories == []
+
+
+def test_lists_changed_directories(tmp_path, listed_directories):
+    root_path = str(tmp_path / "textures")
+    scan_cache = ScanCache(str(tmp_path / "scanCache.json"))
+    create_files(root_path, ("wood_basecolor.png", "stone/stone_roughness.png"))
+
+    scan(root_path, scan_cache)
+    listed_directories.clear()
+
+    create_files(root_path, ("stone/stone_basecolor.png",))
+    set_mtimes(os.path.join(root_path, "stone"), MTIME_NS + 1)
+
+    materials = scan(root_path, scan_cache)
+
+    assert listed_directories == ["stone"]
+    assert sorted(texture_map for texture_map, _ in materials["stone"]) == [
+        TextureMaps.BASE_COLOR,
+        TextureMaps.ROUGHNESS,
+    ]
+
+
+def test_skips_recent_directories(tmp_path, listed_directories):
+    root_path = str(tmp_path / "textures")
+    scan_cache = ScanCache(str(tmp_path / "scanCache.json"))
+    create_files(root_path, ("wood_basecolor.png",))
+    set_mtimes(root_path, mtime_ns=os.stat(root_path).st_mtime_ns + 10**18)
+
+    scan(root_path, scan_cache)
+    scan(root_path, scan_cache)
+
+    assert listed_directories == [".", "."]
+
+
+def test_reclassifies_on_signature_change(tmp_path, listed_directories):
+    root_path = str(tmp_path / "textures")
+    scan_cache = ScanCache(str(tmp_path / "scanCache.json"))
+    create_files(root_path, ("wood_basecolor.png", "wood_rough.png"))
+
+    assert scan(root_path, scan_cache) == {
+        "wood": [
+            (TextureMaps.BASE_COLOR, os.path.join(root_path, "wood_basecolor.png"))
+        ]
+    }
+
+    listed_directories.clear()
+    texture_maps_suffix = ((TextureMaps.ROUGHNESS, "rough"),)
+
+    # The cached listing is reused, only the classification is redone.
+    assert scan(root_path, scan_cache, texture_maps_suffix) == {
+        "wood": [(TextureMaps.ROUGHNESS, os.path.join(root_path, "wood_rough.png"))]
+    }
+    assert listed_directories == []
+    assert scan_cache.is_classified() is False
+
+    scan(root_path, scan_cache, texture_maps_suffix)
+
+    assert scan_cache.is_classified() is True
+
+
+def test_prunes_vanished_directories(tmp_path):
+    root_path = str(tmp_path / "textures")
+    cache_path = str(tmp_path / "scanCache.json")
+    scan_cache = ScanCache(cache_path)
+    create_files(root_path, ("wood_basecolor.png", "stone/stone_basecolor.png"))
+
+    scan(root_path, scan_cache)
+
+    os.remove(os.path.join(root_path, "stone", "stone_basecolor.png"))
+    os.rmdir(os.path.join(root_path, "stone"))
+    set_mtimes(root_path, MTIME_NS + 1)
+
+    scan(root_path, scan_cache)
+
+    with open(cache_path, "r", encoding="utf-8") as f:
+        directories = json.load(f)["roots"][
+            os.path.normcase(os.path.abspath(root_path))
+        ]["directories"]
+
+    assert list(directories) == [root_path]
+
+
+def test_keeps_directories_of_cancelled_scan(tmp_path):
+    root_path = str(tmp_path / "textures")
+    scan_cache = ScanCache(str(tmp_path / "scanCache.json"))
+    stone_path = os.path.join(root_path, "stone")
+    create_files(root_path, ("wood_basecolor.png", "stone/stone_basecolor.png"))
+
+    scan(root_path, scan_cache)
+
+    scan_cache.begin(root_path, TEXTURE_MAPS_SUFFIX)
+    scan_cache.get_directory(root_path, MTIME_NS)
+    scan_cache.end(completed=False)
+
+    scan_cache.begin(root_path, TEXTURE_MAPS_SUFFIX)
+
+    assert scan_cache.get_directory(stone_path, MTIME_NS) is not None
+
+    scan_cache.end(completed=False)
+
+
+def test_evicts_least_recently_used_roots(tmp_path, monkeypatch):
+    scan_cache = ScanCache(str(tmp_path / "scanCache.json"))
+    root_paths = [str(tmp_path / name) for name in ("wood", "stone", "metal")]
+
+    for root_path in root_paths:
+        create_files(root_path, ("a_basecolor.png", "b_basecolor.png"))
+
+    monkeypatch.setattr(ScanCache, "MAX_ENTRIES", 6)
+
+    for root_path in root_paths:
+        scan(root_path, scan_cache)
+
+    assert set(scan_cache._roots) == {
+        os.path.normcase(os.path.abspath(root_path)) for root_path in root_paths[1:]
+    }
+
+    # The root being scanned is never evicted, even when it alone is over the limit.
+    monkeypatch.setattr(ScanCache, "MAX_ENTRIES", 1)
+    scan(root_paths[0], scan_cache)
+
+    assert set(scan_cache._roots) == {os.path.normcase(os.path.abspath(root_paths[0]))}
+
+
+def test_clear_during_scan(tmp_path):
+    root_path = str(tmp_path / "textures")
+    cache_path = str(tmp_path / "scanCache.json")
+    scan_cache = ScanCache(cache_path)
+    create_files(root_path, ("wood_basecolor.png",))
+
+    scan(root_path, scan_cache)
+
+    assert os.path.exists(cache_path)
+
+    scan_cache.begin(root_path, TEXTURE_MAPS_SUFFIX)
+    scan_cache.clear()
+
+    assert not os.path.exists(cache_path)
+    assert scan_cache.get_directory(root_path, MTIME_NS) is None
+
+    scan_cache.set_directory(root_path, MTIME_NS, [], [])
+    scan_cache.end(completed=True)
+
+    assert scan_cache._roots == {}
+
+
+def test_save_failure_is_stored(tmp_path, monkeypatch):
+    # The cache is saved on the scan thread, so failures are left for the caller.
+    monkeypatch.setattr(
+        utils.Logger, "warning", classmethod(lambda cls, msg: pytest.fail(msg))
+    )
+
+    root_path = str(tmp_path / "textures")
+    blocking_path = tmp_path / "blocking"
+    blocking_path.write_bytes(b"")
+    scan_cache = ScanCache(str(blocking_path / "scanCache.json"))
+    create_files(root_path, ("wood_basecolor.png",))
+
+    scan(root_path, scan_cache)
+
+    assert scan_cache.error
+
+    scan_cache.cache_path = str(tmp_path / "scanCache.json")
+    scan(root_path, scan_cache)
+
+    assert scan_cache.error == ""
+    assert os.path.exists(scan_cache.cache_path)
@@ -0,0 +1,245 @@
+"""
+========================================================================================
+Name: test_texture_converter.py
+Author: Mauricio Gonzalez Soto
+Updated Date: 10-17-2026
+
+Copyright (C) 2024 Mauricio Gonzalez Soto. All rights reserved.
+========================================================================================
+"""
+
+from __future__ import annotations
+
+import threading
+import shlex
+import time
+import sys
+import os
+
+import pytest
+
+from texture_connector.core import CreateMaterialNetworkBatch
+from texture_connector.core import CreateMaterialNetworkArnold
+from texture_connector.core import TextureConverter
+from texture_connector.config import UVTilingModes
+import texture_connector.utils as utils
+
+# Stands in for maketx, copies the input to the output. Inputs named "fail" exit with
+# an error and inputs named "slow" hang until they are killed.
+CONVERTER_SCRIPT = (
+    "import os, shutil, sys, time\n"
+    "name = os.path.basename(sys.argv[1])\n"
+    "if 'fail' in name: sys.exit(3)\n"
+    "if 'slow' in name: time.sleep(60)\n"
+    "shutil.copyfile(sys.argv[1], sys.argv[2])"
+)
+
+
+def create_texture_converter(command: str = "") -> TextureConverter:
+    if not command:
+        command = (
+            f"{shlex.quote(sys.executable)} -c {shlex.quote(CONVERTER_SCRIPT)} "
+            '"{input}" "{output}"'
+        )
+
+    texture_converter = TextureConverter()
+    texture_converter.set_command(command, "tx")
+
+    return texture_converter
+
+
+def create_files(tmp_path, *file_names: str) -> list[str]:
+    file_paths = []
+
+    for file_name in file_names:
+        file_path = tmp_path / file_name
+        file_path.write_bytes(file_name.encode("utf-8"))
+        file_paths.append(str(file_path))
+
+    return file_paths
+
+
+def test_convert(tmp_path):
+    texture_converter = create_texture_converter()
+    file_paths = create_files(tmp_path, "wood basecolor.png", "wood_roughness.png")
+
+    assert texture_converter.convert(file_paths + file_paths) == 2
+    assert texture_converter.skipped_count == 0
+    assert texture_converter.failed_count == 0
+
+    # Paths with spaces reach the command as a single argument.
+    assert (tmp_path / "wood basecolor.tx").read_bytes() == b"wood basecolor.png"
+    assert (tmp_path / "wood_roughness.tx").read_bytes() == b"wood_roughness.png"
+
+
+def test_convert_skips_up_to_date(tmp_path):
+    texture_converter = create_texture_converter()
+    file_paths = create_files(tmp_path, "wood_basecolor.png", "wood_roughness.png")
+
+    texture_converter.convert(file_paths)
+
+    assert texture_converter.convert(file_paths) == 0
+    assert texture_converter.skipped_count == 2
+
+    # A source newer than its converted file is converted again.
+    mtime_ns = os.stat(file_paths[0]).st_mtime_ns + 10**9
+    os.utime(file_paths[0], ns=(mtime_ns, mtime_ns))
+
+    assert texture_converter.convert(file_paths) == 1
+    assert texture_converter.skipped_count == 1
+
+
+def test_convert_failures(tmp_path):
+    texture_converter = create_texture_converter()
+    file_paths = create_files(tmp_path, "wood_fail.png", "wood_basecolor.png")
+
+    assert texture_converter.convert(file_paths) == 1
+    assert texture_converter.failed_count == 1
+    assert texture_converter.get_converted_path(file_paths[0]) is None
+
+    # Up to date textures are skipped, the others count as failures when the command
+    # exits cleanly without writing the output or cannot be started at all.
+    for command in (
+        f'{shlex.quote(sys.executable)} -c "pass" "{{input}}"',
+        "textureConnectorMissingCommand",
+    ):
+        texture_converter = create_texture_converter(command)
+
+        assert texture_converter.convert(file_paths) == 0
+        assert texture_converter.skipped_count == 1
+        assert texture_converter.failed_count == 1
+
+
+def test_convert_conflicting_outputs(tmp_path, monkeypatch):
+    warnings = []
+
+    monkeypatch.setattr(
+        utils.Logger, "warning", classmethod(lambda cls, msg: warnings.append(msg))
+    )
+
+    texture_converter = create_texture_converter()
+    exr_path, png_path = create_files(
+        tmp_path, "wood_baseColor.exr", "wood_baseColor.png"
+    )
+
+    # Both sources map to the same output, only one of them may write it.
+    assert texture_converter.convert([png_path, exr_path]) == 1
+    assert (tmp_path / "wood_baseColor.tx").read_bytes() == b"wood_baseColor.exr"
+    assert texture_converter.get_converted_path(exr_path) == str(
+        tmp_path / "wood_baseColor.tx"
+    )
+    assert texture_converter.get_converted_path(png_path) is None
+    assert len(warnings) == 1
+
+    # A converted texture next to its source is kept as it is.
+    (tx_path,) = create_files(tmp_path, "stone_baseColor.tx")
+    (stone_path,) = create_files(tmp_path, "stone_baseColor.png")
+
+    assert texture_converter.convert([stone_path, tx_path]) == 0
+    assert texture_converter.skipped_count == 1
+    assert texture_converter.get_converted_path(stone_path) is None
+    assert texture_converter.get_converted_path(tx_path) == tx_path
+
+
+def test_cancel_kills_running_conversions(tmp_path):
+    texture_converter = create_texture_converter()
+    texture_converter.set_workers(2)
+    texture_converter.set_progress_callback(
+        lambda value, maximum, file_path: value == 0
+    )
+
+    file_paths = create_files(tmp_path, "a_basecolor.png", "b_slow.png")
+
+    start_time = time.perf_counter()
+
+    assert texture_converter.convert(file_paths) == 1
+    assert time.perf_counter() - start_time < 30.0
+    assert texture_converter.is_cancelled()
+    assert texture_converter.failed_count == 0
+    assert not (tmp_path / "b_slow.tx").exists()
+
+
+def test_cancel_while_converting(tmp_path):
+    progress = []
+
+    def progress_callback(value: int, maximum: int, file_path: str) -> bool:
+        progress.append((value, maximum, os.path.basename(file_path)))
+        return len(progress) < 3
+
+    texture_converter = create_texture_converter()
+    texture_converter.set_progress_callback(progress_callback)
+
+    file_paths = create_files(tmp_path, "wood_slow.png")
+
+    start_time = time.perf_counter()
+
+    # The progress callback keeps running before any conversion finishes.
+    assert texture_converter.convert(file_paths) == 0
+    assert time.perf_counter() - start_time < 30.0
+    assert progress == [(0, 1, "wood_slow.png")] * 3
+    assert texture_converter.failed_count == 0
+
+
+def test_convert_logs_on_calling_thread(tmp_path, monkeypatch):
+    threads = []
+
+    monkeypatch.setattr(
+        utils.Logger,
+        "warning",
+        classmethod(lambda cls, msg: threads.append(threading.current_thread())),
+    )
+
+    texture_converter = create_texture_converter()
+    texture_converter.convert(create_files(tmp_path, "wood_fail.png", "stone_fail.png"))
+
+    assert texture_converter.failed_count == 2
+    assert threads == [threading.current_thread()] * 2
+
+
+def test_converted_path(maya_emulator, tmp_path):
+    texture_converter = create_texture_converter()
+    base_color_path, roughness_path = create_files(
+        tmp_path, "wood_basecolor.png", "wood_fail.png"
+    )
+
+    material_network = CreateMaterialNetworkArnold()
+    material_network.set_base_color_settings("sRGB", base_color_path, "basecolor")
+    material_network.set_roughness_settings("Raw", roughness_path, "roughness")
+
+    material_network_batch = CreateMaterialNetworkBatch()
+    material_network_batch.set_texture_converter(texture_converter)
+    material_network_batch.add_material_network("wood", material_network)
+    material_network_batch.create(
+        use_maya_color_space_rules=False,
+        use_triplanar=False,
+        uv_tiling_mode=UVTilingModes.OFF,
+    )
+
+    scene = maya_emulator.scene
+
+    assert scene.get_attr("wood_basecolor_file.fileTextureName") == str(
+        tmp_path / "wood_basecolor.tx"
+    )
+
+    # Textures that failed to convert keep their source file.
+    assert scene.get_attr("wood_roughness_file.fileTextureName") == roughness_path
+
+
+@pytest.mark.parametrize(
+    "command, output_extension, enabled",
+    (
+        ('maketx "{input}" -o "{output}"', ".tx", True),
+        ('maketx "{input}" -o "{output}"', "", False),
+        ("", ".tx", False),
+    ),
+)
+def test_is_enabled(tmp_path, command, output_extension, enabled):
+    texture_converter = TextureConverter()
+    texture_converter.set_command(command, output_extension)
+    (file_path,) = create_files(tmp_path, "wood_basecolor.tx")
+
+    assert texture_converter.is_enabled() is enabled
+
+    if enabled:
+        # Already converted textures are their own output.
+        assert texture_converter.get_converted_path(file_path) == file_path
@@ -0,0 +1,233 @@
+"""
+========================================================================================
+Name: test_texture_header.py
+Author: Mauricio Gonzalez Soto
+Updated Date: 10-17-2026
+
+Copyright (C) 2024 Mauricio Gonzalez Soto. All rights reserved.
+========================================================================================
+"""
+
+from __future__ import annotations
+
+from typing import Optional
+import struct
+import zlib
+
+import pytest
+
+from texture_connector.core import TextureHeaderReader
+
+
+def get_png(width: int, height: int, bit_depth: int, color_type: int) -> bytes:
+    data = struct.pack(">IIBBBBB", width, height, bit_depth, color_type, 0, 0, 0)
+    crc = zlib.crc32(b"IHDR" + data)
+
+    return (
+        b"\x89PNG\r\n\x1a\n"
+        + struct.pack(">I", 13)
+        + b"IHDR"
+        + data
+        + (struct.pack(">I", crc))
+    )
+
+
+def get_jpeg_segment(marker: int, payload: bytes) -> bytes:
+    return struct.pack(">BBH", 0xFF, marker, len(payload) + 2) + payload
+
+
+def get_jpeg(width: int, height: int, channels: int) -> bytes:
+    # An EXIF segment larger than the first read, a fill byte, a Huffman table and a
+    # progressive frame header.
+    return (
+        b"\xff\xd8"
+        + get_jpeg_segment(0xE1, b"Exif\x00\x00" + bytes(8000))
+        + b"\xff"
+        + get_jpeg_segment(0xC4, bytes(20))
+        + b"\xff\xc2"
+        + struct.pack(">HBHHB", 8 + 3 * channels, 8, height, width, channels)
+    )
+
+
+def get_tiff(
+    byte_order: str, width: int, height: int, bits_per_sample: tuple[int, ...]
+) -> bytes:
+
+    magic = b"II*\x00" if byte_order == "<" else b"MM\x00*"
+    samples_offset = 8
+    samples = struct.pack(f"{byte_order}{len(bits_per_sample)}H", *bits_per_sample)
+    ifd_offset = samples_offset + len(samples)
+
+    def get_entry(tag: int, value_type: int, count: int, value: bytes) -> bytes:
+        return struct.pack(f"{byte_order}HHI", tag, value_type, count) + value.ljust(
+            4, b"\x00"
+        )
+
+    if len(bits_per_sample) > 2:
+        bits_per_sample_value = struct.pack(f"{byte_order}I", samples_offset)
+    else:
+        bits_per_sample_value = samples
+
+    entries = (
+        # Width as LONG, height as SHORT.
+        get_entry(256, 4, 1, struct.pack(f"{byte_order}I", width)),
+        get_entry(257, 3, 1, struct.pack(f"{byte_order}H", height)),
+        get_entry(258, 3, len(bits_per_sample), bits_per_sample_value),
+        # Compression as an unsupported RATIONAL entry is skipped.
+        get_entry(259, 5, 1, struct.pack(f"{byte_order}I", 0)),
+        get_entry(277, 3, 1, struct.pack(f"{byte_order}H", len(bits_per_sample))),
+    )
+
+    return (
+        magic
+        + struct.pack(f"{byte_order}I", ifd_offset)
+        + samples
+        + struct.pack(f"{byte_order}H", len(entries))
+        + b"".join(entries)
+    )
+
+
+def get_exr_attribute(name: str, attribute_type: str, value: bytes) -> bytes:
+    return (
+        name.encode("latin-1")
+        + b"\x00"
+        + attribute_type.encode("latin-1")
+        + b"\x00"
+        + struct.pack("<i", len(value))
+        + value
+    )
+
+
+def get_exr(
+    data_window: tuple[int, int, int, int], channels: tuple[tuple[str, int], ...]
+) -> bytes:
+
+    channel_list = b"".join(
+        name.encode("latin-1") + b"\x00" + struct.pack("<iB3xii", pixel_type, 0, 1, 1)
+        for name, pixel_type in channels
+    )
+
+    # The comments are larger than a few reads so the header is walked across chunks.
+    return (
+        b"\x76\x2f\x31\x01"
+        + struct.pack("<I", 2)
+        + get_exr_attribute("comments", "string", b"x" * 10_000)
+        + get_exr_attribute("channels", "chlist", channel_list + b"\x00")
+        + get_exr_attribute("compression", "compression", b"\x03")
+        + get_exr_attribute("dataWindow", "box2i", struct.pack("<4i", *data_window))
+        + b"\x00"
+    )
+
+
+def get_gif(width: int, height: int) -> bytes:
+    return b"GIF89a" + struct.pack("<HHBBB", width, height, 0xF7, 0, 0)
+
+
+def read(tmp_path, data: bytes, file_name: str = "texture.img") -> Optional[tuple]:
+    file_path = tmp_path / file_name
+    file_path.write_bytes(data)
+
+    header = TextureHeaderReader().read(str(file_path))
+
+    if header is None:
+        return None
+
+    return (
+        header.image_format,
+        header.width,
+        header.height,
+        header.bit_depth,
+        header.channels,
+    )
+
+
+@pytest.mark.parametrize(
+    "data, header",
+    (
+        (get_png(2048, 1024, 16, 6), ("png", 2048, 1024, 16, 4)),
+        (get_png(512, 256, 8, 0), ("png", 512, 256, 8, 1)),
+        (get_png(64, 64, 4, 3), ("png", 64, 64, 8, 3)),
+        (get_jpeg(4096, 2048, 3), ("jpeg", 4096, 2048, 8, 3)),
+        (get_tiff("<", 70_000, 512, (16, 16, 16)), ("tiff", 70_000, 512, 16, 3)),
+        (get_tiff(">", 70_000, 512, (16, 16, 16)), ("tiff", 70_000, 512, 16, 3)),
+        (get_tiff("<", 256, 128, (8, 8)), ("tiff", 256, 128, 8, 2)),
+        (get_tiff(">", 256, 128, (32,)), ("tiff", 256, 128, 32, 1)),
+        (
+            get_exr((0, 0, 4095, 2047), (("B", 1), ("G", 1), ("R", 1))),
+            ("exr", 4096, 2048, 16, 3),
+        ),
+        (
+            get_exr((-10, 5, 9, 14), (("A", 1), ("Z", 2))),
+            ("exr", 20, 10, 32, 2),
+        ),
+        (get_gif(320, 200), ("gif", 320, 200, 8, 3)),
+    ),
+)
+def test_read(tmp_path, data, header):
+    assert read(tmp_path, data) == header
+
+
+@pytest.mark.parametrize(
+    "data, trailing_size",
+    (
+        (get_png(2048, 1024, 16, 6), 7),
+        (get_jpeg(4096, 2048, 3), 0),
+        (get_tiff("<", 256, 128, (16, 16, 16)), 2),
+        (get_tiff(">", 256, 128, (8,)), 2),
+        (get_exr((0, 0, 1023, 1023), (("R", 1),)), 0),
+        (get_gif(320, 200), 3),
+    ),
+)
+def test_read_truncated(tmp_path, data, trailing_size):
+    # Only the trailing bytes the reader never looks at can be missing.
+    required_size = len(data) - trailing_size
+
+    for size in (*range(0, required_size, max(1, required_size // 100)), -1):
+        assert read(tmp_path, data[: size % required_size]) is None
+
+    assert read(tmp_path, data[:required_size]) is not None
+
+
+@pytest.mark.parametrize(
+    "data",
+    (
+        get_png(64, 64, 8, 5),
+        get_png(64, 64, 8, 6).replace(b"IHDR", b"IDAT"),
+        b"\xff\xd8\x00\x10" + bytes(100),
+        b"\xff\xd8" + get_jpeg_segment(0xE1, bytes(10))[:2] + b"\xff\xff" + bytes(4),
+        b"II*\x00" + struct.pack("<I", 1 << 30),
+        b"MM\x00*" + struct.pack(">IH", 8, 0xFFFF) + bytes(24),
+        b"II*\x00" + struct.pack("<IH", 8, 0),
+        get_exr((0, 0, 63, 63), ()),
+        get_exr((0, 0, 63, 63), (("R", 1),)).replace(
+            struct.pack("<i", 10_000), struct.pack("<i", -1)
+        ),
+        get_exr((0, 0, 63, 63), (("R", 1),)).replace(
+            struct.pack("<i", 10_000), struct.pack("<i", 1 << 30)
+        ),
+        b"\x76\x2f\x31\x01" + struct.pack("<I", 2) + b"x" * 10_000,
+        b"\x00" * 64,
+    ),
+)
+def test_read_corrupt(tmp_path, data):
+    assert read(tmp_path, data) is None
+
+
+def test_read_many(tmp_path):
+    file_paths = []
+
+    for file_name, data in (
+        ("wood.png", get_png(32, 32, 8, 2)),
+        ("wood.gif", get_gif(16, 8)),
+        ("wood.txt", b"texture"),
+    ):
+        file_path = tmp_path / file_name
+        file_path.write_bytes(data)
+        file_paths.append(str(file_path))
+
+    file_paths.append(str(tmp_path / "missing.png"))
+
+    headers = TextureHeaderReader().read_many(file_paths)
+
+    assert sorted(headers) == sorted(file_paths[:2])
+    assert headers[file_paths[0]].get_description() == ("32 x 32, 8-bit, 3 channel(s)")
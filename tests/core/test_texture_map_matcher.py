@@ -0,0 +1,96 @@
+"""
+========================================================================================
+Name: test_texture_map_matcher.py
+Author: Mauricio Gonzalez Soto
+Updated Date: 10-17-2026
+
+Copyright (C) 2024 Mauricio Gonzalez Soto. All rights reserved.
+========================================================================================
+"""
+
+from __future__ import annotations
+
+import pytest
+
+from texture_connector.core import TextureMapMatcher
+from texture_connector.config import TextureMaps
+
+TEXTURE_MAPS_SUFFIX = (
+    (TextureMaps.BASE_COLOR, "baseColor"),
+    (TextureMaps.ROUGHNESS, "roughness"),
+    (TextureMaps.NORMAL, "normal"),
+    (TextureMaps.HEIGHT, "normal_height"),
+    (TextureMaps.EMISSIVE, ""),
+)
+
+
+@pytest.mark.parametrize(
+    "file_name, texture_match",
+    (
+        ("wood_baseColor.png", ("wood", TextureMaps.BASE_COLOR)),
+        ("Wood_BASECOLOR.PNG", ("Wood", TextureMaps.BASE_COLOR)),
+        ("wood_basecolor", ("wood", TextureMaps.BASE_COLOR)),
+        ("wood_oak_roughness_2k.tif", ("wood_oak", TextureMaps.ROUGHNESS)),
+        ("wood_baseColor.1001.png", ("wood", TextureMaps.BASE_COLOR)),
+        ("wood_normal.png", ("wood", TextureMaps.NORMAL)),
+        ("wood_emissive.png", None),
+        ("wood.png", None),
+        ("_roughness.png", None),
+        ("woodroughness.png", None),
+    ),
+)
+def test_match_file_name(file_name, texture_match):
+    matcher = TextureMapMatcher(TEXTURE_MAPS_SUFFIX)
+
+    assert matcher.match_file_name(file_name) == texture_match
+
+
+@pytest.mark.parametrize(
+    "stem, texture_match",
+    (
+        # The longer suffix wins where both start at the same position.
+        ("wood_normal_height", ("wood", TextureMaps.HEIGHT)),
+        ("wood_Normal_Height", ("wood", TextureMaps.HEIGHT)),
+        # Otherwise the earliest suffix wins.
+        ("wood_roughness_normal", ("wood", TextureMaps.ROUGHNESS)),
+        ("wood_normal_roughness", ("wood", TextureMaps.NORMAL)),
+    ),
+)
+def test_match_overlapping_suffixes(stem, texture_match):
+    matcher = TextureMapMatcher(TEXTURE_MAPS_SUFFIX)
+
+    assert matcher.match(stem) == texture_match
+
+
+def test_match_shared_suffix():
+    # A suffix shared by two texture maps goes to the first one, whatever its case.
+    matcher = TextureMapMatcher(
+        (
+            (TextureMaps.METALNESS, "Mask"),
+            (TextureMaps.OPACITY, "mask"),
+        )
+    )
+
+    assert matcher.match("wood_MASK") == ("wood", TextureMaps.METALNESS)
+
+
+def test_match_escapes_suffixes():
+    matcher = TextureMapMatcher(((TextureMaps.ROUGHNESS, "rough+gloss"),))
+
+    assert matcher.match("wood_rough+gloss") == ("wood", TextureMaps.ROUGHNESS)
+    assert matcher.match("wood_roughhgloss") is None
+
+
+def test_set_texture_maps_suffix():
+    matcher = TextureMapMatcher()
+
+    assert matcher.match("wood_baseColor") is None
+
+    matcher.set_texture_maps_suffix(TEXTURE_MAPS_SUFFIX)
+
+    assert matcher.match("wood_baseColor") == ("wood", TextureMaps.BASE_COLOR)
+
+    matcher.set_texture_maps_suffix(((TextureMaps.BASE_COLOR, "diffuse"),))
+
+    assert matcher.match("wood_baseColor") is None
+    assert matcher.match("wood_diffuse") == ("wood", TextureMaps.BASE_COLOR)
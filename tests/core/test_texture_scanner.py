@@ -0,0 +1,301 @@
+"""
+========================================================================================
+Name: test_texture_scanner.py
+Author: Mauricio Gonzalez Soto
+Updated Date: 10-17-2026
+
+Copyright (C) 2024 Mauricio Gonzalez Soto. All rights reserved.
+========================================================================================
+"""
+
+from __future__ import annotations
+
+import os
+
+import pytest
+
+from texture_connector.core import TextureScanner
+from texture_connector.config import UVTilingModes
+from texture_connector.config import TextureMaps
+
+TEXTURE_MAPS_SUFFIX = (
+    (TextureMaps.BASE_COLOR, "baseColor"),
+    (TextureMaps.ROUGHNESS, "roughness"),
+)
+
+
+def create_scanner(uv_tiling_mode: str = UVTilingModes.OFF) -> TextureScanner:
+    scanner = TextureScanner()
+    scanner.set_texture_maps_suffix(TEXTURE_MAPS_SUFFIX)
+    scanner.set_uv_tiling_mode(uv_tiling_mode)
+
+    return scanner
+
+
+def collapse(
+    scanner: TextureScanner, file_names: tuple[str, ...]
+) -> list[tuple[str, str, str]]:
+
+    images = [scanner._classify(file_name) for file_name in file_names]
+
+    return sorted(scanner._collapse_tile_sets("/textures", images))
+
+
+def test_collapse_udim_tile_sets():
+    scanner = create_scanner(UVTilingModes.MARI)
+
+    assert collapse(
+        scanner,
+        (
+            "wood_baseColor.1003.png",
+            "wood_baseColor.1001.png",
+            "wood_baseColor.1002.png",
+            "wood_roughness.1002.png",
+            "wood_roughness.1001.png",
+            "stone_baseColor.png",
+        ),
+    ) == [
+        ("stone_baseColor.png", "stone", TextureMaps.BASE_COLOR),
+        ("wood_baseColor.1001.png", "wood", TextureMaps.BASE_COLOR),
+        ("wood_roughness.1001.png", "wood", TextureMaps.ROUGHNESS),
+    ]
+    assert scanner.tile_counts == {
+        os.path.join("/textures", "wood_baseColor.1001.png"): 3,
+        os.path.join("/textures", "wood_roughness.1001.png"): 2,
+    }
+
+
+def test_collapse_keeps_extensions_apart():
+    scanner = create_scanner(UVTilingModes.MARI)
+
+    assert collapse(
+        scanner,
+        (
+            "wood_baseColor.1001.png",
+            "wood_baseColor.1002.png",
+            "wood_baseColor.1001.exr",
+        ),
+    ) == [
+        ("wood_baseColor.1001.exr", "wood", TextureMaps.BASE_COLOR),
+        ("wood_baseColor.1001.png", "wood", TextureMaps.BASE_COLOR),
+    ]
+
+
+@pytest.mark.parametrize(
+    "file_name",
+    (
+        "wood_1024_baseColor.png",
+        "rock_baseColor_1024.png",
+        "wood_baseColor_2048.png",
+        "wood_baseColor.1002.png",
+    ),
+)
+def test_collapse_ignores_resolution_tags(file_name):
+    scanner = create_scanner(UVTilingModes.MARI)
+    material_name = file_name.partition("_baseColor")[0]
+
+    assert collapse(scanner, (file_name,)) == [
+        (file_name, material_name, TextureMaps.BASE_COLOR)
+    ]
+    assert scanner.tile_counts == {}
+
+
+def test_collapse_resolution_tag_tile_set():
+    scanner = create_scanner(UVTilingModes.MARI)
+
+    assert collapse(
+        scanner,
+        ("wood_1024_baseColor.1001.png", "wood_1024_baseColor.1002.png"),
+    ) == [("wood_1024_baseColor.1001.png", "wood_1024", TextureMaps.BASE_COLOR)]
+
+
+@pytest.mark.parametrize(
+    "uv_tiling_mode, file_names, first_file_name",
+    (
+        (
+            UVTilingModes.ZBRUSH,
+            ("wood_baseColor_u1_v0.png", "wood_baseColor_u0_v0.png"),
+            "wood_baseColor_u0_v0.png",
+        ),
+        (
+            UVTilingModes.MUDBOX,
+            ("wood_u2_v1_baseColor.png", "wood_u1_v1_baseColor.png"),
+            "wood_u1_v1_baseColor.png",
+        ),
+    ),
+)
+def test_collapse_uv_tile_sets(uv_tiling_mode, file_names, first_file_name):
+    scanner = create_scanner(uv_tiling_mode)
+
+    assert collapse(scanner, file_names) == [
+        (first_file_name, "wood", TextureMaps.BASE_COLOR)
+    ]
+    assert scanner.get_tile_count(os.path.join("/textures", first_file_name)) == 2
+
+
+def test_collapse_unclassified_tiles():
+    scanner = create_scanner(UVTilingModes.MARI)
+
+    assert collapse(scanner, ("noise.1001.png", "noise.1002.png")) == [
+        ("noise.1001.png", "", "")
+    ]
+
+
+def create_files(root_path, file_paths: tuple[str, ...]) -> None:
+    for file_path in file_paths:
+        file_path = root_path / file_path
+        file_path.parent.mkdir(parents=True, exist_ok=True)
+        file_path.touch()
+
+
+def scan(scanner: TextureScanner, folder_path) -> list[str]:
+    scanner.set_folder_path(str(folder_path))
+
+    return sorted(
+        os.path.relpath(file_path, str(folder_path)).replace(os.sep, "/")
+        for file_path, _, _ in scanner.iter_textures()
+    )
+
+
+@pytest.fixture
+def nested_folder_path(tmp_path):
+    create_files(
+        tmp_path,
+        (
+            "wood_baseColor.png",
+            "a/stone_baseColor.png",
+            "a/b/metal_baseColor.png",
+            "a/b/c/brick_baseColor.png",
+        ),
+    )
+
+    return tmp_path
+
+
+@pytest.mark.parametrize(
+    "max_depth, file_paths",
+    (
+        (
+            0,
+            [
+                "a/b/c/brick_baseColor.png",
+                "a/b/metal_baseColor.png",
+                "a/stone_baseColor.png",
+                "wood_baseColor.png",
+            ],
+        ),
+        (1, ["a/stone_baseColor.png", "wood_baseColor.png"]),
+        (2, ["a/b/metal_baseColor.png", "a/stone_baseColor.png", "wood_baseColor.png"]),
+    ),
+)
+@pytest.mark.parametrize("workers", (1, 4))
+def test_scan_max_depth(nested_folder_path, max_depth, file_paths, workers):
+    scanner = create_scanner()
+    scanner.set_max_depth(max_depth)
+    scanner.set_workers(workers)
+
+    assert scan(scanner, nested_folder_path) == file_paths
+
+
+def test_scan_without_subdirectories(nested_folder_path):
+    scanner = create_scanner()
+    scanner.set_search_files_in_subdirectories(False)
+
+    assert scan(scanner, nested_folder_path) == ["wood_baseColor.png"]
+    assert scanner.scanned_directory_count == 1
+
+
+@pytest.mark.parametrize("workers", (1, 4))
+def test_scan_exclude_patterns(tmp_path, workers):
+    create_files(
+        tmp_path,
+        (
+            "wood_baseColor.png",
+            "cache/wood_roughness.png",
+            "old_v1/stone_baseColor.png",
+            "textures/old_v2/metal_baseColor.png",
+            "textures/brick_baseColor.png",
+            "textures/.hidden/brick_roughness.png",
+            "textures/cache_roughness.png",
+            "textures/.wood_roughness.png",
+        ),
+    )
+
+    scanner = create_scanner()
+    scanner.set_workers(workers)
+    scanner.set_exclude_patterns(("cache", " old_* ", ""))
+
+    assert scanner.exclude_patterns == ("cache", "old_*")
+    assert scan(scanner, tmp_path) == [
+        "textures/brick_baseColor.png",
+        "textures/cache_roughness.png",
+        "wood_baseColor.png",
+    ]
+
+    scanner.set_exclude_patterns(())
+
+    assert len(scan(scanner, tmp_path)) == 6
+
+
+def test_scan_parallel_is_deterministic(tmp_path):
+    file_paths = []
+
+    for i in range(8):
+        for j in range(4):
+            # The same material shows up in several folders.
+            file_paths.append(f"{i}/{j}/wood_baseColor.png")
+            file_paths.append(f"{i}/{j}/material{i}{j}_roughness.png")
+            file_paths.append(f"{i}/{j}/material{i}{j}_baseColor.png")
+
+    create_files(tmp_path, tuple(file_paths))
+
+    def get_material_texture_paths(workers: int) -> dict[str, list[tuple[str, str]]]:
+        scanner = create_scanner()
+        scanner.set_folder_path(str(tmp_path))
+        scanner.set_workers(workers)
+
+        return scanner.get_material_texture_paths()
+
+    material_texture_paths = get_material_texture_paths(1)
+
+    assert len(material_texture_paths["wood"]) == 32
+    assert material_texture_paths["wood"] == sorted(material_texture_paths["wood"])
+
+    for _ in range(5):
+        assert get_material_texture_paths(8) == material_texture_paths
+
+
+def test_scan_symlink_loop(tmp_path):
+    folder_path = tmp_path / "textures"
+    create_files(
+        tmp_path,
+        (
+            "textures/wood_baseColor.png",
+            "textures/b/stone_baseColor.png",
+            "shared/metal_baseColor.png",
+        ),
+    )
+
+    try:
+        os.symlink(str(folder_path), str(folder_path / "b" / "loop"))
+        os.symlink(str(folder_path / "b"), str(folder_path / "a"))
+        os.symlink(str(tmp_path / "shared"), str(folder_path / "shared"))
+        os.symlink(str(tmp_path / "shared"), str(folder_path / "b" / "shared"))
+    except (OSError, NotImplementedError):
+        pytest.skip("Symbolic links are not supported.")
+
+    scanner = create_scanner()
+
+    # Links into the folder are walked through their real path, links out of it
+    # only once.
+    for workers in (1, 4):
+        scanner.set_workers(workers)
+
+        file_paths = scan(scanner, folder_path)
+        metal_paths = [f for f in file_paths if f.endswith("metal_baseColor.png")]
+
+        assert [f for f in file_paths if f not in metal_paths] == [
+            "b/stone_baseColor.png",
+            "wood_baseColor.png",
+        ]
+        assert len(metal_paths) == 1
@@ -0,0 +1,132 @@
+"""
+========================================================================================
+Name: test_uv_tiles.py
+Author: Mauricio Gonzalez Soto
+Updated Date: 10-17-2026
+
+Copyright (C) 2024 Mauricio Gonzalez Soto. All rights reserved.
+========================================================================================
+"""
+
+from __future__ import annotations
+
+import os
+
+import pytest
+
+from texture_connector.core import UVTiles
+from texture_connector.config import UVTilingModes
+
+
+@pytest.mark.parametrize(
+    "file_name, template",
+    (
+        ("wood_baseColor.1001.png", ("wood_baseColor.", ".png", "1001")),
+        ("wood_baseColor_1012.exr", ("wood_baseColor_", ".exr", "1012")),
+        ("1001.tif", ("", ".tif", "1001")),
+        ("wood_1999.png", ("wood_", ".png", "1999")),
+        ("wood_1024_baseColor.png", None),
+        ("wood_baseColor.1001_v2.png", None),
+        ("wood_baseColor-1001.png", None),
+        ("wood_baseColor_11001.png", None),
+        ("wood_baseColor_1000.png", None),
+        ("wood_baseColor_2001.png", None),
+        ("wood_baseColor.png", None),
+    ),
+)
+def test_udim_template(file_name, template):
+    assert UVTiles.get_tile_template(file_name, UVTilingModes.MARI) == template
+
+
+@pytest.mark.parametrize(
+    "uv_tiling_mode, file_name, template",
+    (
+        (UVTilingModes.ZBRUSH, "wood_u0_v0.png", ("wood_", ".png", "u0_v0")),
+        (
+            UVTilingModes.MUDBOX,
+            "wood_u1_v2_color.png",
+            ("wood_", "_color.png", "u1_v2"),
+        ),
+        (UVTilingModes.ZBRUSH, "wood_menu0_v0.png", None),
+        (UVTilingModes.OFF, "wood_baseColor.1001.png", None),
+    ),
+)
+def test_uv_template(uv_tiling_mode, file_name, template):
+    assert UVTiles.get_tile_template(file_name, uv_tiling_mode) == template
+
+
+@pytest.mark.parametrize(
+    "uv_tiling_mode, file_name, token_file_name",
+    (
+        (UVTilingModes.MARI, "wood.1001.png", "wood.<UDIM>.png"),
+        (UVTilingModes.ZBRUSH, "wood_u0_v0.png", "wood_u<u>_v<v>.png"),
+        (UVTilingModes.MUDBOX, "wood_u1_v1.png", "wood_u<U>_v<V>.png"),
+        (UVTilingModes.MARI, "wood_1024_baseColor.png", "wood_1024_baseColor.png"),
+    ),
+)
+def test_token_file_name(uv_tiling_mode, file_name, token_file_name):
+    assert UVTiles.get_token_file_name(file_name, uv_tiling_mode) == token_file_name
+
+
+def test_tile_sort_key():
+    tiles = ["u10_v0", "u2_v1", "u-1_v0", "u2_v0"]
+
+    assert sorted(tiles, key=UVTiles.get_tile_sort_key) == [
+        "u-1_v0",
+        "u2_v0",
+        "u2_v1",
+        "u10_v0",
+    ]
+
+
+def test_tile_set(tmp_path):
+    for file_name in (
+        "wood.1010.png",
+        "wood.1002.png",
+        "wood.1001.png",
+        "wood.1001.exr",
+        "stone.1002.png",
+        "rock_1024.png",
+        "metal.1001.png",
+    ):
+        (tmp_path / file_name).touch()
+
+    wood_path = str(tmp_path / "wood.1002.png")
+
+    assert UVTiles.get_tile_set(wood_path, UVTilingModes.MARI) == (
+        "1001",
+        "1002",
+        "1010",
+    )
+    assert UVTiles.get_tile_paths(wood_path, UVTilingModes.MARI) == tuple(
+        os.path.join(str(tmp_path), f"wood.{tile}.png")
+        for tile in ("1001", "1002", "1010")
+    )
+    assert UVTiles.get_tile_set(
+        str(tmp_path / "wood.1001.exr"), UVTilingModes.MARI
+    ) == ("1001",)
+    assert UVTiles.get_tile_set(
+        str(tmp_path / "metal.1001.png"), UVTilingModes.MARI
+    ) == ("1001",)
+
+    # A lone tile other than 1001 is not treated as a tile set.
+    for file_name in ("stone.1002.png", "rock_1024.png"):
+        file_path = str(tmp_path / file_name)
+
+        assert UVTiles.get_tile_set(file_path, UVTilingModes.MARI) == ()
+        assert UVTiles.get_tile_paths(file_path, UVTilingModes.MARI) == (file_path,)
+
+
+def test_tile_set_cache(tmp_path):
+    (tmp_path / "wood.1001.png").touch()
+    wood_path = str(tmp_path / "wood.1001.png")
+
+    assert UVTiles.get_tile_set(wood_path, UVTilingModes.MARI) == ("1001",)
+
+    (tmp_path / "wood.1002.png").touch()
+
+    assert UVTiles.get_tile_set(wood_path, UVTilingModes.MARI) == ("1001",)
+
+    UVTiles.invalidate()
+
+    assert UVTiles.get_tile_set(wood_path, UVTilingModes.MARI) == ("1001", "1002")
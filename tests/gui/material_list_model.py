@@ -0,0 +1,68 @@
+"""
+========================================================================================
+Name: material_list_model.py
+Author: Mauricio Gonzalez Soto
+Updated Date: 10-17-2026
+
+Copyright (C) 2024 Mauricio Gonzalez Soto. All rights reserved.
+========================================================================================
+"""
+
+from PySide2 import QtWidgets
+
+import sys
+
+from texture_connector.gui.color_space_delegate import ColorSpaceDelegate
+from texture_connector.gui.material_list_model import MaterialListModel
+
+
+def main():
+    folder_path = "/textures"
+    material_count = 1000
+
+    app = QtWidgets.QApplication(sys.argv)
+
+    material_list_model = MaterialListModel()
+    material_list_model.set_folder_path(folder_path)
+    material_list_model.add_textures(
+        [
+            (
+                f"{folder_path}/material_{i:04d}_{texture_map}.png",
+                f"material_{i:04d}",
+                texture_map,
+            )
+            for i in range(material_count)
+            for texture_map, _ in MaterialListModel.TEXTURE_MAPS
+        ]
+    )
+
+    search_line_edit = QtWidgets.QLineEdit()
+    search_line_edit.setPlaceholderText("Search...")
+    search_line_edit.textChanged.connect(material_list_model.set_search_text)
+
+    color_space_delegate = ColorSpaceDelegate()
+
+    material_table_view = QtWidgets.QTableView()
+    material_table_view.setModel(material_list_model)
+    material_table_view.setItemDelegateForColumn(
+        MaterialListModel.COLOR_SPACE_COLUMN, color_space_delegate
+    )
+    material_table_view.verticalHeader().setVisible(False)
+    material_table_view.horizontalHeader().setSectionResizeMode(
+        MaterialListModel.PATH_COLUMN, QtWidgets.QHeaderView.Stretch
+    )
+
+    widget = QtWidgets.QWidget()
+    widget.resize(800, 600)
+
+    main_layout = QtWidgets.QVBoxLayout(widget)
+    main_layout.addWidget(search_line_edit)
+    main_layout.addWidget(material_table_view)
+
+    widget.show()
+
+    sys.exit(app.exec_())
+
+
+if __name__ == "__main__":
+    main()
@@ -2,7 +2,7 @@
 ========================================================================================
 Name: material_settings_list_widget.py
 Author: Mauricio Gonzalez Soto
-Updated Date: 12-15-2024
+Updated Date: 10-17-2026
 
 Copyright (C) 2024 Mauricio Gonzalez Soto. All rights reserved.
 ========================================================================================
@@ -12,7 +12,9 @@ from PySide2 import QtWidgets
 
 import sys
 
-from texture_connector.gui.material_settings_list_widget import MaterialSettingsListWidget
+from texture_connector.gui.material_settings_list_widget import (
+    MaterialSettingsListWidget,
+)
 from texture_connector.config import TextureMaps
 
 
@@ -32,7 +34,7 @@ def main():
 
     texture_settings_widget = MaterialSettingsListWidget()
     texture_settings_widget.set_folder_path(folder_path)
-    texture_settings_widget.set_texture_map_suffixes(texture_map_suffixes)
+    texture_settings_widget.set_texture_maps_suffix(texture_map_suffixes)
     texture_settings_widget.create_material_settings_widgets()
     texture_settings_widget.show()
 
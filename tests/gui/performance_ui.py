@@ -1,8 +1,8 @@
 """
 ========================================================================================
-Name: material_settings_widget.py
+Name: performance_ui.py
 Author: Mauricio Gonzalez Soto
-Updated Date: 12-15-2024
+Updated Date: 10-16-2026
 
 Copyright (C) 2024 Mauricio Gonzalez Soto. All rights reserved.
 ========================================================================================
@@ -12,14 +12,14 @@ from PySide2 import QtWidgets
 
 import sys
 
-from texture_connector.gui.material_settings_widget import MaterialSettingsWidget
+from texture_connector.gui.performance_ui import PerformanceUI
 
 
 def main():
     app = QtWidgets.QApplication(sys.argv)
 
-    texture_settings_widget = MaterialSettingsWidget()
-    texture_settings_widget.show()
+    performance_ui = PerformanceUI()
+    performance_ui.show()
 
     sys.exit(app.exec_())
 
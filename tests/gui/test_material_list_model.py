@@ -0,0 +1,285 @@
+"""
+========================================================================================
+Name: test_material_list_model.py
+Author: Mauricio Gonzalez Soto
+Updated Date: 10-17-2026
+
+Copyright (C) 2024 Mauricio Gonzalez Soto. All rights reserved.
+========================================================================================
+"""
+
+from __future__ import annotations
+
+import pytest
+
+material_list_model = pytest.importorskip("texture_connector.gui.material_list_model")
+
+from texture_connector.config import TextureMaps
+
+MaterialListModel = material_list_model.MaterialListModel
+QtCore = material_list_model.QtCore
+
+FOLDER_PATH = "/textures"
+
+
+def get_textures(*names: str) -> list[tuple[str, str, str]]:
+    return [
+        (f"{FOLDER_PATH}/{name}_{texture_map}.png", name, texture_map)
+        for name in names
+        for texture_map in (TextureMaps.BASE_COLOR, TextureMaps.ROUGHNESS)
+    ]
+
+
+def get_visible_names(model: MaterialListModel) -> list[str]:
+    return [material.name for material in model.get_visible_material_items()]
+
+
+@pytest.fixture
+def model() -> MaterialListModel:
+    model = MaterialListModel()
+    model.set_folder_path(FOLDER_PATH)
+
+    return model
+
+
+def test_search(model):
+    model.add_textures(get_textures("Wood_Oak", "wood_pine", "Metal01", "Brick"))
+
+    model.set_search_text("WOOD")
+
+    assert get_visible_names(model) == ["Wood_Oak", "wood_pine"]
+    assert model.rowCount() == 2 * (1 + len(MaterialListModel.TEXTURE_MAPS))
+
+    model.set_search_text("re:^\\D+$")
+
+    assert get_visible_names(model) == ["Brick", "Wood_Oak", "wood_pine"]
+
+    model.set_search_text("re:^[A-Z]+\\d")
+
+    assert get_visible_names(model) == ["Metal01"]
+
+    model.set_search_text("")
+
+    assert len(get_visible_names(model)) == 4
+
+
+def test_search_keeps_new_materials_filtered(model):
+    model.set_search_text("wood")
+    model.add_textures(get_textures("Wood_Oak", "Metal01"))
+
+    assert get_visible_names(model) == ["Wood_Oak"]
+
+
+class RowTracker:
+    """Follows the row count through the model signals, as a view would."""
+
+    def __init__(self, model: MaterialListModel) -> None:
+        self.model = model
+        self.row_count = model.rowCount()
+
+        model.rowsInserted.connect(self._rows_inserted)
+        model.rowsRemoved.connect(self._rows_removed)
+        model.modelReset.connect(self._model_reset)
+
+    def _rows_inserted(self, parent, first: int, last: int) -> None:
+        self.row_count += last - first + 1
+
+    def _rows_removed(self, parent, first: int, last: int) -> None:
+        self.row_count -= last - first + 1
+
+    def _model_reset(self) -> None:
+        self.row_count = self.model.rowCount()
+
+    def check(self) -> None:
+        model = self.model
+        stride = 1 + len(MaterialListModel.TEXTURE_MAPS)
+
+        assert self.row_count == model.rowCount()
+        assert [
+            model.data(model.index(row, MaterialListModel.NAME_COLUMN))
+            for row in range(0, model.rowCount(), stride)
+        ] == get_visible_names(model)
+
+
+def rescan(
+    model: MaterialListModel,
+    textures: list[tuple[str, str, str]],
+    completed: bool = True,
+) -> tuple[int, int]:
+
+    model.begin_reconcile()
+    model.add_textures(textures)
+
+    return model.end_reconcile(completed)
+
+
+def get_texture_map_item(model: MaterialListModel, name: str, texture_map: str):
+    for material in model.get_material_items():
+        if material.key == name:
+            return material.get_texture_map_item(texture_map)
+
+    return None
+
+
+def get_row(model: MaterialListModel, item) -> int:
+    for row in range(model.rowCount()):
+        if model.get_item(model.index(row, 0)) is item:
+            return row
+
+    return -1
+
+
+def test_add_textures_sorted(model):
+    row_tracker = RowTracker(model)
+
+    model.add_textures(get_textures("wood", "brick"))
+    model.add_textures(get_textures("stone", "asphalt"))
+
+    assert get_visible_names(model) == ["asphalt", "brick", "stone", "wood"]
+    row_tracker.check()
+
+
+def test_reconcile_removed(model):
+    model.add_textures(get_textures("wood", "stone", "metal"))
+    row_tracker = RowTracker(model)
+
+    assert rescan(model, get_textures("wood", "stone", "brick")) == (1, 0)
+    assert get_visible_names(model) == ["brick", "stone", "wood"]
+    assert [material.key for material in model.get_material_items()] == [
+        "brick",
+        "stone",
+        "wood",
+    ]
+    row_tracker.check()
+
+    # Removed materials no longer match a search.
+    model.set_search_text("metal")
+
+    assert get_visible_names(model) == []
+
+
+def test_reconcile_moved(model):
+    model.add_textures(get_textures("brick", "wood"))
+    row_tracker = RowTracker(model)
+
+    wood_textures = [
+        (f"{FOLDER_PATH}/a/wood_{texture_map}.png", "wood", texture_map)
+        for _, _, texture_map in get_textures("wood")
+    ]
+
+    assert rescan(model, get_textures("brick") + wood_textures) == (0, 2)
+    assert get_visible_names(model) == ["wood", "brick"]
+    assert get_texture_map_item(model, "wood", TextureMaps.BASE_COLOR).text == (
+        f"/a/wood_{TextureMaps.BASE_COLOR}.png"
+    )
+    row_tracker.check()
+
+
+@pytest.mark.parametrize("count", (3, MaterialListModel.MAX_INSERT_BLOCKS + 1))
+def test_reconcile_resorted(model, count):
+    def get_material_textures(folder_path) -> list[tuple[str, str, str]]:
+        return [
+            (
+                f"{folder_path(i)}/material{i:02d}_{TextureMaps.BASE_COLOR}.png",
+                f"material{i:02d}",
+                TextureMaps.BASE_COLOR,
+            )
+            for i in range(count)
+        ]
+
+    names = [f"material{i:02d}" for i in range(count)]
+
+    model.add_textures(get_material_textures(lambda i: FOLDER_PATH))
+    model.set_search_text("re:[02468]$")
+    row_tracker = RowTracker(model)
+
+    # Every material moves to a folder that sorts it in reverse, past the insert
+    # blocks limit the model resets instead.
+    assert rescan(
+        model, get_material_textures(lambda i: f"{FOLDER_PATH}/{count - i:02d}")
+    ) == (0, count)
+    assert get_visible_names(model) == [
+        name for name in reversed(names) if name[-1] in "02468"
+    ]
+    row_tracker.check()
+
+    model.set_search_text("")
+
+    assert get_visible_names(model) == names[::-1]
+
+
+def test_reconcile_keeps_edits(model):
+    model.add_textures(get_textures("brick", "wood"))
+    model.set_texture_map_color_space(TextureMaps.ROUGHNESS, "Raw")
+
+    wood = model.get_material_items()[1]
+    roughness = wood.get_texture_map_item(TextureMaps.ROUGHNESS)
+    base_color = wood.get_texture_map_item(TextureMaps.BASE_COLOR)
+    row = get_row(model, wood)
+
+    assert model.setData(model.index(row, MaterialListModel.NAME_COLUMN), " Oak ")
+    assert model.setData(
+        model.index(row, MaterialListModel.NAME_COLUMN),
+        QtCore.Qt.Unchecked,
+        QtCore.Qt.CheckStateRole,
+    )
+    assert model.setData(
+        model.index(get_row(model, base_color), MaterialListModel.NAME_COLUMN),
+        QtCore.Qt.Unchecked,
+        QtCore.Qt.CheckStateRole,
+    )
+    assert model.setData(
+        model.index(get_row(model, roughness), MaterialListModel.COLOR_SPACE_COLUMN),
+        "ACEScg",
+    )
+
+    model.begin_reconcile()
+    model.add_textures(get_textures("wood"))
+    model.set_texture_map_color_space(TextureMaps.ROUGHNESS, "Raw")
+    model.end_reconcile(True)
+
+    assert model.get_material_items() == [wood]
+    assert wood.name == "Oak"
+    assert not wood.enabled
+    assert not base_color.enabled
+    assert roughness.enabled
+    assert roughness.color_space == "ACEScg"
+
+    # Renamed materials are searched by their new name.
+    model.set_search_text("oak")
+
+    assert get_visible_names(model) == ["Oak"]
+
+
+def test_reconcile_cancelled(model):
+    model.add_textures(get_textures("brick", "wood"))
+    row_tracker = RowTracker(model)
+    wood_path = get_texture_map_item(model, "wood", TextureMaps.BASE_COLOR).path
+
+    model.begin_reconcile()
+    model.add_textures(
+        [(f"{FOLDER_PATH}/a/wood_basecolor.png", "wood", TextureMaps.BASE_COLOR)]
+        + get_textures("stone")
+    )
+
+    assert model.end_reconcile(False) == (0, 0)
+
+    # Materials found before the cancel are kept, the listed ones stay untouched.
+    assert get_visible_names(model) == ["brick", "stone", "wood"]
+    assert get_texture_map_item(model, "wood", TextureMaps.BASE_COLOR).path == (
+        wood_path
+    )
+    row_tracker.check()
+
+    # The next completed scan still reconciles everything.
+    assert rescan(model, get_textures("wood")) == (2, 0)
+    assert get_visible_names(model) == ["wood"]
+    row_tracker.check()
+
+
+def test_reconcile_removed_texture(model):
+    model.add_textures(get_textures("wood"))
+
+    assert rescan(model, get_textures("wood")[:1]) == (0, 1)
+    assert get_texture_map_item(model, "wood", TextureMaps.ROUGHNESS).path == ""
+    assert get_texture_map_item(model, "wood", TextureMaps.ROUGHNESS).text == ""
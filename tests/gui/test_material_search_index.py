@@ -0,0 +1,141 @@
+"""
+========================================================================================
+Name: test_material_search_index.py
+Author: Mauricio Gonzalez Soto
+Updated Date: 10-17-2026
+
+Copyright (C) 2024 Mauricio Gonzalez Soto. All rights reserved.
+========================================================================================
+"""
+
+from __future__ import annotations
+
+import pytest
+
+from texture_connector.gui.material_search_index import MaterialSearchIndex
+
+NAMES = ("Wood_Oak", "wood_pine", "Stone_Wall", "stone_floor_2k", "Metal01", "Brick")
+
+
+class Material:
+    def __init__(self, name: str) -> None:
+        self.name = name
+
+
+@pytest.fixture
+def materials() -> dict[str, Material]:
+    return {name: Material(name) for name in NAMES}
+
+
+@pytest.fixture
+def search_index(materials) -> MaterialSearchIndex:
+    search_index = MaterialSearchIndex()
+
+    for material in materials.values():
+        search_index.add(material)
+
+    return search_index
+
+
+def search(search_index: MaterialSearchIndex, text: str) -> list[str]:
+    materials = search_index.search(text)
+
+    assert materials is not None
+
+    names = sorted(material.name for material in materials)
+
+    # The postings only narrow the candidates, both paths must agree.
+    assert names == sorted(
+        material.name
+        for material in search_index._names
+        if search_index.matches(material, text)
+    )
+
+    return names
+
+
+@pytest.mark.parametrize(
+    "text, names",
+    (
+        ("wood", ["Wood_Oak", "wood_pine"]),
+        ("oo", ["Wood_Oak", "stone_floor_2k", "wood_pine"]),
+        ("_fl", ["stone_floor_2k"]),
+        ("one_", ["Stone_Wall", "stone_floor_2k"]),
+        ("stone_wall", ["Stone_Wall"]),
+        ("missing", []),
+        ("woodx", []),
+    ),
+)
+def test_plain_search(search_index, text, names):
+    assert search(search_index, text) == names
+
+
+def test_empty_search(search_index, materials):
+    assert search_index.search("") is None
+    assert all(search_index.matches(material, "") for material in materials.values())
+
+
+@pytest.mark.parametrize(
+    "text, names",
+    (
+        ("wood*", ["Wood_Oak", "wood_pine"]),
+        ("*_2k", ["stone_floor_2k"]),
+        ("metal??", ["Metal01"]),
+        ("[bm]*", ["Brick", "Metal01"]),
+        ("wood", ["Wood_Oak", "wood_pine"]),
+    ),
+)
+def test_glob_search(search_index, text, names):
+    assert search(search_index, text) == names
+
+
+@pytest.mark.parametrize(
+    "text, names",
+    (
+        (r"re:^stone", ["Stone_Wall", "stone_floor_2k"]),
+        (r"re:\d+$", ["Metal01"]),
+        (r"re:^\D+$", ["Brick", "Stone_Wall", "Wood_Oak", "wood_pine"]),
+        (r"re:^[A-Z]+_[A-Z]+$", ["Stone_Wall", "Wood_Oak", "wood_pine"]),
+        (r"re:\S+_\S+_\S+", ["stone_floor_2k"]),
+    ),
+)
+def test_regex_search(search_index, text, names):
+    assert search(search_index, text) == names
+
+
+@pytest.mark.parametrize("text", ("re:(", "re:[a-", "re:*wood"))
+def test_invalid_regex(search_index, text):
+    assert search(search_index, text) == []
+
+
+def test_remove(search_index, materials):
+    search_index.remove(materials["wood_pine"])
+    search_index.remove(materials["wood_pine"])
+
+    assert search(search_index, "wood") == ["Wood_Oak"]
+    assert "pin" not in search_index._ngrams
+
+
+def test_rename(search_index, materials):
+    material = materials["Wood_Oak"]
+    material.name = "Birch_Bark"
+    search_index.update(material)
+
+    assert search(search_index, "wood") == ["wood_pine"]
+    assert search(search_index, "birch") == ["Birch_Bark"]
+    assert search(search_index, "oak") == []
+
+
+def test_cached_matcher(search_index):
+    assert search(search_index, "re:^wood") == ["Wood_Oak", "wood_pine"]
+
+    # A new query must not reuse the previous compiled matcher.
+    assert search(search_index, "re:^metal") == ["Metal01"]
+    assert search(search_index, "brick") == ["Brick"]
+
+
+def test_clear(search_index):
+    search_index.clear()
+
+    assert search(search_index, "wood") == []
+    assert search(search_index, "*") == []
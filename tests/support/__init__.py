@@ -0,0 +1,16 @@
+"""
+========================================================================================
+Name: __init__.py
+Author: Mauricio Gonzalez Soto
+Updated Date: 10-16-2026
+
+Copyright (C) 2024 Mauricio Gonzalez Soto. All rights reserved.
+========================================================================================
+"""
+
+from tests.support.maya_emulator import MayaEmulator
+from tests.support.maya_emulator import MObject
+from tests.support.maya_emulator import Latency
+from tests.support.maya_emulator import Scene
+from tests.support.maya_emulator import Node
+from tests.support.maya_emulator import get_emulator
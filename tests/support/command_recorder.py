@@ -0,0 +1,181 @@
+"""
+========================================================================================
+Name: command_recorder.py
+Author: Mauricio Gonzalez Soto
+Updated Date: 10-16-2026
+
+Copyright (C) 2024 Mauricio Gonzalez Soto. All rights reserved.
+========================================================================================
+"""
+
+from __future__ import annotations
+
+from types import ModuleType
+from typing import Callable
+from typing import Optional
+import functools
+import time
+import sys
+
+from texture_connector.core.create_material_network import CreateMaterialNetwork
+
+
+class CommandStats:
+    __slots__ = ("count", "elapsed_time")
+
+    def __init__(self) -> None:
+        self.count = 0
+        self.elapsed_time = 0.0
+
+    def add(self, elapsed_time: float) -> None:
+        self.count += 1
+        self.elapsed_time += elapsed_time
+
+
+class CommandRecorder:
+    NO_METHOD = "<outside network>"
+
+    def __init__(self, module: Optional[ModuleType] = None) -> None:
+        if module is None:
+            import maya.cmds as module
+
+        self.module = module
+
+        self.commands = {}
+        self.methods = {}
+        self.inclusive_methods = {}
+
+        self._functions = {}
+
+    @staticmethod
+    def _get_network_methods() -> list[str]:
+        methods = []
+        frame = sys._getframe(2)
+
+        # Every CreateMaterialNetwork frame on the stack is collected, innermost
+        # first, so both self and inclusive costs can be reported.
+        while frame is not None:
+            instance = frame.f_locals.get("self")
+
+            if isinstance(instance, CreateMaterialNetwork):
+                methods.append(frame.f_code.co_name)
+
+            frame = frame.f_back
+
+        return methods
+
+    def _record(self, command: str, elapsed_time: float) -> None:
+        methods = self._get_network_methods()
+
+        self.commands.setdefault(command, CommandStats()).add(elapsed_time)
+        self.methods.setdefault(
+            methods[0] if methods else CommandRecorder.NO_METHOD, CommandStats()
+        ).add(elapsed_time)
+
+        for method in dict.fromkeys(methods):
+            self.inclusive_methods.setdefault(method, CommandStats()).add(elapsed_time)
+
+    def _wrap(self, command: str, function: Callable) -> Callable:
+        @functools.wraps(function)
+        def wrapper(*args, **kwargs):
+            start_time = time.perf_counter()
+
+            try:
+                return function(*args, **kwargs)
+            finally:
+                self._record(command, time.perf_counter() - start_time)
+
+        return wrapper
+
+    def __enter__(self) -> CommandRecorder:
+        self.start()
+
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.stop()
+
+    def clear(self) -> None:
+        self.commands = {}
+        self.methods = {}
+        self.inclusive_methods = {}
+
+    def get_count(self, command: Optional[str] = None) -> int:
+        if command is None:
+            return sum(stats.count for stats in self.commands.values())
+
+        stats = self.commands.get(command)
+
+        return stats.count if stats is not None else 0
+
+    def get_counts(self) -> dict[str, int]:
+        return {command: stats.count for command, stats in self.commands.items()}
+
+    def get_method_counts(self) -> dict[str, int]:
+        return {
+            method: stats.count
+            for method, stats in self.methods.items()
+            if method != CommandRecorder.NO_METHOD
+        }
+
+    def get_dominant_method(self) -> Optional[str]:
+        methods = {
+            method: stats
+            for method, stats in self.methods.items()
+            if method != CommandRecorder.NO_METHOD
+        }
+
+        if not methods:
+            return None
+
+        return max(methods, key=lambda method: methods[method].elapsed_time)
+
+    def get_elapsed_time(self) -> float:
+        return sum(stats.elapsed_time for stats in self.commands.values())
+
+    def get_report(self, material_count: int = 1) -> str:
+        material_count = max(1, material_count)
+        total_time = self.get_elapsed_time() or 1.0
+        lines = []
+
+        sections = (
+            ("Command", self.commands),
+            ("Method (self)", self.methods),
+            ("Method (inclusive)", self.inclusive_methods),
+        )
+
+        for title, stats_by_name in sections:
+            lines.append(
+                f"{title:<40} {'calls':>8} {'/material':>10} {'ms':>10} {'%':>6}"
+            )
+
+            for name, stats in sorted(
+                stats_by_name.items(), key=lambda item: -item[1].elapsed_time
+            ):
+                lines.append(
+                    f"{name:<40} {stats.count:>8} "
+                    f"{stats.count / material_count:>10.1f} "
+                    f"{stats.elapsed_time * 1000:>10.2f} "
+                    f"{stats.elapsed_time / total_time * 100:>6.1f}"
+                )
+
+            lines.append("")
+
+        return "\n".join(lines)
+
+    def start(self) -> None:
+        if self._functions:
+            return
+
+        for command, function in vars(self.module).items():
+            if command.startswith("_") or not callable(function):
+                continue
+
+            self._functions[command] = function
+            setattr(self.module, command, self._wrap(command, function))
+
+    def stop(self) -> None:
+        for command, function in self._functions.items():
+            setattr(self.module, command, function)
+
+        self._functions = {}
@@ -0,0 +1,50 @@
+"""
+========================================================================================
+Name: material_networks.py
+Author: Mauricio Gonzalez Soto
+Updated Date: 10-16-2026
+
+Copyright (C) 2024 Mauricio Gonzalez Soto. All rights reserved.
+========================================================================================
+"""
+
+from __future__ import annotations
+
+from texture_connector.core import CreateMaterialNetworkBatch
+from texture_connector.config import TextureMaps
+
+TEXTURE_MAPS_SETTINGS = (
+    (TextureMaps.BASE_COLOR, "set_base_color_settings", "sRGB"),
+    (TextureMaps.ROUGHNESS, "set_roughness_settings", "Raw"),
+    (TextureMaps.METALNESS, "set_metalness_settings", "Raw"),
+    (TextureMaps.NORMAL, "set_normal_settings", "Raw"),
+    (TextureMaps.HEIGHT, "set_height_settings", "Raw"),
+    (TextureMaps.EMISSIVE, "set_emissive_settings", "sRGB"),
+    (TextureMaps.OPACITY, "set_opacity_settings", "Raw"),
+)
+
+
+def create_material_network_batch(
+    material_network_class: type,
+    material_count: int,
+    texture_maps: tuple[str, ...],
+    folder_path: str = "/textures",
+) -> CreateMaterialNetworkBatch:
+
+    material_network_batch = CreateMaterialNetworkBatch()
+
+    for i in range(material_count):
+        name = f"material_{i:05d}"
+        material_network = material_network_class()
+
+        for texture_map, setter, color_space in TEXTURE_MAPS_SETTINGS:
+            if texture_map in texture_maps:
+                getattr(material_network, setter)(
+                    color_space=color_space,
+                    file_path=f"{folder_path}/{name}_{texture_map}.1001.png",
+                    suffix=texture_map,
+                )
+
+        material_network_batch.add_material_network(name, material_network)
+
+    return material_network_batch
@@ -0,0 +1,1006 @@
+"""
+========================================================================================
+Name: maya_emulator.py
+Author: Mauricio Gonzalez Soto
+Updated Date: 10-17-2026
+
+Copyright (C) 2024 Mauricio Gonzalez Soto. All rights reserved.
+========================================================================================
+"""
+
+from __future__ import annotations
+
+from typing import Any
+from typing import Callable
+from typing import Optional
+import importlib.util
+import itertools
+import tempfile
+import types
+import time
+import sys
+import os
+import re
+
+
+class Node:
+    __slots__ = ("name", "node_type", "attrs")
+
+    def __init__(self, name: str, node_type: str) -> None:
+        self.name = name
+        self.node_type = node_type
+        self.attrs = {}
+
+
+class MObject:
+    def __init__(self, node: Optional[Node] = None) -> None:
+        self.node = node
+
+    def isNull(self) -> bool:
+        return self.node is None
+
+
+MObject.kNullObj = MObject()
+
+
+class Scene:
+    BUILT_IN_NODE_TYPES = frozenset(
+        (
+            "bump2d",
+            "displacementShader",
+            "file",
+            "lambert",
+            "place2dTexture",
+            "shadingEngine",
+        )
+    )
+
+    PLUGIN_NODE_TYPES = {
+        "lookdevKit": ("floatConstant", "colorConstant"),
+        "mtoa": ("aiStandardSurface", "aiTriplanar", "aiNormalMap"),
+        "redshift4maya": (
+            "RedshiftStandardMaterial",
+            "RedshiftTriPlanar",
+            "RedshiftNormalMap",
+        ),
+        "vrayformaya": ("VRayMtl", "VRayTriplanar", "VRayNormalMap"),
+    }
+
+    COLOR_SPACE_FAMILIES = (
+        ("sRGB", "Input/Generic"),
+        ("Raw", "Utility"),
+        ("ACEScg", "ACES"),
+        ("ACES2065-1", "ACES"),
+        ("scene-linear Rec.709-sRGB", "Input/Generic"),
+    )
+
+    DEFAULT_ATTRIBUTE_VALUES = {
+        "alphaIsLuminance": False,
+        "bumpInterp": 0,
+        "colorSpace": "sRGB",
+        "fileTextureName": "",
+        "uvTilingMode": 0,
+    }
+
+    CLASSIFICATIONS = ("asShader", "asTexture", "asUtility")
+
+    # Nodes every Maya scene has, which shadingNode and sets connect to implicitly.
+    DEFAULT_NODES = {
+        "defaultColorMgtGlobals": "colorManagementGlobals",
+        "defaultRenderUtilityList1": "defaultRenderUtilityList",
+        "defaultShaderList1": "defaultShaderList",
+        "defaultTextureList1": "defaultTextureList",
+        "renderPartition": "partition",
+    }
+
+    FLOAT_ATTRIBUTES = frozenset(
+        (
+            "emission",
+            "emission_weight",
+            "reflectionColorR",
+            "reflectionColorG",
+            "reflectionColorB",
+        )
+    )
+
+    def __init__(self) -> None:
+        self.nodes = {
+            name: Node(name, node_type)
+            for name, node_type in Scene.DEFAULT_NODES.items()
+        }
+        self.connections = {}
+        self.loaded_plugins = set(Scene.PLUGIN_NODE_TYPES)
+        self.color_spaces = list(Scene.COLOR_SPACE_FAMILIES)
+        self.user_pref_dir = os.path.join(tempfile.gettempdir(), "maya", "prefs")
+
+        self.undo_state = True
+        self.undo_chunks = []
+        self.undo_history = []
+        self.refresh_suspended = False
+        self.selection = []
+        self.messages = []
+
+        self.call_backs = {}
+        self._call_back_ids = itertools.count(1)
+
+    def _get_node(self, name: str) -> Node:
+        node = self.nodes.get(name.lstrip(":"))
+
+        if node is None:
+            raise RuntimeError(f"No object matches name: {name}")
+
+        return node
+
+    def _get_node_types(self) -> set[str]:
+        node_types = set(Scene.BUILT_IN_NODE_TYPES)
+
+        for plugin in self.loaded_plugins:
+            node_types.update(Scene.PLUGIN_NODE_TYPES.get(plugin, ()))
+
+        return node_types
+
+    def _get_unique_name(self, name: str) -> str:
+        if name not in self.nodes:
+            return name
+
+        base_name = name.rstrip("0123456789")
+        match = re.search(r"\d+$", name)
+        index = int(match.group()) + 1 if match else 1
+
+        while f"{base_name}{index}" in self.nodes:
+            index += 1
+
+        return f"{base_name}{index}"
+
+    def _notify(self, message: str, *args) -> None:
+        for call_back_message, node_type, function in list(self.call_backs.values()):
+            if call_back_message != message:
+                continue
+
+            if node_type and node_type != args[0].node.node_type:
+                continue
+
+            function(*args)
+
+    @staticmethod
+    def _split_plug(plug: str) -> tuple[str, str]:
+        node_name, _, attr = plug.lstrip(":").partition(".")
+
+        return node_name, attr
+
+    def add_call_back(
+        self, message: str, function: Callable, node_type: str = ""
+    ) -> int:
+
+        if node_type == "dependNode":
+            node_type = ""
+
+        if node_type and node_type not in self._get_node_types():
+            raise RuntimeError(f"Unknown node type: {node_type}")
+
+        call_back_id = next(self._call_back_ids)
+        self.call_backs[call_back_id] = (message, node_type, function)
+
+        return call_back_id
+
+    def connect(self, source: str, destination: str, force: bool = False) -> None:
+        source_node, source_attr = self._split_plug(source)
+        destination_node, destination_attr = self._split_plug(destination)
+
+        self._get_node(source_node)
+        self._get_node(destination_node)
+
+        if not source_attr or not destination_attr:
+            raise RuntimeError(f"Connection not made: {source!r} -> {destination!r}")
+
+        destination = f"{destination_node}.{destination_attr}"
+
+        if destination in self.connections and not force:
+            raise RuntimeError(
+                f"{destination!r} is already connected to "
+                f"{self.connections[destination]!r}."
+            )
+
+        self.connections[destination] = f"{source_node}.{source_attr}"
+
+    def create_node(self, node_type: str, name: str = "") -> str:
+        if node_type not in self._get_node_types():
+            raise RuntimeError(f"Unknown object type: {node_type}")
+
+        name = self._get_unique_name(name or f"{node_type}1")
+        node = Node(name, node_type)
+        self.nodes[name] = node
+
+        self._notify("nodeAdded", MObject(node))
+
+        return name
+
+    def delete(self, names: list[str]) -> None:
+        for name in names:
+            node = self._get_node(name)
+
+            for destination, source in list(self.connections.items()):
+                if (
+                    self._split_plug(destination)[0] == node.name
+                    or self._split_plug(source)[0] == node.name
+                ):
+                    del self.connections[destination]
+
+            del self.nodes[node.name]
+
+            self._notify("nodeRemoved", MObject(node))
+
+    def get_array_indices(self, plug: str) -> list[int]:
+        node_name, attr = self._split_plug(plug)
+        prefix = f"{self._get_node(node_name).name}.{attr}["
+
+        return sorted(
+            int(destination[len(prefix) : -1])
+            for destination in self.connections
+            if destination.startswith(prefix)
+        )
+
+    def get_attr(self, plug: str) -> Any:
+        node_name, attr = self._split_plug(plug)
+        node = self._get_node(node_name)
+
+        if attr in node.attrs:
+            return node.attrs[attr]
+
+        return Scene.DEFAULT_ATTRIBUTE_VALUES.get(attr, 0)
+
+    def list_connections(
+        self,
+        plug: str,
+        source: bool = True,
+        destination: bool = True,
+        node_type: Optional[str] = None,
+    ) -> list[str]:
+
+        node_name, attr = self._split_plug(plug)
+        self._get_node(node_name)
+
+        def matches(other_plug: str) -> bool:
+            if attr:
+                return other_plug == f"{node_name}.{attr}"
+
+            return self._split_plug(other_plug)[0] == node_name
+
+        nodes = []
+
+        for other_destination, other_source in self.connections.items():
+            if source and matches(other_destination):
+                nodes.append(self._split_plug(other_source)[0])
+
+            if destination and matches(other_source):
+                nodes.append(self._split_plug(other_destination)[0])
+
+        if node_type:
+            nodes = [name for name in nodes if self.nodes[name].node_type == node_type]
+
+        return nodes
+
+    def list_nodes(self, names: tuple[str, ...], node_type: Optional[str]) -> list[str]:
+        if names:
+            nodes = [self.nodes[name] for name in names if name in self.nodes]
+        else:
+            nodes = list(self.nodes.values())
+
+        if node_type:
+            nodes = [node for node in nodes if node.node_type == node_type]
+
+        return [node.name for node in nodes]
+
+    def load_plugin(self, plugin: str) -> None:
+        plugin = os.path.splitext(os.path.basename(plugin))[0]
+        self.loaded_plugins.add(plugin)
+
+    def restore(self, state: tuple[dict, dict]) -> None:
+        nodes, connections = state
+
+        self.nodes = {name: node for name, (node, _) in nodes.items()}
+        self.connections = dict(connections)
+
+        for node, attrs in nodes.values():
+            node.attrs = dict(attrs)
+
+    def snapshot(self) -> tuple[dict, dict]:
+        nodes = {name: (node, dict(node.attrs)) for name, node in self.nodes.items()}
+
+        return nodes, dict(self.connections)
+
+    def object_exists(self, name: str) -> bool:
+        node_name, attr = self._split_plug(name)
+        node = self.nodes.get(node_name)
+
+        if node is None:
+            return False
+
+        return (
+            not attr
+            or attr in node.attrs
+            or any(
+                plug == f"{node_name}.{attr}"
+                for plug in itertools.chain(self.connections, self.connections.values())
+            )
+        )
+
+    def remove_call_backs(self, call_back_ids: list[int]) -> None:
+        for call_back_id in call_back_ids:
+            self.call_backs.pop(call_back_id, None)
+
+    def rename(self, name: str, new_name: str) -> str:
+        node = self._get_node(name)
+        previous_name = node.name
+
+        del self.nodes[previous_name]
+        node.name = self._get_unique_name(new_name)
+        self.nodes[node.name] = node
+
+        for destination, source in list(self.connections.items()):
+            del self.connections[destination]
+
+            destination_node, destination_attr = self._split_plug(destination)
+            source_node, source_attr = self._split_plug(source)
+
+            if destination_node == previous_name:
+                destination = f"{node.name}.{destination_attr}"
+
+            if source_node == previous_name:
+                source = f"{node.name}.{source_attr}"
+
+            self.connections[destination] = source
+
+        self._notify("nameChanged", MObject(node), previous_name)
+
+        return node.name
+
+    def set_attr(self, plug: str, values: tuple, attr_type: Optional[str]) -> None:
+        node_name, attr = self._split_plug(plug)
+        node = self._get_node(node_name)
+
+        if not values:
+            raise RuntimeError(f"No value given for {plug!r}.")
+
+        if attr_type == "string" and not isinstance(values[0], str):
+            raise RuntimeError(f"Invalid string value for {plug!r}.")
+
+        if attr_type != "string" and isinstance(values[0], str):
+            raise RuntimeError(f"{plug!r} needs the string type flag.")
+
+        node.attrs[attr] = values[0] if len(values) == 1 else tuple(values)
+
+    def unload_plugin(self, plugin: str) -> None:
+        self.loaded_plugins.discard(plugin)
+
+
+class Latency:
+    REALISTIC = {
+        "colorManagementFileRules": 0.000_300,
+        "connectAttr": 0.000_250,
+        "delete": 0.000_600,
+        "displayError": 0.000_050,
+        "displayInfo": 0.000_050,
+        "displayWarning": 0.000_050,
+        "getAttr": 0.000_060,
+        "internalVar": 0.000_010,
+        "listConnections": 0.000_080,
+        "loadPlugin": 0.050_000,
+        "ls": 0.000_200,
+        "nodeType": 0.000_020,
+        "objExists": 0.000_030,
+        "pluginInfo": 0.000_100,
+        "refresh": 0.002_000,
+        "rename": 0.000_150,
+        "select": 0.000_050,
+        "setAttr": 0.000_120,
+        "sets": 0.000_900,
+        "shadingNode": 0.001_200,
+        "undoInfo": 0.000_020,
+    }
+
+    def __init__(self) -> None:
+        self.latencies = {}
+        self.scale = 1.0
+
+    def get_latency(self, command: str) -> float:
+        return self.latencies.get(command, 0.0) * self.scale
+
+    def set_latencies(self, latencies: dict[str, float]) -> None:
+        self.latencies = dict(latencies)
+
+    def set_realistic(self) -> None:
+        self.set_latencies(Latency.REALISTIC)
+
+    def set_scale(self, scale: float) -> None:
+        self.scale = max(0.0, scale)
+
+    def wait(self, command: str) -> None:
+        latency = self.get_latency(command)
+
+        if latency <= 0.0:
+            return
+
+        # Sleeping is far too coarse for sub-millisecond delays, so the remaining
+        # time is spun.
+        end_time = time.perf_counter() + latency
+
+        if latency > 0.002:
+            time.sleep(latency - 0.001)
+
+        while time.perf_counter() < end_time:
+            pass
+
+
+class MayaEmulator:
+    MODULE_NAMES = (
+        "maya",
+        "maya.cmds",
+        "maya.mel",
+        "maya.api",
+        "maya.api.OpenMaya",
+        "maya.OpenMayaUI",
+        "maya.standalone",
+    )
+
+    def __init__(self) -> None:
+        self.scene = Scene()
+        self.latency = Latency()
+        self.call_counts = {}
+
+        self.modules = {}
+        self._previous_modules = {}
+
+    def _call(self, command: str) -> None:
+        self.call_counts[command] = self.call_counts.get(command, 0) + 1
+        self.latency.wait(command)
+
+    def _create_cmds_module(self) -> types.ModuleType:
+        scene = self.scene
+        call = self._call
+
+        def colorManagementFileRules(
+            colorSpaceNames: bool = False,
+            colorSpaceFamilies: Optional[str] = None,
+            query: bool = False,
+        ) -> Optional[list[str]]:
+
+            call("colorManagementFileRules")
+
+            if colorSpaceNames:
+                return [color_space for color_space, _ in scene.color_spaces]
+
+            if colorSpaceFamilies is not None:
+                families = dict(scene.color_spaces)
+
+                if colorSpaceFamilies in families:
+                    return [families[colorSpaceFamilies]]
+
+            return None
+
+        def connectAttr(source: str, destination: str, force: bool = False) -> None:
+            call("connectAttr")
+            scene.connect(source, destination, force=force)
+
+        def delete(*names) -> None:
+            call("delete")
+
+            if len(names) == 1 and isinstance(names[0], (list, tuple)):
+                names = names[0]
+
+            scene.delete(list(names))
+
+        def getAttr(plug: str) -> Any:
+            call("getAttr")
+            value = scene.get_attr(plug)
+
+            return [value] if isinstance(value, tuple) else value
+
+        def internalVar(userPrefDir: bool = False, **kwargs) -> str:
+            call("internalVar")
+
+            return f"{scene.user_pref_dir}/".replace("\\", "/")
+
+        def listConnections(
+            plug: str,
+            source: bool = True,
+            destination: bool = True,
+            type: Optional[str] = None,
+            skipConversionNodes: bool = False,
+        ) -> Optional[list[str]]:
+
+            call("listConnections")
+
+            return (
+                scene.list_connections(
+                    plug, source=source, destination=destination, node_type=type
+                )
+                or None
+            )
+
+        def loadPlugin(plugin: str, quiet: bool = False) -> list[str]:
+            call("loadPlugin")
+            scene.load_plugin(plugin)
+
+            # Python plugins given by path are initialized so their commands exist.
+            if os.path.isfile(plugin):
+                self._initialize_plugin(plugin)
+
+            return [plugin]
+
+        def ls(*names, type: Optional[str] = None, **kwargs) -> list[str]:
+            call("ls")
+
+            return scene.list_nodes(names, type)
+
+        def nodeType(name: str) -> str:
+            call("nodeType")
+
+            return scene._get_node(name).node_type
+
+        def objExists(name: str) -> bool:
+            call("objExists")
+
+            return scene.object_exists(name)
+
+        def pluginInfo(
+            plugin: Optional[str] = None,
+            query: bool = False,
+            loaded: bool = False,
+            listPlugins: bool = False,
+        ) -> Any:
+
+            call("pluginInfo")
+
+            if listPlugins:
+                return sorted(scene.loaded_plugins)
+
+            if loaded:
+                plugin = os.path.splitext(os.path.basename(plugin or ""))[0]
+
+                return plugin in scene.loaded_plugins
+
+            return None
+
+        def refresh(suspend: Optional[bool] = None, **kwargs) -> None:
+            call("refresh")
+
+            if suspend is not None:
+                scene.refresh_suspended = suspend
+
+        def rename(name: str, new_name: str) -> str:
+            call("rename")
+
+            return scene.rename(name, new_name)
+
+        def select(*names, clear: bool = False, **kwargs) -> None:
+            call("select")
+
+            scene.selection = [] if clear else list(names)
+
+        def setAttr(plug: str, *values, type: Optional[str] = None) -> None:
+            call("setAttr")
+            scene.set_attr(plug, values, type)
+
+        def sets(
+            *names,
+            renderable: bool = False,
+            noSurfaceShader: bool = False,
+            empty: bool = False,
+            name: str = "",
+        ) -> str:
+
+            call("sets")
+
+            return scene.create_node("shadingEngine", name=name or "set1")
+
+        def shadingNode(
+            node_type: str,
+            name: str = "",
+            isColorManaged: bool = False,
+            **flags,
+        ) -> str:
+
+            call("shadingNode")
+
+            classifications = [
+                flag for flag in Scene.CLASSIFICATIONS if flags.pop(flag, False)
+            ]
+
+            if len(classifications) != 1 or flags:
+                raise RuntimeError(
+                    "shadingNode needs exactly one of asShader, asTexture or "
+                    "asUtility."
+                )
+
+            return scene.create_node(node_type, name=name)
+
+        def undoInfo(
+            query: bool = False,
+            state: Optional[bool] = None,
+            stateWithoutFlush: Optional[bool] = None,
+            chunkName: str = "",
+            openChunk: bool = False,
+            closeChunk: bool = False,
+        ) -> Optional[bool]:
+
+            call("undoInfo")
+
+            if query:
+                return scene.undo_state
+
+            if state is not None:
+                scene.undo_state = state
+                scene.undo_history.append(("state", state))
+
+            if stateWithoutFlush is not None:
+                scene.undo_state = stateWithoutFlush
+                scene.undo_history.append(("stateWithoutFlush", stateWithoutFlush))
+
+            if openChunk:
+                scene.undo_chunks.append(chunkName)
+                scene.undo_history.append(("openChunk", chunkName))
+            elif closeChunk:
+                if not scene.undo_chunks:
+                    raise RuntimeError("No undo chunk is open.")
+
+                scene.undo_history.append(("closeChunk", scene.undo_chunks.pop()))
+
+            return None
+
+        module = types.ModuleType("maya.cmds")
+        module.__dict__.update(
+            colorManagementFileRules=colorManagementFileRules,
+            connectAttr=connectAttr,
+            delete=delete,
+            getAttr=getAttr,
+            internalVar=internalVar,
+            listConnections=listConnections,
+            loadPlugin=loadPlugin,
+            ls=ls,
+            nodeType=nodeType,
+            objExists=objExists,
+            pluginInfo=pluginInfo,
+            refresh=refresh,
+            rename=rename,
+            select=select,
+            setAttr=setAttr,
+            sets=sets,
+            shadingNode=shadingNode,
+            undoInfo=undoInfo,
+        )
+
+        return module
+
+    def _create_open_maya_module(self) -> types.ModuleType:
+        scene = self.scene
+        call = self._call
+        register_command = self._register_command
+        deregister_command = self._deregister_command
+
+        class MGlobal:
+            @staticmethod
+            def displayError(message: str) -> None:
+                call("displayError")
+                scene.messages.append(("error", message))
+
+            @staticmethod
+            def displayInfo(message: str) -> None:
+                call("displayInfo")
+                scene.messages.append(("info", message))
+
+            @staticmethod
+            def displayWarning(message: str) -> None:
+                call("displayWarning")
+                scene.messages.append(("warning", message))
+
+        class MDGMessage:
+            @staticmethod
+            def addNodeAddedCallback(
+                function: Callable, node_type: str = "dependNode", *args
+            ) -> int:
+
+                return scene.add_call_back("nodeAdded", function, node_type)
+
+            @staticmethod
+            def addNodeRemovedCallback(
+                function: Callable, node_type: str = "dependNode", *args
+            ) -> int:
+
+                return scene.add_call_back("nodeRemoved", function, node_type)
+
+        class MNodeMessage:
+            @staticmethod
+            def addNameChangedCallback(node: MObject, function: Callable, *args) -> int:
+                if node.isNull():
+                    return scene.add_call_back("nameChanged", function)
+
+                def node_name_changed(other_node: MObject, *other_args) -> None:
+                    if other_node.node is node.node:
+                        function(other_node, *other_args)
+
+                return scene.add_call_back("nameChanged", node_name_changed)
+
+        class MMessage:
+            @staticmethod
+            def removeCallback(call_back_id: int) -> None:
+                scene.remove_call_backs([call_back_id])
+
+            @staticmethod
+            def removeCallbacks(call_back_ids: list[int]) -> None:
+                scene.remove_call_backs(call_back_ids)
+
+        class MSceneMessage(MMessage):
+            kAfterPluginLoad = 0
+            kAfterPluginUnload = 1
+
+            @staticmethod
+            def addStringArrayCallback(message: int, function: Callable, *args) -> int:
+                return scene.add_call_back(f"scene{message}", function)
+
+        class MFn:
+            kNumericAttribute = 0
+            kUnitAttribute = 1
+
+        class MFnNumericData:
+            kInt = 0
+            kFloat = 1
+            kDouble = 2
+
+        class MAttribute:
+            def __init__(self, name: str) -> None:
+                self.name = name
+
+            def hasFn(self, function_set: int) -> bool:
+                return function_set == MFn.kNumericAttribute
+
+        class MFnNumericAttribute:
+            def __init__(self, attribute: MAttribute) -> None:
+                self.attribute = attribute
+
+            def numericType(self) -> int:
+                if self.attribute.name in Scene.FLOAT_ATTRIBUTES:
+                    return MFnNumericData.kFloat
+
+                return MFnNumericData.kInt
+
+        class MPlug:
+            CHILD_SUFFIXES = "RGB"
+
+            def __init__(
+                self, node: Node, attr: str, parent: Optional[MPlug] = None
+            ) -> None:
+
+                self.node = node
+                self.attr = attr
+                self.parent = parent
+
+            def attribute(self) -> MAttribute:
+                return MAttribute(self.attr)
+
+            def child(self, index: int) -> MPlug:
+                return MPlug(
+                    self.node, f"{self.attr}{MPlug.CHILD_SUFFIXES[index]}", self
+                )
+
+            def elementByLogicalIndex(self, index: int) -> MPlug:
+                return MPlug(self.node, f"{self.attr}[{index}]")
+
+            def getExistingArrayAttributeIndices(self) -> list[int]:
+                return scene.get_array_indices(self.name())
+
+            def name(self) -> str:
+                return f"{self.node.name}.{self.attr}"
+
+        class MFnDependencyNode:
+            def __init__(self, node: MObject) -> None:
+                self.node = node
+
+            def findPlug(self, attr: str, want_networked_plug: bool) -> MPlug:
+                return MPlug(self.node.node, attr)
+
+            def name(self) -> str:
+                return self.node.node.name
+
+            def typeName(self) -> str:
+                return self.node.node.node_type
+
+        class MSelectionList:
+            def __init__(self) -> None:
+                self.nodes = []
+
+            def add(self, name: str) -> None:
+                self.nodes.append(scene._get_node(name))
+
+            def getDependNode(self, index: int) -> MObject:
+                return MObject(self.nodes[index])
+
+        class MDGModifier:
+            def __init__(self) -> None:
+                self.operations = []
+                self.undo_state = None
+
+            def _set_value(self, plug: MPlug, value: Any) -> None:
+                self.operations.append(("setAttr", plug, value))
+
+            def connect(self, source: MPlug, destination: MPlug) -> None:
+                self.operations.append(("connectAttr", source, destination))
+
+            def createNode(self, node_type: str) -> MObject:
+                if node_type not in scene._get_node_types():
+                    raise RuntimeError(f"Unknown object type: {node_type}")
+
+                node = Node(f"{node_type}1", node_type)
+                self.operations.append(("createNode", node, None))
+
+                return MObject(node)
+
+            def deleteNode(self, node: MObject) -> None:
+                self.operations.append(("delete", node.node, None))
+
+            def doIt(self) -> None:
+                call("MDGModifier.doIt")
+
+                self.undo_state = scene.snapshot()
+
+                for operation, target, value in self.operations:
+                    if operation == "createNode":
+                        target.name = scene._get_unique_name(target.name)
+                        scene.nodes[target.name] = target
+                        scene._notify("nodeAdded", MObject(target))
+                    elif operation == "rename":
+                        scene.rename(target.name, value)
+                    elif operation == "delete":
+                        scene.delete([target.name])
+                    elif operation == "connectAttr":
+                        scene.connect(target.name(), value.name())
+                    elif target.parent is not None:
+                        parent_value = list(
+                            target.node.attrs.get(target.parent.attr, (0, 0, 0))
+                        )
+                        parent_value[MPlug.CHILD_SUFFIXES.index(target.attr[-1])] = (
+                            value
+                        )
+                        target.node.attrs[target.parent.attr] = tuple(parent_value)
+                    else:
+                        target.node.attrs[target.attr] = value
+
+            def newPlugValueBool(self, plug: MPlug, value: bool) -> None:
+                self._set_value(plug, bool(value))
+
+            def newPlugValueDouble(self, plug: MPlug, value: float) -> None:
+                self._set_value(plug, float(value))
+
+            def newPlugValueInt(self, plug: MPlug, value: int) -> None:
+                self._set_value(plug, int(value))
+
+            def newPlugValueString(self, plug: MPlug, value: str) -> None:
+                self._set_value(plug, str(value))
+
+            def renameNode(self, node: MObject, name: str) -> None:
+                # Nodes are only named once they exist, as Maya does on doIt.
+                if self.operations and self.operations[-1][1] is node.node:
+                    node.node.name = name
+                else:
+                    self.operations.append(("rename", node.node, name))
+
+            def undoIt(self) -> None:
+                if self.undo_state is not None:
+                    scene.restore(self.undo_state)
+                    self.undo_state = None
+
+        class MArgList:
+            pass
+
+        class MPxCommand:
+            pass
+
+        class MFnPlugin:
+            def __init__(self, plugin: MObject, vendor: str = "", *args) -> None:
+                self.plugin = plugin
+
+            def deregisterCommand(self, command: str) -> None:
+                deregister_command(command)
+
+            def registerCommand(self, command: str, creator: Callable) -> None:
+                register_command(command, creator)
+
+        module = types.ModuleType("maya.api.OpenMaya")
+        module.__dict__.update(
+            MArgList=MArgList,
+            MDGMessage=MDGMessage,
+            MDGModifier=MDGModifier,
+            MFn=MFn,
+            MFnDependencyNode=MFnDependencyNode,
+            MFnNumericAttribute=MFnNumericAttribute,
+            MFnNumericData=MFnNumericData,
+            MFnPlugin=MFnPlugin,
+            MGlobal=MGlobal,
+            MMessage=MMessage,
+            MNodeMessage=MNodeMessage,
+            MObject=MObject,
+            MPlug=MPlug,
+            MPxCommand=MPxCommand,
+            MSceneMessage=MSceneMessage,
+            MSelectionList=MSelectionList,
+        )
+
+        return module
+
+    def _deregister_command(self, command: str) -> None:
+        cmds = self.modules["maya.cmds"]
+
+        if hasattr(cmds, command):
+            delattr(cmds, command)
+
+    def _initialize_plugin(self, plugin_path: str) -> None:
+        name = os.path.splitext(os.path.basename(plugin_path))[0]
+        spec = importlib.util.spec_from_file_location(name, plugin_path)
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+
+        module.initializePlugin(MObject())
+
+    def _register_command(self, command: str, creator: Callable) -> None:
+        call = self._call
+
+        # Commands run doIt right away, which is all the plugins here need.
+        def run_command(*args, **kwargs) -> None:
+            call(command)
+            creator().doIt(self.modules["maya.api.OpenMaya"].MArgList())
+
+        setattr(self.modules["maya.cmds"], command, run_command)
+
+    def install(self) -> MayaEmulator:
+        modules = {name: types.ModuleType(name) for name in MayaEmulator.MODULE_NAMES}
+        modules["maya.cmds"] = self._create_cmds_module()
+        modules["maya.api.OpenMaya"] = self._create_open_maya_module()
+        modules["maya.mel"].eval = lambda command: None
+        modules["maya.standalone"].initialize = lambda name="python": None
+        modules["maya.standalone"].uninitialize = lambda: None
+
+        for name in MayaEmulator.MODULE_NAMES:
+            parent_name, _, child_name = name.rpartition(".")
+
+            if parent_name:
+                setattr(modules[parent_name], child_name, modules[name])
+
+        for name, module in modules.items():
+            self._previous_modules.setdefault(name, sys.modules.get(name))
+            sys.modules[name] = module
+
+        self.modules = modules
+
+        return self
+
+    def reset(self) -> None:
+        scene = Scene()
+
+        # Functions handed out by the modules hold on to the scene, so its state is
+        # swapped in place.
+        self.scene.__dict__.clear()
+        self.scene.__dict__.update(scene.__dict__)
+
+        self.call_counts = {}
+
+    def uninstall(self) -> None:
+        for name, module in self._previous_modules.items():
+            if module is None:
+                sys.modules.pop(name, None)
+            else:
+                sys.modules[name] = module
+
+        self._previous_modules = {}
+        self.modules = {}
+
+
+_emulator = None
+
+
+def get_emulator() -> MayaEmulator:
+    global _emulator
+
+    if _emulator is None:
+        _emulator = MayaEmulator().install()
+
+    return _emulator
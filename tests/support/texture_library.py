@@ -0,0 +1,237 @@
+"""
+========================================================================================
+Name: texture_library.py
+Author: Mauricio Gonzalez Soto
+Updated Date: 10-16-2026
+
+Copyright (C) 2024 Mauricio Gonzalez Soto. All rights reserved.
+========================================================================================
+"""
+
+from __future__ import annotations
+
+import random
+import os
+
+from texture_connector.config import UVTilingModes
+from texture_connector.config import TextureMaps
+
+
+class TextureLibrary:
+    def __init__(self, root_path: str) -> None:
+        self.root_path = root_path
+
+        self.materials = {}
+        self.directory_count = 0
+        self.file_count = 0
+        self.image_count = 0
+        self.junk_count = 0
+        self.symlink_count = 0
+
+    def get_texture_count(self) -> int:
+        return sum(len(texture_maps) for texture_maps in self.materials.values())
+
+
+class TextureLibraryGenerator:
+    TEXTURE_MAPS_SUFFIX = (
+        (TextureMaps.BASE_COLOR, "basecolor"),
+        (TextureMaps.ROUGHNESS, "roughness"),
+        (TextureMaps.METALNESS, "metallic"),
+        (TextureMaps.NORMAL, "normal"),
+        (TextureMaps.HEIGHT, "height"),
+        (TextureMaps.EMISSIVE, "emissive"),
+        (TextureMaps.OPACITY, "opacity"),
+    )
+
+    NAMING_CONVENTIONS = ("snake", "camel", "resolution", "version")
+    IMAGE_EXTENSIONS = (".png", ".exr", ".tif", ".jpg")
+
+    JUNK_FILE_NAMES = (
+        "readme.txt",
+        "material.json",
+        "source.psd",
+        "preview.jpg",
+        "thumbnail.png",
+        ".DS_Store",
+        "Thumbs.db",
+    )
+
+    TILE_FORMATS = {
+        UVTilingModes.MARI: "{name}.{udim}",
+        UVTilingModes.ZBRUSH: "{name}_u{u}_v{v}",
+        UVTilingModes.MUDBOX: "{name}_u{u1}_v{v1}",
+    }
+
+    def __init__(
+        self,
+        material_count: int = 100,
+        maps_per_material: int = 4,
+        tile_count: int = 1,
+        uv_tiling_mode: str = UVTilingModes.MARI,
+        depth: int = 2,
+        materials_per_directory: int = 1,
+        naming_conventions: tuple[str, ...] = NAMING_CONVENTIONS,
+        junk_per_directory: int = 2,
+        symlink_count: int = 0,
+        seed: int = 0,
+    ) -> None:
+
+        self.material_count = material_count
+        self.maps_per_material = max(
+            1, min(maps_per_material, len(TextureLibraryGenerator.TEXTURE_MAPS_SUFFIX))
+        )
+        self.tile_count = max(1, tile_count)
+        self.uv_tiling_mode = uv_tiling_mode
+        self.depth = max(0, depth)
+        self.materials_per_directory = max(1, materials_per_directory)
+        self.naming_conventions = naming_conventions
+        self.junk_per_directory = junk_per_directory
+        self.symlink_count = symlink_count
+        self.seed = seed
+
+    def _create_symlinks(
+        self, library: TextureLibrary, directory_paths: list[str], rng: random.Random
+    ) -> None:
+
+        if not directory_paths or not hasattr(os, "symlink"):
+            return
+
+        for i in range(self.symlink_count):
+            directory_path = rng.choice(directory_paths)
+            link_path = os.path.join(directory_path, f"link_{i:04d}")
+
+            # Alternates between loops back to an ancestor and links to other assets.
+            if i % 2:
+                target_path = os.path.dirname(directory_path)
+            else:
+                target_path = rng.choice(directory_paths)
+
+            try:
+                os.symlink(target_path, link_path, target_is_directory=True)
+            except OSError:
+                return
+
+            library.symlink_count += 1
+
+    def _get_directory_path(self, root_path: str, index: int) -> str:
+        directory_index = index // self.materials_per_directory
+        parts = [f"category_{directory_index % 10:02d}"]
+
+        # Every level below the category splits the directories further, so deep
+        # trees still spread their assets out instead of forming a single chain.
+        for level in range(1, self.depth):
+            parts.append(f"group_{(directory_index >> (level * 3)) % 8:d}")
+
+        parts.append(f"asset_{directory_index:06d}")
+
+        return os.path.join(root_path, *parts)
+
+    @staticmethod
+    def _get_file_stem(
+        material_name: str, suffix: str, naming_convention: str, rng: random.Random
+    ) -> str:
+
+        if naming_convention == "camel":
+            suffix = suffix.capitalize()
+        elif naming_convention == "resolution":
+            suffix = f"{suffix}_{rng.choice(('1k', '2k', '4k', '8k'))}"
+        elif naming_convention == "version":
+            suffix = f"{suffix}_v{rng.randint(1, 9):03d}"
+
+        return f"{material_name}_{suffix}"
+
+    @staticmethod
+    def _get_material_name(index: int, naming_convention: str) -> str:
+        if naming_convention == "camel":
+            return f"Material{index:06d}"
+
+        return f"material_{index:06d}"
+
+    def _get_tile_stems(self, stem: str) -> list[str]:
+        tile_format = TextureLibraryGenerator.TILE_FORMATS.get(self.uv_tiling_mode)
+
+        if self.tile_count == 1 or tile_format is None:
+            return [stem]
+
+        stems = []
+
+        for i in range(self.tile_count):
+            u, v = i % 10, i // 10
+            stems.append(
+                tile_format.format(
+                    name=stem, udim=1001 + i, u=u, v=v, u1=u + 1, v1=v + 1
+                )
+            )
+
+        return stems
+
+    def generate(self, root_path: str) -> TextureLibrary:
+        rng = random.Random(self.seed)
+        library = TextureLibrary(root_path)
+        directory_paths = []
+        created_directory_paths = set()
+
+        for i in range(self.material_count):
+            directory_path = self._get_directory_path(root_path, i)
+
+            if directory_path not in created_directory_paths:
+                os.makedirs(directory_path, exist_ok=True)
+                created_directory_paths.add(directory_path)
+                directory_paths.append(directory_path)
+
+                for junk_file_name in rng.sample(
+                    TextureLibraryGenerator.JUNK_FILE_NAMES,
+                    min(
+                        self.junk_per_directory,
+                        len(TextureLibraryGenerator.JUNK_FILE_NAMES),
+                    ),
+                ):
+                    with open(os.path.join(directory_path, junk_file_name), "wb"):
+                        pass
+
+                    library.junk_count += 1
+
+            naming_convention = self.naming_conventions[
+                i % len(self.naming_conventions)
+            ]
+            material_name = self._get_material_name(i, naming_convention)
+            extension = rng.choice(TextureLibraryGenerator.IMAGE_EXTENSIONS)
+            texture_maps = rng.sample(
+                TextureLibraryGenerator.TEXTURE_MAPS_SUFFIX, self.maps_per_material
+            )
+
+            library.materials[material_name] = {}
+
+            for texture_map, suffix in texture_maps:
+                stem = self._get_file_stem(
+                    material_name, suffix, naming_convention, rng
+                )
+                tile_stems = self._get_tile_stems(stem)
+
+                for tile_stem in tile_stems:
+                    with open(
+                        os.path.join(directory_path, f"{tile_stem}{extension}"), "wb"
+                    ):
+                        pass
+
+                library.materials[material_name][texture_map] = os.path.join(
+                    directory_path, f"{tile_stems[0]}{extension}"
+                )
+                library.image_count += len(tile_stems)
+
+        self._create_symlinks(library, directory_paths, rng)
+
+        directories = {root_path}
+
+        for directory_path in directory_paths:
+            while directory_path not in directories:
+                directories.add(directory_path)
+                directory_path = os.path.dirname(directory_path)
+
+        library.directory_count = len(directories)
+        library.file_count = library.image_count + library.junk_count
+
+        return library
+
+    def get_texture_maps_suffix(self) -> tuple[tuple[str, str], ...]:
+        return TextureLibraryGenerator.TEXTURE_MAPS_SUFFIX
@@ -0,0 +1,184 @@
+"""
+========================================================================================
+Name: test_batch.py
+Author: Mauricio Gonzalez Soto
+Updated Date: 10-17-2026
+
+Copyright (C) 2024 Mauricio Gonzalez Soto. All rights reserved.
+========================================================================================
+"""
+
+from __future__ import annotations
+
+import os
+
+import pytest
+
+from texture_connector.__main__ import main
+from texture_connector.batch import MaterialBatch
+from texture_connector.config import RenderPlugins
+from texture_connector.config import TextureMaps
+
+
+def create_files(root_path: str, file_names: tuple[str, ...]) -> None:
+    for file_name in file_names:
+        file_path = os.path.join(root_path, file_name)
+        os.makedirs(os.path.dirname(file_path), exist_ok=True)
+
+        with open(file_path, "wb"):
+            pass
+
+
+@pytest.fixture
+def folder_path(tmp_path) -> str:
+    folder_path = str(tmp_path)
+    create_files(
+        folder_path,
+        (
+            "wood_basecolor.png",
+            "wood_roughness.png",
+            "stone/stone_basecolor.png",
+            "stone/stone_normal.png",
+        ),
+    )
+
+    return folder_path
+
+
+def create_material_batch(folder_path: str) -> MaterialBatch:
+    material_batch = MaterialBatch()
+    material_batch.set_folder_path(folder_path)
+
+    return material_batch
+
+
+def test_scan(folder_path):
+    assert create_material_batch(folder_path).scan() == {
+        "stone": {
+            TextureMaps.BASE_COLOR: os.path.join(
+                folder_path, "stone", "stone_basecolor.png"
+            ),
+            TextureMaps.NORMAL: os.path.join(folder_path, "stone", "stone_normal.png"),
+        },
+        "wood": {
+            TextureMaps.BASE_COLOR: os.path.join(folder_path, "wood_basecolor.png"),
+            TextureMaps.ROUGHNESS: os.path.join(folder_path, "wood_roughness.png"),
+        },
+    }
+
+
+def test_scan_keeps_last_file(folder_path):
+    create_files(folder_path, ("v2/wood_basecolor.png", "a/wood_basecolor.png"))
+
+    textures = create_material_batch(folder_path).scan()["wood"]
+
+    assert textures[TextureMaps.BASE_COLOR] == os.path.join(
+        folder_path, "wood_basecolor.png"
+    )
+
+    create_files(folder_path, ("wood_basecolor.tif",))
+
+    textures = create_material_batch(folder_path).scan()["wood"]
+
+    assert textures[TextureMaps.BASE_COLOR] == os.path.join(
+        folder_path, "wood_basecolor.tif"
+    )
+
+
+def test_scan_with_suffixes(folder_path):
+    material_batch = create_material_batch(folder_path)
+    material_batch.set_texture_map_suffix(TextureMaps.BASE_COLOR, "")
+    material_batch.set_texture_map_suffix(TextureMaps.NORMAL, "nrm")
+    material_batch.set_search_files_in_subdirectories(False)
+
+    assert material_batch.scan() == {
+        "wood": {
+            TextureMaps.ROUGHNESS: os.path.join(folder_path, "wood_roughness.png"),
+        }
+    }
+
+
+@pytest.mark.parametrize("use_modifier_builder", (False, True))
+def test_build(maya_emulator, folder_path, use_modifier_builder):
+    scene = maya_emulator.scene
+    material_batch = create_material_batch(folder_path)
+    material_batch.set_use_modifier_builder(use_modifier_builder)
+    material_batch.set_texture_map_color_space(TextureMaps.BASE_COLOR, "ACEScg")
+
+    assert material_batch.build() == 2
+    assert material_batch.get_updated_count() == 0
+    assert scene.get_attr("wood_basecolor_file.colorSpace") == "ACEScg"
+    assert scene.get_attr("stone_normal_file.fileTextureName") == os.path.join(
+        folder_path, "stone", "stone_normal.png"
+    )
+    assert scene.connections["woodSG.surfaceShader"] == (
+        "wood_aiStandardSurface.outColor"
+    )
+
+    # Existing materials are skipped unless they are updated.
+    assert material_batch.build() == 0
+
+    material_batch.set_update_existing_materials(True)
+
+    assert material_batch.build() == 0
+    assert material_batch.get_updated_count() == 2
+
+
+def test_build_loads_render_plugin(maya_emulator, folder_path):
+    maya_emulator.scene.unload_plugin("redshift4maya")
+
+    material_batch = create_material_batch(folder_path)
+    material_batch.set_render_engine(RenderPlugins.REDSHIFT.value[0])
+
+    assert material_batch.build() == 2
+    assert "redshift4maya" in maya_emulator.scene.loaded_plugins
+    assert maya_emulator.scene.nodes["wood_RedshiftStandardMaterial"]
+
+
+def test_build_unsupported_render_engine(folder_path):
+    material_batch = create_material_batch(folder_path)
+    material_batch.set_render_engine("Cycles")
+
+    with pytest.raises(ValueError):
+        material_batch.build()
+
+
+def test_main(maya_emulator, folder_path):
+    scene = maya_emulator.scene
+
+    assert (
+        main(
+            [
+                folder_path,
+                "--render-engine",
+                RenderPlugins.V_RAY.value[0],
+                "--suffix",
+                "normal=",
+                "--color-space",
+                "roughness=ACEScg",
+            ]
+        )
+        == 0
+    )
+    assert scene.list_nodes((), "VRayMtl") == ["stone_VRayMtl", "wood_VRayMtl"]
+    assert scene.get_attr("wood_roughness_file.colorSpace") == "ACEScg"
+    assert "stone_normal_file" not in scene.nodes
+
+    assert not scene.undo_chunks
+    assert scene.undo_state
+
+
+def test_main_exit_code(maya_emulator, folder_path):
+    assert main([folder_path]) == 0
+
+    # Nothing left to create fails the run, updating existing materials does not.
+    assert main([folder_path]) == 1
+    assert main([folder_path, "--update-existing"]) == 0
+    assert main([os.path.join(folder_path, "missing")]) == 1
+
+
+def test_main_invalid_texture_map(folder_path, capsys):
+    with pytest.raises(SystemExit):
+        main([folder_path, "--suffix", "diffuse=diff"])
+
+    assert "--suffix expects MAP=VALUE" in capsys.readouterr().err
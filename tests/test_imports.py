@@ -0,0 +1,71 @@
+"""
+========================================================================================
+Name: test_imports.py
+Author: Mauricio Gonzalez Soto
+Updated Date: 10-17-2026
+
+Copyright (C) 2024 Mauricio Gonzalez Soto. All rights reserved.
+========================================================================================
+"""
+
+from __future__ import annotations
+
+import subprocess
+import json
+import sys
+import os
+
+import pytest
+
+ROOT_PATH = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+FORBIDDEN_MODULE_PREFIXES = (
+    "PySide2",
+    "PySide6",
+    "shiboken2",
+    "shiboken6",
+    "maya",
+    "texture_connector.gui",
+)
+
+
+def get_imported_modules(module: str) -> list[str]:
+    environment = dict(os.environ)
+    environment["PYTHONPATH"] = os.pathsep.join(
+        filter(None, (ROOT_PATH, environment.get("PYTHONPATH")))
+    )
+
+    # Runs in a fresh interpreter, the test session already has the Maya emulator
+    # and possibly PySide loaded.
+    process = subprocess.run(
+        [
+            sys.executable,
+            "-c",
+            f"import json, sys, {module}; print(json.dumps(sorted(sys.modules)))",
+        ],
+        capture_output=True,
+        check=True,
+        env=environment,
+        text=True,
+    )
+
+    return json.loads(process.stdout)
+
+
+@pytest.mark.parametrize(
+    "module",
+    (
+        "texture_connector",
+        "texture_connector.config",
+        "texture_connector.core",
+        "texture_connector.utils",
+        "texture_connector.utils.logger",
+    ),
+)
+def test_import_is_headless(module):
+    imported_modules = get_imported_modules(module)
+
+    assert module in imported_modules
+    assert [
+        name for name in imported_modules if name.startswith(FORBIDDEN_MODULE_PREFIXES)
+    ] == []
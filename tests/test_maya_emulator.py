@@ -0,0 +1,137 @@
+"""
+========================================================================================
+Name: test_maya_emulator.py
+Author: Mauricio Gonzalez Soto
+Updated Date: 10-16-2026
+
+Copyright (C) 2024 Mauricio Gonzalez Soto. All rights reserved.
+========================================================================================
+"""
+
+from __future__ import annotations
+
+import time
+
+import maya.api.OpenMaya as om
+import maya.cmds as cmds
+import pytest
+
+from texture_connector.utils import ColorSpaceCatalog
+import texture_connector.utils as utils
+
+
+def test_unique_names(maya_emulator):
+    assert cmds.shadingNode("file", name="wood_file", asTexture=True) == "wood_file"
+    assert cmds.shadingNode("file", name="wood_file", asTexture=True) == "wood_file1"
+    assert cmds.shadingNode("file", name="wood_file", asTexture=True) == "wood_file2"
+    assert cmds.sets(renderable=True, empty=True, name="woodSG") == "woodSG"
+    assert cmds.ls(type="file") == ["wood_file", "wood_file1", "wood_file2"]
+
+
+def test_errors(maya_emulator):
+    cmds.shadingNode("file", name="wood_file", asTexture=True)
+    cmds.shadingNode("place2dTexture", name="wood_place2dTexture", asUtility=True)
+
+    with pytest.raises(RuntimeError):
+        cmds.shadingNode("file", name="stone_file")
+
+    with pytest.raises(RuntimeError):
+        cmds.setAttr("stone_file.fileTextureName", "", type="string")
+
+    with pytest.raises(RuntimeError):
+        cmds.setAttr("wood_file.fileTextureName", "/textures/wood.png")
+
+    maya_emulator.scene.unload_plugin("mtoa")
+
+    with pytest.raises(RuntimeError):
+        cmds.shadingNode("aiStandardSurface", name="wood", asShader=True)
+
+    cmds.connectAttr("wood_place2dTexture.outUV", "wood_file.uv")
+
+    with pytest.raises(RuntimeError):
+        cmds.connectAttr("wood_place2dTexture.outUV", "wood_file.uv")
+
+    cmds.connectAttr("wood_place2dTexture.outUV", "wood_file.uv", force=True)
+
+
+def test_connections(maya_emulator):
+    cmds.shadingNode("file", name="wood_file", asTexture=True)
+    cmds.shadingNode("place2dTexture", name="wood_place2dTexture", asUtility=True)
+    cmds.connectAttr("wood_place2dTexture.outUV", "wood_file.uv")
+
+    assert cmds.objExists("wood_file.uv")
+    assert cmds.listConnections("wood_file.uv", destination=False) == [
+        "wood_place2dTexture"
+    ]
+    assert cmds.listConnections("wood_file.uv", source=False) is None
+    assert cmds.listConnections("wood_place2dTexture", type="file") == ["wood_file"]
+
+    cmds.delete(["wood_place2dTexture"])
+
+    assert not cmds.objExists("wood_place2dTexture")
+    assert not maya_emulator.scene.connections
+
+
+def test_undo(maya_emulator):
+    cmds.undoInfo(chunkName="test", openChunk=True)
+    cmds.undoInfo(stateWithoutFlush=False)
+
+    assert not cmds.undoInfo(query=True, state=True)
+
+    cmds.undoInfo(stateWithoutFlush=True)
+    cmds.undoInfo(chunkName="test", closeChunk=True)
+
+    assert not maya_emulator.scene.undo_chunks
+
+    with pytest.raises(RuntimeError):
+        cmds.undoInfo(chunkName="test", closeChunk=True)
+
+
+def test_plugins(maya_emulator):
+    maya_emulator.scene.unload_plugin("lookdevKit")
+
+    assert "lookdevKit" not in cmds.pluginInfo(listPlugins=True, query=True)
+
+    cmds.loadPlugin("lookdevKit.py")
+
+    assert cmds.pluginInfo("lookdevKit", query=True, loaded=True)
+
+
+def test_color_space_catalog(maya_emulator):
+    assert ColorSpaceCatalog.has_color_space("ACEScg")
+    assert ColorSpaceCatalog.get_color_space_families()["ACES"] == (
+        "ACEScg",
+        "ACES2065-1",
+    )
+
+
+def test_messages(maya_emulator):
+    utils.Logger.warning("Missing texture.")
+    om.MGlobal.displayInfo("Done.")
+
+    assert maya_emulator.scene.messages == [
+        ("warning", "[Texture Connector] Missing texture."),
+        ("info", "Done."),
+    ]
+
+
+def test_internal_var(maya_emulator):
+    assert cmds.internalVar(userPrefDir=True).endswith("/")
+    assert utils.get_preferences_path().startswith(cmds.internalVar(userPrefDir=True))
+
+
+def test_latency(maya_emulator):
+    maya_emulator.latency.set_latencies({"setAttr": 0.001})
+    cmds.shadingNode("file", name="wood_file", asTexture=True)
+
+    start_time = time.perf_counter()
+
+    for _ in range(20):
+        cmds.setAttr("wood_file.alphaIsLuminance", True)
+
+    assert time.perf_counter() - start_time >= 0.02
+    assert maya_emulator.call_counts == {"shadingNode": 1, "setAttr": 20}
+
+    maya_emulator.latency.set_scale(0.0)
+
+    assert maya_emulator.latency.get_latency("setAttr") == 0.0
@@ -0,0 +1,79 @@
+"""
+========================================================================================
+Name: test_texture_library.py
+Author: Mauricio Gonzalez Soto
+Updated Date: 10-16-2026
+
+Copyright (C) 2024 Mauricio Gonzalez Soto. All rights reserved.
+========================================================================================
+"""
+
+from __future__ import annotations
+
+import pytest
+
+from texture_connector.core import TextureScanner
+from texture_connector.config import UVTilingModes
+from tests.support.texture_library import TextureLibraryGenerator
+
+
+def scan(root_path: str, uv_tiling_mode: str, workers: int = 1) -> dict:
+    scanner = TextureScanner()
+    scanner.set_folder_path(root_path)
+    scanner.set_texture_maps_suffix(TextureLibraryGenerator.TEXTURE_MAPS_SUFFIX)
+    scanner.set_uv_tiling_mode(uv_tiling_mode)
+    scanner.set_workers(workers)
+
+    return scanner.get_material_texture_paths()
+
+
+@pytest.mark.parametrize("workers", (1, 4))
+def test_scan_matches_library(tmp_path, workers):
+    generator = TextureLibraryGenerator(
+        material_count=60, maps_per_material=3, depth=3, materials_per_directory=2
+    )
+    library = generator.generate(str(tmp_path))
+
+    material_texture_paths = scan(str(tmp_path), UVTilingModes.OFF, workers)
+
+    assert library.image_count == 180
+    assert library.get_texture_count() == 180
+    assert {
+        material_name: dict(textures)
+        for material_name, textures in material_texture_paths.items()
+    } == library.materials
+
+
+@pytest.mark.parametrize(
+    "uv_tiling_mode", (UVTilingModes.MARI, UVTilingModes.ZBRUSH, UVTilingModes.MUDBOX)
+)
+def test_scan_collapses_tiles(tmp_path, uv_tiling_mode):
+    generator = TextureLibraryGenerator(
+        material_count=20, tile_count=12, uv_tiling_mode=uv_tiling_mode
+    )
+    library = generator.generate(str(tmp_path))
+
+    material_texture_paths = scan(str(tmp_path), uv_tiling_mode)
+
+    assert library.image_count == 20 * 4 * 12
+    assert {
+        material_name: dict(textures)
+        for material_name, textures in material_texture_paths.items()
+    } == library.materials
+
+
+def test_scan_with_symlinks(tmp_path):
+    generator = TextureLibraryGenerator(material_count=30, symlink_count=6)
+    library = generator.generate(str(tmp_path))
+
+    if not library.symlink_count:
+        pytest.skip("Symbolic links are not supported.")
+
+    material_texture_paths = scan(str(tmp_path), UVTilingModes.OFF)
+
+    assert set(material_texture_paths) == set(library.materials)
+
+    for material_name, textures in material_texture_paths.items():
+        assert {texture_map for texture_map, _ in textures} == set(
+            library.materials[material_name]
+        )
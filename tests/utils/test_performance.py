@@ -0,0 +1,94 @@
+"""
+========================================================================================
+Name: test_performance.py
+Author: Mauricio Gonzalez Soto
+Updated Date: 10-16-2026
+
+Copyright (C) 2024 Mauricio Gonzalez Soto. All rights reserved.
+========================================================================================
+"""
+
+from __future__ import annotations
+
+import json
+import os
+
+import pytest
+
+from texture_connector.core import TextureScanner
+from texture_connector.config import TextureMaps
+from texture_connector.utils import PerformanceMonitor
+
+
+@pytest.fixture(autouse=True)
+def performance_monitor():
+    PerformanceMonitor.reset()
+    PerformanceMonitor.set_enabled(True)
+
+    yield PerformanceMonitor
+
+    PerformanceMonitor.reset()
+    PerformanceMonitor.set_enabled(True)
+
+
+def test_timer_records_phase():
+    for _ in range(3):
+        with PerformanceMonitor.timer("phase"):
+            pass
+
+    phase = PerformanceMonitor.get_phases()["phase"]
+
+    assert phase.count == 3
+    assert phase.max_time >= phase.last_time >= 0.0
+    assert phase.get_average_time() == pytest.approx(phase.total_time / 3)
+
+
+def test_counters():
+    PerformanceMonitor.increment("counter")
+    PerformanceMonitor.increment("counter", 4)
+    PerformanceMonitor.set_counter("other", 7)
+
+    assert PerformanceMonitor.get_counters() == {"counter": 5, "other": 7}
+
+
+def test_disabled_records_nothing():
+    PerformanceMonitor.set_enabled(False)
+    PerformanceMonitor.add_time("phase", 1.0)
+    PerformanceMonitor.increment("counter")
+
+    assert PerformanceMonitor.get_phases() == {}
+    assert PerformanceMonitor.get_counters() == {}
+
+
+def test_export(tmp_path):
+    PerformanceMonitor.add_time("phase", 0.5)
+    file_path = str(tmp_path / "report.json")
+
+    PerformanceMonitor.export(file_path)
+
+    with open(file_path) as f:
+        report = json.load(f)
+
+    assert report["phases"]["phase"]["count"] == 1
+    assert report["phases"]["phase"]["total"] == pytest.approx(0.5)
+
+
+def test_scanner_is_instrumented(tmp_path):
+    for suffix in ("basecolor", "roughness"):
+        with open(os.path.join(tmp_path, f"wood_{suffix}.png"), "wb"):
+            pass
+
+    scanner = TextureScanner()
+    scanner.set_folder_path(str(tmp_path))
+    scanner.set_texture_maps_suffix(
+        ((TextureMaps.BASE_COLOR, "basecolor"), (TextureMaps.ROUGHNESS, "roughness"))
+    )
+    scanner.get_material_texture_paths()
+
+    phases = PerformanceMonitor.get_phases()
+
+    assert PerformanceMonitor.CLASSIFY_TEXTURES in phases
+    assert PerformanceMonitor.GET_MATERIAL_TEXTURE_PATHS in phases
+    assert (
+        PerformanceMonitor.get_counters()[PerformanceMonitor.TEXTURES_CLASSIFIED] == 2
+    )
@@ -0,0 +1,177 @@
+"""
+========================================================================================
+Name: test_profiler.py
+Author: Mauricio Gonzalez Soto
+Updated Date: 10-16-2026
+
+Copyright (C) 2024 Mauricio Gonzalez Soto. All rights reserved.
+========================================================================================
+"""
+
+from __future__ import annotations
+
+import json
+
+import maya.api.OpenMaya as om
+import pytest
+
+from texture_connector.core import CreateMaterialNetworkArnold
+from texture_connector.core import CreateMaterialNetworkVRay
+from texture_connector.config import UVTilingModes
+from texture_connector.utils import Profiler
+from texture_connector.utils import profile
+
+
+class FakeProfilingScope:
+    scopes = []
+
+    def __init__(self, category: int, color: int, name: str) -> None:
+        self.category = category
+        self.name = name
+
+    def __enter__(self) -> FakeProfilingScope:
+        FakeProfilingScope.scopes.append((self.category, self.name))
+
+        return self
+
+    def __exit__(self, *args) -> None:
+        pass
+
+
+class FakeProfiler:
+    kColorC_L1 = 7
+
+    categories = []
+
+    @classmethod
+    def addCategory(cls, name: str, description: str) -> int:
+        cls.categories.append(name)
+
+        return len(cls.categories)
+
+
+@pytest.fixture(autouse=True)
+def profiler():
+    Profiler.stop()
+    Profiler.clear()
+
+    yield Profiler
+
+    Profiler.stop()
+    Profiler.clear()
+    Profiler._maya_loaded = False
+
+
+def create_material(material_network_class: type, use_triplanar: bool = False) -> None:
+    material_network = material_network_class()
+    material_network.set_base_color_settings(
+        "sRGB", "/textures/wood_basecolor.png", "basecolor"
+    )
+    material_network.set_roughness_settings(
+        "Raw", "/textures/wood_roughness.png", "roughness"
+    )
+    material_network.set_normal_settings("Raw", "/textures/wood_normal.png", "normal")
+    material_network.create(
+        name="wood",
+        use_maya_color_space_rules=False,
+        use_triplanar=use_triplanar,
+        uv_tiling_mode=UVTilingModes.OFF,
+    )
+
+
+def test_fallback_without_maya_profiler():
+    assert not Profiler.has_maya_profiler()
+
+    create_material(CreateMaterialNetworkArnold)
+
+    assert Profiler.get_events() == []
+
+
+def test_recording_captures_stages():
+    Profiler.start()
+    create_material(CreateMaterialNetworkArnold)
+    Profiler.stop()
+
+    names = [event.name for event in Profiler.get_events()]
+
+    for name in (
+        "CreateMaterialNetwork.create",
+        "CreateMaterialNetwork._load_plugins",
+        "CreateMaterialNetwork._create_material",
+        "CreateMaterialNetwork._create_base_color_network",
+        "CreateMaterialNetwork._create_roughness_network",
+        "CreateMaterialNetwork._create_normal_network",
+        "CreateMaterialNetwork._create_file_node_network",
+        "NetworkBuilder.end",
+    ):
+        assert name in names
+
+    # Scopes are recorded when they close, so the outermost one comes last.
+    assert names[-1] == "CreateMaterialNetwork.create"
+
+
+def test_recording_captures_renderer_overrides():
+    Profiler.start()
+    create_material(CreateMaterialNetworkVRay, use_triplanar=True)
+    Profiler.stop()
+
+    events = {event.name: event for event in Profiler.get_events()}
+    override = events["CreateMaterialNetworkVRay._create_roughness_network"]
+    base = events["CreateMaterialNetwork._create_roughness_network"]
+
+    assert "CreateMaterialNetworkVRay._create_triplanar_node_network" in events
+    assert override.start_time <= base.start_time
+    assert override.duration >= base.duration
+
+
+def test_export_chrome_trace(tmp_path):
+    Profiler.start()
+
+    with Profiler.scope("outer"):
+        with Profiler.scope("inner"):
+            pass
+
+    Profiler.stop()
+
+    file_path = str(tmp_path / "trace.json")
+    Profiler.export_chrome_trace(file_path)
+
+    with open(file_path) as f:
+        trace = json.load(f)
+
+    events = {event["name"]: event for event in trace["traceEvents"]}
+
+    assert set(events) == {"outer", "inner"}
+    assert all(event["ph"] == "X" for event in events.values())
+    assert all(event["cat"] == Profiler.CATEGORY_NAME for event in events.values())
+    assert events["outer"]["ts"] <= events["inner"]["ts"]
+    assert events["outer"]["dur"] >= events["inner"]["dur"]
+
+
+def test_profile_decorator_name():
+    @profile(name="custom")
+    def function(value: int) -> int:
+        return value * 2
+
+    Profiler.start()
+    result = function(2)
+    Profiler.stop()
+
+    assert result == 4
+    assert [event.name for event in Profiler.get_events()] == ["custom"]
+
+
+def test_maya_profiler(monkeypatch):
+    FakeProfilingScope.scopes = []
+    FakeProfiler.categories = []
+
+    monkeypatch.setattr(om, "MProfiler", FakeProfiler, raising=False)
+    monkeypatch.setattr(om, "MProfilingScope", FakeProfilingScope, raising=False)
+    monkeypatch.setattr(Profiler, "_maya_loaded", False)
+
+    create_material(CreateMaterialNetworkArnold)
+
+    assert Profiler.has_maya_profiler()
+    assert FakeProfiler.categories == [Profiler.CATEGORY_NAME]
+    assert FakeProfilingScope.scopes[0] == (1, "CreateMaterialNetwork.create")
+    assert Profiler.get_events() == []
@@ -2,10 +2,20 @@
 ========================================================================================
 Name: __init__.py
 Author: Mauricio Gonzalez Soto
-Updated Date: 12-15-2024
+Updated Date: 10-16-2026
 
 Copyright (C) 2024 Mauricio Gonzalez Soto. All rights reserved.
 ========================================================================================
 """
 
-from texture_connector.gui.texture_connector_ui import TextureConnectorUI
+from typing import Any
+
+
+def __getattr__(name: str) -> Any:
+    # The UI is imported on first access so mayapy batch jobs never load PySide.
+    if name == "TextureConnectorUI":
+        from texture_connector.gui.texture_connector_ui import TextureConnectorUI
+
+        return TextureConnectorUI
+
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
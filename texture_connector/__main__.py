@@ -0,0 +1,199 @@
+"""
+========================================================================================
+Name: __main__.py
+Author: Mauricio Gonzalez Soto
+Updated Date: 10-16-2026
+
+Copyright (C) 2024 Mauricio Gonzalez Soto. All rights reserved.
+========================================================================================
+"""
+
+from __future__ import annotations
+
+from typing import Optional
+import argparse
+import sys
+
+from texture_connector.config import PlacementScopes
+from texture_connector.config import RenderPlugins
+from texture_connector.config import UVTilingModes
+from texture_connector.config import TextureMaps
+
+TEXTURE_MAPS = (
+    TextureMaps.BASE_COLOR,
+    TextureMaps.ROUGHNESS,
+    TextureMaps.METALNESS,
+    TextureMaps.NORMAL,
+    TextureMaps.HEIGHT,
+    TextureMaps.EMISSIVE,
+    TextureMaps.OPACITY,
+)
+
+
+def _parse_texture_map_values(
+    parser: argparse.ArgumentParser, values: list[str], option: str
+) -> list[tuple[str, str]]:
+
+    texture_map_values = []
+
+    for value in values:
+        texture_map, separator, texture_map_value = value.partition("=")
+
+        if not separator or texture_map not in TEXTURE_MAPS:
+            parser.error(
+                f"{option} expects MAP=VALUE with MAP in {', '.join(TEXTURE_MAPS)}, "
+                f"got {value!r}."
+            )
+
+        texture_map_values.append((texture_map, texture_map_value))
+
+    return texture_map_values
+
+
+def _create_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="python -m texture_connector",
+        description="Scan a folder of textures and build material networks in mayapy.",
+    )
+    parser.add_argument("folder_path", help="Folder to scan for textures.")
+    parser.add_argument(
+        "-r",
+        "--render-engine",
+        choices=[render_plugin.value[0] for render_plugin in RenderPlugins],
+        default=RenderPlugins.ARNOLD.value[0],
+    )
+    parser.add_argument(
+        "--suffix",
+        action="append",
+        default=[],
+        metavar="MAP=SUFFIX",
+        help="Texture map suffix, e.g. basecolor=BaseColor. An empty suffix "
+        "disables the map.",
+    )
+    parser.add_argument(
+        "--color-space",
+        action="append",
+        default=[],
+        metavar="MAP=COLOR_SPACE",
+        help="Texture map color space, e.g. basecolor=sRGB.",
+    )
+    parser.add_argument(
+        "--uv-tiling-mode",
+        choices=[
+            UVTilingModes.OFF,
+            UVTilingModes.ZBRUSH,
+            UVTilingModes.MUDBOX,
+            UVTilingModes.MARI,
+        ],
+        default=UVTilingModes.OFF,
+    )
+    parser.add_argument(
+        "--placement-scope",
+        choices=[
+            PlacementScopes.MATERIAL,
+            PlacementScopes.UDIM_SET,
+            PlacementScopes.SHARED,
+        ],
+        default=PlacementScopes.MATERIAL,
+    )
+    parser.add_argument("--triplanar", action="store_true")
+    parser.add_argument("--use-maya-color-space-rules", action="store_true")
+    parser.add_argument("--modifier-builder", action="store_true")
+    parser.add_argument("--no-subdirectories", action="store_true")
+    parser.add_argument("--max-depth", type=int, default=0)
+    parser.add_argument("--workers", type=int, default=1)
+    parser.add_argument("--exclude", action="append", default=[], metavar="PATTERN")
+    parser.add_argument(
+        "--include-existing",
+        action="store_true",
+        help="Also create materials that already exist in the scene.",
+    )
+    parser.add_argument(
+        "--update-existing",
+        action="store_true",
+        help="Update the texture branches of materials that already exist in the "
+        "scene instead of skipping them.",
+    )
+    parser.add_argument(
+        "--convert-textures",
+        action="store_true",
+        help="Convert the textures to the render engine format (.tx, .rstexbin) "
+        "and use the converted files.",
+    )
+    parser.add_argument(
+        "--converter-command",
+        default="",
+        help='Converter command, e.g. "maketx {input} -o {output}". Defaults to '
+        "the render engine converter.",
+    )
+    parser.add_argument(
+        "--converter-extension",
+        default="",
+        help="Extension of the files written by --converter-command.",
+    )
+    parser.add_argument("--scene", help="Scene to open before building.")
+    parser.add_argument("-o", "--output", help="Path the scene is saved to.")
+
+    return parser
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    parser = _create_parser()
+    args = parser.parse_args(argv)
+
+    suffixes = _parse_texture_map_values(parser, args.suffix, "--suffix")
+    color_spaces = _parse_texture_map_values(parser, args.color_space, "--color-space")
+
+    import maya.standalone
+
+    maya.standalone.initialize(name="python")
+
+    try:
+        import maya.cmds as cmds
+
+        from texture_connector.batch import MaterialBatch
+
+        material_batch = MaterialBatch()
+        material_batch.set_folder_path(args.folder_path)
+        material_batch.set_render_engine(args.render_engine)
+        material_batch.set_uv_tiling_mode(args.uv_tiling_mode)
+        material_batch.set_placement_scope(args.placement_scope)
+        material_batch.set_use_triplanar(args.triplanar)
+        material_batch.set_use_maya_color_space_rules(args.use_maya_color_space_rules)
+        material_batch.set_use_modifier_builder(args.modifier_builder)
+        material_batch.set_search_files_in_subdirectories(not args.no_subdirectories)
+        material_batch.set_max_depth(args.max_depth)
+        material_batch.set_workers(args.workers)
+        material_batch.set_exclude_patterns(tuple(args.exclude))
+        material_batch.set_do_not_create_existing_materials(not args.include_existing)
+        material_batch.set_update_existing_materials(args.update_existing)
+        material_batch.set_convert_textures(args.convert_textures)
+        material_batch.set_texture_converter_command(
+            args.converter_command, args.converter_extension
+        )
+        material_batch.set_undo_enabled(False)
+
+        for texture_map, suffix in suffixes:
+            material_batch.set_texture_map_suffix(texture_map, suffix)
+
+        for texture_map, color_space in color_spaces:
+            material_batch.set_texture_map_color_space(texture_map, color_space)
+
+        if args.scene:
+            cmds.file(args.scene, open=True, force=True)
+
+        count = material_batch.build() + material_batch.get_updated_count()
+
+        if args.output:
+            file_type = "mayaBinary" if args.output.endswith(".mb") else "mayaAscii"
+
+            cmds.file(rename=args.output)
+            cmds.file(save=True, force=True, type=file_type)
+    finally:
+        maya.standalone.uninitialize()
+
+    return 0 if count else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
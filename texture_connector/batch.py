@@ -0,0 +1,287 @@
+"""
+========================================================================================
+Name: batch.py
+Author: Mauricio Gonzalez Soto
+Updated Date: 10-16-2026
+
+Copyright (C) 2024 Mauricio Gonzalez Soto. All rights reserved.
+========================================================================================
+"""
+
+from __future__ import annotations
+
+import maya.cmds as cmds
+
+from typing import Callable
+from typing import Optional
+
+from texture_connector.core import CreateMaterialNetworkRedshift
+from texture_connector.core import CreateMaterialNetworkBatch
+from texture_connector.core import CreateMaterialNetworkArnold
+from texture_connector.core import CreateMaterialNetworkVRay
+from texture_connector.core import ModifierNetworkBuilder
+from texture_connector.core import NetworkBuilder
+from texture_connector.core import TextureConverter
+from texture_connector.core import TextureScanner
+from texture_connector.config import PlacementScopes
+from texture_connector.config import RenderPlugins
+from texture_connector.config import UVTilingModes
+from texture_connector.config import TextureMaps
+import texture_connector.utils as utils
+
+
+class MaterialBatch:
+    MATERIAL_NETWORK_CLASSES = {
+        RenderPlugins.ARNOLD.value[0]: CreateMaterialNetworkArnold,
+        RenderPlugins.REDSHIFT.value[0]: CreateMaterialNetworkRedshift,
+        RenderPlugins.V_RAY.value[0]: CreateMaterialNetworkVRay,
+    }
+
+    TEXTURE_MAP_SETTERS = {
+        TextureMaps.BASE_COLOR: "set_base_color_settings",
+        TextureMaps.ROUGHNESS: "set_roughness_settings",
+        TextureMaps.METALNESS: "set_metalness_settings",
+        TextureMaps.NORMAL: "set_normal_settings",
+        TextureMaps.HEIGHT: "set_height_settings",
+        TextureMaps.EMISSIVE: "set_emissive_settings",
+        TextureMaps.OPACITY: "set_opacity_settings",
+    }
+
+    TEXTURE_MAPS_COLOR_SPACE = (
+        (TextureMaps.BASE_COLOR, "sRGB"),
+        (TextureMaps.ROUGHNESS, "Raw"),
+        (TextureMaps.METALNESS, "Raw"),
+        (TextureMaps.NORMAL, "Raw"),
+        (TextureMaps.HEIGHT, "Raw"),
+        (TextureMaps.EMISSIVE, "sRGB"),
+        (TextureMaps.OPACITY, "Raw"),
+    )
+
+    def __init__(self) -> None:
+        self.folder_path = ""
+        self.render_engine = RenderPlugins.ARNOLD.value[0]
+        self.uv_tiling_mode = UVTilingModes.OFF
+        self.placement_scope = PlacementScopes.MATERIAL
+
+        self.texture_maps_suffix = {
+            texture_map: texture_map
+            for texture_map in MaterialBatch.TEXTURE_MAP_SETTERS
+        }
+        self.texture_maps_color_space = dict(MaterialBatch.TEXTURE_MAPS_COLOR_SPACE)
+
+        self.search_files_in_subdirectories = True
+        self.max_depth = 0
+        self.workers = 1
+        self.exclude_patterns = ()
+
+        self.do_not_create_existing_materials = True
+        self.use_maya_color_space_rules = False
+        self.use_modifier_builder = False
+        self.use_triplanar = False
+        self.undo_enabled = True
+        self.update_existing_materials = False
+
+        self.convert_textures = False
+        self.texture_converter_command = ""
+        self.texture_converter_extension = ""
+
+        self.progress_callback = None
+
+        self.updated_count = 0
+
+    def _create_texture_converter(self) -> Optional[TextureConverter]:
+        texture_converter = TextureConverter()
+        texture_converter.set_render_engine(self.render_engine)
+
+        if self.texture_converter_command:
+            texture_converter.set_command(
+                self.texture_converter_command,
+                self.texture_converter_extension or texture_converter.output_extension,
+            )
+
+        if not texture_converter.is_enabled():
+            utils.Logger.warning(
+                f"No texture converter for {self.render_engine!r}, the original "
+                f"textures are used."
+            )
+            return None
+
+        return texture_converter
+
+    def _get_material_network_class(self) -> type:
+        material_network_class = MaterialBatch.MATERIAL_NETWORK_CLASSES.get(
+            self.render_engine
+        )
+
+        if material_network_class is None:
+            raise ValueError(f"Unsupported render engine {self.render_engine!r}.")
+
+        return material_network_class
+
+    def _load_render_plugin(self) -> None:
+        for render_plugin in RenderPlugins:
+            render_engine, plugin = render_plugin.value
+
+            if render_engine == self.render_engine:
+                if not cmds.pluginInfo(plugin, query=True, loaded=True):
+                    cmds.loadPlugin(plugin, quiet=True)
+
+                return
+
+    def build(self) -> int:
+        material_network_class = self._get_material_network_class()
+        material_textures = self.scan()
+
+        self._load_render_plugin()
+
+        if self.use_modifier_builder:
+            builder = ModifierNetworkBuilder()
+        else:
+            builder = NetworkBuilder()
+
+        material_network_batch = CreateMaterialNetworkBatch(builder)
+        material_network_batch.set_progress_callback(self.progress_callback)
+        material_network_batch.set_undo_enabled(self.undo_enabled)
+        material_network_batch.set_update_existing_materials(
+            self.update_existing_materials
+        )
+
+        if self.convert_textures:
+            material_network_batch.set_texture_converter(
+                self._create_texture_converter()
+            )
+
+        for material_name, textures in material_textures.items():
+            material_network = material_network_class(builder)
+
+            if (
+                self.do_not_create_existing_materials
+                and not self.update_existing_materials
+                and material_network.material_exists(material_name)
+            ):
+                continue
+
+            material_network.set_placement_scope(self.placement_scope)
+
+            for texture_map, file_path in textures.items():
+                setter = MaterialBatch.TEXTURE_MAP_SETTERS[texture_map]
+
+                getattr(material_network, setter)(
+                    color_space=self.texture_maps_color_space.get(texture_map, ""),
+                    file_path=file_path,
+                    suffix=self.texture_maps_suffix[texture_map],
+                )
+
+            material_network_batch.add_material_network(material_name, material_network)
+
+        count = material_network_batch.create(
+            use_maya_color_space_rules=self.use_maya_color_space_rules,
+            use_triplanar=self.use_triplanar,
+            uv_tiling_mode=self.uv_tiling_mode,
+        )
+
+        self.updated_count = material_network_batch.get_updated_count()
+
+        utils.Logger.info(
+            f"{count} material(s) created and {self.updated_count} updated in "
+            f"{material_network_batch.get_elapsed_time():.2f}s."
+        )
+
+        return count
+
+    def scan(self) -> dict[str, dict[str, str]]:
+        texture_scanner = TextureScanner()
+        texture_scanner.set_folder_path(self.folder_path)
+        texture_scanner.set_search_files_in_subdirectories(
+            self.search_files_in_subdirectories
+        )
+        texture_scanner.set_max_depth(self.max_depth)
+        texture_scanner.set_workers(self.workers)
+        texture_scanner.set_exclude_patterns(self.exclude_patterns)
+        texture_scanner.set_uv_tiling_mode(self.uv_tiling_mode)
+        texture_scanner.set_texture_maps_suffix(
+            tuple(
+                (texture_map, suffix)
+                for texture_map, suffix in self.texture_maps_suffix.items()
+                if suffix
+            )
+        )
+
+        material_texture_paths = texture_scanner.get_material_texture_paths()
+        material_textures = {}
+
+        for material_name, textures in material_texture_paths.items():
+            texture_paths = material_textures.setdefault(material_name, {})
+
+            # The paths are sorted and the last one wins, as in the material list.
+            for texture_map, file_path in textures:
+                texture_paths[texture_map] = file_path
+
+        return material_textures
+
+    def get_updated_count(self) -> int:
+        return self.updated_count
+
+    def set_convert_textures(self, enabled: bool) -> None:
+        self.convert_textures = enabled
+
+    def set_do_not_create_existing_materials(self, enabled: bool) -> None:
+        self.do_not_create_existing_materials = enabled
+
+    def set_exclude_patterns(self, exclude_patterns: tuple[str, ...]) -> None:
+        self.exclude_patterns = tuple(exclude_patterns)
+
+    def set_folder_path(self, folder_path: str) -> None:
+        self.folder_path = folder_path
+
+    def set_max_depth(self, max_depth: int) -> None:
+        self.max_depth = max_depth
+
+    def set_placement_scope(self, placement_scope: str) -> None:
+        self.placement_scope = placement_scope
+
+    def set_progress_callback(
+        self, callback: Optional[Callable[[int, int, str, float], bool]]
+    ) -> None:
+
+        self.progress_callback = callback
+
+    def set_render_engine(self, render_engine: str) -> None:
+        self.render_engine = render_engine
+
+    def set_search_files_in_subdirectories(self, enabled: bool) -> None:
+        self.search_files_in_subdirectories = enabled
+
+    def set_texture_map_color_space(self, texture_map: str, color_space: str) -> None:
+        self.texture_maps_color_space[texture_map] = color_space
+
+    def set_texture_converter_command(
+        self, command: str, output_extension: str = ""
+    ) -> None:
+
+        self.texture_converter_command = command
+        self.texture_converter_extension = output_extension
+
+    def set_texture_map_suffix(self, texture_map: str, suffix: str) -> None:
+        self.texture_maps_suffix[texture_map] = suffix
+
+    def set_undo_enabled(self, enabled: bool) -> None:
+        self.undo_enabled = enabled
+
+    def set_use_maya_color_space_rules(self, enabled: bool) -> None:
+        self.use_maya_color_space_rules = enabled
+
+    def set_use_modifier_builder(self, enabled: bool) -> None:
+        self.use_modifier_builder = enabled
+
+    def set_update_existing_materials(self, enabled: bool) -> None:
+        self.update_existing_materials = enabled
+
+    def set_use_triplanar(self, enabled: bool) -> None:
+        self.use_triplanar = enabled
+
+    def set_uv_tiling_mode(self, uv_tiling_mode: str) -> None:
+        self.uv_tiling_mode = uv_tiling_mode
+
+    def set_workers(self, workers: int) -> None:
+        self.workers = workers
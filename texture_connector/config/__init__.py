@@ -2,7 +2,7 @@
 ========================================================================================
 Name: __init__.py
 Author: Mauricio Gonzalez Soto
-Updated Date: 01-10-2025
+Updated Date: 10-16-2026
 
 Copyright (C) 2024 Mauricio Gonzalez Soto. All rights reserved.
 ========================================================================================
@@ -10,6 +10,8 @@ Copyright (C) 2024 Mauricio Gonzalez Soto. All rights reserved.
 
 from texture_connector.config.image_extensions import ImageExtensions
 
+from texture_connector.config.placement_scopes import PlacementScopes
+
 from texture_connector.config.render_plugins import RenderPlugins
 
 from texture_connector.config.texture_maps import TextureMaps
@@ -0,0 +1,15 @@
+"""
+========================================================================================
+Name: placement_scopes.py
+Author: Mauricio Gonzalez Soto
+Updated Date: 10-16-2026
+
+Copyright (C) 2024 Mauricio Gonzalez Soto. All rights reserved.
+========================================================================================
+"""
+
+
+class PlacementScopes:
+    MATERIAL = "Per material"
+    UDIM_SET = "Per UDIM set"
+    SHARED = "Shared"
@@ -2,16 +2,87 @@
 ========================================================================================
 Name: __init__.py
 Author: Mauricio Gonzalez Soto
-Updated Date: 12-15-2024
+Updated Date: 10-17-2026
 
 Copyright (C) 2024 Mauricio Gonzalez Soto. All rights reserved.
 ========================================================================================
 """
 
-from texture_connector.core.create_material_network import CreateMaterialNetwork
+from __future__ import annotations
 
-from texture_connector.core.create_material_network_arnold import CreateMaterialNetworkArnold
+from typing import TYPE_CHECKING
+from typing import Any
+import importlib
 
-from texture_connector.core.create_material_network_redshift import CreateMaterialNetworkRedshift
+if TYPE_CHECKING:
+    from texture_connector.core.create_material_network import CreateMaterialNetwork
 
-from texture_connector.core.create_network_network_v_ray import CreateMaterialNetworkVRay
+    from texture_connector.core.create_material_network_arnold import (
+        CreateMaterialNetworkArnold,
+    )
+
+    from texture_connector.core.create_material_network_redshift import (
+        CreateMaterialNetworkRedshift,
+    )
+
+    from texture_connector.core.create_network_network_v_ray import (
+        CreateMaterialNetworkVRay,
+    )
+
+    from texture_connector.core.create_material_network_batch import (
+        CreateMaterialNetworkBatch,
+    )
+
+    from texture_connector.core.network_builder import ModifierNetworkBuilder
+    from texture_connector.core.network_builder import NetworkBuilder
+
+    from texture_connector.core.material_status_resolver import MaterialStatusResolver
+
+    from texture_connector.core.texture_converter import TextureConverter
+
+    from texture_connector.core.texture_header import TextureHeader
+    from texture_connector.core.texture_header import TextureHeaderReader
+
+    from texture_connector.core.texture_map_matcher import TextureMapMatcher
+
+    from texture_connector.core.scan_cache import ScanCache
+
+    from texture_connector.core.texture_scanner import TextureScanner
+
+    from texture_connector.core.uv_tiles import UVTiles
+
+# Submodules are imported on first attribute access so that importing the package
+# doesn't load Maya until a class is actually used.
+_LAZY_ATTRIBUTES = {
+    "CreateMaterialNetwork": "texture_connector.core.create_material_network",
+    "CreateMaterialNetworkArnold": "texture_connector.core.create_material_network_arnold",
+    "CreateMaterialNetworkRedshift": "texture_connector.core.create_material_network_redshift",
+    "CreateMaterialNetworkVRay": "texture_connector.core.create_network_network_v_ray",
+    "CreateMaterialNetworkBatch": "texture_connector.core.create_material_network_batch",
+    "ModifierNetworkBuilder": "texture_connector.core.network_builder",
+    "NetworkBuilder": "texture_connector.core.network_builder",
+    "MaterialStatusResolver": "texture_connector.core.material_status_resolver",
+    "TextureConverter": "texture_connector.core.texture_converter",
+    "TextureHeader": "texture_connector.core.texture_header",
+    "TextureHeaderReader": "texture_connector.core.texture_header",
+    "TextureMapMatcher": "texture_connector.core.texture_map_matcher",
+    "ScanCache": "texture_connector.core.scan_cache",
+    "TextureScanner": "texture_connector.core.texture_scanner",
+    "UVTiles": "texture_connector.core.uv_tiles",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_ATTRIBUTES.get(name)
+
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(_LAZY_ATTRIBUTES))
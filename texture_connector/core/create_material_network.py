@@ -2,7 +2,7 @@
 ========================================================================================
 Name: create_material_network.py
 Author: Mauricio Gonzalez Soto
-Updated Date: 01-10-2025
+Updated Date: 10-17-2026
 
 Copyright (C) 2024 Mauricio Gonzalez Soto. All rights reserved.
 ========================================================================================
@@ -12,7 +12,17 @@ from __future__ import annotations
 
 import maya.cmds as cmds
 
+from typing import Callable
+from typing import Any
+from typing import Optional
+import hashlib
+import time
+
+from texture_connector.core.texture_converter import TextureConverter
+from texture_connector.core.network_builder import NetworkBuilder
+from texture_connector.config import PlacementScopes
 from texture_connector.config import UVTilingModes
+from texture_connector.core.uv_tiles import UVTiles
 import texture_connector.utils as utils
 
 
@@ -27,71 +37,85 @@ class CreateMaterialNetwork:
     OPACITY_MATERIAL_INPUT_NAME = None
     ROUGHNESS_MATERIAL_INPUT_NAME = None
 
+    TRIPLANAR_NODE = None
     TRIPLANAR_INPUT_NAME = None
     TRIPLANAR_ALPHA_OUTPUT_NAME = None
     TRIPLANAR_COLOR_OUTPUT_NAME = None
 
-    def __init__(self) -> None:
+    UV_TILING_MODE_VALUES = {
+        UVTilingModes.OFF: 0,
+        UVTilingModes.ZBRUSH: 1,
+        UVTilingModes.MUDBOX: 2,
+        UVTilingModes.MARI: 3,
+    }
+
+    def __init__(self, builder: Optional[NetworkBuilder] = None) -> None:
+        self.builder = builder or NetworkBuilder()
+
         self.name = ""
+        self.placement_scope = PlacementScopes.MATERIAL
         self.uv_tiling_mode = ""
         self.use_maya_color_space_rules = False
         self.use_triplanar = False
 
-        self.float_constant_node = ""
-        self.material = ""
-        self.place_2d_texture_node = ""
-        self.shading_engine_node = ""
+        self.texture_converter = None
+
+        self.float_constant_node = None
+        self.material = None
+        self.place_2d_texture_node = None
+        self.shading_engine_node = None
 
         self.base_color_color_space = ""
         self.base_color_file_path = ""
-        self.base_color_file_node = ""
+        self.base_color_file_node = None
         self.base_color_suffix = ""
-        self.base_color_triplanar_node = ""
+        self.base_color_triplanar_node = None
 
         self.roughness_color_space = ""
         self.roughness_file_path = ""
-        self.roughness_file_node = ""
+        self.roughness_file_node = None
         self.roughness_suffix = ""
-        self.roughness_triplanar_node = ""
+        self.roughness_triplanar_node = None
 
         self.metalness_color_space = ""
         self.metalness_file_path = ""
-        self.metalness_file_node = ""
+        self.metalness_file_node = None
         self.metalness_suffix = ""
-        self.metalness_triplanar_node = ""
+        self.metalness_triplanar_node = None
 
         self.normal_color_space = ""
         self.normal_file_path = ""
-        self.normal_file_node = ""
+        self.normal_file_node = None
         self.normal_suffix = ""
-        self.normal_triplanar_node = ""
+        self.normal_triplanar_node = None
 
         self.height_color_space = ""
         self.height_file_path = ""
-        self.height_displacement_shader_node = ""
-        self.height_file_node = ""
+        self.height_displacement_shader_node = None
+        self.height_file_node = None
         self.height_suffix = ""
-        self.height_triplanar_node = ""
+        self.height_triplanar_node = None
 
         self.emissive_color_space = ""
         self.emissive_file_path = ""
-        self.emissive_file_node = ""
+        self.emissive_file_node = None
         self.emissive_suffix = ""
-        self.emissive_triplanar_node = ""
+        self.emissive_triplanar_node = None
 
         self.opacity_color_space = ""
         self.opacity_file_path = ""
-        self.opacity_file_node = ""
+        self.opacity_file_node = None
         self.opacity_suffix = ""
-        self.opacity_triplanar_node = ""
+        self.opacity_triplanar_node = None
 
+    @utils.profile
     def create(
         self,
         name: str,
         use_maya_color_space_rules: bool,
         use_triplanar: bool,
         uv_tiling_mode: str,
-    ) -> None:
+    ) -> bool:
 
         self.name = name
         self.use_maya_color_space_rules = use_maya_color_space_rules
@@ -100,9 +124,11 @@ class CreateMaterialNetwork:
 
         if not self.name:
             utils.Logger.error("No name for the material.")
-            return
+            return False
+
+        start_time = time.perf_counter()
 
-        cmds.undoInfo(chunkName="CreateMaterialNetwork", openChunk=True)
+        self.builder.begin()
 
         self._load_plugins()
         self._create_material()
@@ -128,11 +154,33 @@ class CreateMaterialNetwork:
         if self.opacity_file_path:
             self._create_opacity_network()
 
-        cmds.select(clear=True)
+        with utils.Profiler.scope("NetworkBuilder.end"):
+            self.builder.end()
+
+        utils.PerformanceMonitor.add_time(
+            utils.PerformanceMonitor.CREATE_MATERIAL_NETWORK,
+            time.perf_counter() - start_time,
+        )
 
         utils.Logger.info(f"Created {self.name!r} material network.")
 
-        cmds.undoInfo(chunkName="CreateMaterialNetwork", closeChunk=True)
+        return True
+
+    def get_file_paths(self) -> list[str]:
+        file_paths = (
+            self.base_color_file_path,
+            self.roughness_file_path,
+            self.metalness_file_path,
+            self.normal_file_path,
+            self.height_file_path,
+            self.emissive_file_path,
+            self.opacity_file_path,
+        )
+
+        return [file_path for file_path in file_paths if file_path]
+
+    def material_exists(self, name: str) -> bool:
+        return cmds.objExists(f"{name}_{self.MATERIAL_NODE}")
 
     def set_base_color_settings(
         self, color_space: str, file_path: str, suffix: str
@@ -176,6 +224,9 @@ class CreateMaterialNetwork:
         self.opacity_file_path = file_path
         self.opacity_suffix = suffix
 
+    def set_placement_scope(self, placement_scope: str) -> None:
+        self.placement_scope = placement_scope
+
     def set_roughness_settings(
         self, color_space: str, file_path: str, suffix: str
     ) -> None:
@@ -183,12 +234,138 @@ class CreateMaterialNetwork:
         self.roughness_file_path = file_path
         self.roughness_suffix = suffix
 
+    def set_texture_converter(
+        self, texture_converter: Optional[TextureConverter]
+    ) -> None:
+
+        self.texture_converter = texture_converter
+
+    @utils.profile
+    def update(
+        self,
+        name: str,
+        use_maya_color_space_rules: bool,
+        use_triplanar: bool,
+        uv_tiling_mode: str,
+    ) -> bool:
+
+        self.name = name
+        self.use_maya_color_space_rules = use_maya_color_space_rules
+        self.use_triplanar = use_triplanar
+        self.uv_tiling_mode = uv_tiling_mode
+
+        if not self.material_exists(name):
+            return False
+
+        start_time = time.perf_counter()
+
+        self.builder.begin()
+
+        self._load_plugins()
+
+        self.material = f"{self.name}_{self.MATERIAL_NODE}"
+
+        shading_engine_nodes = cmds.listConnections(
+            f"{self.material}.outColor",
+            source=False,
+            destination=True,
+            type="shadingEngine",
+        )
+        self.shading_engine_node = (
+            shading_engine_nodes[0] if shading_engine_nodes else None
+        )
+
+        if cmds.objExists(f"{self.name}_floatConstant"):
+            self.float_constant_node = f"{self.name}_floatConstant"
+
+        if cmds.objExists(f"{self.name}_place2dTexture"):
+            self.place_2d_texture_node = f"{self.name}_place2dTexture"
+
+        networks = (
+            (
+                self.base_color_color_space,
+                self.base_color_file_path,
+                self.material,
+                self.BASE_COLOR_MATERIAL_INPUT_NAME,
+                self._create_base_color_network,
+            ),
+            (
+                self.roughness_color_space,
+                self.roughness_file_path,
+                self.material,
+                self.ROUGHNESS_MATERIAL_INPUT_NAME,
+                self._create_roughness_network,
+            ),
+            (
+                self.metalness_color_space,
+                self.metalness_file_path,
+                self.material,
+                self.METALNESS_MATERIAL_INPUT_NAME,
+                self._create_metalness_network,
+            ),
+            (
+                self.normal_color_space,
+                self.normal_file_path,
+                self.material,
+                self.NORMAL_MATERIAL_INPUT_NAME,
+                self._create_normal_network,
+            ),
+            (
+                self.height_color_space,
+                self.height_file_path,
+                self.shading_engine_node,
+                "displacementShader",
+                self._create_height_network,
+            ),
+            (
+                self.emissive_color_space,
+                self.emissive_file_path,
+                self.material,
+                self.EMISSIVE_MATERIAL_INPUT_NAME,
+                self._create_emissive_network,
+            ),
+            (
+                self.opacity_color_space,
+                self.opacity_file_path,
+                self.material,
+                self.OPACITY_MATERIAL_INPUT_NAME,
+                self._create_opacity_network,
+            ),
+        )
+
+        change_count = 0
+
+        for color_space, file_path, node, attr, create_network in networks:
+            if node is not None:
+                change_count += self._update_texture_network(
+                    color_space=color_space,
+                    file_path=file_path,
+                    node=node,
+                    attr=attr,
+                    create_network=create_network,
+                )
+
+        self.builder.end()
+
+        utils.PerformanceMonitor.add_time(
+            utils.PerformanceMonitor.UPDATE_MATERIAL_NETWORK,
+            time.perf_counter() - start_time,
+        )
+
+        utils.Logger.debug(
+            f"Updated {self.name!r} material network with {change_count} change(s)."
+        )
+
+        return True
+
+    @utils.profile
     def _create_base_color_network(self) -> None:
         self.base_color_file_node, self.base_color_triplanar_node = (
             self._create_standard_network(
                 material_input_name=self.BASE_COLOR_MATERIAL_INPUT_NAME,
                 out_alpha=False,
                 suffix=self.base_color_suffix,
+                file_path=self.base_color_file_path,
             )
         )
 
@@ -198,20 +375,22 @@ class CreateMaterialNetwork:
             node=self.base_color_file_node,
         )
 
-    def _create_bump_2d_node(self) -> str:
-        bump_2d_node = cmds.shadingNode(
-            "bump2d", asUtility=True, name=f"{self.name}_bump2d"
+    def _create_bump_2d_node(self) -> Any:
+        bump_2d_node = self.builder.create_node(
+            "bump2d", name=f"{self.name}_bump2d", classification=NetworkBuilder.UTILITY
         )
-        cmds.setAttr(f"{bump_2d_node}.bumpInterp", 1)
+        self.builder.set_attr(bump_2d_node, "bumpInterp", 1)
 
         return bump_2d_node
 
+    @utils.profile
     def _create_emissive_network(self) -> None:
         self.emissive_file_node, self.emissive_triplanar_node = (
             self._create_standard_network(
                 material_input_name=self.EMISSIVE_MATERIAL_INPUT_NAME,
                 out_alpha=False,
                 suffix=self.emissive_suffix,
+                file_path=self.emissive_file_path,
             )
         )
 
@@ -221,83 +400,95 @@ class CreateMaterialNetwork:
             node=self.emissive_file_node,
         )
 
-    def _create_file_node_network(self, name: str) -> str:
-        if not cmds.objExists(self.place_2d_texture_node):
-            self._create_place_2d_texture_node()
+    @utils.profile
+    def _create_file_node_network(self, name: str, file_path: str) -> Any:
+        place_2d_texture_node = self._get_place_2d_texture_node(file_path)
 
-        file_node = cmds.shadingNode(
-            "file", asTexture=True, isColorManaged=True, name=f"{name}_file"
+        file_node = self.builder.create_node(
+            "file",
+            name=f"{name}_file",
+            classification=NetworkBuilder.TEXTURE,
+            color_managed=True,
         )
 
         attributes = (
-            ".coverage",
-            ".translateFrame",
-            ".rotateFrame",
-            ".mirrorU",
-            ".mirrorV",
-            ".stagger",
-            ".wrapU",
-            ".wrapV",
-            ".repeatUV",
-            ".offset",
-            ".rotateUV",
-            ".noiseUV",
-            ".vertexUvOne",
-            ".vertexUvTwo",
-            ".vertexUvThree",
-            ".vertexCameraOne",
+            "coverage",
+            "translateFrame",
+            "rotateFrame",
+            "mirrorU",
+            "mirrorV",
+            "stagger",
+            "wrapU",
+            "wrapV",
+            "repeatUV",
+            "offset",
+            "rotateUV",
+            "noiseUV",
+            "vertexUvOne",
+            "vertexUvTwo",
+            "vertexUvThree",
+            "vertexCameraOne",
         )
 
         for attr in attributes:
-            cmds.connectAttr(
-                f"{self.place_2d_texture_node}{attr}", f"{file_node}{attr}", force=True
-            )
+            self.builder.connect_attr(place_2d_texture_node, attr, file_node, attr)
 
-        cmds.connectAttr(
-            f"{self.place_2d_texture_node}.outUvFilterSize", f"{file_node}.uvFilterSize"
+        self.builder.connect_attr(
+            place_2d_texture_node, "outUvFilterSize", file_node, "uvFilterSize"
         )
-        cmds.connectAttr(f"{self.place_2d_texture_node}.outUV", f"{file_node}.uv")
+        self.builder.connect_attr(place_2d_texture_node, "outUV", file_node, "uv")
 
         return file_node
 
     def _create_float_constant_node(self) -> None:
-        self.float_constant_node = cmds.shadingNode(
-            "floatConstant", asUtility=True, name=f"{self.name}_floatConstant"
+        self.float_constant_node = self.builder.create_node(
+            "floatConstant",
+            name=f"{self.name}_floatConstant",
+            classification=NetworkBuilder.UTILITY,
         )
 
+    @utils.profile
     def _create_height_network(self) -> None:
         name = f"{self.name}_{self.height_suffix}"
 
-        self.height_displacement_shader_node = cmds.shadingNode(
-            "displacementShader", asShader=True, name=f"{name}_displacementShader"
+        self.height_displacement_shader_node = self.builder.create_node(
+            "displacementShader",
+            name=f"{name}_displacementShader",
+            classification=NetworkBuilder.SHADER,
         )
 
-        self.height_file_node = self._create_file_node_network(name=name)
+        self.height_file_node = self._create_file_node_network(
+            name=name, file_path=self.height_file_path
+        )
 
         if self.use_triplanar:
             self.height_triplanar_node = self._create_triplanar_node_network(name)
 
-            cmds.connectAttr(
-                f"{self.height_file_node}.outColor",
-                f"{self.height_triplanar_node}.{self.TRIPLANAR_INPUT_NAME}",
-                force=True,
+            self.builder.connect_attr(
+                self.height_file_node,
+                "outColor",
+                self.height_triplanar_node,
+                self.TRIPLANAR_INPUT_NAME,
             )
-            cmds.connectAttr(
-                f"{self.height_triplanar_node}.{self.TRIPLANAR_ALPHA_OUTPUT_NAME}",
-                f"{self.height_displacement_shader_node}.displacement",
-                force=True,
+            self.builder.connect_attr(
+                self.height_triplanar_node,
+                self.TRIPLANAR_ALPHA_OUTPUT_NAME,
+                self.height_displacement_shader_node,
+                "displacement",
             )
         else:
-            cmds.connectAttr(
-                f"{self.height_file_node}.outAlpha",
-                f"{self.height_displacement_shader_node}.displacement",
-                force=True,
+            self.builder.connect_attr(
+                self.height_file_node,
+                "outAlpha",
+                self.height_displacement_shader_node,
+                "displacement",
             )
 
-        cmds.connectAttr(
-            f"{self.height_displacement_shader_node}.displacement",
-            f"{self.shading_engine_node}.displacementShader",
-            force=True,
+        self.builder.connect_attr(
+            self.height_displacement_shader_node,
+            "displacement",
+            self.shading_engine_node,
+            "displacementShader",
         )
 
         self._set_texture_file_node_settings(
@@ -306,29 +497,32 @@ class CreateMaterialNetwork:
             node=self.height_file_node,
         )
 
-        cmds.setAttr(f"{self.height_file_node}.alphaIsLuminance", True)
+        self.builder.set_attr(self.height_file_node, "alphaIsLuminance", True)
 
+    @utils.profile
     def _create_material(self) -> None:
-        self.material = cmds.shadingNode(
-            self.MATERIAL_NODE, asShader=True, name=f"{self.name}_{self.MATERIAL_NODE}"
+        self.material = self.builder.create_node(
+            self.MATERIAL_NODE,
+            name=f"{self.name}_{self.MATERIAL_NODE}",
+            classification=NetworkBuilder.SHADER,
         )
 
-        self.shading_engine_node = cmds.sets(
-            renderable=True, noSurfaceShader=True, empty=True, name=f"{self.name}SG"
+        self.shading_engine_node = self.builder.create_shading_engine(
+            name=f"{self.name}SG"
         )
 
-        cmds.connectAttr(
-            f"{self.material}.outColor",
-            f"{self.shading_engine_node}.surfaceShader",
-            force=True,
+        self.builder.connect_attr(
+            self.material, "outColor", self.shading_engine_node, "surfaceShader"
         )
 
+    @utils.profile
     def _create_metalness_network(self) -> None:
         self.metalness_file_node, self.metalness_triplanar_node = (
             self._create_standard_network(
                 material_input_name=self.METALNESS_MATERIAL_INPUT_NAME,
                 out_alpha=True,
                 suffix=self.metalness_suffix,
+                file_path=self.metalness_file_path,
             )
         )
 
@@ -338,56 +532,62 @@ class CreateMaterialNetwork:
             node=self.metalness_file_node,
         )
 
-        cmds.setAttr(f"{self.metalness_file_node}.alphaIsLuminance", True)
+        self.builder.set_attr(self.metalness_file_node, "alphaIsLuminance", True)
 
+    @utils.profile
     def _create_normal_network(self) -> None:
         name = f"{self.name}_{self.normal_suffix}"
-        bump_2d_node = ""
+        bump_2d_node = None
 
-        self.normal_file_node = self._create_file_node_network(name=name)
+        self.normal_file_node = self._create_file_node_network(
+            name=name, file_path=self.normal_file_path
+        )
 
         if self.USE_BUMP_2D_NODE:
             bump_2d_node = self._create_bump_2d_node()
 
-            cmds.connectAttr(
-                f"{self.normal_file_node}.outColorR",
-                f"{bump_2d_node}.bumpValue",
-                force=True,
+            self.builder.connect_attr(
+                self.normal_file_node, "outColorR", bump_2d_node, "bumpValue"
             )
 
         if self.use_triplanar:
             self.normal_triplanar_node = self._create_triplanar_node_network(name=name)
 
             if self.USE_BUMP_2D_NODE:
-                cmds.connectAttr(
-                    f"{bump_2d_node}.outNormal",
-                    f"{self.normal_triplanar_node}.{self.TRIPLANAR_INPUT_NAME}",
-                    force=True,
+                self.builder.connect_attr(
+                    bump_2d_node,
+                    "outNormal",
+                    self.normal_triplanar_node,
+                    self.TRIPLANAR_INPUT_NAME,
                 )
             else:
-                cmds.connectAttr(
-                    f"{self.normal_file_node}.outColor",
-                    f"{self.normal_triplanar_node}.{self.TRIPLANAR_INPUT_NAME}",
-                    force=True,
+                self.builder.connect_attr(
+                    self.normal_file_node,
+                    "outColor",
+                    self.normal_triplanar_node,
+                    self.TRIPLANAR_INPUT_NAME,
                 )
 
-            cmds.connectAttr(
-                f"{self.normal_triplanar_node}.outColor",
-                f"{self.material}.{self.NORMAL_MATERIAL_INPUT_NAME}",
-                force=True,
+            self.builder.connect_attr(
+                self.normal_triplanar_node,
+                "outColor",
+                self.material,
+                self.NORMAL_MATERIAL_INPUT_NAME,
             )
         else:
             if self.USE_BUMP_2D_NODE:
-                cmds.connectAttr(
-                    f"{bump_2d_node}.outNormal",
-                    f"{self.material}.{self.NORMAL_MATERIAL_INPUT_NAME}",
-                    force=True,
+                self.builder.connect_attr(
+                    bump_2d_node,
+                    "outNormal",
+                    self.material,
+                    self.NORMAL_MATERIAL_INPUT_NAME,
                 )
             else:
-                cmds.connectAttr(
-                    f"{self.normal_file_node}.outColor",
-                    f"{self.material}.{self.NORMAL_MATERIAL_INPUT_NAME}",
-                    force=True,
+                self.builder.connect_attr(
+                    self.normal_file_node,
+                    "outColor",
+                    self.material,
+                    self.NORMAL_MATERIAL_INPUT_NAME,
                 )
 
         self._set_texture_file_node_settings(
@@ -396,19 +596,23 @@ class CreateMaterialNetwork:
             node=self.normal_file_node,
         )
 
-        cmds.setAttr(f"{self.normal_file_node}.alphaIsLuminance", True)
+        self.builder.set_attr(self.normal_file_node, "alphaIsLuminance", True)
 
     def _create_place_2d_texture_node(self) -> None:
-        self.place_2d_texture_node = cmds.shadingNode(
-            "place2dTexture", asUtility=True, name=f"{self.name}_place2dTexture"
+        self.place_2d_texture_node = self.builder.create_node(
+            "place2dTexture",
+            name=f"{self.name}_place2dTexture",
+            classification=NetworkBuilder.UTILITY,
         )
 
+    @utils.profile
     def _create_opacity_network(self) -> None:
         self.opacity_file_node, self.opacity_triplanar_node = (
             self._create_standard_network(
                 material_input_name=self.OPACITY_MATERIAL_INPUT_NAME,
                 out_alpha=False,
                 suffix=self.opacity_suffix,
+                file_path=self.opacity_file_path,
             )
         )
 
@@ -418,14 +622,16 @@ class CreateMaterialNetwork:
             node=self.opacity_file_node,
         )
 
-        cmds.setAttr(f"{self.opacity_file_node}.alphaIsLuminance", True)
+        self.builder.set_attr(self.opacity_file_node, "alphaIsLuminance", True)
 
+    @utils.profile
     def _create_roughness_network(self) -> None:
         self.roughness_file_node, self.roughness_triplanar_node = (
             self._create_standard_network(
                 material_input_name=self.ROUGHNESS_MATERIAL_INPUT_NAME,
                 out_alpha=True,
                 suffix=self.roughness_suffix,
+                file_path=self.roughness_file_path,
             )
         )
 
@@ -435,15 +641,16 @@ class CreateMaterialNetwork:
             node=self.roughness_file_node,
         )
 
-        cmds.setAttr(f"{self.roughness_file_node}.alphaIsLuminance", True)
+        self.builder.set_attr(self.roughness_file_node, "alphaIsLuminance", True)
 
+    @utils.profile
     def _create_standard_network(
-        self, material_input_name: str, out_alpha: bool, suffix: str
-    ) -> tuple[str, str]:
+        self, material_input_name: str, out_alpha: bool, suffix: str, file_path: str
+    ) -> tuple[Any, Any]:
         name = f"{self.name}_{suffix}"
 
-        file_node = self._create_file_node_network(name=name)
-        triplanar_node = ""
+        file_node = self._create_file_node_network(name=name, file_path=file_path)
+        triplanar_node = None
 
         if self.use_triplanar:
             triplanar_node = self._create_triplanar_node_network(name=name)
@@ -452,32 +659,117 @@ class CreateMaterialNetwork:
             else:
                 out = self.TRIPLANAR_COLOR_OUTPUT_NAME
 
-            cmds.connectAttr(
-                f"{file_node}.outColor",
-                f"{triplanar_node}.{self.TRIPLANAR_INPUT_NAME}",
-                force=True,
+            self.builder.connect_attr(
+                file_node, "outColor", triplanar_node, self.TRIPLANAR_INPUT_NAME
             )
 
-            cmds.connectAttr(
-                f"{triplanar_node}.{out}",
-                f"{self.material}.{material_input_name}",
-                force=True,
+            self.builder.connect_attr(
+                triplanar_node, out, self.material, material_input_name
             )
         else:
             out = "outAlpha" if out_alpha else "outColor"
 
-            cmds.connectAttr(
-                f"{file_node}.{out}",
-                f"{self.material}.{material_input_name}",
-                force=True,
+            self.builder.connect_attr(
+                file_node, out, self.material, material_input_name
             )
 
         return file_node, triplanar_node
 
-    def _create_triplanar_node_network(self, name: str) -> any:
-        if not cmds.objExists(self.float_constant_node):
+    @utils.profile
+    def _create_triplanar_node_network(self, name: str) -> Any:
+        if self.float_constant_node is None:
             self._create_float_constant_node()
 
+    def _get_place_2d_texture_node(self, file_path: str) -> Any:
+        if self.placement_scope == PlacementScopes.SHARED:
+            key = PlacementScopes.SHARED
+            name = "textureConnector"
+        elif self.placement_scope == PlacementScopes.UDIM_SET:
+            tiles = UVTiles.get_tile_set(file_path, self.uv_tiling_mode)
+
+            if not tiles:
+                return self._get_material_place_2d_texture_node()
+
+            key = (PlacementScopes.UDIM_SET, tiles)
+
+            # Hashes the whole tile set, sets sharing their first and last tile still
+            # need their own placement node.
+            digest = hashlib.md5(",".join(tiles).encode("utf-8")).hexdigest()[:8]
+            name = f"udim_{tiles[0]}_{digest}"
+        else:
+            return self._get_material_place_2d_texture_node()
+
+        name = f"{name}_place2dTexture"
+        place_2d_texture_node = self.builder.get_placement_node(key)
+
+        # Reuses the node left by a previous run so creating again does not add
+        # another place2dTexture for the same scope.
+        if place_2d_texture_node is None and cmds.objExists(name):
+            if cmds.nodeType(name) == "place2dTexture":
+                place_2d_texture_node = name
+
+        if place_2d_texture_node is None:
+            place_2d_texture_node = self.builder.create_node(
+                "place2dTexture",
+                name=name,
+                classification=NetworkBuilder.UTILITY,
+            )
+
+            self.builder.set_placement_node(key, place_2d_texture_node)
+
+        return place_2d_texture_node
+
+    def _get_material_place_2d_texture_node(self) -> Any:
+        if self.place_2d_texture_node is None:
+            self._create_place_2d_texture_node()
+
+        return self.place_2d_texture_node
+
+    def _get_texture_branch(
+        self, node: str, attr: str
+    ) -> Optional[list[tuple[str, str]]]:
+
+        input_names = {
+            "bump2d": "bumpValue",
+            "displacementShader": "displacement",
+            self.TRIPLANAR_NODE: self.TRIPLANAR_INPUT_NAME,
+        }
+
+        branch = []
+        plug = f"{node}.{attr}"
+
+        # Walks up from the material input to the file node through the nodes this
+        # tool creates, anything else means the input was rewired by hand.
+        while True:
+            upstream_nodes = cmds.listConnections(
+                plug, source=True, destination=False, skipConversionNodes=True
+            )
+
+            if not upstream_nodes:
+                return None if branch else []
+
+            upstream_node = upstream_nodes[0]
+            node_type = cmds.nodeType(upstream_node)
+            branch.append((upstream_node, node_type))
+
+            if node_type == "file":
+                return branch
+
+            if node_type not in input_names or len(branch) > 2:
+                return None
+
+            plug = f"{upstream_node}.{input_names[node_type]}"
+
+    def _get_texture_file_path(self, file_path: str) -> str:
+        if self.texture_converter is None:
+            return file_path
+
+        return self.texture_converter.get_converted_path(file_path) or file_path
+
+    def _get_uv_tiling_mode_value(self) -> Optional[int]:
+        return CreateMaterialNetwork.UV_TILING_MODE_VALUES.get(self.uv_tiling_mode)
+
+    @utils.profile
     def _load_plugins(self) -> None:
         plugins_loaded = cmds.pluginInfo(listPlugins=True, query=True)
         look_dev_kit_plugin = "lookdevKit"
@@ -488,16 +780,79 @@ class CreateMaterialNetwork:
     def _set_texture_file_node_settings(
         self, color_space: str, file_path: str, node: str
     ) -> None:
-        cmds.setAttr(f"{node}.fileTextureName", file_path, type="string")
+        self.builder.set_attr(
+            node, "fileTextureName", self._get_texture_file_path(file_path)
+        )
 
         if not self.use_maya_color_space_rules:
-            cmds.setAttr(f"{node}.colorSpace", color_space, type="string")
-
-        if UVTilingModes.OFF == self.uv_tiling_mode:
-            cmds.setAttr(f"{node}.uvTilingMode", 0)
-        elif UVTilingModes.ZBRUSH == self.uv_tiling_mode:
-            cmds.setAttr(f"{node}.uvTilingMode", 1)
-        elif UVTilingModes.MUDBOX == self.uv_tiling_mode:
-            cmds.setAttr(f"{node}.uvTilingMode", 2)
-        elif UVTilingModes.MARI == self.uv_tiling_mode:
-            cmds.setAttr(f"{node}.uvTilingMode", 3)
+            self.builder.set_attr(node, "colorSpace", color_space)
+
+        uv_tiling_mode_value = self._get_uv_tiling_mode_value()
+
+        if uv_tiling_mode_value is not None:
+            self.builder.set_attr(node, "uvTilingMode", uv_tiling_mode_value)
+
+    @utils.profile
+    def _update_texture_network(
+        self,
+        color_space: str,
+        file_path: str,
+        node: str,
+        attr: str,
+        create_network: Callable[[], None],
+    ) -> int:
+
+        branch = self._get_texture_branch(node, attr)
+
+        if branch is None:
+            utils.Logger.debug(f"Skipped {node}.{attr}, it is not a texture branch.")
+            return 0
+
+        if not branch:
+            if not file_path:
+                return 0
+
+            create_network()
+
+            return 1
+
+        branch_nodes = [branch_node for branch_node, _ in branch]
+        has_triplanar = any(node_type == self.TRIPLANAR_NODE for _, node_type in branch)
+
+        # Branches are only rebuilt when they are no longer wanted or their shape
+        # changed, otherwise just the file node settings that differ are set.
+        if not file_path or has_triplanar != self.use_triplanar:
+            self.builder.delete_nodes(branch_nodes)
+
+            if not file_path:
+                return 1
+
+            create_network()
+
+            return 1
+
+        file_node = branch_nodes[-1]
+        texture_file_path = self._get_texture_file_path(file_path)
+        change_count = 0
+
+        if cmds.getAttr(f"{file_node}.fileTextureName") != texture_file_path:
+            self.builder.set_attr(file_node, "fileTextureName", texture_file_path)
+            change_count += 1
+
+        if (
+            not self.use_maya_color_space_rules
+            and cmds.getAttr(f"{file_node}.colorSpace") != color_space
+        ):
+            self.builder.set_attr(file_node, "colorSpace", color_space)
+            change_count += 1
+
+        uv_tiling_mode_value = self._get_uv_tiling_mode_value()
+
+        if (
+            uv_tiling_mode_value is not None
+            and cmds.getAttr(f"{file_node}.uvTilingMode") != uv_tiling_mode_value
+        ):
+            self.builder.set_attr(file_node, "uvTilingMode", uv_tiling_mode_value)
+            change_count += 1
+
+        return change_count
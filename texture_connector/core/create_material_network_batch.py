@@ -0,0 +1,186 @@
+"""
+========================================================================================
+Name: create_material_network_batch.py
+Author: Mauricio Gonzalez Soto
+Updated Date: 10-16-2026
+
+Copyright (C) 2024 Mauricio Gonzalez Soto. All rights reserved.
+========================================================================================
+"""
+
+from __future__ import annotations
+
+import maya.cmds as cmds
+
+from typing import Callable
+from typing import Optional
+import time
+
+from texture_connector.core.create_material_network import CreateMaterialNetwork
+from texture_connector.core.texture_converter import TextureConverter
+from texture_connector.core.network_builder import NetworkBuilder
+from texture_connector.core.uv_tiles import UVTiles
+import texture_connector.utils as utils
+
+
+class CreateMaterialNetworkBatch:
+    CHUNK_NAME = "CreateMaterialNetworkBatch"
+
+    def __init__(self, builder: Optional[NetworkBuilder] = None) -> None:
+        self.builder = builder or NetworkBuilder()
+
+        self.elapsed_time = 0.0
+        self.material_networks = []
+        self.progress_callback = None
+        self.texture_converter = None
+        self.timings = []
+        self.undo_enabled = True
+        self.update_existing_materials = False
+        self.updated_count = 0
+
+    def add_material_network(
+        self, name: str, material_network: CreateMaterialNetwork
+    ) -> None:
+
+        material_network.builder = self.builder
+
+        self.material_networks.append((name, material_network))
+
+    @utils.profile
+    def create(
+        self,
+        use_maya_color_space_rules: bool,
+        use_triplanar: bool,
+        uv_tiling_mode: str,
+    ) -> int:
+
+        count = len(self.material_networks)
+        created = 0
+
+        self.elapsed_time = 0.0
+        self.timings = []
+        self.updated_count = 0
+
+        if not count:
+            return created
+
+        UVTiles.invalidate()
+
+        if self.texture_converter is not None:
+            self._convert_textures(uv_tiling_mode)
+
+            if self.texture_converter.is_cancelled():
+                return created
+
+        undo_state = cmds.undoInfo(query=True, state=True)
+
+        if self.undo_enabled:
+            cmds.undoInfo(
+                chunkName=CreateMaterialNetworkBatch.CHUNK_NAME, openChunk=True
+            )
+        elif undo_state:
+            cmds.undoInfo(stateWithoutFlush=False)
+
+        cmds.refresh(suspend=True)
+
+        self.builder.set_batched(True)
+
+        start_time = time.perf_counter()
+
+        try:
+            for i, (name, material_network) in enumerate(self.material_networks):
+                material_start_time = time.perf_counter()
+
+                if self.update_existing_materials and material_network.material_exists(
+                    name
+                ):
+                    material_network.update(
+                        name=name,
+                        use_maya_color_space_rules=use_maya_color_space_rules,
+                        use_triplanar=use_triplanar,
+                        uv_tiling_mode=uv_tiling_mode,
+                    )
+
+                    self.updated_count += 1
+                elif material_network.create(
+                    name=name,
+                    use_maya_color_space_rules=use_maya_color_space_rules,
+                    use_triplanar=use_triplanar,
+                    uv_tiling_mode=uv_tiling_mode,
+                ):
+                    created += 1
+
+                elapsed_time = time.perf_counter() - material_start_time
+                self.timings.append((name, elapsed_time))
+
+                utils.Logger.debug(f"Processed {name!r} in {elapsed_time:.3f}s.")
+
+                if self.progress_callback and not self.progress_callback(
+                    i + 1, count, name, elapsed_time
+                ):
+                    utils.Logger.warning(
+                        f"Material creation canceled after {i + 1} of {count}."
+                    )
+                    break
+
+            with utils.Profiler.scope("NetworkBuilder.commit"):
+                self.builder.commit()
+        finally:
+            self.builder.set_batched(False)
+
+            cmds.refresh(suspend=False)
+
+            if self.undo_enabled:
+                cmds.undoInfo(
+                    chunkName=CreateMaterialNetworkBatch.CHUNK_NAME, closeChunk=True
+                )
+            elif undo_state:
+                cmds.undoInfo(stateWithoutFlush=True)
+
+            cmds.refresh()
+
+            self.elapsed_time = time.perf_counter() - start_time
+
+        return created
+
+    @utils.profile
+    def _convert_textures(self, uv_tiling_mode: str) -> None:
+        file_paths = []
+
+        for _, material_network in self.material_networks:
+            material_network.set_texture_converter(self.texture_converter)
+
+            for file_path in material_network.get_file_paths():
+                file_paths.extend(UVTiles.get_tile_paths(file_path, uv_tiling_mode))
+
+        self.texture_converter.convert(file_paths)
+
+    def get_elapsed_time(self) -> float:
+        return self.elapsed_time
+
+    def get_material_network_count(self) -> int:
+        return len(self.material_networks)
+
+    def get_timings(self) -> list[tuple[str, float]]:
+        return list(self.timings)
+
+    def get_updated_count(self) -> int:
+        return self.updated_count
+
+    def set_progress_callback(
+        self, callback: Optional[Callable[[int, int, str, float], bool]]
+    ) -> None:
+
+        self.progress_callback = callback
+
+    def set_texture_converter(
+        self, texture_converter: Optional[TextureConverter]
+    ) -> None:
+
+        self.texture_converter = texture_converter
+
+    def set_undo_enabled(self, enabled: bool) -> None:
+        self.undo_enabled = enabled
+
+    def set_update_existing_materials(self, enabled: bool) -> None:
+        self.update_existing_materials = enabled
@@ -2,15 +2,18 @@
 ========================================================================================
 Name: create_material_network_redshift.py
 Author: Mauricio Gonzalez Soto
-Updated Date: 12-15-2024
+Updated Date: 10-16-2026
 
 Copyright (C) 2024 Mauricio Gonzalez Soto. All rights reserved.
 ========================================================================================
 """
 
-import maya.cmds as cmds
+from typing import Any
+from typing import Optional
 
 from texture_connector.core.create_material_network import CreateMaterialNetwork
+from texture_connector.core.network_builder import NetworkBuilder
+import texture_connector.utils as utils
 
 
 class CreateMaterialNetworkRedshift(CreateMaterialNetwork):
@@ -23,32 +26,35 @@ class CreateMaterialNetworkRedshift(CreateMaterialNetwork):
     OPACITY_MATERIAL_INPUT_NAME = "opacity_color"
     ROUGHNESS_MATERIAL_INPUT_NAME = "refl_roughness"
 
+    TRIPLANAR_NODE = "RedshiftTriPlanar"
     TRIPLANAR_INPUT_NAME = "imageX"
     TRIPLANAR_ALPHA_OUTPUT_NAME = "outAlpha"
     TRIPLANAR_COLOR_OUTPUT_NAME = "outColor"
 
-    def __init__(self) -> None:
-        super().__init__()
+    def __init__(self, builder: Optional[NetworkBuilder] = None) -> None:
+        super().__init__(builder)
 
+    @utils.profile
     def _create_emissive_network(self) -> None:
         super()._create_emissive_network()
 
-        cmds.setAttr(f"{self.material}.emission_weight", 1)
+        self.builder.set_attr(self.material, "emission_weight", 1)
 
-    def _create_triplanar_node_network(self, name: str) -> str:
+    @utils.profile
+    def _create_triplanar_node_network(self, name: str) -> Any:
         super()._create_triplanar_node_network(name)
 
-        triplanar_node = cmds.shadingNode(
-            "RedshiftTriPlanar", asTexture=True, name=f"{name}_RedshiftTriPlanar"
+        triplanar_node = self.builder.create_node(
+            self.TRIPLANAR_NODE,
+            name=f"{name}_{self.TRIPLANAR_NODE}",
+            classification=NetworkBuilder.TEXTURE,
         )
 
-        cmds.setAttr(f"{triplanar_node}.projSpaceType", 0)
+        self.builder.set_attr(triplanar_node, "projSpaceType", 0)
 
         for i in range(3):
-            cmds.connectAttr(
-                f"{self.float_constant_node}.outFloat",
-                f"{triplanar_node}.scale.scale{i}",
-                force=True,
+            self.builder.connect_attr(
+                self.float_constant_node, "outFloat", triplanar_node, f"scale.scale{i}"
             )
 
         return triplanar_node
@@ -2,15 +2,18 @@
 ========================================================================================
 Name: create_network_network_v_ray.py
 Author: Mauricio Gonzalez Soto
-Updated Date: 12-15-2024
+Updated Date: 10-16-2026
 
 Copyright (C) 2024 Mauricio Gonzalez Soto. All rights reserved.
 ========================================================================================
 """
 
-import maya.cmds as cmds
+from typing import Any
+from typing import Optional
 
 from texture_connector.core.create_material_network import CreateMaterialNetwork
+from texture_connector.core.network_builder import NetworkBuilder
+import texture_connector.utils as utils
 
 
 class CreateMaterialNetworkVRay(CreateMaterialNetwork):
@@ -23,37 +26,43 @@ class CreateMaterialNetworkVRay(CreateMaterialNetwork):
     OPACITY_MATERIAL_INPUT_NAME = "opacityMap"
     ROUGHNESS_MATERIAL_INPUT_NAME = "reflectionGlossiness"
 
+    TRIPLANAR_NODE = "VRayTriplanar"
     TRIPLANAR_INPUT_NAME = "textureX"
     TRIPLANAR_ALPHA_OUTPUT_NAME = "outAlpha"
     TRIPLANAR_COLOR_OUTPUT_NAME = "outColor"
 
     USE_BUMP_2D_NODE = False
 
-    def __init__(self) -> None:
-        super().__init__()
+    def __init__(self, builder: Optional[NetworkBuilder] = None) -> None:
+        super().__init__(builder)
 
+    @utils.profile
     def _create_normal_network(self) -> None:
         super()._create_normal_network()
 
-        cmds.setAttr(f"{self.material}.bumpMapType", 1)
+        self.builder.set_attr(self.material, "bumpMapType", 1)
 
+    @utils.profile
     def _create_roughness_network(self) -> None:
         super()._create_roughness_network()
 
-        cmds.setAttr(f"{self.material}.reflectionColor", 1, 1, 1, type="double3")
-        cmds.setAttr(f"{self.material}.useRoughness", 1)
+        self.builder.set_attr(self.material, "reflectionColor", (1, 1, 1))
+        self.builder.set_attr(self.material, "useRoughness", 1)
 
-    def _create_triplanar_node_network(self, name: str) -> str:
+    @utils.profile
+    def _create_triplanar_node_network(self, name: str) -> Any:
         super()._create_triplanar_node_network(name)
 
-        triplanar_node = cmds.shadingNode(
-            "VRayTriplanar", asTexture=True, name=f"{name}_VRayTriplanar"
+        triplanar_node = self.builder.create_node(
+            self.TRIPLANAR_NODE,
+            name=f"{name}_{self.TRIPLANAR_NODE}",
+            classification=NetworkBuilder.TEXTURE,
         )
 
-        cmds.setAttr(f"{triplanar_node}.refSpace", 1)
+        self.builder.set_attr(triplanar_node, "refSpace", 1)
 
-        cmds.connectAttr(
-            f"{self.float_constant_node}.outFloat", f"{triplanar_node}.size", force=True
+        self.builder.connect_attr(
+            self.float_constant_node, "outFloat", triplanar_node, "size"
         )
 
         return triplanar_node
@@ -0,0 +1,161 @@
+"""
+========================================================================================
+Name: material_status_resolver.py
+Author: Mauricio Gonzalez Soto
+Updated Date: 10-16-2026
+
+Copyright (C) 2024 Mauricio Gonzalez Soto. All rights reserved.
+========================================================================================
+"""
+
+from __future__ import annotations
+
+import maya.api.OpenMaya as om
+import maya.cmds as cmds
+
+from typing import Callable
+from typing import Optional
+
+from texture_connector.config import RenderPlugins
+import texture_connector.utils as utils
+
+
+class MaterialStatusResolver:
+    MATERIAL_TYPES = {
+        RenderPlugins.ARNOLD.value[0]: "aiStandardSurface",
+        RenderPlugins.REDSHIFT.value[0]: "RedshiftStandardMaterial",
+        RenderPlugins.V_RAY.value[0]: "VRayMtl",
+    }
+
+    def __init__(self) -> None:
+        self.material_type = ""
+        self.changed_callback = None
+
+        self.call_backs = []
+        self.tracking = False
+
+        self._node_names = None
+
+    def _add_call_backs(self) -> None:
+        if self.call_backs or not self.material_type:
+            return
+
+        try:
+            self.call_backs.append(
+                om.MDGMessage.addNodeAddedCallback(self._node_added, self.material_type)
+            )
+            self.call_backs.append(
+                om.MDGMessage.addNodeRemovedCallback(
+                    self._node_removed, self.material_type
+                )
+            )
+        except RuntimeError as e:
+            utils.Logger.debug(
+                f"Could not track {self.material_type!r} nodes, {e}. Is the render "
+                f"plugin loaded?"
+            )
+
+            self._remove_call_backs()
+            return
+
+        # Nodes built through a modifier are created with a default name and renamed
+        # afterwards, so renames have to be tracked as well.
+        self.call_backs.append(
+            om.MNodeMessage.addNameChangedCallback(
+                om.MObject.kNullObj, self._node_name_changed
+            )
+        )
+
+    def _get_material_name(self, node_name: str) -> Optional[str]:
+        suffix = f"_{self.material_type}"
+
+        if not node_name.endswith(suffix):
+            return None
+
+        return node_name[: -len(suffix)]
+
+    def _get_node_names(self) -> set[str]:
+        if self._node_names is None:
+            if self.material_type:
+                try:
+                    self._node_names = set(cmds.ls(type=self.material_type) or [])
+                except RuntimeError:
+                    self._node_names = set()
+            else:
+                self._node_names = set()
+
+        return self._node_names
+
+    def _node_added(self, node: om.MObject, *args) -> None:
+        if self._node_names is None:
+            return
+
+        node_name = om.MFnDependencyNode(node).name()
+        self._node_names.add(node_name)
+        self._notify(node_name)
+
+    def _node_name_changed(self, node: om.MObject, previous_name: str, *args) -> None:
+        if self._node_names is None or previous_name not in self._node_names:
+            return
+
+        node_name = om.MFnDependencyNode(node).name()
+
+        self._node_names.discard(previous_name)
+        self._node_names.add(node_name)
+
+        self._notify(previous_name)
+        self._notify(node_name)
+
+    def _node_removed(self, node: om.MObject, *args) -> None:
+        if self._node_names is None:
+            return
+
+        node_name = om.MFnDependencyNode(node).name()
+        self._node_names.discard(node_name)
+        self._notify(node_name)
+
+    def _notify(self, node_name: str) -> None:
+        material_name = self._get_material_name(node_name)
+
+        if material_name is not None and self.changed_callback is not None:
+            self.changed_callback(material_name)
+
+    def _remove_call_backs(self) -> None:
+        if self.call_backs:
+            om.MMessage.removeCallbacks(self.call_backs)
+
+            self.call_backs.clear()
+
+        # Without callbacks the cached nodes can no longer be trusted.
+        self.invalidate()
+
+    def create_call_backs(self) -> None:
+        self.tracking = True
+
+        self._add_call_backs()
+
+    def delete_call_backs(self) -> None:
+        self.tracking = False
+
+        self._remove_call_backs()
+
+    def exists(self, material_name: str) -> bool:
+        return f"{material_name}_{self.material_type}" in self._get_node_names()
+
+    def invalidate(self) -> None:
+        self._node_names = None
+
+    def set_changed_callback(self, callback: Optional[Callable[[str], None]]) -> None:
+        self.changed_callback = callback
+
+    def set_render_engine(self, render_engine: str) -> None:
+        material_type = MaterialStatusResolver.MATERIAL_TYPES.get(render_engine, "")
+
+        if material_type == self.material_type:
+            return
+
+        self._remove_call_backs()
+        self.material_type = material_type
+
+        if self.tracking:
+            self._add_call_backs()
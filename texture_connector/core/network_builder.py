@@ -0,0 +1,280 @@
+"""
+========================================================================================
+Name: network_builder.py
+Author: Mauricio Gonzalez Soto
+Updated Date: 10-16-2026
+
+Copyright (C) 2024 Mauricio Gonzalez Soto. All rights reserved.
+========================================================================================
+"""
+
+from __future__ import annotations
+
+import maya.api.OpenMaya as om
+import maya.cmds as cmds
+
+from typing import Any
+import os
+
+
+class NetworkBuilder:
+    SHADER = "asShader"
+    TEXTURE = "asTexture"
+    UTILITY = "asUtility"
+
+    def __init__(self) -> None:
+        self.batched = False
+        self.placement_nodes = {}
+
+    def begin(self) -> None:
+        cmds.undoInfo(chunkName="CreateMaterialNetwork", openChunk=True)
+
+    def commit(self) -> None:
+        pass
+
+    def connect_attr(
+        self, source: Any, source_attr: str, destination: Any, destination_attr: str
+    ) -> None:
+
+        cmds.connectAttr(
+            f"{source}.{source_attr}", f"{destination}.{destination_attr}", force=True
+        )
+
+    def create_node(
+        self,
+        node_type: str,
+        name: str,
+        classification: str,
+        color_managed: bool = False,
+    ) -> Any:
+
+        flags = {classification: True}
+
+        if color_managed:
+            flags["isColorManaged"] = True
+
+        return cmds.shadingNode(node_type, name=name, **flags)
+
+    def create_shading_engine(self, name: str) -> Any:
+        return cmds.sets(renderable=True, noSurfaceShader=True, empty=True, name=name)
+
+    def delete_nodes(self, nodes: list[Any]) -> None:
+        cmds.delete(nodes)
+
+    def end(self) -> None:
+        cmds.select(clear=True)
+
+        cmds.undoInfo(chunkName="CreateMaterialNetwork", closeChunk=True)
+
+    def get_name(self, node: Any) -> str:
+        return node
+
+    def get_placement_node(self, key: Any) -> Any:
+        return self.placement_nodes.get(key)
+
+    def set_attr(self, node: Any, attr: str, value: Any) -> None:
+        if isinstance(value, str):
+            cmds.setAttr(f"{node}.{attr}", value, type="string")
+        elif isinstance(value, (list, tuple)):
+            cmds.setAttr(f"{node}.{attr}", *value)
+        else:
+            cmds.setAttr(f"{node}.{attr}", value)
+
+    def set_batched(self, batched: bool) -> None:
+        self.batched = batched
+
+    def set_placement_node(self, key: Any, node: Any) -> None:
+        self.placement_nodes[key] = node
+
+
+class ModifierNetworkBuilder(NetworkBuilder):
+    COMMAND_NAME = "textureConnectorCommitModifier"
+    PLUGIN_PATH = os.path.join(os.path.dirname(__file__), "network_builder_command.py")
+
+    DEFAULT_LISTS = {
+        NetworkBuilder.SHADER: (":defaultShaderList1", "shaders"),
+        NetworkBuilder.TEXTURE: (":defaultTextureList1", "textures"),
+        NetworkBuilder.UTILITY: (":defaultRenderUtilityList1", "utilities"),
+    }
+
+    COLOR_MANAGEMENT_ATTRIBUTES = (
+        ("cmEnabled", "colorManagementEnabled"),
+        ("configFileEnabled", "colorManagementConfigFileEnabled"),
+        ("configFilePath", "colorManagementConfigFilePath"),
+        ("workingSpaceName", "workingSpace"),
+    )
+
+    _pending_modifier = None
+
+    def __init__(self) -> None:
+        super().__init__()
+
+        self.modifier = om.MDGModifier()
+        self.operation_count = 0
+
+        self._default_nodes = {}
+        self._next_indices = {}
+
+    def _connect_to_next_available(
+        self, source: om.MObject, source_attr: str, node_name: str, attr: str
+    ) -> None:
+
+        key = (node_name, attr)
+        array_plug = self._get_plug(self._get_default_node(node_name), attr)
+
+        if key not in self._next_indices:
+            indices = array_plug.getExistingArrayAttributeIndices()
+            self._next_indices[key] = indices[-1] + 1 if indices else 0
+
+        index = self._next_indices[key]
+        self._next_indices[key] += 1
+
+        self.modifier.connect(
+            self._get_plug(source, source_attr),
+            array_plug.elementByLogicalIndex(index),
+        )
+
+    def _get_default_node(self, node_name: str) -> om.MObject:
+        if node_name not in self._default_nodes:
+            selection_list = om.MSelectionList()
+            selection_list.add(node_name)
+            self._default_nodes[node_name] = selection_list.getDependNode(0)
+
+        return self._default_nodes[node_name]
+
+    @staticmethod
+    def _get_node(node: om.MObject | str) -> om.MObject:
+        if not isinstance(node, str):
+            return node
+
+        selection_list = om.MSelectionList()
+        selection_list.add(node)
+
+        return selection_list.getDependNode(0)
+
+    def _get_plug(self, node: om.MObject | str, attr: str) -> om.MPlug:
+        return om.MFnDependencyNode(self._get_node(node)).findPlug(
+            attr.rsplit(".", 1)[-1], False
+        )
+
+    @staticmethod
+    def _is_float_plug(plug: om.MPlug) -> bool:
+        attribute = plug.attribute()
+
+        if attribute.hasFn(om.MFn.kNumericAttribute):
+            return om.MFnNumericAttribute(attribute).numericType() in (
+                om.MFnNumericData.kFloat,
+                om.MFnNumericData.kDouble,
+            )
+
+        return attribute.hasFn(om.MFn.kUnitAttribute)
+
+    @classmethod
+    def _load_plugin(cls) -> None:
+        if not cmds.pluginInfo(cls.PLUGIN_PATH, query=True, loaded=True):
+            cmds.loadPlugin(cls.PLUGIN_PATH, quiet=True)
+
+    def _set_plug_value(self, plug: om.MPlug, value: Any) -> None:
+        if isinstance(value, (list, tuple)):
+            for i, child_value in enumerate(value):
+                self._set_plug_value(plug.child(i), child_value)
+        elif isinstance(value, str):
+            self.modifier.newPlugValueString(plug, value)
+        elif isinstance(value, bool):
+            self.modifier.newPlugValueBool(plug, value)
+        elif isinstance(value, int) and not self._is_float_plug(plug):
+            self.modifier.newPlugValueInt(plug, value)
+        else:
+            self.modifier.newPlugValueDouble(plug, float(value))
+
+    def begin(self) -> None:
+        pass
+
+    def commit(self) -> None:
+        if not self.operation_count:
+            return
+
+        self._load_plugin()
+
+        ModifierNetworkBuilder._pending_modifier = self.modifier
+        getattr(cmds, ModifierNetworkBuilder.COMMAND_NAME)()
+
+        self.modifier = om.MDGModifier()
+        self.operation_count = 0
+        self._next_indices = {}
+
+    def connect_attr(
+        self,
+        source: om.MObject | str,
+        source_attr: str,
+        destination: om.MObject | str,
+        destination_attr: str,
+    ) -> None:
+
+        self.modifier.connect(
+            self._get_plug(source, source_attr),
+            self._get_plug(destination, destination_attr),
+        )
+        self.operation_count += 1
+
+    def create_node(
+        self,
+        node_type: str,
+        name: str,
+        classification: str,
+        color_managed: bool = False,
+    ) -> om.MObject:
+
+        node = self.modifier.createNode(node_type)
+        self.modifier.renameNode(node, name)
+
+        self._connect_to_next_available(
+            node, "message", *ModifierNetworkBuilder.DEFAULT_LISTS[classification]
+        )
+
+        if color_managed:
+            color_management_globals = self._get_default_node(":defaultColorMgtGlobals")
+
+            for source_attr, attr in ModifierNetworkBuilder.COLOR_MANAGEMENT_ATTRIBUTES:
+                self.modifier.connect(
+                    self._get_plug(color_management_globals, source_attr),
+                    self._get_plug(node, attr),
+                )
+
+        self.operation_count += 1
+
+        return node
+
+    def create_shading_engine(self, name: str) -> om.MObject:
+        node = self.modifier.createNode("shadingEngine")
+        self.modifier.renameNode(node, name)
+
+        self._connect_to_next_available(node, "partition", ":renderPartition", "sets")
+        self.operation_count += 1
+
+        return node
+
+    def delete_nodes(self, nodes: list[om.MObject | str]) -> None:
+        for node in nodes:
+            self.modifier.deleteNode(self._get_node(node))
+
+        self.operation_count += 1
+
+    def end(self) -> None:
+        # Without a batch to commit the modifier, every material network is one.
+        if not self.batched:
+            self.commit()
+
+    def get_name(self, node: om.MObject | str) -> str:
+        return om.MFnDependencyNode(self._get_node(node)).name()
+
+    @classmethod
+    def pop_pending_modifier(cls) -> om.MDGModifier:
+        modifier = cls._pending_modifier
+        cls._pending_modifier = None
+
+        return modifier
+
+    def set_attr(self, node: om.MObject | str, attr: str, value: Any) -> None:
+        self._set_plug_value(self._get_plug(node, attr), value)
+        self.operation_count += 1
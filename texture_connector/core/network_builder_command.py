@@ -0,0 +1,53 @@
+"""
+========================================================================================
+Name: network_builder_command.py
+Author: Mauricio Gonzalez Soto
+Updated Date: 10-16-2026
+
+Copyright (C) 2024 Mauricio Gonzalez Soto. All rights reserved.
+========================================================================================
+"""
+
+import maya.api.OpenMaya as om
+
+from texture_connector.core.network_builder import ModifierNetworkBuilder
+
+
+def maya_useNewAPI() -> None:
+    pass
+
+
+class CommitModifierCommand(om.MPxCommand):
+    def __init__(self) -> None:
+        super().__init__()
+
+        self.modifier = None
+
+    @classmethod
+    def creator(cls) -> "CommitModifierCommand":
+        return cls()
+
+    def doIt(self, args: om.MArgList) -> None:
+        self.modifier = ModifierNetworkBuilder.pop_pending_modifier()
+
+        if self.modifier is not None:
+            self.redoIt()
+
+    def isUndoable(self) -> bool:
+        return self.modifier is not None
+
+    def redoIt(self) -> None:
+        self.modifier.doIt()
+
+    def undoIt(self) -> None:
+        self.modifier.undoIt()
+
+
+def initializePlugin(plugin: om.MObject) -> None:
+    om.MFnPlugin(plugin, "Mauricio Gonzalez Soto").registerCommand(
+        ModifierNetworkBuilder.COMMAND_NAME, CommitModifierCommand.creator
+    )
+
+
+def uninitializePlugin(plugin: om.MObject) -> None:
+    om.MFnPlugin(plugin).deregisterCommand(ModifierNetworkBuilder.COMMAND_NAME)
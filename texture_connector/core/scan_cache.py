@@ -0,0 +1,212 @@
+"""
+========================================================================================
+Name: scan_cache.py
+Author: Mauricio Gonzalez Soto
+Updated Date: 10-17-2026
+
+Copyright (C) 2024 Mauricio Gonzalez Soto. All rights reserved.
+========================================================================================
+"""
+
+from __future__ import annotations
+
+from typing import Optional
+import threading
+import json
+import time
+import os
+
+import texture_connector.utils as utils
+
+
+class ScanCache:
+    VERSION = 1
+
+    MAX_ENTRIES = 500_000
+
+    # Directory mtimes can have a resolution of a couple of seconds on network
+    # shares, so listings that recent are not trusted.
+    MIN_DIRECTORY_AGE_NS = 2_000_000_000
+
+    def __init__(self, cache_path: str) -> None:
+        self.cache_path = cache_path
+        self.error = ""
+
+        self._roots = None
+        self._root_key = ""
+        self._signature = []
+        self._classified = True
+        self._visited_directories = set()
+        self._changed = False
+
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _get_entry_count(root: dict) -> int:
+        return sum(
+            1 + len(directory["images"]) for directory in root["directories"].values()
+        )
+
+    @staticmethod
+    def _get_root_key(root_path: str) -> str:
+        return os.path.normcase(os.path.abspath(root_path))
+
+    def _get_directories(self) -> dict:
+        root = self._roots.get(self._root_key) if self._roots else None
+
+        # The cache can be cleared under a scan, which then only stops caching.
+        return root["directories"] if root is not None else {}
+
+    def _evict(self) -> None:
+        entry_counts = {
+            root_key: self._get_entry_count(root)
+            for root_key, root in self._roots.items()
+        }
+        total_entry_count = sum(entry_counts.values())
+
+        root_keys = sorted(self._roots, key=lambda k: self._roots[k]["lastUsed"])
+
+        for root_key in root_keys:
+            if total_entry_count <= ScanCache.MAX_ENTRIES:
+                break
+
+            if root_key == self._root_key:
+                continue
+
+            total_entry_count -= entry_counts[root_key]
+            del self._roots[root_key]
+
+            self._changed = True
+
+            utils.Logger.debug(f"Evicted {root_key!r} from the scan cache.")
+
+    def _load(self) -> None:
+        if self._roots is not None:
+            return
+
+        self._roots = {}
+
+        try:
+            with open(self.cache_path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return
+
+        if isinstance(data, dict) and data.get("version") == ScanCache.VERSION:
+            self._roots = data.get("roots", {})
+
+    def begin(self, root_path: str, signature: tuple[tuple[str, str], ...]) -> None:
+
+        with self._lock:
+            self._load()
+
+            self._root_key = self._get_root_key(root_path)
+            self._signature = [list(item) for item in signature]
+            self._visited_directories = set()
+
+            root = self._roots.setdefault(
+                self._root_key,
+                {"signature": self._signature, "lastUsed": 0.0, "directories": {}},
+            )
+            root["lastUsed"] = time.time()
+
+            self._classified = root["signature"] == self._signature
+
+    def clear(self) -> None:
+        with self._lock:
+            self._roots = {}
+            self._root_key = ""
+            self._visited_directories = set()
+            self._changed = False
+
+            if os.path.exists(self.cache_path):
+                os.remove(self.cache_path)
+
+        utils.Logger.info("Scan cache cleared.")
+
+    def end(self, completed: bool) -> None:
+        with self._lock:
+            if not self._root_key:
+                return
+
+            root = self._roots[self._root_key]
+
+            if completed:
+                directories = root["directories"]
+
+                for directory_path in directories.keys() - self._visited_directories:
+                    del directories[directory_path]
+                    self._changed = True
+
+                if root["signature"] != self._signature:
+                    root["signature"] = self._signature
+                    self._changed = True
+
+            self._evict()
+
+            self._root_key = ""
+            self._visited_directories = set()
+
+            if self._changed:
+                self.save()
+
+    def get_directory(
+        self, directory_path: str, mtime: int
+    ) -> Optional[tuple[list[tuple[str, str, str]], list[tuple[str, bool]]]]:
+
+        with self._lock:
+            self._visited_directories.add(directory_path)
+
+            directory = self._get_directories().get(directory_path)
+
+            if directory is None or directory["mtime"] != mtime:
+                return None
+
+            return directory["images"], directory["subdirectories"]
+
+    def is_classified(self) -> bool:
+        return self._classified
+
+    def save(self) -> None:
+        data = {"version": ScanCache.VERSION, "roots": self._roots or {}}
+        temp_path = f"{self.cache_path}.tmp"
+
+        try:
+            os.makedirs(os.path.dirname(self.cache_path), exist_ok=True)
+
+            with open(temp_path, "w", encoding="utf-8") as f:
+                json.dump(data, f, separators=(",", ":"))
+
+            os.replace(temp_path, self.cache_path)
+        except OSError as e:
+            # Saving runs on the scan thread, the error is reported by the caller.
+            self.error = str(e)
+            return
+
+        self.error = ""
+        self._changed = False
+
+    def set_directory(
+        self,
+        directory_path: str,
+        mtime: int,
+        images: list[tuple[str, str, str]],
+        subdirectories: list[tuple[str, bool]],
+    ) -> None:
+
+        with self._lock:
+            directories = self._get_directories()
+
+            if time.time_ns() - mtime < ScanCache.MIN_DIRECTORY_AGE_NS:
+                if directories.pop(directory_path, None) is not None:
+                    self._changed = True
+
+                return
+
+            directories[directory_path] = {
+                "mtime": mtime,
+                "images": images,
+                "subdirectories": subdirectories,
+            }
+
+            self._changed = True
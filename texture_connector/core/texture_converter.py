@@ -0,0 +1,302 @@
+"""
+========================================================================================
+Name: texture_converter.py
+Author: Mauricio Gonzalez Soto
+Updated Date: 10-17-2026
+
+Copyright (C) 2024 Mauricio Gonzalez Soto. All rights reserved.
+========================================================================================
+"""
+
+from __future__ import annotations
+
+from concurrent.futures import FIRST_COMPLETED
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import wait
+from typing import Callable
+from typing import Iterable
+from typing import Optional
+import subprocess
+import threading
+import shlex
+import time
+import os
+
+from texture_connector.config import RenderPlugins
+import texture_connector.utils as utils
+
+
+class TextureConverter:
+    INPUT_TOKEN = "{input}"
+    OUTPUT_TOKEN = "{output}"
+
+    COMMANDS = {
+        RenderPlugins.ARNOLD.value[0]: (
+            'maketx -u --oiio "{input}" -o "{output}"',
+            ".tx",
+        ),
+        RenderPlugins.REDSHIFT.value[0]: (
+            'redshiftTextureProcessor "{input}"',
+            ".rstexbin",
+        ),
+    }
+
+    POLL_INTERVAL = 0.1
+    TIMEOUT = 600
+    WORKERS = 4
+
+    def __init__(self) -> None:
+        self.command = ""
+        self.output_extension = ""
+        self.workers = TextureConverter.WORKERS
+
+        self.converted_count = 0
+        self.skipped_count = 0
+        self.failed_count = 0
+        self.elapsed_time = 0.0
+
+        self.progress_callback = None
+
+        self._cancel_event = threading.Event()
+
+        self._processes = set()
+        self._processes_lock = threading.Lock()
+
+        self._conflicting_file_paths = set()
+
+    def _convert(self, file_path: str) -> tuple[bool, str]:
+        if self._cancel_event.is_set():
+            return False, ""
+
+        output_path = self.get_output_path(file_path)
+        args = self._get_args(file_path, output_path)
+
+        try:
+            process = subprocess.Popen(
+                args,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE,
+                text=True,
+            )
+        except OSError as e:
+            return False, f"Could not convert {file_path!r}: {e}"
+
+        # Registered under the lock so a cancel never misses a process that is just
+        # starting, it is killed here instead.
+        with self._processes_lock:
+            if self._cancel_event.is_set():
+                process.kill()
+
+            self._processes.add(process)
+
+        try:
+            stdout, stderr = process.communicate(timeout=TextureConverter.TIMEOUT)
+        except subprocess.TimeoutExpired:
+            process.kill()
+            process.communicate()
+
+            self._remove_output(output_path)
+
+            return False, (
+                f"Could not convert {file_path!r}, {args[0]!r} timed out after "
+                f"{TextureConverter.TIMEOUT}s."
+            )
+        finally:
+            with self._processes_lock:
+                self._processes.discard(process)
+
+        if self._cancel_event.is_set() and process.returncode:
+            self._remove_output(output_path)
+            return False, ""
+
+        if process.returncode or not os.path.isfile(output_path):
+            output = (stderr or stdout).strip()
+
+            return False, (
+                f"Could not convert {file_path!r}, {args[0]!r} exited with "
+                f"{process.returncode}. {output}"
+            )
+
+        return True, ""
+
+    def _get_args(self, file_path: str, output_path: str) -> list[str]:
+        posix = os.name != "nt"
+        args = []
+
+        # Paths are substituted after splitting so spaces in them are kept.
+        for arg in shlex.split(self.command, posix=posix):
+            if not posix and len(arg) > 1 and arg[0] == arg[-1] == '"':
+                arg = arg[1:-1]
+
+            args.append(
+                arg.replace(TextureConverter.INPUT_TOKEN, file_path).replace(
+                    TextureConverter.OUTPUT_TOKEN, output_path
+                )
+            )
+
+        return args
+
+    @staticmethod
+    def _remove_output(output_path: str) -> None:
+        # A killed converter can leave a partial file that would look up to date.
+        try:
+            os.remove(output_path)
+        except OSError:
+            pass
+
+    def cancel(self) -> None:
+        self._cancel_event.set()
+
+        with self._processes_lock:
+            for process in self._processes:
+                process.kill()
+
+    def convert(self, file_paths: Iterable[str]) -> int:
+        self.converted_count = 0
+        self.skipped_count = 0
+        self.failed_count = 0
+        self.elapsed_time = 0.0
+
+        self._cancel_event.clear()
+        self._conflicting_file_paths = set()
+
+        if not self.is_enabled():
+            return 0
+
+        start_time = time.perf_counter()
+
+        source_file_paths = {}
+
+        for file_path in dict.fromkeys(file_paths):
+            source_file_paths.setdefault(self.get_output_path(file_path), []).append(
+                file_path
+            )
+
+        pending_file_paths = []
+
+        for output_path, sources in source_file_paths.items():
+            # Sources that only differ by extension share an output, only one of them
+            # is converted and the others keep their own file.
+            file_path = min(sources, key=lambda f: (f != output_path, f))
+
+            if len(sources) > 1:
+                self._conflicting_file_paths.update(
+                    conflicting_file_path
+                    for conflicting_file_path in sources
+                    if conflicting_file_path != file_path
+                )
+                utils.Logger.warning(
+                    f"{len(sources)} textures would be converted to "
+                    f"{output_path!r}, only {file_path!r} is converted."
+                )
+
+            if self.is_up_to_date(file_path):
+                self.skipped_count += 1
+            else:
+                pending_file_paths.append(file_path)
+
+        count = len(pending_file_paths)
+
+        # Every job waits on its own converter process, so the thread count bounds
+        # how many of them run at once. Results are logged here since the workers
+        # must not call into Maya.
+        with ThreadPoolExecutor(
+            max_workers=self.workers, thread_name_prefix="TextureConverter"
+        ) as executor:
+            futures = {
+                executor.submit(self._convert, file_path): file_path
+                for file_path in pending_file_paths
+            }
+            running = set(futures)
+
+            file_path = pending_file_paths[0] if pending_file_paths else ""
+            finished = 0
+
+            # Polls instead of waiting for the next result, so the progress callback
+            # and with it a cancel still run while a long conversion is busy.
+            while running:
+                done, running = wait(
+                    running,
+                    timeout=TextureConverter.POLL_INTERVAL,
+                    return_when=FIRST_COMPLETED,
+                )
+
+                for future in done:
+                    file_path = futures[future]
+                    finished += 1
+
+                    converted, message = future.result()
+
+                    if converted:
+                        self.converted_count += 1
+                    elif not self._cancel_event.is_set():
+                        self.failed_count += 1
+                        utils.Logger.warning(message)
+
+                if (
+                    self.progress_callback
+                    and not self._cancel_event.is_set()
+                    and not self.progress_callback(finished, count, file_path)
+                ):
+                    utils.Logger.warning(
+                        f"Texture conversion canceled after {finished} of {count}."
+                    )
+
+                    self.cancel()
+
+        self.elapsed_time = time.perf_counter() - start_time
+
+        utils.Logger.info(
+            f"{self.converted_count} texture(s) converted, {self.skipped_count} up "
+            f"to date and {self.failed_count} failed in {self.elapsed_time:.2f}s."
+        )
+
+        return self.converted_count
+
+    def get_converted_path(self, file_path: str) -> Optional[str]:
+        if file_path in self._conflicting_file_paths:
+            return None
+
+        if not self.is_enabled() or not self.is_up_to_date(file_path):
+            return None
+
+        return self.get_output_path(file_path)
+
+    def get_output_path(self, file_path: str) -> str:
+        return f"{os.path.splitext(file_path)[0]}{self.output_extension}"
+
+    def is_cancelled(self) -> bool:
+        return self._cancel_event.is_set()
+
+    def is_enabled(self) -> bool:
+        return bool(self.command and self.output_extension)
+
+    def is_up_to_date(self, file_path: str) -> bool:
+        output_path = self.get_output_path(file_path)
+
+        if output_path == file_path:
+            return True
+
+        try:
+            return os.stat(output_path).st_mtime_ns >= os.stat(file_path).st_mtime_ns
+        except OSError:
+            return False
+
+    def set_command(self, command: str, output_extension: str) -> None:
+        self.command = command.strip()
+        self.output_extension = output_extension.strip()
+
+        if self.output_extension and not self.output_extension.startswith("."):
+            self.output_extension = f".{self.output_extension}"
+
+    def set_progress_callback(
+        self, callback: Optional[Callable[[int, int, str], bool]]
+    ) -> None:
+
+        self.progress_callback = callback
+
+    def set_render_engine(self, render_engine: str) -> None:
+        self.set_command(*TextureConverter.COMMANDS.get(render_engine, ("", "")))
+
+    def set_workers(self, workers: int) -> None:
+        self.workers = max(1, workers)
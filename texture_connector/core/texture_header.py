@@ -0,0 +1,324 @@
+"""
+========================================================================================
+Name: texture_header.py
+Author: Mauricio Gonzalez Soto
+Updated Date: 10-16-2026
+
+Copyright (C) 2024 Mauricio Gonzalez Soto. All rights reserved.
+========================================================================================
+"""
+
+from __future__ import annotations
+
+from concurrent.futures import ThreadPoolExecutor
+from typing import BinaryIO
+from typing import Iterable
+from typing import Optional
+import threading
+import struct
+import os
+
+import texture_connector.utils as utils
+
+
+class TextureHeader:
+    __slots__ = ("image_format", "width", "height", "bit_depth", "channels")
+
+    def __init__(
+        self,
+        image_format: str,
+        width: int,
+        height: int,
+        bit_depth: int,
+        channels: int,
+    ) -> None:
+
+        self.image_format = image_format
+        self.width = width
+        self.height = height
+        self.bit_depth = bit_depth
+        self.channels = channels
+
+    def get_description(self) -> str:
+        return (
+            f"{self.width} x {self.height}, {self.bit_depth}-bit, "
+            f"{self.channels} channel(s)"
+        )
+
+
+class TextureHeaderReader:
+    HEADER_SIZE = 4096
+    MAX_HEADER_SIZE = 1 << 20
+    MAX_ENTRIES = 200_000
+    WORKERS = 4
+
+    EXR_MAGIC = b"\x76\x2f\x31\x01"
+    GIF_MAGICS = (b"GIF87a", b"GIF89a")
+    JPEG_MAGIC = b"\xff\xd8"
+    PNG_MAGIC = b"\x89PNG\r\n\x1a\n"
+    TIFF_MAGICS = (b"II*\x00", b"MM\x00*")
+
+    EXR_PIXEL_TYPE_BITS = {0: 32, 1: 16, 2: 32}
+    PNG_COLOR_TYPE_CHANNELS = {0: 1, 2: 3, 3: 3, 4: 2, 6: 4}
+
+    # Start of frame markers, every one but DHT, JPG and DAC.
+    JPEG_SOF_MARKERS = frozenset(range(0xC0, 0xD0)) - {0xC4, 0xC8, 0xCC}
+
+    TIFF_IMAGE_WIDTH = 256
+    TIFF_IMAGE_LENGTH = 257
+    TIFF_BITS_PER_SAMPLE = 258
+    TIFF_SAMPLES_PER_PIXEL = 277
+
+    def __init__(self) -> None:
+        self.workers = TextureHeaderReader.WORKERS
+
+        self._headers = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _parse_exr(f: BinaryIO, data: bytes) -> Optional[TextureHeader]:
+        data = bytearray(data)
+
+        def ensure(size: int) -> bool:
+            while len(data) < size:
+                if len(data) >= TextureHeaderReader.MAX_HEADER_SIZE:
+                    return False
+
+                chunk = f.read(TextureHeaderReader.HEADER_SIZE)
+
+                if not chunk:
+                    return False
+
+                data.extend(chunk)
+
+            return True
+
+        def read_string(offset: int) -> tuple[str, int]:
+            while True:
+                end = data.find(b"\x00", offset)
+
+                if end >= 0:
+                    return data[offset:end].decode("latin-1"), end + 1
+
+                if not ensure(len(data) + 1):
+                    raise ValueError("Truncated OpenEXR header.")
+
+        width = height = 0
+        channel_bits = []
+        offset = 8
+
+        # Only the first part of a multi-part file is described.
+        while True:
+            name, offset = read_string(offset)
+
+            if not name:
+                break
+
+            _, offset = read_string(offset)
+
+            if not ensure(offset + 4):
+                return None
+
+            (size,) = struct.unpack_from("<i", data, offset)
+            offset += 4
+
+            if size < 0 or not ensure(offset + size):
+                return None
+
+            if name == "dataWindow" and size == 16:
+                x_min, y_min, x_max, y_max = struct.unpack_from("<4i", data, offset)
+                width = x_max - x_min + 1
+                height = y_max - y_min + 1
+            elif name == "channels":
+                channel_offset = offset
+
+                while channel_offset < offset + size:
+                    channel_name, channel_offset = read_string(channel_offset)
+
+                    if not channel_name:
+                        break
+
+                    (pixel_type,) = struct.unpack_from("<i", data, channel_offset)
+                    channel_bits.append(
+                        TextureHeaderReader.EXR_PIXEL_TYPE_BITS.get(pixel_type, 0)
+                    )
+
+                    # Pixel type, pLinear, three reserved bytes and the sampling.
+                    channel_offset += 16
+
+            offset += size
+
+        if not width or not height or not channel_bits:
+            return None
+
+        return TextureHeader("exr", width, height, max(channel_bits), len(channel_bits))
+
+    @staticmethod
+    def _parse_gif(f: BinaryIO, data: bytes) -> Optional[TextureHeader]:
+        width, height = struct.unpack_from("<HH", data, 6)
+
+        return TextureHeader("gif", width, height, 8, 3)
+
+    @staticmethod
+    def _parse_jpeg(f: BinaryIO, data: bytes) -> Optional[TextureHeader]:
+        offset = 2
+
+        # Metadata segments such as EXIF thumbnails can come before the frame
+        # header, so segments are skipped with seeks instead of being read.
+        while True:
+            f.seek(offset)
+            marker = f.read(4)
+
+            if len(marker) < 4 or marker[0] != 0xFF:
+                return None
+
+            if marker[1] == 0xFF:
+                offset += 1
+                continue
+
+            if marker[1] in TextureHeaderReader.JPEG_SOF_MARKERS:
+                frame = f.read(6)
+
+                if len(frame) < 6:
+                    return None
+
+                bit_depth, height, width, channels = struct.unpack(">BHHB", frame)
+
+                return TextureHeader("jpeg", width, height, bit_depth, channels)
+
+            (length,) = struct.unpack_from(">H", marker, 2)
+            offset += 2 + length
+
+    @staticmethod
+    def _parse_png(f: BinaryIO, data: bytes) -> Optional[TextureHeader]:
+        if data[12:16] != b"IHDR":
+            return None
+
+        width, height, bit_depth, color_type = struct.unpack_from(">IIBB", data, 16)
+        channels = TextureHeaderReader.PNG_COLOR_TYPE_CHANNELS.get(color_type)
+
+        if channels is None:
+            return None
+
+        # Palette indices are looked up into 8-bit colors.
+        if color_type == 3:
+            bit_depth = 8
+
+        return TextureHeader("png", width, height, bit_depth, channels)
+
+    @staticmethod
+    def _parse_tiff(f: BinaryIO, data: bytes) -> Optional[TextureHeader]:
+        byte_order = "<" if data[:2] == b"II" else ">"
+
+        (ifd_offset,) = struct.unpack_from(f"{byte_order}I", data, 4)
+
+        f.seek(ifd_offset)
+        (entry_count,) = struct.unpack(f"{byte_order}H", f.read(2))
+        entries = f.read(entry_count * 12)
+
+        values = {}
+
+        for i in range(entry_count):
+            tag, value_type, count = struct.unpack_from(
+                f"{byte_order}HHI", entries, i * 12
+            )
+            value_offset = i * 12 + 8
+
+            if value_type == 3:
+                if count > 2:
+                    (offset,) = struct.unpack_from(
+                        f"{byte_order}I", entries, value_offset
+                    )
+                    f.seek(offset)
+                    (value,) = struct.unpack(f"{byte_order}H", f.read(2))
+                else:
+                    (value,) = struct.unpack_from(
+                        f"{byte_order}H", entries, value_offset
+                    )
+            elif value_type == 4 and count == 1:
+                (value,) = struct.unpack_from(f"{byte_order}I", entries, value_offset)
+            else:
+                continue
+
+            values[tag] = value
+
+        width = values.get(TextureHeaderReader.TIFF_IMAGE_WIDTH)
+        height = values.get(TextureHeaderReader.TIFF_IMAGE_LENGTH)
+
+        if not width or not height:
+            return None
+
+        return TextureHeader(
+            "tiff",
+            width,
+            height,
+            values.get(TextureHeaderReader.TIFF_BITS_PER_SAMPLE, 1),
+            values.get(TextureHeaderReader.TIFF_SAMPLES_PER_PIXEL, 1),
+        )
+
+    @staticmethod
+    def _read_header(file_path: str) -> Optional[TextureHeader]:
+        with open(file_path, "rb") as f:
+            data = f.read(TextureHeaderReader.HEADER_SIZE)
+
+            if data.startswith(TextureHeaderReader.PNG_MAGIC):
+                return TextureHeaderReader._parse_png(f, data)
+            elif data.startswith(TextureHeaderReader.JPEG_MAGIC):
+                return TextureHeaderReader._parse_jpeg(f, data)
+            elif data.startswith(TextureHeaderReader.EXR_MAGIC):
+                return TextureHeaderReader._parse_exr(f, data)
+            elif data.startswith(TextureHeaderReader.TIFF_MAGICS):
+                return TextureHeaderReader._parse_tiff(f, data)
+            elif data.startswith(TextureHeaderReader.GIF_MAGICS):
+                return TextureHeaderReader._parse_gif(f, data)
+
+        return None
+
+    def clear(self) -> None:
+        with self._lock:
+            self._headers = {}
+
+    def read(self, file_path: str) -> Optional[TextureHeader]:
+        try:
+            stat = os.stat(file_path)
+        except OSError:
+            return None
+
+        key = (stat.st_mtime_ns, stat.st_size)
+
+        with self._lock:
+            cached_header = self._headers.get(file_path)
+
+        if cached_header is not None and cached_header[0] == key:
+            return cached_header[1]
+
+        try:
+            header = self._read_header(file_path)
+        except (OSError, ValueError, struct.error) as e:
+            utils.Logger.debug(f"Could not read the header of {file_path!r}: {e}")
+            header = None
+
+        with self._lock:
+            if len(self._headers) >= TextureHeaderReader.MAX_ENTRIES:
+                self._headers = {}
+
+            self._headers[file_path] = (key, header)
+
+        return header
+
+    def read_many(self, file_paths: Iterable[str]) -> dict[str, TextureHeader]:
+        file_paths = list(file_paths)
+
+        with ThreadPoolExecutor(
+            max_workers=self.workers, thread_name_prefix="TextureHeaderReader"
+        ) as executor:
+            headers = executor.map(self.read, file_paths)
+
+            return {
+                file_path: header
+                for file_path, header in zip(file_paths, headers)
+                if header is not None
+            }
+
+    def set_workers(self, workers: int) -> None:
+        self.workers = max(1, workers)
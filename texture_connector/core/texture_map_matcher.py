@@ -0,0 +1,76 @@
+"""
+========================================================================================
+Name: texture_map_matcher.py
+Author: Mauricio Gonzalez Soto
+Updated Date: 10-17-2026
+
+Copyright (C) 2024 Mauricio Gonzalez Soto. All rights reserved.
+========================================================================================
+"""
+
+from __future__ import annotations
+
+from typing import Optional
+import functools
+import re
+
+
+@functools.lru_cache(maxsize=32)
+def _compile_texture_maps_suffix(
+    texture_maps_suffix: tuple[tuple[str, str], ...],
+) -> tuple[Optional[re.Pattern], dict[str, str]]:
+    suffix_texture_maps = {}
+
+    for texture_map, suffix in texture_maps_suffix:
+        if suffix:
+            suffix_texture_maps.setdefault(suffix.lower(), texture_map)
+
+    if not suffix_texture_maps:
+        return None, suffix_texture_maps
+
+    # Longer suffixes go first so "normal_gl" wins over "normal" at the same position.
+    suffixes = sorted(suffix_texture_maps, key=lambda s: (-len(s), s))
+    alternation = "|".join(re.escape(suffix) for suffix in suffixes)
+    pattern = re.compile(rf"(.+?)_({alternation})", re.IGNORECASE)
+
+    return pattern, suffix_texture_maps
+
+
+class TextureMapMatcher:
+
+    def __init__(self, texture_maps_suffix: tuple[tuple[str, str], ...] = ()) -> None:
+        self.texture_maps_suffix = ()
+
+        self._pattern = None
+        self._suffix_texture_maps = {}
+
+        self.set_texture_maps_suffix(texture_maps_suffix)
+
+    def match(self, stem: str) -> Optional[tuple[str, str]]:
+        if self._pattern is None:
+            return None
+
+        match = self._pattern.match(stem)
+
+        if not match:
+            return None
+
+        material_name, suffix = match.groups()
+
+        return material_name, self._suffix_texture_maps[suffix.lower()]
+
+    def match_file_name(self, file_name: str) -> Optional[tuple[str, str]]:
+        stem, dot, _ = file_name.rpartition(".")
+
+        return self.match(stem if dot else file_name)
+
+    def set_texture_maps_suffix(
+        self, texture_maps_suffix: tuple[tuple[str, str], ...]
+    ) -> None:
+        self.texture_maps_suffix = tuple(
+            (texture_map, suffix) for texture_map, suffix in texture_maps_suffix
+        )
+
+        self._pattern, self._suffix_texture_maps = _compile_texture_maps_suffix(
+            self.texture_maps_suffix
+        )
@@ -0,0 +1,387 @@
+"""
+========================================================================================
+Name: texture_scanner.py
+Author: Mauricio Gonzalez Soto
+Updated Date: 10-16-2026
+
+Copyright (C) 2024 Mauricio Gonzalez Soto. All rights reserved.
+========================================================================================
+"""
+
+from __future__ import annotations
+
+from concurrent.futures import FIRST_COMPLETED
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import wait
+from collections import defaultdict
+from collections import deque
+from typing import Iterator
+from typing import Optional
+import threading
+import fnmatch
+import os
+import re
+
+from texture_connector.core.texture_map_matcher import TextureMapMatcher
+from texture_connector.core.scan_cache import ScanCache
+from texture_connector.core.uv_tiles import UVTiles
+from texture_connector.config import ImageExtensions
+from texture_connector.config import UVTilingModes
+import texture_connector.utils as utils
+
+
+class TextureScanner:
+    IMAGE_EXTENSIONS = tuple(
+        [image_extension.value for image_extension in ImageExtensions]
+    )
+
+    TILE_SEPARATORS = "._-"
+
+    def __init__(self) -> None:
+        self.search_files_in_subdirectories = True
+        self.max_depth = 0
+        self.workers = 1
+
+        self.folder_path = ""
+        self.exclude_patterns = ()
+        self.uv_tiling_mode = UVTilingModes.OFF
+
+        self.matcher = TextureMapMatcher()
+        self.scan_cache = None
+
+        self.scanned_directory_count = 0
+        self.scanned_directories = []
+        self.tile_counts = {}
+
+        self._exclude_pattern = None
+
+        self._real_folder_path = ""
+        self._visited_directories = set()
+        self._visited_directories_lock = threading.Lock()
+
+        self._cancel_event = threading.Event()
+
+    def _collapse_tile_sets(
+        self, directory_path: str, images: list[tuple[str, str, str]]
+    ) -> list[tuple[str, str, str]]:
+
+        collapsed_images = []
+        tile_sets = {}
+
+        for image in images:
+            template = UVTiles.get_tile_template(image[0], self.uv_tiling_mode)
+
+            if template is None:
+                collapsed_images.append(image)
+                continue
+
+            prefix, suffix, tile = template
+            tile_set = tile_sets.get((prefix, suffix))
+
+            if tile_set is None:
+                tile_sets[(prefix, suffix)] = [tile, image, 1]
+                continue
+
+            tile_set[2] += 1
+
+            if UVTiles.get_tile_sort_key(tile) < UVTiles.get_tile_sort_key(tile_set[0]):
+                tile_set[0] = tile
+                tile_set[1] = image
+
+        # Every tile set becomes a single texture pointing at its first tile, which is
+        # classified without the tile so "wood_u0_v0_baseColor" still belongs to "wood".
+        for (prefix, suffix), (tile, image, tile_count) in tile_sets.items():
+            if tile_count == 1 and not UVTiles.is_tile_set(
+                (tile,), self.uv_tiling_mode
+            ):
+                collapsed_images.append(image)
+                continue
+
+            prefix = prefix.rstrip(TextureScanner.TILE_SEPARATORS)
+
+            if prefix:
+                _, material_name, texture_map = self._classify(f"{prefix}{suffix}")
+            else:
+                _, material_name, texture_map = self._classify(
+                    suffix.lstrip(TextureScanner.TILE_SEPARATORS)
+                )
+
+            file_name = image[0]
+            self.tile_counts[os.path.join(directory_path, file_name)] = tile_count
+
+            collapsed_images.append((file_name, material_name, texture_map))
+
+        return collapsed_images
+
+    def _is_excluded(self, directory_name: str) -> bool:
+        if self._exclude_pattern is None:
+            return False
+
+        return self._exclude_pattern.match(os.path.normcase(directory_name)) is not None
+
+    def _classify(self, file_name: str) -> tuple[str, str, str]:
+        texture_match = self.matcher.match_file_name(file_name)
+
+        if texture_match:
+            material_name, texture_map = texture_match
+            return file_name, material_name, texture_map
+
+        return file_name, "", ""
+
+    def _list_directory(
+        self, directory_path: str
+    ) -> tuple[list[tuple[str, str, str]], list[tuple[str, bool]]]:
+
+        image_names = []
+        subdirectories = []
+
+        with os.scandir(directory_path) as entries:
+            for entry in entries:
+                name = entry.name
+
+                if name.startswith("."):
+                    continue
+
+                if name.endswith(TextureScanner.IMAGE_EXTENSIONS) and entry.is_file():
+                    image_names.append(name)
+                elif entry.is_dir():
+                    subdirectories.append((name, entry.is_symlink()))
+
+        # Classified once per directory so the timer stays out of the per-file loop.
+        with utils.PerformanceMonitor.timer(utils.PerformanceMonitor.CLASSIFY_TEXTURES):
+            images = [self._classify(name) for name in image_names]
+
+        utils.PerformanceMonitor.increment(
+            utils.PerformanceMonitor.TEXTURES_CLASSIFIED, len(images)
+        )
+
+        return images, subdirectories
+
+    def _read_directory(
+        self, directory_path: str
+    ) -> tuple[list[tuple[str, str, str]], list[tuple[str, bool]]]:
+
+        if self.scan_cache is None:
+            return self._list_directory(directory_path)
+
+        mtime = os.stat(directory_path).st_mtime_ns
+        cached_directory = self.scan_cache.get_directory(directory_path, mtime)
+
+        if cached_directory is not None:
+            images, subdirectories = cached_directory
+
+            if self.scan_cache.is_classified():
+                return images, subdirectories
+
+            images = [self._classify(file_name) for file_name, _, _ in images]
+        else:
+            images, subdirectories = self._list_directory(directory_path)
+
+        self.scan_cache.set_directory(directory_path, mtime, images, subdirectories)
+
+        return images, subdirectories
+
+    def _scan_directory(
+        self, directory_path: str, depth: int
+    ) -> tuple[list[tuple[str, str, str]], list[tuple[str, int]]]:
+
+        walk_subdirectories = self.search_files_in_subdirectories and (
+            not self.max_depth or depth < self.max_depth
+        )
+
+        try:
+            images, subdirectory_names = self._read_directory(directory_path)
+        except OSError as e:
+            utils.Logger.debug(f"Could not scan {directory_path!r}: {e}")
+            return [], []
+
+        if self.uv_tiling_mode != UVTilingModes.OFF:
+            images = self._collapse_tile_sets(directory_path, images)
+
+        textures = [
+            (os.path.join(directory_path, file_name), material_name, texture_map)
+            for file_name, material_name, texture_map in images
+        ]
+        subdirectories = []
+
+        if walk_subdirectories:
+            for name, is_symlink in subdirectory_names:
+                if self._is_excluded(name):
+                    continue
+
+                subdirectory_path = os.path.join(directory_path, name)
+
+                # Links into the folder are skipped since their targets are walked
+                # through their real path. Every directory is recorded, so a link
+                # back to an ancestor or a second link to a target is not walked.
+                if is_symlink and self._is_inside_folder(subdirectory_path):
+                    continue
+
+                if not self._visit_directory(subdirectory_path):
+                    continue
+
+                subdirectories.append((subdirectory_path, depth + 1))
+
+        return textures, subdirectories
+
+    def _is_inside_folder(self, directory_path: str) -> bool:
+        real_path = os.path.realpath(directory_path)
+
+        return real_path == self._real_folder_path or real_path.startswith(
+            os.path.join(self._real_folder_path, "")
+        )
+
+    def _visit_directory(self, directory_path: str) -> bool:
+        try:
+            stat = os.stat(directory_path)
+        except OSError:
+            return False
+
+        # Some file systems report no inode, their directories cannot be told apart.
+        if not stat.st_ino:
+            return True
+
+        key = (stat.st_dev, stat.st_ino)
+
+        with self._visited_directories_lock:
+            if key in self._visited_directories:
+                return False
+
+            self._visited_directories.add(key)
+
+        return True
+
+    def _iter_images(self) -> Iterator[tuple[str, str, str]]:
+        if not self.folder_path:
+            return
+
+        self._real_folder_path = os.path.realpath(self.folder_path)
+        self._visited_directories.clear()
+        self._visit_directory(self.folder_path)
+        self.scanned_directory_count = 0
+        self.scanned_directories = []
+        self.tile_counts.clear()
+
+        if self.scan_cache is not None:
+            self.scan_cache.begin(self.folder_path, self.matcher.texture_maps_suffix)
+
+        completed = False
+
+        try:
+            if self.workers > 1:
+                yield from self._iter_images_parallel()
+            else:
+                yield from self._iter_images_sequential()
+
+            completed = not self._cancel_event.is_set()
+        finally:
+            if self.scan_cache is not None:
+                self.scan_cache.end(completed)
+
+    def _iter_images_sequential(self) -> Iterator[tuple[str, str, str]]:
+        stack = [(self.folder_path, 0)]
+
+        while stack and not self._cancel_event.is_set():
+            directory_path, depth = stack.pop()
+            self.scanned_directories.append(directory_path)
+
+            textures, subdirectories = self._scan_directory(directory_path, depth)
+            self.scanned_directory_count += 1
+
+            yield from textures
+
+            subdirectories.sort(reverse=True)
+            stack.extend(subdirectories)
+
+    def _iter_images_parallel(self) -> Iterator[tuple[str, str, str]]:
+        pending = deque([(self.folder_path, 0)])
+        running = set()
+
+        with ThreadPoolExecutor(
+            max_workers=self.workers, thread_name_prefix="TextureScanner"
+        ) as executor:
+            while (pending or running) and not self._cancel_event.is_set():
+                while pending and len(running) < self.workers * 2:
+                    directory_path, depth = pending.popleft()
+                    self.scanned_directories.append(directory_path)
+
+                    running.add(
+                        executor.submit(self._scan_directory, directory_path, depth)
+                    )
+
+                done, running = wait(running, return_when=FIRST_COMPLETED)
+
+                for future in done:
+                    textures, subdirectories = future.result()
+                    self.scanned_directory_count += 1
+
+                    yield from textures
+
+                    pending.extend(subdirectories)
+
+    def cancel(self) -> None:
+        self._cancel_event.set()
+
+    def is_cancelled(self) -> bool:
+        return self._cancel_event.is_set()
+
+    def get_tile_count(self, file_path: str) -> int:
+        return self.tile_counts.get(file_path, 1)
+
+    def iter_image_paths(self) -> Iterator[str]:
+        for file_path, _, _ in self._iter_images():
+            yield file_path
+
+    def iter_textures(self) -> Iterator[tuple[str, str, str]]:
+        for texture in self._iter_images():
+            if texture[1]:
+                yield texture
+
+    def get_material_texture_paths(self) -> dict[str, list[tuple[str, str]]]:
+        materials = defaultdict(list)
+
+        with utils.PerformanceMonitor.timer(
+            utils.PerformanceMonitor.GET_MATERIAL_TEXTURE_PATHS
+        ):
+            for file_path, material_name, texture_map in sorted(self.iter_textures()):
+                materials[material_name].append((texture_map, file_path))
+
+        return dict(materials)
+
+    def set_exclude_patterns(self, exclude_patterns: tuple[str, ...]) -> None:
+        self.exclude_patterns = tuple(
+            pattern.strip() for pattern in exclude_patterns if pattern.strip()
+        )
+
+        if self.exclude_patterns:
+            self._exclude_pattern = re.compile(
+                "|".join(
+                    fnmatch.translate(os.path.normcase(pattern))
+                    for pattern in self.exclude_patterns
+                )
+            )
+        else:
+            self._exclude_pattern = None
+
+    def set_folder_path(self, folder_path: str) -> None:
+        self.folder_path = folder_path
+
+    def set_max_depth(self, max_depth: int) -> None:
+        self.max_depth = max(0, max_depth)
+
+    def set_scan_cache(self, scan_cache: Optional[ScanCache]) -> None:
+        self.scan_cache = scan_cache
+
+    def set_search_files_in_subdirectories(self, enabled: bool) -> None:
+        self.search_files_in_subdirectories = enabled
+
+    def set_uv_tiling_mode(self, uv_tiling_mode: str) -> None:
+        self.uv_tiling_mode = uv_tiling_mode
+
+    def set_workers(self, workers: int) -> None:
+        self.workers = max(1, workers)
+
+    def set_texture_maps_suffix(
+        self, texture_maps_suffix: tuple[tuple[str, str], ...]
+    ) -> None:
+        self.matcher.set_texture_maps_suffix(texture_maps_suffix)
@@ -0,0 +1,148 @@
+"""
+========================================================================================
+Name: uv_tiles.py
+Author: Mauricio Gonzalez Soto
+Updated Date: 10-17-2026
+
+Copyright (C) 2024 Mauricio Gonzalez Soto. All rights reserved.
+========================================================================================
+"""
+
+from __future__ import annotations
+
+from typing import Optional
+import os
+import re
+
+from texture_connector.config import UVTilingModes
+
+
+class UVTiles:
+    # Only the last "." or "_" delimited token before the extension is a tile, so
+    # "wood_1024_baseColor.png" is not one. 1000 is not a valid UDIM.
+    UDIM_PATTERN = re.compile(r"(?<![^._])(1(?!000)\d{3})(?=\.[^.]*$)")
+    UV_PATTERN = re.compile(
+        r"(?<![a-z0-9])u(-?\d+)_v(-?\d+)(?![a-z0-9])", re.IGNORECASE
+    )
+
+    TILE_TOKENS = {
+        UVTilingModes.MARI: "<UDIM>",
+        UVTilingModes.ZBRUSH: "u<u>_v<v>",
+        UVTilingModes.MUDBOX: "u<U>_v<V>",
+    }
+
+    _directory_tile_sets = {}
+
+    @classmethod
+    def _get_directory_tile_sets(
+        cls, directory: str, uv_tiling_mode: str
+    ) -> dict[tuple[str, str], tuple[str, ...]]:
+
+        key = (directory, uv_tiling_mode)
+
+        if key not in cls._directory_tile_sets:
+            tile_sets = {}
+
+            try:
+                file_names = os.listdir(directory)
+            except OSError:
+                file_names = []
+
+            for file_name in file_names:
+                template = cls.get_tile_template(file_name, uv_tiling_mode)
+
+                if template is not None:
+                    tile_sets.setdefault(template[:2], set()).add(template[2])
+
+            cls._directory_tile_sets[key] = {
+                template: tuple(sorted(tiles, key=cls.get_tile_sort_key))
+                for template, tiles in tile_sets.items()
+            }
+
+        return cls._directory_tile_sets[key]
+
+    @classmethod
+    def is_tile_set(cls, tiles: tuple[str, ...], uv_tiling_mode: str) -> bool:
+        # A lone UDIM other than 1001, as in "rock_baseColor_1024.png", is far more
+        # likely a resolution or version tag.
+        if uv_tiling_mode == UVTilingModes.MARI and len(tiles) == 1:
+            return tiles[0] == "1001"
+
+        return bool(tiles)
+
+    @classmethod
+    def get_tile_pattern(cls, uv_tiling_mode: str) -> Optional[re.Pattern]:
+        if uv_tiling_mode == UVTilingModes.MARI:
+            return cls.UDIM_PATTERN
+        elif uv_tiling_mode in (UVTilingModes.ZBRUSH, UVTilingModes.MUDBOX):
+            return cls.UV_PATTERN
+
+        return None
+
+    @staticmethod
+    def get_tile_sort_key(tile: str) -> tuple[int, ...]:
+        return tuple(int(number) for number in re.findall(r"-?\d+", tile))
+
+    @classmethod
+    def get_tile_paths(cls, file_path: str, uv_tiling_mode: str) -> tuple[str, ...]:
+        directory, file_name = os.path.split(file_path)
+        template = cls.get_tile_template(file_name, uv_tiling_mode)
+
+        tiles = cls.get_tile_set(file_path, uv_tiling_mode)
+
+        if template is None or not tiles:
+            return (file_path,)
+
+        prefix, suffix, _ = template
+
+        return tuple(
+            os.path.join(directory, f"{prefix}{tile}{suffix}") for tile in tiles
+        )
+
+    @classmethod
+    def get_tile_set(cls, file_path: str, uv_tiling_mode: str) -> tuple[str, ...]:
+        directory, file_name = os.path.split(file_path)
+        template = cls.get_tile_template(file_name, uv_tiling_mode)
+
+        if template is None:
+            return ()
+
+        tile_sets = cls._get_directory_tile_sets(directory, uv_tiling_mode)
+        tiles = tile_sets.get(template[:2], (template[2],))
+
+        return tiles if cls.is_tile_set(tiles, uv_tiling_mode) else ()
+
+    @classmethod
+    def get_tile_template(
+        cls, file_name: str, uv_tiling_mode: str
+    ) -> Optional[tuple[str, str, str]]:
+
+        pattern = cls.get_tile_pattern(uv_tiling_mode)
+
+        if pattern is None:
+            return None
+
+        match = None
+
+        for match in pattern.finditer(file_name):
+            pass
+
+        if match is None:
+            return None
+
+        return file_name[: match.start()], file_name[match.end() :], match.group(0)
+
+    @classmethod
+    def get_token_file_name(cls, file_name: str, uv_tiling_mode: str) -> str:
+        template = cls.get_tile_template(file_name, uv_tiling_mode)
+
+        if template is None:
+            return file_name
+
+        prefix, suffix, _ = template
+
+        return f"{prefix}{cls.TILE_TOKENS[uv_tiling_mode]}{suffix}"
+
+    @classmethod
+    def invalidate(cls) -> None:
+        cls._directory_tile_sets = {}
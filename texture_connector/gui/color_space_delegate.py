@@ -0,0 +1,118 @@
+"""
+========================================================================================
+Name: color_space_delegate.py
+Author: Mauricio Gonzalez Soto
+Updated Date: 10-16-2026
+
+Copyright (C) 2024 Mauricio Gonzalez Soto. All rights reserved.
+========================================================================================
+"""
+
+from __future__ import annotations
+
+try:
+    from PySide6 import QtWidgets
+    from PySide6 import QtCore
+    from PySide6 import QtGui
+except ImportError:
+    from PySide2 import QtWidgets
+    from PySide2 import QtCore
+    from PySide2 import QtGui
+
+from functools import partial
+from typing import Optional
+
+import texture_connector.utils as utils
+
+
+class ColorSpaceDelegate(QtWidgets.QStyledItemDelegate):
+    BUTTON_COLOR = QtGui.QColor(251, 65, 65)
+    TEXT_COLOR = QtGui.QColor(0, 0, 0)
+
+    def __init__(self, parent: Optional[QtCore.QObject] = None) -> None:
+        super().__init__(parent)
+
+        self.arrow_icon = QtGui.QIcon(":teDownArrow.png")
+
+    def _show_menu(
+        self, model: QtCore.QAbstractItemModel, index: QtCore.QModelIndex
+    ) -> None:
+
+        persistent_index = QtCore.QPersistentModelIndex(index)
+
+        menu = QtWidgets.QMenu(self.parent())
+        color_space_families = utils.ColorSpaceCatalog.get_color_space_families()
+
+        for family, color_spaces in color_space_families.items():
+            if family == "Roles":
+                continue
+
+            submenu = menu.addMenu(family)
+
+            for color_space in color_spaces:
+                action = submenu.addAction(color_space)
+                action.triggered.connect(
+                    partial(self._set_color_space, model, persistent_index, color_space)
+                )
+
+        menu.exec_(QtGui.QCursor.pos())
+
+    @staticmethod
+    def _set_color_space(
+        model: QtCore.QAbstractItemModel,
+        persistent_index: QtCore.QPersistentModelIndex,
+        color_space: str,
+    ) -> None:
+
+        if persistent_index.isValid():
+            model.setData(QtCore.QModelIndex(persistent_index), color_space)
+
+    def editorEvent(
+        self,
+        event: QtCore.QEvent,
+        model: QtCore.QAbstractItemModel,
+        option: QtWidgets.QStyleOptionViewItem,
+        index: QtCore.QModelIndex,
+    ) -> bool:
+
+        if (
+            event.type() == QtCore.QEvent.MouseButtonRelease
+            and event.button() == QtCore.Qt.LeftButton
+            and index.data() is not None
+            and index.flags() & QtCore.Qt.ItemIsEnabled
+        ):
+            self._show_menu(model, index)
+            return True
+
+        return super().editorEvent(event, model, option, index)
+
+    def paint(
+        self,
+        painter: QtGui.QPainter,
+        option: QtWidgets.QStyleOptionViewItem,
+        index: QtCore.QModelIndex,
+    ) -> None:
+
+        color_space = index.data()
+
+        if color_space is None:
+            super().paint(painter, option, index)
+            return
+
+        option = QtWidgets.QStyleOptionViewItem(option)
+        self.initStyleOption(option, index)
+
+        if not utils.ColorSpaceCatalog.has_color_space(color_space):
+            option.backgroundBrush = QtGui.QBrush(ColorSpaceDelegate.BUTTON_COLOR)
+            option.palette.setColor(QtGui.QPalette.Text, ColorSpaceDelegate.TEXT_COLOR)
+
+        size = option.rect.height()
+        icon_rect = QtCore.QRect(
+            option.rect.right() - size + 1, option.rect.top(), size, size
+        )
+
+        widget = option.widget
+        style = widget.style() if widget else QtWidgets.QApplication.style()
+        style.drawControl(QtWidgets.QStyle.CE_ItemViewItem, option, painter, widget)
+
+        self.arrow_icon.paint(painter, icon_rect)
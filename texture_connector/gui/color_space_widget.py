@@ -2,7 +2,7 @@
 ========================================================================================
 Name: color_space_widget.py
 Author: Mauricio Gonzalez Soto
-Updated Date: 04-12-2025
+Updated Date: 10-16-2026
 
 Copyright (C) 2024 Mauricio Gonzalez Soto. All rights reserved.
 ========================================================================================
@@ -17,10 +17,10 @@ except ImportError:
     from PySide2 import QtCore
     from PySide2 import QtGui
 
-import maya.cmds as cmds
-
 from functools import partial
 
+import texture_connector.utils as utils
+
 
 class ColorSpaceWidget(QtWidgets.QWidget):
     color_space_changed = QtCore.Signal(str)
@@ -31,12 +31,9 @@ class ColorSpaceWidget(QtWidgets.QWidget):
         self.setSizePolicy(QtWidgets.QSizePolicy.Maximum, QtWidgets.QSizePolicy.Maximum)
         self.setMinimumWidth(100)
 
-        self.color_spaces = {}
-
         self._create_widgets()
         self._create_layouts()
         self._create_connections()
-        self._get_color_spaces()
 
     def _create_widgets(self) -> None:
         combo_box = QtWidgets.QComboBox()
@@ -68,15 +65,16 @@ class ColorSpaceWidget(QtWidgets.QWidget):
 
     def _show_menu(self):
         menu = QtWidgets.QMenu(self)
+        color_space_families = utils.ColorSpaceCatalog.get_color_space_families()
 
-        for family in self.color_spaces:
+        for family, color_spaces in color_space_families.items():
             if family == "Roles":
                 continue
 
             submenu = QtWidgets.QMenu(family)
             menu.addMenu(submenu)
 
-            for color_space in self.color_spaces[family]:
+            for color_space in color_spaces:
                 action = submenu.addAction(color_space)
                 action.triggered.connect(partial(self.set_color_space, color_space))
 
@@ -85,29 +83,10 @@ class ColorSpaceWidget(QtWidgets.QWidget):
         self.label_push_button.update()
         self.icon_push_button.update()
 
-    def _get_color_spaces(self) -> None:
-        self.color_spaces.clear()
-
-        color_spaces = cmds.colorManagementFileRules(colorSpaceNames=True, query=True)
-
-        for color_space in color_spaces:
-            color_space_family = cmds.colorManagementFileRules(
-                colorSpaceFamilies=color_space, query=True
-            )
-
-            if color_space_family:
-                color_space_family = color_space_family[0]
-
-                family_color_spaces = self.color_spaces.get(color_space_family, [])
-                family_color_spaces.append(color_space)
-
-                self.color_spaces[color_space_family] = family_color_spaces
-
     def _update_widget_color(self) -> None:
-        color_spaces = cmds.colorManagementFileRules(colorSpaceNames=True, query=True)
         color_space = self.get_color_space()
 
-        if color_space in color_spaces:
+        if utils.ColorSpaceCatalog.has_color_space(color_space):
             self.label_push_button.setPalette(self.label_palette)
             self.icon_push_button.setPalette(self.icon_palette)
         else:
@@ -136,4 +115,3 @@ class ColorSpaceWidget(QtWidgets.QWidget):
 
     def update_color_spaces(self) -> None:
         self._update_widget_color()
-        self._get_color_spaces()
@@ -0,0 +1,95 @@
+"""
+========================================================================================
+Name: folder_watcher.py
+Author: Mauricio Gonzalez Soto
+Updated Date: 10-16-2026
+
+Copyright (C) 2024 Mauricio Gonzalez Soto. All rights reserved.
+========================================================================================
+"""
+
+from __future__ import annotations
+
+try:
+    from PySide6 import QtCore
+except ImportError:
+    from PySide2 import QtCore
+
+from typing import Optional
+
+import texture_connector.utils as utils
+
+
+class FolderWatcher(QtCore.QObject):
+    # Exports write many files over a few seconds, so changes are coalesced until
+    # the folder has been quiet for a while.
+    DEBOUNCE_INTERVAL = 1000
+
+    # Every directory takes a watch from a per-user limit shared with the rest of
+    # the system, so deep trees only get their shallowest directories watched.
+    MAX_WATCHED_DIRECTORIES = 1024
+
+    folder_changed = QtCore.Signal()
+
+    def __init__(self, parent: Optional[QtCore.QObject] = None) -> None:
+        super().__init__(parent)
+
+        self.file_system_watcher = QtCore.QFileSystemWatcher(self)
+        self.capped = False
+
+        self.debounce_timer = QtCore.QTimer(self)
+        self.debounce_timer.setSingleShot(True)
+        self.debounce_timer.setInterval(FolderWatcher.DEBOUNCE_INTERVAL)
+
+        self.file_system_watcher.directoryChanged.connect(self._directory_changed)
+        self.debounce_timer.timeout.connect(self.folder_changed.emit)
+
+    def _directory_changed(self, directory_path: str) -> None:
+        utils.Logger.debug(f"{directory_path!r} changed.")
+
+        self.debounce_timer.start()
+
+    def clear(self) -> None:
+        self.debounce_timer.stop()
+        self.capped = False
+
+        directories = self.file_system_watcher.directories()
+
+        if directories:
+            self.file_system_watcher.removePaths(directories)
+
+    def get_watched_directory_count(self) -> int:
+        return len(self.file_system_watcher.directories())
+
+    def set_directories(self, directories: list[str]) -> None:
+        directories = sorted(
+            {QtCore.QDir.fromNativeSeparators(d) for d in directories},
+            key=lambda d: (d.count("/"), d),
+        )
+
+        capped = len(directories) > FolderWatcher.MAX_WATCHED_DIRECTORIES
+
+        if capped and not self.capped:
+            utils.Logger.warning(
+                f"Watching {FolderWatcher.MAX_WATCHED_DIRECTORIES} of "
+                f"{len(directories)} folders. Changes in deeper folders need a manual "
+                f"update."
+            )
+
+        self.capped = capped
+
+        directories = set(directories[: FolderWatcher.MAX_WATCHED_DIRECTORIES])
+        watched_directories = set(self.file_system_watcher.directories())
+
+        removed_directories = list(watched_directories - directories)
+        added_directories = list(directories - watched_directories)
+
+        if removed_directories:
+            self.file_system_watcher.removePaths(removed_directories)
+
+        if added_directories:
+            self.file_system_watcher.addPaths(added_directories)
+
+        utils.Logger.debug(
+            f"Watching {self.get_watched_directory_count()} folder(s) for changes."
+        )
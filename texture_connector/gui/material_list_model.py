@@ -0,0 +1,746 @@
+"""
+========================================================================================
+Name: material_list_model.py
+Author: Mauricio Gonzalez Soto
+Updated Date: 10-16-2026
+
+Copyright (C) 2024 Mauricio Gonzalez Soto. All rights reserved.
+========================================================================================
+"""
+
+from __future__ import annotations
+
+try:
+    from PySide6 import QtCore
+    from PySide6 import QtGui
+except ImportError:
+    from PySide2 import QtCore
+    from PySide2 import QtGui
+
+from typing import TYPE_CHECKING
+from typing import Optional
+import bisect
+
+from texture_connector.gui.material_search_index import MaterialSearchIndex
+from texture_connector.core import UVTiles
+from texture_connector.config import UVTilingModes
+from texture_connector.config import TextureMaps
+import texture_connector.utils as utils
+
+if TYPE_CHECKING:
+    from texture_connector.core import TextureHeader
+
+
+class TextureMapItem:
+    __slots__ = (
+        "material",
+        "texture_map",
+        "title",
+        "path",
+        "text",
+        "color_space",
+        "enabled",
+    )
+
+    def __init__(self, material: MaterialItem, texture_map: str, title: str) -> None:
+        self.material = material
+        self.texture_map = texture_map
+        self.title = title
+
+        self.path = ""
+        self.text = ""
+        self.color_space = ""
+        self.enabled = True
+
+
+class MaterialItem:
+    __slots__ = ("key", "name", "sort_key", "enabled", "exists", "texture_maps")
+
+    def __init__(self, key: str, sort_key: tuple[str, str]) -> None:
+        self.key = key
+        self.name = key
+        self.sort_key = sort_key
+
+        self.enabled = True
+        self.exists = False
+
+        self.texture_maps = [
+            TextureMapItem(self, texture_map, title)
+            for texture_map, title in MaterialListModel.TEXTURE_MAPS
+        ]
+
+    def get_texture_map_item(self, texture_map: str) -> Optional[TextureMapItem]:
+        for texture_map_item in self.texture_maps:
+            if texture_map_item.texture_map == texture_map:
+                return texture_map_item
+
+        return None
+
+
+class MaterialListModel(QtCore.QAbstractTableModel):
+    NAME_COLUMN = 0
+    PATH_COLUMN = 1
+    COLOR_SPACE_COLUMN = 2
+
+    HEADERS = ("Material", "Texture", "Color Space")
+
+    TEXTURE_MAPS = (
+        (TextureMaps.BASE_COLOR, "Base Color"),
+        (TextureMaps.ROUGHNESS, "Roughness"),
+        (TextureMaps.METALNESS, "Metalness"),
+        (TextureMaps.NORMAL, "Normal"),
+        (TextureMaps.HEIGHT, "Height"),
+        (TextureMaps.EMISSIVE, "Emissive"),
+        (TextureMaps.OPACITY, "Opacity"),
+    )
+
+    # Views may query the flags of many rows at once, so they are built only once.
+    ENABLED_FLAGS = QtCore.Qt.ItemIsEnabled | QtCore.Qt.ItemIsSelectable
+    DISABLED_FLAGS = QtCore.Qt.ItemIsSelectable
+    MATERIAL_NAME_FLAGS = (
+        ENABLED_FLAGS | QtCore.Qt.ItemIsUserCheckable | QtCore.Qt.ItemIsEditable
+    )
+    TEXTURE_MAP_NAME_FLAGS = ENABLED_FLAGS | QtCore.Qt.ItemIsUserCheckable
+
+    MAX_INSERT_BLOCKS = 32
+
+    GREEN_COLOR = QtGui.QColor(92, 179, 56)
+    RED_COLOR = QtGui.QColor(251, 65, 65)
+
+    def __init__(self, parent: Optional[QtCore.QObject] = None) -> None:
+        super().__init__(parent)
+
+        self.folder_path = ""
+        self.search_text = ""
+        self.uv_tiling_mode = UVTilingModes.OFF
+
+        self.tile_counts = {}
+        self.texture_headers = {}
+
+        self.texture_maps_color_space = {}
+        self.hidden_texture_maps = set()
+
+        self.material_font = QtGui.QFont()
+        self.material_font.setBold(True)
+
+        self._materials = []
+        self._sort_keys = []
+        self._materials_by_key = {}
+
+        self.search_index = MaterialSearchIndex()
+
+        # Every visible material takes a fixed block of rows, its own followed by
+        # one per visible texture map, so rows map to items without a lookup table.
+        self._visible_materials = []
+        self._visible_sort_keys = []
+        self._visible_texture_map_rows = tuple(
+            range(len(MaterialListModel.TEXTURE_MAPS))
+        )
+
+        # Materials listed before a rescan only get their changes applied once the
+        # scan completes, so a cancelled scan leaves them untouched.
+        self._stale_materials = {}
+        self._reconciled_textures = {}
+
+    def _get_row_stride(self) -> int:
+        return 1 + len(self._visible_texture_map_rows)
+
+    def _get_item(self, row: int) -> MaterialItem | TextureMapItem:
+        material_row, offset = divmod(row, self._get_row_stride())
+        material = self._visible_materials[material_row]
+
+        if not offset:
+            return material
+
+        return material.texture_maps[self._visible_texture_map_rows[offset - 1]]
+
+    def _get_material_row(self, material: MaterialItem) -> int:
+        index = bisect.bisect_left(self._visible_sort_keys, material.sort_key)
+
+        if (
+            index < len(self._visible_materials)
+            and self._visible_materials[index] is material
+        ):
+            return index * self._get_row_stride()
+
+        return -1
+
+    def _get_texture_map_row(self, texture_map_item: TextureMapItem) -> int:
+        material_row = self._get_material_row(texture_map_item.material)
+
+        if material_row < 0:
+            return -1
+
+        texture_map_row = texture_map_item.material.texture_maps.index(texture_map_item)
+
+        if texture_map_row not in self._visible_texture_map_rows:
+            return -1
+
+        return material_row + 1 + self._visible_texture_map_rows.index(texture_map_row)
+
+    def _is_material_visible(self, material: MaterialItem) -> bool:
+        return self.search_index.matches(material, self.search_text)
+
+    def _emit_rows_changed(self, first_row: int, last_row: int) -> None:
+        if first_row > last_row:
+            return
+
+        self.dataChanged.emit(
+            self.index(first_row, MaterialListModel.NAME_COLUMN),
+            self.index(last_row, MaterialListModel.COLOR_SPACE_COLUMN),
+        )
+
+    def _insert_materials(
+        self, materials: list[MaterialItem], notify: bool = True
+    ) -> None:
+
+        for material in materials:
+            index = bisect.bisect(self._sort_keys, material.sort_key)
+            self._sort_keys.insert(index, material.sort_key)
+            self._materials.insert(index, material)
+
+            self.search_index.add(material)
+
+        materials = [
+            material for material in materials if self._is_material_visible(material)
+        ]
+        materials.sort(key=lambda m: m.sort_key)
+
+        # Materials that land between the same two rows are inserted as one block.
+        blocks = []
+        first = 0
+
+        while first < len(materials):
+            index = bisect.bisect(self._visible_sort_keys, materials[first].sort_key)
+            last = first + 1
+
+            if index < len(self._visible_sort_keys):
+                next_sort_key = self._visible_sort_keys[index]
+
+                while (
+                    last < len(materials) and materials[last].sort_key < next_sort_key
+                ):
+                    last += 1
+            else:
+                last = len(materials)
+
+            blocks.append((index, materials[first:last]))
+            first = last
+
+        # Views pay for every row insertion separately, so a batch scattered all
+        # over the list is cheaper to show with a single reset.
+        reset = notify and len(blocks) > MaterialListModel.MAX_INSERT_BLOCKS
+        notify = notify and not reset
+        stride = self._get_row_stride()
+
+        if reset:
+            self.beginResetModel()
+
+        for index, block in reversed(blocks):
+            if notify:
+                self.beginInsertRows(
+                    QtCore.QModelIndex(),
+                    index * stride,
+                    (index + len(block)) * stride - 1,
+                )
+
+            self._visible_sort_keys[index:index] = [m.sort_key for m in block]
+            self._visible_materials[index:index] = block
+
+            if notify:
+                self.endInsertRows()
+
+        if reset:
+            self.endResetModel()
+
+    def _remove_material(
+        self, material: MaterialItem, sort_key: tuple[str, str], notify: bool = True
+    ) -> None:
+
+        index = bisect.bisect_left(self._sort_keys, sort_key)
+        del self._sort_keys[index]
+        del self._materials[index]
+
+        index = bisect.bisect_left(self._visible_sort_keys, sort_key)
+
+        if (
+            index >= len(self._visible_materials)
+            or self._visible_materials[index] is not material
+        ):
+            return
+
+        stride = self._get_row_stride()
+
+        if notify:
+            self.beginRemoveRows(
+                QtCore.QModelIndex(), index * stride, index * stride + stride - 1
+            )
+
+        del self._visible_sort_keys[index]
+        del self._visible_materials[index]
+
+        if notify:
+            self.endRemoveRows()
+
+    def _move_materials(
+        self,
+        moved_materials: list[tuple[MaterialItem, tuple[str, str]]],
+        materials: list[MaterialItem],
+    ) -> None:
+
+        reset = len(moved_materials) > MaterialListModel.MAX_INSERT_BLOCKS
+
+        if reset:
+            self.beginResetModel()
+
+        for material, sort_key in moved_materials:
+            self._remove_material(material, sort_key, notify=not reset)
+
+        self._insert_materials(materials, notify=not reset)
+
+        if reset:
+            self.endResetModel()
+
+    def _set_texture_map_path(
+        self, texture_map_item: TextureMapItem, file_path: str
+    ) -> None:
+
+        text = utils.remove_prefix(prefix=self.folder_path, string=file_path).replace(
+            "\\", "/"
+        )
+
+        # Only collapsed tile sets are shown with their tile token.
+        if self.uv_tiling_mode != UVTilingModes.OFF and file_path in self.tile_counts:
+            directory, separator, file_name = text.rpartition("/")
+            file_name = UVTiles.get_token_file_name(file_name, self.uv_tiling_mode)
+            text = f"{directory}{separator}{file_name}"
+
+        texture_map_item.path = file_path
+        texture_map_item.text = text
+
+    def _filter(self) -> None:
+        self.beginResetModel()
+
+        self._visible_texture_map_rows = tuple(
+            row
+            for row, (texture_map, _) in enumerate(MaterialListModel.TEXTURE_MAPS)
+            if texture_map not in self.hidden_texture_maps
+        )
+
+        matching_materials = self.search_index.search(self.search_text)
+
+        if matching_materials is not None:
+            self._visible_materials = [
+                material
+                for material in self._materials
+                if material in matching_materials
+            ]
+            self._visible_sort_keys = [
+                material.sort_key for material in self._visible_materials
+            ]
+        else:
+            self._visible_materials = list(self._materials)
+            self._visible_sort_keys = list(self._sort_keys)
+
+        self.endResetModel()
+
+    def add_textures(self, textures: list[tuple[str, str, str]]) -> list[MaterialItem]:
+        new_materials = []
+        moved_materials = []
+        pending_materials = {}
+        texture_map_items = []
+
+        for file_path, material_key, texture_map in textures:
+            if material_key in self._stale_materials:
+                reconciled_textures = self._reconciled_textures.get(material_key)
+
+                if reconciled_textures is None:
+                    reconciled_textures = [file_path, {}]
+                    self._reconciled_textures[material_key] = reconciled_textures
+                elif file_path < reconciled_textures[0]:
+                    reconciled_textures[0] = file_path
+
+                texture_paths = reconciled_textures[1]
+
+                if file_path > texture_paths.get(texture_map, ""):
+                    texture_paths[texture_map] = file_path
+
+                continue
+
+            material = self._materials_by_key.get(material_key)
+
+            if material is None:
+                material = MaterialItem(material_key, (file_path, material_key))
+
+                for texture_map_item in material.texture_maps:
+                    texture_map_item.color_space = self.texture_maps_color_space.get(
+                        texture_map_item.texture_map, ""
+                    )
+
+                self._materials_by_key[material_key] = material
+
+                new_materials.append(material)
+                pending_materials[material_key] = material
+            elif file_path < material.sort_key[0]:
+                if material_key not in pending_materials:
+                    moved_materials.append((material, material.sort_key))
+                    pending_materials[material_key] = material
+
+                material.sort_key = (file_path, material_key)
+
+            texture_map_item = material.get_texture_map_item(texture_map)
+
+            # Files used to be visited in sorted order with the last one winning.
+            if texture_map_item is None or file_path <= texture_map_item.path:
+                continue
+
+            self._set_texture_map_path(texture_map_item, file_path)
+            texture_map_items.append(texture_map_item)
+
+        self._move_materials(moved_materials, list(pending_materials.values()))
+
+        for texture_map_item in texture_map_items:
+            if texture_map_item.material.key in pending_materials:
+                continue
+
+            row = self._get_texture_map_row(texture_map_item)
+
+            if row >= 0:
+                index = self.index(row, MaterialListModel.PATH_COLUMN)
+                self.dataChanged.emit(index, index)
+
+        return new_materials
+
+    def add_texture_headers(self, texture_headers: dict[str, TextureHeader]) -> None:
+        self.texture_headers.update(texture_headers)
+
+    def begin_reconcile(self) -> None:
+        self._stale_materials = dict(self._materials_by_key)
+        self._reconciled_textures = {}
+
+    def clear(self) -> None:
+        self.beginResetModel()
+        self._materials = []
+        self._sort_keys = []
+        self._materials_by_key = {}
+        self._visible_materials = []
+        self._visible_sort_keys = []
+        self._stale_materials = {}
+        self._reconciled_textures = {}
+        self.texture_headers = {}
+        self.search_index.clear()
+        self.endResetModel()
+
+    def end_reconcile(self, completed: bool) -> tuple[int, int]:
+        stale_materials = self._stale_materials
+        reconciled_textures = self._reconciled_textures
+
+        self._stale_materials = {}
+        self._reconciled_textures = {}
+
+        if not completed:
+            return 0, 0
+
+        removed_materials = [
+            material
+            for material_key, material in stale_materials.items()
+            if material_key not in reconciled_textures
+        ]
+
+        reset = len(removed_materials) > MaterialListModel.MAX_INSERT_BLOCKS
+
+        if reset:
+            self.beginResetModel()
+
+        for material in removed_materials:
+            del self._materials_by_key[material.key]
+            self.search_index.remove(material)
+            self._remove_material(material, material.sort_key, notify=not reset)
+
+        if reset:
+            self.endResetModel()
+
+        moved_materials = []
+        texture_map_items = []
+
+        for material_key, (sort_path, texture_paths) in reconciled_textures.items():
+            material = stale_materials[material_key]
+            sort_key = (sort_path, material_key)
+
+            if sort_key != material.sort_key:
+                moved_materials.append((material, material.sort_key))
+                material.sort_key = sort_key
+
+            for texture_map_item in material.texture_maps:
+                file_path = texture_paths.get(texture_map_item.texture_map, "")
+
+                if file_path != texture_map_item.path:
+                    self._set_texture_map_path(texture_map_item, file_path)
+                    texture_map_items.append(texture_map_item)
+
+        self._move_materials(
+            moved_materials, [material for material, _ in moved_materials]
+        )
+
+        moved_material_keys = {material.key for material, _ in moved_materials}
+
+        for texture_map_item in texture_map_items:
+            if texture_map_item.material.key in moved_material_keys:
+                continue
+
+            row = self._get_texture_map_row(texture_map_item)
+
+            if row >= 0:
+                index = self.index(row, MaterialListModel.PATH_COLUMN)
+                self.dataChanged.emit(index, index)
+
+        return len(removed_materials), len(texture_map_items)
+
+    def get_item(self, index: QtCore.QModelIndex) -> MaterialItem | TextureMapItem:
+        return self._get_item(index.row())
+
+    def get_material_items(self) -> list[MaterialItem]:
+        return list(self._materials)
+
+    def get_visible_material_items(self) -> list[MaterialItem]:
+        return list(self._visible_materials)
+
+    def set_folder_path(self, folder_path: str) -> None:
+        self.folder_path = folder_path
+
+    def set_material_exists(self, material: MaterialItem, exists: bool) -> None:
+        if material.exists == exists:
+            return
+
+        material.exists = exists
+
+        row = self._get_material_row(material)
+
+        if row >= 0:
+            index = self.index(row, MaterialListModel.NAME_COLUMN)
+            self.dataChanged.emit(index, index, [QtCore.Qt.DecorationRole])
+
+    def set_material_enabled(self, material: MaterialItem, enabled: bool) -> None:
+        material.enabled = enabled
+
+        row = self._get_material_row(material)
+
+        if row >= 0:
+            self._emit_rows_changed(row, row + self._get_row_stride() - 1)
+
+    def set_materials_enabled(
+        self, materials: list[MaterialItem], enabled: bool
+    ) -> None:
+
+        for material in materials:
+            material.enabled = enabled
+
+        self._emit_rows_changed(0, self.rowCount() - 1)
+
+    def set_search_text(self, text: str) -> None:
+        # Lowering a regular expression would change its meaning, "\D" into "\d",
+        # so it is matched case insensitively instead.
+        if not text.startswith(MaterialSearchIndex.REGEX_PREFIX):
+            text = text.lower()
+
+        if text == self.search_text:
+            return
+
+        self.search_text = text
+        self._filter()
+
+    def set_texture_map_color_space(self, texture_map: str, color_space: str) -> None:
+        # Leaves the per texture overrides alone when a rescan reapplies the defaults.
+        if self.texture_maps_color_space.get(texture_map) == color_space:
+            return
+
+        self.texture_maps_color_space[texture_map] = color_space
+
+        for material in self._materials:
+            texture_map_item = material.get_texture_map_item(texture_map)
+            texture_map_item.color_space = color_space
+
+        self._emit_rows_changed(0, self.rowCount() - 1)
+
+    def set_texture_map_visible(self, texture_map: str, visible: bool) -> None:
+        if visible == (texture_map not in self.hidden_texture_maps):
+            return
+
+        if visible:
+            self.hidden_texture_maps.discard(texture_map)
+        else:
+            self.hidden_texture_maps.add(texture_map)
+
+        self._filter()
+
+    def set_tile_counts(self, tile_counts: dict[str, int]) -> None:
+        self.tile_counts = tile_counts
+
+    def set_uv_tiling_mode(self, uv_tiling_mode: str) -> None:
+        if uv_tiling_mode == self.uv_tiling_mode:
+            return
+
+        self.uv_tiling_mode = uv_tiling_mode
+
+        for material in self._materials:
+            for texture_map_item in material.texture_maps:
+                if texture_map_item.path:
+                    self._set_texture_map_path(texture_map_item, texture_map_item.path)
+
+        self._emit_rows_changed(0, self.rowCount() - 1)
+
+    def columnCount(self, parent: QtCore.QModelIndex = QtCore.QModelIndex()) -> int:
+        if parent.isValid():
+            return 0
+
+        return len(MaterialListModel.HEADERS)
+
+    def rowCount(self, parent: QtCore.QModelIndex = QtCore.QModelIndex()) -> int:
+        if parent.isValid():
+            return 0
+
+        return len(self._visible_materials) * self._get_row_stride()
+
+    def flags(self, index: QtCore.QModelIndex) -> QtCore.Qt.ItemFlags:
+        if not index.isValid():
+            return QtCore.Qt.NoItemFlags
+
+        item = self._get_item(index.row())
+        column = index.column()
+
+        if isinstance(item, MaterialItem):
+            if column == MaterialListModel.NAME_COLUMN:
+                return MaterialListModel.MATERIAL_NAME_FLAGS
+
+            return MaterialListModel.ENABLED_FLAGS
+
+        if not item.material.enabled:
+            return MaterialListModel.DISABLED_FLAGS
+
+        if column == MaterialListModel.NAME_COLUMN:
+            return MaterialListModel.TEXTURE_MAP_NAME_FLAGS
+
+        if not item.enabled:
+            return MaterialListModel.DISABLED_FLAGS
+
+        return MaterialListModel.ENABLED_FLAGS
+
+    def data(self, index: QtCore.QModelIndex, role: int = QtCore.Qt.DisplayRole):
+        if not index.isValid():
+            return None
+
+        item = self._get_item(index.row())
+        column = index.column()
+
+        if isinstance(item, MaterialItem):
+            if column != MaterialListModel.NAME_COLUMN:
+                return None
+
+            if role in (QtCore.Qt.DisplayRole, QtCore.Qt.EditRole):
+                return item.name
+
+            if role == QtCore.Qt.CheckStateRole:
+                return QtCore.Qt.Checked if item.enabled else QtCore.Qt.Unchecked
+
+            if role == QtCore.Qt.DecorationRole:
+                if item.exists:
+                    return MaterialListModel.GREEN_COLOR
+
+                return MaterialListModel.RED_COLOR
+
+            if role == QtCore.Qt.FontRole:
+                return self.material_font
+
+            return None
+
+        if column == MaterialListModel.NAME_COLUMN:
+            if role == QtCore.Qt.DisplayRole:
+                return f"{item.title}: "
+
+            if role == QtCore.Qt.CheckStateRole:
+                return QtCore.Qt.Checked if item.enabled else QtCore.Qt.Unchecked
+
+            if role == QtCore.Qt.TextAlignmentRole:
+                return int(QtCore.Qt.AlignRight | QtCore.Qt.AlignVCenter)
+        elif column == MaterialListModel.PATH_COLUMN:
+            if role == QtCore.Qt.DisplayRole:
+                return item.text
+
+            if role == QtCore.Qt.ToolTipRole:
+                if not item.path:
+                    return None
+
+                lines = [item.path]
+
+                texture_header = self.texture_headers.get(item.path)
+
+                if texture_header is not None:
+                    lines.append(texture_header.get_description())
+
+                tile_count = self.tile_counts.get(item.path)
+
+                if tile_count is not None:
+                    lines.append(f"{tile_count} tile(s)")
+
+                return "\n".join(lines)
+        elif column == MaterialListModel.COLOR_SPACE_COLUMN:
+            if role in (QtCore.Qt.DisplayRole, QtCore.Qt.EditRole):
+                return item.color_space
+
+        return None
+
+    def setData(
+        self, index: QtCore.QModelIndex, value, role: int = QtCore.Qt.EditRole
+    ) -> bool:
+
+        if not index.isValid():
+            return False
+
+        item = self._get_item(index.row())
+        column = index.column()
+
+        if role == QtCore.Qt.CheckStateRole and column == MaterialListModel.NAME_COLUMN:
+            enabled = QtCore.Qt.CheckState(value) == QtCore.Qt.Checked
+
+            if isinstance(item, MaterialItem):
+                self.set_material_enabled(item, enabled)
+            else:
+                item.enabled = enabled
+                self._emit_rows_changed(index.row(), index.row())
+
+            return True
+
+        if role != QtCore.Qt.EditRole:
+            return False
+
+        if isinstance(item, MaterialItem) and column == MaterialListModel.NAME_COLUMN:
+            name = str(value).strip()
+
+            if not name:
+                return False
+
+            item.name = name
+            self.search_index.update(item)
+        elif (
+            isinstance(item, TextureMapItem)
+            and column == MaterialListModel.COLOR_SPACE_COLUMN
+        ):
+            item.color_space = str(value)
+        else:
+            return False
+
+        self.dataChanged.emit(index, index, [role])
+
+        return True
+
+    def headerData(
+        self,
+        section: int,
+        orientation: QtCore.Qt.Orientation,
+        role: int = QtCore.Qt.DisplayRole,
+    ):
+
+        if orientation == QtCore.Qt.Horizontal and role == QtCore.Qt.DisplayRole:
+            return MaterialListModel.HEADERS[section]
+
+        return None
@@ -0,0 +1,140 @@
+"""
+========================================================================================
+Name: material_scan_worker.py
+Author: Mauricio Gonzalez Soto
+Updated Date: 10-16-2026
+
+Copyright (C) 2024 Mauricio Gonzalez Soto. All rights reserved.
+========================================================================================
+"""
+
+try:
+    from PySide6 import QtCore
+except ImportError:
+    from PySide2 import QtCore
+
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import wait
+from typing import Optional
+import time
+
+from texture_connector.core import TextureHeaderReader
+from texture_connector.core import TextureScanner
+
+
+class MaterialScanWorker(QtCore.QObject):
+    BATCH_SIZE = 500
+    BATCH_INTERVAL = 0.1
+
+    textures_found = QtCore.Signal(int, list)
+    headers_read = QtCore.Signal(int, dict)
+    progress_changed = QtCore.Signal(int, int, int)
+    finished = QtCore.Signal(int, bool)
+
+    def __init__(self, scan_id: int, scanner: TextureScanner) -> None:
+        super().__init__()
+
+        self.scan_id = scan_id
+        self.scanner = scanner
+        self.header_reader = None
+
+        self.header_futures = {}
+
+        self.error = ""
+
+    def cancel(self) -> None:
+        self.scanner.cancel()
+
+    def is_cancelled(self) -> bool:
+        return self.scanner.is_cancelled()
+
+    def set_header_reader(self, header_reader: Optional[TextureHeaderReader]) -> None:
+        self.header_reader = header_reader
+
+    def run(self) -> None:
+        batch = []
+        texture_count = 0
+        last_emit_time = time.monotonic()
+
+        textures = self.scanner.iter_textures()
+
+        # Headers are read in the background while the folder is still being listed.
+        executor = None
+
+        if self.header_reader is not None:
+            executor = ThreadPoolExecutor(
+                max_workers=self.header_reader.workers,
+                thread_name_prefix="TextureHeaderReader",
+            )
+
+        try:
+            for texture in textures:
+                if self.is_cancelled():
+                    break
+
+                batch.append(texture)
+                texture_count += 1
+
+                if executor is not None:
+                    future = executor.submit(self.header_reader.read, texture[0])
+                    self.header_futures[future] = texture[0]
+
+                current_time = time.monotonic()
+                elapsed_time = current_time - last_emit_time
+
+                if (
+                    len(batch) >= MaterialScanWorker.BATCH_SIZE
+                    or elapsed_time >= MaterialScanWorker.BATCH_INTERVAL
+                ):
+                    self._emit_batch(batch, texture_count)
+
+                    batch = []
+                    last_emit_time = current_time
+        except Exception as e:
+            self.error = str(e)
+        finally:
+            textures.close()
+
+        completed = not self.is_cancelled() and not self.error
+
+        if batch and completed:
+            self._emit_batch(batch, texture_count)
+
+        if executor is not None:
+            self._wait_headers()
+            executor.shutdown()
+
+        self.finished.emit(self.scan_id, completed)
+
+    def _emit_batch(self, batch: list, texture_count: int) -> None:
+        self.textures_found.emit(self.scan_id, batch)
+        self.progress_changed.emit(
+            self.scan_id, self.scanner.scanned_directory_count, texture_count
+        )
+
+        self._emit_headers([future for future in self.header_futures if future.done()])
+
+    def _emit_headers(self, futures: list) -> None:
+        headers = {}
+
+        for future in futures:
+            file_path = self.header_futures.pop(future)
+            header = future.result()
+
+            if header is not None:
+                headers[file_path] = header
+
+        if headers:
+            self.headers_read.emit(self.scan_id, headers)
+
+    def _wait_headers(self) -> None:
+        pending = set(self.header_futures)
+
+        while pending and not self.is_cancelled():
+            done, pending = wait(pending, timeout=MaterialScanWorker.BATCH_INTERVAL)
+            self._emit_headers(list(done))
+
+        for future in pending:
+            future.cancel()
+
+        self.header_futures = {}
@@ -0,0 +1,134 @@
+"""
+========================================================================================
+Name: material_search_index.py
+Author: Mauricio Gonzalez Soto
+Updated Date: 10-16-2026
+
+Copyright (C) 2024 Mauricio Gonzalez Soto. All rights reserved.
+========================================================================================
+"""
+
+from __future__ import annotations
+
+from collections import defaultdict
+from typing import TYPE_CHECKING
+from typing import Callable
+from typing import Optional
+import fnmatch
+import re
+
+if TYPE_CHECKING:
+    from texture_connector.gui.material_list_model import MaterialItem
+
+
+class MaterialSearchIndex:
+    GLOB_CHARACTERS = ("*", "?", "[")
+    NGRAM_SIZE = 3
+    REGEX_PREFIX = "re:"
+
+    NO_MATCH_PATTERN = re.compile(r"(?!)")
+
+    def __init__(self) -> None:
+        self._names = {}
+        self._ngrams = defaultdict(set)
+
+        self._text = ""
+        self._matcher = None
+
+    @staticmethod
+    def _get_ngrams(text: str) -> set[str]:
+        size = MaterialSearchIndex.NGRAM_SIZE
+
+        return {text[i : i + size] for i in range(len(text) - size + 1)}
+
+    def _get_matcher(self, text: str) -> Callable[[str], Optional[re.Match]]:
+        if text == self._text and self._matcher is not None:
+            return self._matcher
+
+        if text.startswith(MaterialSearchIndex.REGEX_PREFIX):
+            try:
+                matcher = re.compile(
+                    text[len(MaterialSearchIndex.REGEX_PREFIX) :], re.IGNORECASE
+                ).search
+            except re.error:
+                matcher = MaterialSearchIndex.NO_MATCH_PATTERN.match
+        elif self._is_glob(text):
+            matcher = re.compile(fnmatch.translate(text)).match
+        else:
+            matcher = re.compile(re.escape(text)).search
+
+        self._text = text
+        self._matcher = matcher
+
+        return matcher
+
+    @staticmethod
+    def _is_glob(text: str) -> bool:
+        return any(c in text for c in MaterialSearchIndex.GLOB_CHARACTERS)
+
+    def add(self, material: MaterialItem) -> None:
+        name = material.name.lower()
+        self._names[material] = name
+
+        for ngram in self._get_ngrams(name):
+            self._ngrams[ngram].add(material)
+
+    def clear(self) -> None:
+        self._names = {}
+        self._ngrams = defaultdict(set)
+
+    def matches(self, material: MaterialItem, text: str) -> bool:
+        if not text:
+            return True
+
+        name = self._names.get(material)
+
+        if name is None:
+            name = material.name.lower()
+
+        return self._get_matcher(text)(name) is not None
+
+    def remove(self, material: MaterialItem) -> None:
+        name = self._names.pop(material, None)
+
+        if name is None:
+            return
+
+        for ngram in self._get_ngrams(name):
+            materials = self._ngrams.get(ngram)
+
+            if materials is not None:
+                materials.discard(material)
+
+                if not materials:
+                    del self._ngrams[ngram]
+
+    def search(self, text: str) -> Optional[set[MaterialItem]]:
+        if not text:
+            return None
+
+        matcher = self._get_matcher(text)
+        names = self._names
+
+        # Plain substrings long enough to contain an n-gram only have to be checked
+        # against the materials that share all of them.
+        if (
+            len(text) >= MaterialSearchIndex.NGRAM_SIZE
+            and not text.startswith(MaterialSearchIndex.REGEX_PREFIX)
+            and not self._is_glob(text)
+        ):
+            postings = [self._ngrams.get(ngram) for ngram in self._get_ngrams(text)]
+
+            if not all(postings):
+                return set()
+
+            postings.sort(key=len)
+            candidates = set(postings[0]).intersection(*postings[1:])
+
+            return {material for material in candidates if matcher(names[material])}
+
+        return {material for material, name in names.items() if matcher(name)}
+
+    def update(self, material: MaterialItem) -> None:
+        self.remove(material)
+        self.add(material)
@@ -2,7 +2,7 @@
 ========================================================================================
 Name: material_settings_list_widget.py
 Author: Mauricio Gonzalez Soto
-Updated Date: 04-12-2025
+Updated Date: 10-17-2026
 
 Copyright (C) 2024 Mauricio Gonzalez Soto. All rights reserved.
 ========================================================================================
@@ -13,22 +13,22 @@ from __future__ import annotations
 try:
     from PySide6 import QtWidgets
     from PySide6 import QtCore
-    from PySide6 import QtGui
-    from shiboken6 import delete
 except ImportError:
     from PySide2 import QtWidgets
     from PySide2 import QtCore
-    from PySide2 import QtGui
-    from shiboken2 import delete
 
-import maya.cmds as cmds
-
-from collections import defaultdict
-import pathlib
-import glob
-import re
-
-from texture_connector.gui.material_settings_widget import MaterialSettingsWidget
+import time
+
+from texture_connector.gui.material_list_model import MaterialListModel
+from texture_connector.gui.material_list_model import MaterialItem
+from texture_connector.gui.color_space_delegate import ColorSpaceDelegate
+from texture_connector.gui.material_scan_worker import MaterialScanWorker
+from texture_connector.gui.folder_watcher import FolderWatcher
+from texture_connector.core import MaterialStatusResolver
+from texture_connector.core import TextureHeaderReader
+from texture_connector.core import TextureHeader
+from texture_connector.core import TextureScanner
+from texture_connector.core import ScanCache
 import texture_connector.config as config
 import texture_connector.utils as utils
 
@@ -36,10 +36,9 @@ import texture_connector.utils as utils
 class MaterialSettingsListWidget(QtWidgets.QWidget):
     PREFERENCES_PATH = utils.get_preferences_path()
 
-    IMAGE_EXTENSIONS = tuple(
-        [image_extension.value for image_extension in config.ImageExtensions]
-    )
+    SEARCH_DEBOUNCE_INTERVAL = 150
 
+    scan_finished = QtCore.Signal()
     update_clicked = QtCore.Signal()
 
     def __init__(self) -> None:
@@ -47,10 +46,33 @@ class MaterialSettingsListWidget(QtWidgets.QWidget):
 
         self.search_files_in_subdirectories = True
         self.use_maya_color_space_rules = False
+        self.use_scan_cache = True
+        self.watch_folder = False
+        self.read_texture_headers = True
+
+        self.subdirectories_max_depth = 0
+        self.excluded_directories = ()
+        self.scan_workers = 1
 
         self.folder_path = ""
         self.texture_maps_suffix = ()
         self.render_engine = ""
+        self.uv_tiling_mode = config.UVTilingModes.OFF
+
+        self.scan_cache = ScanCache(utils.get_scan_cache_path())
+        self.texture_header_reader = TextureHeaderReader()
+        self.scan_id = 0
+        self.scan_start_time = 0.0
+        self.scan_thread = None
+        self.scan_worker = None
+
+        self.folder_watcher = FolderWatcher(self)
+
+        self.material_status_resolver = MaterialStatusResolver()
+        self.material_status_resolver.set_changed_callback(
+            self._material_status_resolver_changed
+        )
+        self.changed_material_names = set()
 
         self._create_widgets()
         self._create_layouts()
@@ -59,6 +81,17 @@ class MaterialSettingsListWidget(QtWidgets.QWidget):
     def _create_widgets(self) -> None:
         self.search_material_line_edit = QtWidgets.QLineEdit()
         self.search_material_line_edit.setPlaceholderText("Search...")
+        self.search_material_line_edit.setToolTip(
+            "Filters materials by name. Supports * and ? wildcards, or a regular "
+            "expression when prefixed with re:"
+        )
+
+        # The list is filtered once typing pauses instead of on every keystroke.
+        self.search_material_timer = QtCore.QTimer(self)
+        self.search_material_timer.setSingleShot(True)
+        self.search_material_timer.setInterval(
+            MaterialSettingsListWidget.SEARCH_DEBOUNCE_INTERVAL
+        )
 
         self.unselect_all_materials_push_button = QtWidgets.QPushButton("Unselect All")
 
@@ -66,30 +99,78 @@ class MaterialSettingsListWidget(QtWidgets.QWidget):
 
         self.update_materials_push_button = QtWidgets.QPushButton("Update Materials")
 
+        self.material_list_model = MaterialListModel(self)
+
+        self.color_space_delegate = ColorSpaceDelegate(self)
+
+        self.material_table_view = QtWidgets.QTableView()
+        self.material_table_view.setModel(self.material_list_model)
+        self.material_table_view.setItemDelegateForColumn(
+            MaterialListModel.COLOR_SPACE_COLUMN, self.color_space_delegate
+        )
+        self.material_table_view.setShowGrid(False)
+        self.material_table_view.setWordWrap(False)
+        self.material_table_view.setAlternatingRowColors(True)
+        self.material_table_view.setSelectionMode(
+            QtWidgets.QAbstractItemView.NoSelection
+        )
+        self.material_table_view.setEditTriggers(
+            QtWidgets.QAbstractItemView.DoubleClicked
+            | QtWidgets.QAbstractItemView.EditKeyPressed
+        )
+        self.material_table_view.setHorizontalScrollBarPolicy(
+            QtCore.Qt.ScrollBarAlwaysOff
+        )
+
+        vertical_header = self.material_table_view.verticalHeader()
+        vertical_header.setVisible(False)
+        vertical_header.setSectionResizeMode(QtWidgets.QHeaderView.Fixed)
+        vertical_header.setDefaultSectionSize(
+            self.search_material_line_edit.sizeHint().height()
+        )
+
+        header = self.material_table_view.horizontalHeader()
+        header.setSectionResizeMode(
+            MaterialListModel.PATH_COLUMN, QtWidgets.QHeaderView.Stretch
+        )
+        header.resizeSection(MaterialListModel.NAME_COLUMN, 200)
+        header.resizeSection(MaterialListModel.COLOR_SPACE_COLUMN, 150)
+
+        self.scan_progress_widget = QtWidgets.QWidget()
+        self.scan_progress_widget.setVisible(False)
+
+        self.scan_progress_bar = QtWidgets.QProgressBar()
+        self.scan_progress_bar.setRange(0, 0)
+        self.scan_progress_bar.setTextVisible(False)
+        self.scan_progress_bar.setFixedHeight(
+            self.search_material_line_edit.sizeHint().height()
+        )
+
+        self.scan_progress_label = QtWidgets.QLabel()
+
+        self.cancel_scan_push_button = QtWidgets.QPushButton("Cancel")
+
+        # Scene callbacks fire once per node, so status changes are applied together
+        # once control returns to the event loop.
+        self.material_status_timer = QtCore.QTimer(self)
+        self.material_status_timer.setSingleShot(True)
+        self.material_status_timer.setInterval(0)
+
     def _create_layouts(self) -> None:
         main_layout = QtWidgets.QVBoxLayout(self)
         main_layout.addWidget(self.search_material_line_edit)
         main_layout.setContentsMargins(0, 0, 0, 0)
         main_layout.setSpacing(3)
 
-        scroll_area = QtWidgets.QScrollArea()
-        scroll_area.setFocusPolicy(QtCore.Qt.NoFocus)
-        scroll_area.setHorizontalScrollBarPolicy(QtCore.Qt.ScrollBarAlwaysOff)
-        scroll_area.setWidgetResizable(True)
-        main_layout.addWidget(scroll_area)
-
-        self.material_list_items_widget = QtWidgets.QWidget()
-        self.material_list_items_widget.setAutoFillBackground(True)
-        palette = self.material_list_items_widget.palette()
-        palette.setColor(QtGui.QPalette.Window, QtGui.QColor(40, 40, 40))
-        self.material_list_items_widget.setPalette(palette)
-        scroll_area.setWidget(self.material_list_items_widget)
-
-        self.material_items_list_v_box_layout = QtWidgets.QVBoxLayout()
-        self.material_items_list_v_box_layout.setAlignment(QtCore.Qt.AlignTop)
-        self.material_items_list_v_box_layout.setContentsMargins(3, 3, 3, 3)
-        self.material_items_list_v_box_layout.setSpacing(3)
-        self.material_list_items_widget.setLayout(self.material_items_list_v_box_layout)
+        main_layout.addWidget(self.material_table_view)
+
+        scan_progress_layout = QtWidgets.QHBoxLayout(self.scan_progress_widget)
+        scan_progress_layout.addWidget(self.scan_progress_bar)
+        scan_progress_layout.addWidget(self.scan_progress_label)
+        scan_progress_layout.addWidget(self.cancel_scan_push_button)
+        scan_progress_layout.setContentsMargins(0, 0, 0, 0)
+        scan_progress_layout.setSpacing(3)
+        main_layout.addWidget(self.scan_progress_widget)
 
         layout = QtWidgets.QHBoxLayout()
         layout.addWidget(self.unselect_all_materials_push_button)
@@ -102,6 +183,10 @@ class MaterialSettingsListWidget(QtWidgets.QWidget):
         self.search_material_line_edit.textChanged.connect(
             self._search_material_text_changed_line_edit
         )
+        self.search_material_line_edit.returnPressed.connect(
+            self._search_material_timer_timeout
+        )
+        self.search_material_timer.timeout.connect(self._search_material_timer_timeout)
         self.unselect_all_materials_push_button.clicked.connect(
             self._unselect_all_clicked_action
         )
@@ -111,34 +196,143 @@ class MaterialSettingsListWidget(QtWidgets.QWidget):
         self.update_materials_push_button.clicked.connect(
             self._update_materials_clicked_push_button
         )
+        self.cancel_scan_push_button.clicked.connect(
+            self._cancel_scan_clicked_push_button
+        )
+        self.folder_watcher.folder_changed.connect(self._folder_watcher_folder_changed)
+        self.material_status_timer.timeout.connect(self._material_status_timer_timeout)
 
     def _search_material_text_changed_line_edit(self) -> None:
-        text = self.search_material_line_edit.text()
-        text_lower = text.lower()
+        self.search_material_timer.start()
 
-        for material_settings_widget in self.get_material_settings_widgets():
-            if text_lower in material_settings_widget.get_material_name().lower():
-                material_settings_widget.set_enabled(True)
-                material_settings_widget.setVisible(True)
-            else:
-                material_settings_widget.set_enabled(False)
-                material_settings_widget.setVisible(False)
+    def _search_material_timer_timeout(self) -> None:
+        self.search_material_timer.stop()
+
+        self.material_list_model.set_search_text(self.search_material_line_edit.text())
 
     def _unselect_all_clicked_action(self) -> None:
-        for material_settings_widget in self.get_material_settings_widgets():
-            if material_settings_widget.isVisible():
-                material_settings_widget.set_enabled(False)
+        self.material_list_model.set_materials_enabled(
+            self.get_visible_material_items(), False
+        )
 
     def _select_all_clicked_action(self) -> None:
-        for material_settings_widget in self.get_material_settings_widgets():
-            if material_settings_widget.isVisible():
-                material_settings_widget.set_enabled(True)
+        self.material_list_model.set_materials_enabled(
+            self.get_visible_material_items(), True
+        )
 
     def _update_materials_clicked_push_button(self) -> None:
         self.update_clicked.emit()
 
         utils.Logger.info("Materials updated.")
 
+    def _cancel_scan_clicked_push_button(self) -> None:
+        self.cancel_scan()
+
+        utils.Logger.info("Material scan cancelled.")
+
+    def _folder_watcher_folder_changed(self) -> None:
+        utils.Logger.debug(f"{self.folder_path!r} changed, updating materials.")
+
+        self.create_material_settings_widgets()
+
+    def _material_status_resolver_changed(self, material_name: str) -> None:
+        self.changed_material_names.add(material_name)
+        self.material_status_timer.start()
+
+    def _material_status_timer_timeout(self) -> None:
+        changed_material_names = self.changed_material_names
+        self.changed_material_names = set()
+
+        for material in self.get_material_items():
+            if material.name in changed_material_names:
+                self.material_list_model.set_material_exists(
+                    material, self._material_exists(material.name)
+                )
+
+    def _scan_worker_textures_found(
+        self, scan_id: int, textures: list[tuple[str, str, str]]
+    ) -> None:
+
+        if scan_id != self.scan_id:
+            return
+
+        with utils.PerformanceMonitor.timer(
+            utils.PerformanceMonitor.BUILD_MATERIAL_LIST
+        ):
+            new_materials = self.material_list_model.add_textures(textures)
+
+            for material in new_materials:
+                self.material_list_model.set_material_exists(
+                    material, self._material_exists(material.name)
+                )
+
+    def _scan_worker_headers_read(
+        self, scan_id: int, texture_headers: dict[str, TextureHeader]
+    ) -> None:
+
+        if scan_id != self.scan_id:
+            return
+
+        self.material_list_model.add_texture_headers(texture_headers)
+
+    def _scan_worker_progress_changed(
+        self, scan_id: int, directory_count: int, texture_count: int
+    ) -> None:
+
+        if scan_id != self.scan_id:
+            return
+
+        self.scan_progress_label.setText(
+            f"{self.material_list_model.rowCount()} materials, "
+            f"{texture_count} textures, {directory_count} folders"
+        )
+
+    def _scan_worker_finished(self, scan_id: int, completed: bool) -> None:
+        if scan_id != self.scan_id:
+            return
+
+        if self.scan_worker.error:
+            utils.Logger.error(f"Material scan failed: {self.scan_worker.error}")
+
+        if self.scan_cache.error:
+            utils.Logger.warning(
+                f"Could not save the scan cache: {self.scan_cache.error}"
+            )
+            self.scan_cache.error = ""
+
+        if completed and self.watch_folder:
+            self.folder_watcher.set_directories(
+                self.scan_worker.scanner.scanned_directories
+            )
+
+        utils.PerformanceMonitor.add_time(
+            utils.PerformanceMonitor.SCAN_FOLDER,
+            time.perf_counter() - self.scan_start_time,
+        )
+        utils.PerformanceMonitor.set_counter(
+            utils.PerformanceMonitor.DIRECTORIES_SCANNED,
+            self.scan_worker.scanner.scanned_directory_count,
+        )
+
+        self.scan_worker = None
+        self.scan_thread = None
+        self.scan_progress_widget.setVisible(False)
+
+        removed_count, updated_count = self.material_list_model.end_reconcile(completed)
+
+        utils.PerformanceMonitor.set_counter(
+            utils.PerformanceMonitor.MATERIALS_LISTED,
+            self.material_list_model.rowCount(),
+        )
+
+        utils.Logger.debug(
+            f"Material scan finished with {self.material_list_model.rowCount()} "
+            f"material(s), {removed_count} removed, {updated_count} texture(s) "
+            f"updated, completed={completed}."
+        )
+
+        self.scan_finished.emit()
+
     def _add_directory_and_subdirectories(self, folder_path):
         q_dir = QtCore.QDir(folder_path)
         subfolders = q_dir.entryList(QtCore.QDir.Dirs | QtCore.QDir.NoDotAndDotDot)
@@ -155,144 +349,140 @@ class MaterialSettingsListWidget(QtWidgets.QWidget):
         self.search_files_in_subdirectories = s.value(
             "searchFilesInSubdirectories", True, bool
         )
+        self.subdirectories_max_depth = s.value("subdirectoriesMaxDepth", 0, int)
+        self.excluded_directories = tuple(
+            s.value("excludedDirectories", ".mayaSwatches", str).split(",")
+        )
+        self.scan_workers = s.value("scanWorkers", 1, int)
+        self.use_scan_cache = s.value("useScanCache", True, bool)
+        self.watch_folder = s.value("watchFolder", False, bool)
+        self.read_texture_headers = s.value("readTextureHeaders", True, bool)
         s.endGroup()
 
         s.beginGroup("colorManagement")
         self.use_maya_color_space_rules = s.value("useMayaColorSpaceRules", False, bool)
         s.endGroup()
 
+    def _create_scanner(self) -> TextureScanner:
+        scanner = TextureScanner()
+        scanner.set_folder_path(self.folder_path)
+        scanner.set_texture_maps_suffix(self.texture_maps_suffix)
+        scanner.set_search_files_in_subdirectories(self.search_files_in_subdirectories)
+        scanner.set_max_depth(self.subdirectories_max_depth)
+        scanner.set_exclude_patterns(self.excluded_directories)
+        scanner.set_workers(self.scan_workers)
+        scanner.set_uv_tiling_mode(self.uv_tiling_mode)
+        scanner.set_scan_cache(self.scan_cache if self.use_scan_cache else None)
+
+        return scanner
+
     def _get_material_texture_paths(
         self,
     ) -> dict[str, list[tuple[str, str]]]:
 
-        materials = defaultdict(list)
-
-        if self.search_files_in_subdirectories:
-            files = glob.glob(f"{self.folder_path}/**/*", recursive=True)
-        else:
-            files = glob.glob(f"{self.folder_path}/*")
+        return self._create_scanner().get_material_texture_paths()
 
-        files.sort()
+    def _start_scan(self) -> None:
+        self.scan_id += 1
+        self.scan_start_time = time.perf_counter()
 
-        for file_path in files:
-            path = pathlib.Path(file_path)
-            path_suffix = path.suffix
+        self.scan_thread = QtCore.QThread(self)
+        self.scan_worker = MaterialScanWorker(self.scan_id, self._create_scanner())
+        self.scan_worker.set_header_reader(
+            self.texture_header_reader if self.read_texture_headers else None
+        )
+        self.scan_worker.moveToThread(self.scan_thread)
 
-            if path_suffix in MaterialSettingsListWidget.IMAGE_EXTENSIONS:
-                for texture_map_name, texture_map_suffix in self.texture_maps_suffix:
-                    if texture_map_suffix:
-                        material_name = self._get_material_name_from_texture_map_path(
-                            path=path, texture_map_suffix=texture_map_suffix
-                        )
+        self.material_list_model.set_tile_counts(self.scan_worker.scanner.tile_counts)
 
-                        if material_name:
-                            materials[material_name].append(
-                                (texture_map_name, file_path)
-                            )
+        self.scan_thread.started.connect(self.scan_worker.run)
+        self.scan_worker.textures_found.connect(self._scan_worker_textures_found)
+        self.scan_worker.headers_read.connect(self._scan_worker_headers_read)
+        self.scan_worker.progress_changed.connect(self._scan_worker_progress_changed)
+        self.scan_worker.finished.connect(self._scan_worker_finished)
+        self.scan_worker.finished.connect(self.scan_thread.quit)
+        self.scan_thread.finished.connect(self.scan_worker.deleteLater)
+        self.scan_thread.finished.connect(self.scan_thread.deleteLater)
 
-        return dict(materials)
+        self.scan_progress_label.setText("Scanning...")
+        self.scan_progress_widget.setVisible(True)
 
-    @staticmethod
-    def _get_material_name_from_texture_map_path(
-        path: pathlib.Path, texture_map_suffix: str
-    ) -> str:
-        material_name = ""
+        self.scan_thread.start()
 
-        pattern = rf"(.+?)(?=_{texture_map_suffix})(?=_.*$|$)"
-        match = re.search(pattern, path.stem, re.IGNORECASE)
+    def cancel_scan(self) -> None:
+        self.scan_id += 1
 
-        if match:
-            material_name = match.group(1)
+        if self.scan_worker is not None:
+            self.scan_worker.cancel()
+            self.scan_thread.quit()
+            self.scan_thread.wait()
 
-        return material_name
+            self.scan_worker = None
+            self.scan_thread = None
 
-    def clear_material_settings_widgets(self) -> None:
-        for material_settings_widget in self.get_material_settings_widgets():
-            delete(material_settings_widget)
+        self.material_list_model.end_reconcile(completed=False)
 
-    def create_material_settings_widgets(self) -> None:
-        self._load_preferences()
-        self.clear_material_settings_widgets()
+        self.scan_progress_widget.setVisible(False)
 
-        material_texture_paths = self._get_material_texture_paths()
+    def is_scanning(self) -> bool:
+        return self.scan_worker is not None
 
-        for material_name, textures_paths in material_texture_paths.items():
-            material_widget = MaterialSettingsWidget()
-            material_widget.set_material_name(material_name)
-            material_widget.set_color_spaces_visible(
-                not self.use_maya_color_space_rules
-            )
-            self.material_items_list_v_box_layout.addWidget(material_widget)
+    def create_call_backs(self) -> None:
+        self.material_status_resolver.create_call_backs()
 
-            for texture_type, texture_path in textures_paths:
-                texture_path_short_name = utils.remove_prefix(
-                    prefix=self.folder_path, string=texture_path
-                )
-
-                if texture_type == config.TextureMaps.BASE_COLOR:
-                    base_color_widget = material_widget.get_base_color_settings_widget()
-                    base_color_widget.set_path(texture_path)
-                    base_color_widget.set_text(texture_path_short_name)
+    def delete_call_backs(self) -> None:
+        self.material_status_resolver.delete_call_backs()
 
-                if texture_type == config.TextureMaps.ROUGHNESS:
-                    roughness_widget = material_widget.get_roughness_settings_widget()
-                    roughness_widget.set_path(texture_path)
-                    roughness_widget.set_text(texture_path_short_name)
+    def clear_scan_cache(self) -> None:
+        # A running scan reads and writes the cache from its worker thread.
+        self.cancel_scan()
+        self.scan_cache.clear()
 
-                if texture_type == config.TextureMaps.METALNESS:
-                    metalness_widget = material_widget.get_metalness_settings_widget()
-                    metalness_widget.set_path(texture_path)
-                    metalness_widget.set_text(texture_path_short_name)
+    def clear_material_settings_widgets(self) -> None:
+        self.cancel_scan()
+        self.folder_watcher.clear()
 
-                if texture_type == config.TextureMaps.NORMAL:
-                    normal_widget = material_widget.get_normal_settings_widget()
-                    normal_widget.set_path(texture_path)
-                    normal_widget.set_text(texture_path_short_name)
+        self.material_list_model.clear()
 
-                if texture_type == config.TextureMaps.HEIGHT:
-                    height_widget = material_widget.get_height_settings_widget()
-                    height_widget.set_path(texture_path)
-                    height_widget.set_text(texture_path_short_name)
+    def create_material_settings_widgets(self) -> None:
+        with utils.PerformanceMonitor.timer(
+            utils.PerformanceMonitor.CREATE_MATERIAL_SETTINGS_WIDGETS
+        ):
+            self._load_preferences()
+
+            # Rescanning the same folder reconciles the listed materials with the scan
+            # instead of rebuilding them, which keeps the user changes made to them.
+            if self.folder_path == self.material_list_model.folder_path:
+                self.cancel_scan()
+            else:
+                self.clear_material_settings_widgets()
 
-                if texture_type == config.TextureMaps.EMISSIVE:
-                    emissive_widget = material_widget.get_emissive_settings_widget()
-                    emissive_widget.set_path(texture_path)
-                    emissive_widget.set_text(texture_path_short_name)
+            if not self.watch_folder:
+                self.folder_watcher.clear()
 
-                if texture_type == config.TextureMaps.OPACITY:
-                    opacity_widget = material_widget.get_opacity_settings_widget()
-                    opacity_widget.set_path(texture_path)
-                    opacity_widget.set_text(texture_path_short_name)
+            self.material_list_model.set_folder_path(self.folder_path)
+            self.set_color_spaces_visible(not self.use_maya_color_space_rules)
 
-        self.update_material_status()
-        self._search_material_text_changed_line_edit()
+            if self.folder_path:
+                self.material_list_model.begin_reconcile()
+                self._start_scan()
 
-    def get_material_settings_widgets(self) -> list[MaterialSettingsWidget]:
-        material_settings_widgets = []
+    def get_material_items(self) -> list[MaterialItem]:
+        return self.material_list_model.get_material_items()
 
-        for child in self.material_list_items_widget.children():
-            if isinstance(child, MaterialSettingsWidget):
-                material_settings_widgets.append(child)
+    def get_visible_material_items(self) -> list[MaterialItem]:
+        if self.search_material_timer.isActive():
+            self._search_material_timer_timeout()
 
-        return material_settings_widgets
+        return self.material_list_model.get_visible_material_items()
 
     def _material_exists(self, material_name: str) -> bool:
-        if self.render_engine == config.render_plugins.RenderPlugins.ARNOLD.value[0]:
-            material_type = "aiStandardSurface"
-        elif self.render_engine == config.render_plugins.RenderPlugins.REDSHIFT.value[0]:
-            material_type = "RedshiftStandardMaterial"
-        elif self.render_engine == config.render_plugins.RenderPlugins.V_RAY.value[0]:
-            material_type = "VRayMtl"
-        else:
-            return False
-
-        material_exits = cmds.objExists(f"{material_name}_{material_type}")
-
-        return material_exits
+        return self.material_status_resolver.exists(material_name)
 
     def set_color_spaces_visible(self, enabled: bool) -> None:
-        for material_widget in self.get_material_settings_widgets():
-            material_widget.set_color_spaces_visible(enabled)
+        self.material_table_view.setColumnHidden(
+            MaterialListModel.COLOR_SPACE_COLUMN, not enabled
+        )
 
     def set_folder_path(self, folder_path: str) -> None:
         self.folder_path = folder_path
@@ -304,79 +494,86 @@ class MaterialSettingsListWidget(QtWidgets.QWidget):
     ) -> None:
         self.texture_maps_suffix = texture_maps_suffix
 
+    def set_uv_tiling_mode(self, uv_tiling_mode: str) -> None:
+        self.uv_tiling_mode = uv_tiling_mode
+
+        self.material_list_model.set_uv_tiling_mode(uv_tiling_mode)
+
     def set_base_color_widgets_color_space(self, color_space: str) -> None:
-        for material_widget in self.get_material_settings_widgets():
-            base_color_widget = material_widget.get_base_color_settings_widget()
-            base_color_widget.set_color_space(color_space)
+        self.material_list_model.set_texture_map_color_space(
+            config.TextureMaps.BASE_COLOR, color_space
+        )
 
     def set_base_color_widgets_enabled(self, enabled: bool) -> None:
-        for material_widget in self.get_material_settings_widgets():
-            base_color_widget = material_widget.get_base_color_settings_widget()
-            base_color_widget.setVisible(enabled)
+        self.material_list_model.set_texture_map_visible(
+            config.TextureMaps.BASE_COLOR, enabled
+        )
 
     def set_roughness_widgets_color_space(self, color_space: str) -> None:
-        for material_widget in self.get_material_settings_widgets():
-            roughness_widget = material_widget.get_roughness_settings_widget()
-            roughness_widget.set_color_space(color_space)
+        self.material_list_model.set_texture_map_color_space(
+            config.TextureMaps.ROUGHNESS, color_space
+        )
 
     def set_roughness_widgets_enabled(self, enabled: bool) -> None:
-        for material_widget in self.get_material_settings_widgets():
-            roughness_widget = material_widget.get_roughness_settings_widget()
-            roughness_widget.setVisible(enabled)
+        self.material_list_model.set_texture_map_visible(
+            config.TextureMaps.ROUGHNESS, enabled
+        )
 
     def set_metalness_widgets_color_space(self, color_space: str) -> None:
-        for material_widget in self.get_material_settings_widgets():
-            metalness_widget = material_widget.get_metalness_settings_widget()
-            metalness_widget.set_color_space(color_space)
+        self.material_list_model.set_texture_map_color_space(
+            config.TextureMaps.METALNESS, color_space
+        )
 
     def set_metalness_widgets_enabled(self, enabled: bool) -> None:
-        for material_widget in self.get_material_settings_widgets():
-            metalness_widget = material_widget.get_metalness_settings_widget()
-            metalness_widget.setVisible(enabled)
+        self.material_list_model.set_texture_map_visible(
+            config.TextureMaps.METALNESS, enabled
+        )
 
     def set_normal_widgets_color_space(self, color_space: str) -> None:
-        for material_widget in self.get_material_settings_widgets():
-            normal_widget = material_widget.get_normal_settings_widget()
-            normal_widget.set_color_space(color_space)
+        self.material_list_model.set_texture_map_color_space(
+            config.TextureMaps.NORMAL, color_space
+        )
 
     def set_normal_widgets_enabled(self, enabled: bool) -> None:
-        for material_widget in self.get_material_settings_widgets():
-            normal_widget = material_widget.get_normal_settings_widget()
-            normal_widget.setVisible(enabled)
+        self.material_list_model.set_texture_map_visible(
+            config.TextureMaps.NORMAL, enabled
+        )
 
     def set_height_widgets_color_space(self, color_space: str) -> None:
-        for material_widget in self.get_material_settings_widgets():
-            height_widget = material_widget.get_height_settings_widget()
-            height_widget.set_color_space(color_space)
+        self.material_list_model.set_texture_map_color_space(
+            config.TextureMaps.HEIGHT, color_space
+        )
 
     def set_height_widgets_enabled(self, enabled: bool) -> None:
-        for material_widget in self.get_material_settings_widgets():
-            height_widget = material_widget.get_height_settings_widget()
-            height_widget.setVisible(enabled)
+        self.material_list_model.set_texture_map_visible(
+            config.TextureMaps.HEIGHT, enabled
+        )
 
     def set_emissive_widgets_color_space(self, color_space: str) -> None:
-        for material_widget in self.get_material_settings_widgets():
-            emissive_widget = material_widget.get_emissive_settings_widget()
-            emissive_widget.set_color_space(color_space)
+        self.material_list_model.set_texture_map_color_space(
+            config.TextureMaps.EMISSIVE, color_space
+        )
 
     def set_emissive_widgets_enabled(self, enabled: bool) -> None:
-        for material_widget in self.get_material_settings_widgets():
-            emissive_widget = material_widget.get_emissive_settings_widget()
-            emissive_widget.setVisible(enabled)
+        self.material_list_model.set_texture_map_visible(
+            config.TextureMaps.EMISSIVE, enabled
+        )
 
     def set_opacity_widgets_color_space(self, color_space: str) -> None:
-        for material_widget in self.get_material_settings_widgets():
-            opacity_widget = material_widget.get_opacity_settings_widget()
-            opacity_widget.set_color_space(color_space)
+        self.material_list_model.set_texture_map_color_space(
+            config.TextureMaps.OPACITY, color_space
+        )
 
     def set_opacity_widgets_enabled(self, enabled: bool) -> None:
-        for material_widget in self.get_material_settings_widgets():
-            opacity_widget = material_widget.get_opacity_settings_widget()
-            opacity_widget.setVisible(enabled)
+        self.material_list_model.set_texture_map_visible(
+            config.TextureMaps.OPACITY, enabled
+        )
 
     def set_render_engine(self, render_engine: str) -> None:
         self.render_engine = render_engine
 
+        self.material_status_resolver.set_render_engine(render_engine)
+
     def set_texture_map_widgets_color_space(
         self, widgets_color_space: tuple[tuple[str, str], ...]
     ) -> None:
@@ -428,10 +625,22 @@ class MaterialSettingsListWidget(QtWidgets.QWidget):
                 self.set_opacity_widgets_enabled(enabled)
 
     def update_color_spaces(self) -> None:
-        for material_widget in self.get_material_settings_widgets():
-            material_widget.update_color_spaces()
+        self.material_table_view.viewport().update()
 
     def update_material_status(self) -> None:
-        for material_widget in self.get_material_settings_widgets():
-            material_exists = self._material_exists(material_widget.get_material_name())
-            material_widget.set_material_exists(material_exists)
+        with utils.PerformanceMonitor.timer(
+            utils.PerformanceMonitor.UPDATE_MATERIAL_STATUS
+        ):
+            # Statuses are resolved from a single query of the scene.
+            self.material_status_resolver.invalidate()
+
+            material_items = self.get_material_items()
+
+            for material in material_items:
+                self.material_list_model.set_material_exists(
+                    material, self._material_exists(material.name)
+                )
+
+        utils.PerformanceMonitor.increment(
+            utils.PerformanceMonitor.MATERIAL_STATUS_CHECKS, len(material_items)
+        )
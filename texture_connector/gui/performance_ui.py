@@ -0,0 +1,175 @@
+"""
+========================================================================================
+Name: performance_ui.py
+Author: Mauricio Gonzalez Soto
+Updated Date: 10-16-2026
+
+Copyright (C) 2024 Mauricio Gonzalez Soto. All rights reserved.
+========================================================================================
+"""
+
+try:
+    from PySide6 import QtWidgets
+    from PySide6 import QtCore
+    from PySide6 import QtGui
+except ImportError:
+    from PySide2 import QtWidgets
+    from PySide2 import QtCore
+    from PySide2 import QtGui
+
+from typing import Optional
+import os
+
+import texture_connector.utils as utils
+
+
+class PerformanceUI(QtWidgets.QDialog):
+    WINDOW_NAME = "textureConnectorPerformance"
+    WINDOW_TITLE = "Performance"
+
+    PHASE_HEADERS = (
+        "Phase",
+        "Calls",
+        "Last (ms)",
+        "Average (ms)",
+        "Max (ms)",
+        "Total (ms)",
+    )
+    COUNTER_HEADERS = ("Counter", "Value")
+
+    def __init__(self, parent: Optional[QtWidgets.QWidget] = None) -> None:
+        super().__init__(parent)
+
+        self.resize(600, 400)
+        self.setObjectName(PerformanceUI.WINDOW_NAME)
+        self.setWindowTitle(PerformanceUI.WINDOW_TITLE)
+
+        self._create_widgets()
+        self._create_layouts()
+        self._create_connections()
+
+    def _create_widgets(self) -> None:
+        self.phases_table_widget = self._create_table_widget(
+            PerformanceUI.PHASE_HEADERS
+        )
+        self.counters_table_widget = self._create_table_widget(
+            PerformanceUI.COUNTER_HEADERS
+        )
+
+        self.since_label = QtWidgets.QLabel()
+
+        self.refresh_push_button = QtWidgets.QPushButton("Refresh")
+        self.reset_push_button = QtWidgets.QPushButton("Reset")
+        self.export_push_button = QtWidgets.QPushButton("Export...")
+        self.close_push_button = QtWidgets.QPushButton("Close")
+
+    def _create_layouts(self) -> None:
+        main_layout = QtWidgets.QVBoxLayout(self)
+        main_layout.setContentsMargins(6, 6, 6, 6)
+        main_layout.setSpacing(3)
+
+        main_layout.addWidget(self.phases_table_widget, 3)
+        main_layout.addWidget(self.counters_table_widget, 2)
+        main_layout.addWidget(self.since_label)
+
+        h_box_layout = QtWidgets.QHBoxLayout()
+        h_box_layout.addWidget(self.refresh_push_button)
+        h_box_layout.addWidget(self.reset_push_button)
+        h_box_layout.addWidget(self.export_push_button)
+        h_box_layout.addWidget(self.close_push_button)
+        main_layout.addLayout(h_box_layout)
+
+    def _create_connections(self) -> None:
+        self.refresh_push_button.clicked.connect(self.refresh)
+        self.reset_push_button.clicked.connect(self._reset_clicked_push_button)
+        self.export_push_button.clicked.connect(self._export_clicked_push_button)
+        self.close_push_button.clicked.connect(self.close)
+
+    @staticmethod
+    def _create_table_widget(headers: tuple[str, ...]) -> QtWidgets.QTableWidget:
+        table_widget = QtWidgets.QTableWidget(0, len(headers))
+        table_widget.setHorizontalHeaderLabels(headers)
+        table_widget.setEditTriggers(QtWidgets.QAbstractItemView.NoEditTriggers)
+        table_widget.setSelectionBehavior(QtWidgets.QAbstractItemView.SelectRows)
+        table_widget.setAlternatingRowColors(True)
+        table_widget.setShowGrid(False)
+        table_widget.setWordWrap(False)
+        table_widget.verticalHeader().setVisible(False)
+
+        header = table_widget.horizontalHeader()
+        header.setSectionResizeMode(0, QtWidgets.QHeaderView.Stretch)
+
+        for column in range(1, len(headers)):
+            header.setSectionResizeMode(column, QtWidgets.QHeaderView.ResizeToContents)
+
+        return table_widget
+
+    @staticmethod
+    def _set_row(
+        table_widget: QtWidgets.QTableWidget, row: int, values: tuple[str, ...]
+    ) -> None:
+
+        for column, value in enumerate(values):
+            item = QtWidgets.QTableWidgetItem(value)
+
+            if column:
+                item.setTextAlignment(QtCore.Qt.AlignRight | QtCore.Qt.AlignVCenter)
+
+            table_widget.setItem(row, column, item)
+
+    def _reset_clicked_push_button(self) -> None:
+        utils.PerformanceMonitor.reset()
+
+        self.refresh()
+
+    def _export_clicked_push_button(self) -> None:
+        file_path, _ = QtWidgets.QFileDialog.getSaveFileName(
+            self,
+            "Export Performance Report",
+            os.path.join(os.path.expanduser("~"), "textureConnectorPerformance.json"),
+            "JSON (*.json)",
+        )
+
+        if not file_path:
+            return
+
+        try:
+            utils.PerformanceMonitor.export(file_path)
+        except OSError as e:
+            utils.Logger.error(f"Could not export the performance report: {e}")
+            return
+
+        utils.Logger.info(f"Performance report exported to {file_path!r}.")
+
+    def showEvent(self, event: QtGui.QShowEvent) -> None:
+        super().showEvent(event)
+
+        self.refresh()
+
+    def refresh(self) -> None:
+        report = utils.PerformanceMonitor.get_report()
+        phases = report["phases"]
+        counters = report["counters"]
+
+        self.phases_table_widget.setRowCount(len(phases))
+
+        for row, (name, phase) in enumerate(phases.items()):
+            self._set_row(
+                self.phases_table_widget,
+                row,
+                (
+                    name,
+                    str(phase["count"]),
+                    f"{phase['last'] * 1000:.2f}",
+                    f"{phase['average'] * 1000:.2f}",
+                    f"{phase['max'] * 1000:.2f}",
+                    f"{phase['total'] * 1000:.2f}",
+                ),
+            )
+
+        self.counters_table_widget.setRowCount(len(counters))
+
+        for row, (name, value) in enumerate(counters.items()):
+            self._set_row(self.counters_table_widget, row, (name, str(value)))
+
+        self.since_label.setText(f"Recorded since {report['since']}.")
@@ -2,7 +2,7 @@
 ========================================================================================
 Name: preferences_ui.py
 Author: Mauricio Gonzalez Soto
-Updated Date: 04-12-2025
+Updated Date: 10-17-2026
 
 Copyright (C) 2024 Mauricio Gonzalez Soto. All rights reserved.
 ========================================================================================
@@ -19,6 +19,7 @@ except ImportError:
     from PySide2 import QtCore
     from PySide2 import QtGui
 
+from texture_connector.config import PlacementScopes
 import texture_connector.utils as utils
 
 
@@ -63,6 +64,36 @@ class PreferencesUI(QtWidgets.QDialog):
             "Search files in subdirectories"
         )
 
+        self.subdirectories_max_depth_spin_box = QtWidgets.QSpinBox()
+        self.subdirectories_max_depth_spin_box.setRange(0, 100)
+        self.subdirectories_max_depth_spin_box.setSpecialValueText("Unlimited")
+
+        self.excluded_directories_line_edit = QtWidgets.QLineEdit()
+        self.excluded_directories_line_edit.setPlaceholderText(".mayaSwatches, _old")
+
+        self.use_scan_cache_check_box = QtWidgets.QCheckBox("Use scan cache")
+
+        self.watch_folder_check_box = QtWidgets.QCheckBox("Watch folder for changes")
+        self.watch_folder_check_box.setToolTip(
+            "Updates the material list when textures are added, removed or renamed "
+            "in the selected folder."
+        )
+
+        self.read_texture_headers_check_box = QtWidgets.QCheckBox(
+            "Read texture headers"
+        )
+        self.read_texture_headers_check_box.setToolTip(
+            "Shows the resolution, bit depth and channels of every texture in its "
+            "tooltip."
+        )
+
+        self.scan_workers_spin_box = QtWidgets.QSpinBox()
+        self.scan_workers_spin_box.setRange(1, 32)
+        self.scan_workers_spin_box.setToolTip(
+            "Number of threads used to scan folders. "
+            "Values above 1 speed up scans on network file servers."
+        )
+
         self.auto_set_project_source_images_folder_check_box = QtWidgets.QCheckBox(
             "Auto-set project sourceimages folder"
         )
@@ -71,6 +102,62 @@ class PreferencesUI(QtWidgets.QDialog):
             "Do not create existing materials"
         )
 
+        self.update_existing_materials_check_box = QtWidgets.QCheckBox(
+            "Update existing materials in place"
+        )
+        self.update_existing_materials_check_box.setToolTip(
+            "Rewires only the texture branches of existing materials that changed "
+            "instead of skipping them."
+        )
+
+        self.use_modifier_builder_check_box = QtWidgets.QCheckBox(
+            "Build networks in a single OpenMaya modifier"
+        )
+        self.use_modifier_builder_check_box.setToolTip(
+            "Records every node, connection and attribute into one modifier and "
+            "creates all materials at once."
+        )
+
+        self.disable_undo_during_creation_check_box = QtWidgets.QCheckBox(
+            "Disable undo while creating materials"
+        )
+        self.disable_undo_during_creation_check_box.setToolTip(
+            "Speeds up very large imports. The created materials cannot be undone."
+        )
+
+        self.convert_textures_check_box = QtWidgets.QCheckBox(
+            "Convert textures for the render engine"
+        )
+        self.convert_textures_check_box.setToolTip(
+            "Converts new or changed textures to mipmapped files (.tx for Arnold, "
+            ".rstexbin for Redshift) and connects the converted files."
+        )
+
+        self.texture_converter_command_line_edit = QtWidgets.QLineEdit()
+        self.texture_converter_command_line_edit.setPlaceholderText(
+            "maketx -u --oiio {input} -o {output}"
+        )
+        self.texture_converter_command_line_edit.setToolTip(
+            "Custom converter command. {input} and {output} are replaced by the "
+            "texture paths. Leave empty to use the render engine converter."
+        )
+
+        self.texture_converter_extension_line_edit = QtWidgets.QLineEdit()
+        self.texture_converter_extension_line_edit.setPlaceholderText(".tx")
+
+        self.placement_scope_combo_box = QtWidgets.QComboBox()
+        self.placement_scope_combo_box.addItems(
+            [
+                PlacementScopes.MATERIAL,
+                PlacementScopes.UDIM_SET,
+                PlacementScopes.SHARED,
+            ]
+        )
+        self.placement_scope_combo_box.setToolTip(
+            "Which file nodes share a place2dTexture node. Sharing creates fewer "
+            "nodes and connections on large imports."
+        )
+
         self.use_maya_color_space_rules_check_box = QtWidgets.QCheckBox(
             "Use Maya color space rules"
         )
@@ -104,6 +191,16 @@ class PreferencesUI(QtWidgets.QDialog):
             self.auto_set_project_source_images_folder_check_box
         )
         general_form_layout.addWidget(self.search_files_in_subdirectories_check_box)
+        general_form_layout.addRow(
+            "Subdirectories max depth: ", self.subdirectories_max_depth_spin_box
+        )
+        general_form_layout.addRow(
+            "Excluded directories: ", self.excluded_directories_line_edit
+        )
+        general_form_layout.addRow("Scan workers: ", self.scan_workers_spin_box)
+        general_form_layout.addWidget(self.use_scan_cache_check_box)
+        general_form_layout.addWidget(self.watch_folder_check_box)
+        general_form_layout.addWidget(self.read_texture_headers_check_box)
         general_form_layout.setContentsMargins(3, 3, 3, 3)
         general_form_layout.setSpacing(3)
         self.general_group_box.setLayout(general_form_layout)
@@ -116,6 +213,23 @@ class PreferencesUI(QtWidgets.QDialog):
         material_creation_form_layout.addWidget(
             self.do_not_create_existing_materials_check_box
         )
+        material_creation_form_layout.addWidget(
+            self.update_existing_materials_check_box
+        )
+        material_creation_form_layout.addWidget(self.use_modifier_builder_check_box)
+        material_creation_form_layout.addWidget(
+            self.disable_undo_during_creation_check_box
+        )
+        material_creation_form_layout.addRow(
+            "Placement: ", self.placement_scope_combo_box
+        )
+        material_creation_form_layout.addWidget(self.convert_textures_check_box)
+        material_creation_form_layout.addRow(
+            "Converter: ", self.texture_converter_command_line_edit
+        )
+        material_creation_form_layout.addRow(
+            "Converted extension: ", self.texture_converter_extension_line_edit
+        )
         material_creation_form_layout.setContentsMargins(3, 3, 3, 3)
         material_creation_form_layout.setSpacing(3)
         self.material_creation_group_box.setLayout(material_creation_form_layout)
@@ -142,11 +256,18 @@ class PreferencesUI(QtWidgets.QDialog):
             self._categories_item_clicked_list_widget
         )
 
+        self.search_files_in_subdirectories_check_box.toggled.connect(
+            self._search_files_in_subdirectories_toggled_check_box
+        )
+        self.convert_textures_check_box.toggled.connect(
+            self._convert_textures_toggled_check_box
+        )
+
         self.save_push_button.clicked.connect(self._save_clicked_push_button)
         self.cancel_push_button.clicked.connect(self.close)
 
     def _categories_item_clicked_list_widget(
-            self, item: QtWidgets.QListWidgetItem
+        self, item: QtWidgets.QListWidgetItem
     ) -> None:
 
         self.general_group_box.setVisible(False)
@@ -162,6 +283,14 @@ class PreferencesUI(QtWidgets.QDialog):
         elif category == PreferencesUI.COLOR_MANAGEMENT:
             self.color_management_group_box.setVisible(True)
 
+    def _search_files_in_subdirectories_toggled_check_box(self, checked: bool) -> None:
+        self.subdirectories_max_depth_spin_box.setEnabled(checked)
+        self.excluded_directories_line_edit.setEnabled(checked)
+
+    def _convert_textures_toggled_check_box(self, checked: bool) -> None:
+        self.texture_converter_command_line_edit.setEnabled(checked)
+        self.texture_converter_extension_line_edit.setEnabled(checked)
+
     def _save_clicked_push_button(self) -> None:
         self._save_preferences()
         self.close()
@@ -175,6 +304,25 @@ class PreferencesUI(QtWidgets.QDialog):
         self.search_files_in_subdirectories_check_box.setChecked(
             bool(s.value("searchFilesInSubdirectories", True, bool))
         )
+        self.subdirectories_max_depth_spin_box.setValue(
+            int(s.value("subdirectoriesMaxDepth", 0, int))
+        )
+        self.excluded_directories_line_edit.setText(
+            str(s.value("excludedDirectories", ".mayaSwatches", str))
+        )
+        self._search_files_in_subdirectories_toggled_check_box(
+            self.search_files_in_subdirectories_check_box.isChecked()
+        )
+        self.scan_workers_spin_box.setValue(int(s.value("scanWorkers", 1, int)))
+        self.use_scan_cache_check_box.setChecked(
+            bool(s.value("useScanCache", True, bool))
+        )
+        self.watch_folder_check_box.setChecked(
+            bool(s.value("watchFolder", False, bool))
+        )
+        self.read_texture_headers_check_box.setChecked(
+            bool(s.value("readTextureHeaders", True, bool))
+        )
         self.auto_set_project_source_images_folder_check_box.setChecked(
             bool(s.value("autoSetProjectSourceImagesFolder", False, bool))
         )
@@ -184,6 +332,30 @@ class PreferencesUI(QtWidgets.QDialog):
         self.do_not_create_existing_materials_check_box.setChecked(
             bool(s.value("doNotCreateExistingMaterials", True, bool))
         )
+        self.update_existing_materials_check_box.setChecked(
+            bool(s.value("updateExistingMaterials", False, bool))
+        )
+        self.use_modifier_builder_check_box.setChecked(
+            bool(s.value("useModifierBuilder", False, bool))
+        )
+        self.disable_undo_during_creation_check_box.setChecked(
+            bool(s.value("disableUndoDuringCreation", False, bool))
+        )
+        self.placement_scope_combo_box.setCurrentText(
+            str(s.value("placementScope", PlacementScopes.MATERIAL, str))
+        )
+        self.convert_textures_check_box.setChecked(
+            bool(s.value("convertTextures", False, bool))
+        )
+        self.texture_converter_command_line_edit.setText(
+            str(s.value("textureConverterCommand", "", str))
+        )
+        self.texture_converter_extension_line_edit.setText(
+            str(s.value("textureConverterExtension", "", str))
+        )
+        self._convert_textures_toggled_check_box(
+            self.convert_textures_check_box.isChecked()
+        )
         s.endGroup()
 
         s.beginGroup("colorManagement")
@@ -200,6 +372,16 @@ class PreferencesUI(QtWidgets.QDialog):
             "searchFilesInSubdirectories",
             self.search_files_in_subdirectories_check_box.isChecked(),
         )
+        s.setValue(
+            "subdirectoriesMaxDepth", self.subdirectories_max_depth_spin_box.value()
+        )
+        s.setValue("excludedDirectories", self.excluded_directories_line_edit.text())
+        s.setValue("scanWorkers", self.scan_workers_spin_box.value())
+        s.setValue("useScanCache", self.use_scan_cache_check_box.isChecked())
+        s.setValue("watchFolder", self.watch_folder_check_box.isChecked())
+        s.setValue(
+            "readTextureHeaders", self.read_texture_headers_check_box.isChecked()
+        )
         s.setValue(
             "autoSetProjectSourceImagesFolder",
             self.auto_set_project_source_images_folder_check_box.isChecked(),
@@ -211,6 +393,27 @@ class PreferencesUI(QtWidgets.QDialog):
             "doNotCreateExistingMaterials",
             self.do_not_create_existing_materials_check_box.isChecked(),
         )
+        s.setValue(
+            "updateExistingMaterials",
+            self.update_existing_materials_check_box.isChecked(),
+        )
+        s.setValue(
+            "useModifierBuilder", self.use_modifier_builder_check_box.isChecked()
+        )
+        s.setValue(
+            "disableUndoDuringCreation",
+            self.disable_undo_during_creation_check_box.isChecked(),
+        )
+        s.setValue("placementScope", self.placement_scope_combo_box.currentText())
+        s.setValue("convertTextures", self.convert_textures_check_box.isChecked())
+        s.setValue(
+            "textureConverterCommand",
+            self.texture_converter_command_line_edit.text().strip(),
+        )
+        s.setValue(
+            "textureConverterExtension",
+            self.texture_converter_extension_line_edit.text().strip(),
+        )
         s.endGroup()
 
         s.beginGroup("colorManagement")
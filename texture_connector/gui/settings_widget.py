@@ -20,7 +20,9 @@ except ImportError:
 import maya.api.OpenMaya as om
 import maya.cmds as cmds
 
-from texture_connector.gui.material_texture_map_settings_widget import MaterialTextureMapSettingsWidget
+from texture_connector.gui.material_texture_map_settings_widget import (
+    MaterialTextureMapSettingsWidget,
+)
 from texture_connector.gui.texture_map_settings_widget import TextureMapSettingsWidget
 from texture_connector.config import RenderPlugins
 from texture_connector.config import UVTilingModes
@@ -32,6 +34,7 @@ class SettingsWidget(QtWidgets.QWidget):
     PREFERENCES_PATH = utils.get_preferences_path()
 
     render_engine_changed = QtCore.Signal(str)
+    uv_tiling_mode_changed = QtCore.Signal(str)
 
     def __init__(self) -> None:
         super().__init__()
@@ -141,6 +144,9 @@ class SettingsWidget(QtWidgets.QWidget):
         self.render_engine_combo_box.currentTextChanged.connect(
             self._render_engine_current_text_changed_combo_box
         )
+        self.uv_tiling_mode_combo_box.currentTextChanged.connect(
+            self._uv_tiling_mode_current_text_changed_combo_box
+        )
 
     def create_call_backs(self) -> None:
         utils.Logger.debug(f"Callbacks before creating {self.call_backs}.")
@@ -174,6 +180,12 @@ class SettingsWidget(QtWidgets.QWidget):
     def _render_engine_current_text_changed_combo_box(self, render_engine: str) -> None:
         self.render_engine_changed.emit(render_engine)
 
+    def _uv_tiling_mode_current_text_changed_combo_box(
+        self, uv_tiling_mode: str
+    ) -> None:
+
+        self.uv_tiling_mode_changed.emit(uv_tiling_mode)
+
     def _set_render_engines(self, *args) -> None:
         plugins_loaded = cmds.pluginInfo(listPlugins=True, query=True)
 
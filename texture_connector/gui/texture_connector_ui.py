@@ -2,7 +2,7 @@
 ========================================================================================
 Name: texture_connector_ui.py
 Author: Mauricio Gonzalez Soto
-Updated Date: 04-12-2025
+Updated Date: 10-17-2026
 
 Copyright (C) 2024 Mauricio Gonzalez Soto. All rights reserved.
 ========================================================================================
@@ -22,18 +22,29 @@ except ImportError:
 from maya.OpenMayaUI import MQtUtil
 from maya import cmds
 
+from functools import partial
+from typing import Optional
 import webbrowser
 import os
 
-from texture_connector.gui.material_settings_list_widget import MaterialSettingsListWidget
-from texture_connector.gui.material_settings_widget import MaterialSettingsWidget
+from texture_connector.gui.material_settings_list_widget import (
+    MaterialSettingsListWidget,
+)
+from texture_connector.gui.material_list_model import MaterialItem
 from texture_connector.gui.settings_widget import SettingsWidget
 from texture_connector.gui.preferences_ui import PreferencesUI
+from texture_connector.gui.performance_ui import PerformanceUI
 from texture_connector.core import CreateMaterialNetworkRedshift
+from texture_connector.core import CreateMaterialNetworkBatch
 from texture_connector.core import CreateMaterialNetworkArnold
 from texture_connector.core import CreateMaterialNetworkVRay
 from texture_connector.core import CreateMaterialNetwork
+from texture_connector.core import ModifierNetworkBuilder
+from texture_connector.core import NetworkBuilder
+from texture_connector.core import TextureConverter
+from texture_connector.config import PlacementScopes
 from texture_connector.config import RenderPlugins
+from texture_connector.config import TextureMaps
 import texture_connector.utils as utils
 
 
@@ -94,9 +105,17 @@ class TextureConnectorUI(QtWidgets.QWidget):
         self.script_jobs = []
 
         self.preferences_ui = PreferencesUI(self)
+        self.performance_ui = PerformanceUI(self)
         self.auto_set_project_source_images_folder = False
         self.use_maya_color_space_rules = False
         self.do_not_create_existing_materials = False
+        self.update_existing_materials = False
+        self.use_modifier_builder = False
+        self.disable_undo_during_creation = False
+        self.placement_scope = PlacementScopes.MATERIAL
+        self.convert_textures = False
+        self.texture_converter_command = ""
+        self.texture_converter_extension = ""
 
         self.setMinimumSize(800, 600)
         self.setObjectName(TextureConnectorUI.WINDOW_NAME)
@@ -114,9 +133,12 @@ class TextureConnectorUI(QtWidgets.QWidget):
         edit_menu.addAction("Save Settings", self._save_settings)
         edit_menu.addAction("Reset Settings", self._reset_settings)
         edit_menu.addSeparator()
+        edit_menu.addAction("Clear Scan Cache", self._clear_scan_cache)
+        edit_menu.addSeparator()
         edit_menu.addAction("Preferences", self._open_preferences)
 
         help_menu = self.menu_bar.addMenu("Help")
+        help_menu.addAction("Performance", self._open_performance)
         help_menu.addAction("Help on Texture Connector", self._open_help)
 
         self.folder_path_line_edit = QtWidgets.QLineEdit()
@@ -156,6 +178,9 @@ class TextureConnectorUI(QtWidgets.QWidget):
         self.material_settings_list_widget.set_render_engine(
             self.settings_widget.get_render_engine()
         )
+        self.material_settings_list_widget.set_uv_tiling_mode(
+            self.settings_widget.get_uv_tiling_mode()
+        )
 
         self.create_materials_push_button = QtWidgets.QPushButton("Create Materials")
 
@@ -207,6 +232,9 @@ class TextureConnectorUI(QtWidgets.QWidget):
         self.settings_widget.render_engine_changed.connect(
             self._render_engine_changed_settings_widget
         )
+        self.settings_widget.uv_tiling_mode_changed.connect(
+            self._uv_tiling_mode_changed_settings_widget
+        )
         self.base_color_settings_widget.color_space_changed.connect(
             self._base_color_settings_color_space_changed_widget
         )
@@ -270,7 +298,7 @@ class TextureConnectorUI(QtWidgets.QWidget):
             self.workspace_control_instance.create(
                 label=self.WINDOW_TITLE,
                 ui_script="from texture_connector import TextureConnectorUI\n"
-                          "TextureConnectorUI.display()",
+                "TextureConnectorUI.display()",
                 widget=self,
             )
 
@@ -283,6 +311,12 @@ class TextureConnectorUI(QtWidgets.QWidget):
     def _reset_settings(self) -> None:
         self.settings_widget.load_settings()
 
+    def _clear_scan_cache(self) -> None:
+        self.material_settings_list_widget.clear_scan_cache()
+
+    def _open_performance(self) -> None:
+        self.performance_ui.show()
+
     def _open_preferences(self) -> None:
         self.preferences_ui.show()
 
@@ -305,6 +339,15 @@ class TextureConnectorUI(QtWidgets.QWidget):
         self.do_not_create_existing_materials = s.value(
             "doNotCreateExistingMaterials", True, bool
         )
+        self.update_existing_materials = s.value("updateExistingMaterials", False, bool)
+        self.use_modifier_builder = s.value("useModifierBuilder", False, bool)
+        self.disable_undo_during_creation = s.value(
+            "disableUndoDuringCreation", False, bool
+        )
+        self.placement_scope = s.value("placementScope", PlacementScopes.MATERIAL, str)
+        self.convert_textures = s.value("convertTextures", False, bool)
+        self.texture_converter_command = s.value("textureConverterCommand", "", str)
+        self.texture_converter_extension = s.value("textureConverterExtension", "", str)
         s.endGroup()
 
         s.beginGroup("colorManagement")
@@ -330,6 +373,8 @@ class TextureConnectorUI(QtWidgets.QWidget):
             cmds.scriptJob(kill=script_job)
 
     def _on_color_mgt_config_file_path_changed(self) -> None:
+        utils.ColorSpaceCatalog.invalidate()
+
         self.settings_widget.update_color_spaces()
         self.material_settings_list_widget.update_color_spaces()
 
@@ -363,6 +408,16 @@ class TextureConnectorUI(QtWidgets.QWidget):
         self.material_settings_list_widget.set_render_engine(render_engine)
         self.material_settings_list_widget.update_material_status()
 
+    def _uv_tiling_mode_changed_settings_widget(self, uv_tiling_mode: str) -> None:
+        self.material_settings_list_widget.set_uv_tiling_mode(uv_tiling_mode)
+
+        # Tiles are collapsed while scanning, so the listed materials need a rescan.
+        if (
+            self.material_settings_list_widget.get_material_items()
+            or self.material_settings_list_widget.is_scanning()
+        ):
+            self._create_material_settings_widgets()
+
     def _base_color_settings_color_space_changed_widget(self) -> None:
         self.material_settings_list_widget.set_base_color_widgets_color_space(
             self.base_color_settings_widget.get_color_space()
@@ -439,43 +494,130 @@ class TextureConnectorUI(QtWidgets.QWidget):
 
     def _create_materials_clicked_push_button(self) -> None:
         render_engine = self.settings_widget.get_render_engine()
-        materials = self.material_settings_list_widget.get_material_settings_widgets()
-        count = 0
+
+        if render_engine == RenderPlugins.ARNOLD.value[0]:
+            material_network_class = CreateMaterialNetworkArnold
+        elif render_engine == RenderPlugins.REDSHIFT.value[0]:
+            material_network_class = CreateMaterialNetworkRedshift
+        elif render_engine == RenderPlugins.V_RAY.value[0]:
+            material_network_class = CreateMaterialNetworkVRay
+        else:
+            utils.Logger.error(
+                "No supported render engine loaded (Arnold, Redshift, V-Ray)."
+            )
+
+            return
+
+        if self.use_modifier_builder:
+            builder = ModifierNetworkBuilder()
+        else:
+            builder = NetworkBuilder()
+
+        material_network_batch = CreateMaterialNetworkBatch(builder)
+        material_network_batch.set_undo_enabled(not self.disable_undo_during_creation)
+        material_network_batch.set_update_existing_materials(
+            self.update_existing_materials
+        )
+
+        materials = self.material_settings_list_widget.get_visible_material_items()
 
         for material in materials:
-            if material.is_enabled() and material.isVisible():
-                if render_engine == RenderPlugins.ARNOLD.value[0]:
-                    material_network = CreateMaterialNetworkArnold()
-                elif render_engine == RenderPlugins.REDSHIFT.value[0]:
-                    material_network = CreateMaterialNetworkRedshift()
-                elif render_engine == RenderPlugins.V_RAY.value[0]:
-                    material_network = CreateMaterialNetworkVRay()
-                else:
-                    utils.Logger.error(
-                        "No supported render engine loaded (Arnold, Redshift, V-Ray)."
-                    )
-
-                    return
-
-                if self.do_not_create_existing_materials:
-                    if material.get_material_exists():
-                        continue
-
-                if material_network:
-                    self._create_material_network(
-                        material_network=material_network,
-                        material_settings_widget=material,
-                    )
-
-                    count += 1
+            if not material.enabled:
+                continue
+
+            if (
+                self.do_not_create_existing_materials
+                and not self.update_existing_materials
+                and material.exists
+            ):
+                continue
+
+            material_network = material_network_class(builder)
+            material_network.set_placement_scope(self.placement_scope)
+            self._set_material_network_settings(
+                material_network=material_network, material_item=material
+            )
+
+            material_network_batch.add_material_network(material.name, material_network)
+
+        progress_dialog = QtWidgets.QProgressDialog(
+            "Creating materials...",
+            "Cancel",
+            0,
+            material_network_batch.get_material_network_count(),
+            self,
+        )
+        progress_dialog.setWindowTitle("Create Materials")
+        progress_dialog.setWindowModality(QtCore.Qt.WindowModal)
+        progress_dialog.setMinimumDuration(500)
+
+        material_network_batch.set_progress_callback(
+            partial(self._material_network_batch_progress, progress_dialog)
+        )
+
+        if self.convert_textures:
+            texture_converter = self._create_texture_converter(render_engine)
+
+            if texture_converter is not None:
+                texture_converter.set_progress_callback(
+                    partial(self._texture_converter_progress, progress_dialog)
+                )
+
+            material_network_batch.set_texture_converter(texture_converter)
+
+        try:
+            count = material_network_batch.create(
+                use_maya_color_space_rules=self.use_maya_color_space_rules,
+                use_triplanar=self.settings_widget.is_use_triplanar_checked(),
+                uv_tiling_mode=self.settings_widget.get_uv_tiling_mode(),
+            )
+        finally:
+            progress_dialog.close()
 
         self.material_settings_list_widget.update_material_status()
 
-        if count:
-            utils.Logger.info(f"{count} material(s) created.")
+        updated_count = material_network_batch.get_updated_count()
+
+        if count or updated_count:
+            elapsed_time = material_network_batch.get_elapsed_time()
+            utils.Logger.info(
+                f"{count} material(s) created and {updated_count} updated in "
+                f"{elapsed_time:.2f}s."
+            )
         else:
             utils.Logger.warning("No material has been created.")
 
+    @staticmethod
+    def _material_network_batch_progress(
+        progress_dialog: QtWidgets.QProgressDialog,
+        value: int,
+        maximum: int,
+        name: str,
+        elapsed_time: float,
+    ) -> bool:
+
+        progress_dialog.setLabelText(f"Creating {name!r} ({value}/{maximum})...")
+        progress_dialog.setMaximum(maximum)
+        progress_dialog.setValue(value)
+
+        return not progress_dialog.wasCanceled()
+
+    @staticmethod
+    def _texture_converter_progress(
+        progress_dialog: QtWidgets.QProgressDialog,
+        value: int,
+        maximum: int,
+        file_path: str,
+    ) -> bool:
+
+        progress_dialog.setLabelText(
+            f"Converting {os.path.basename(file_path)!r} ({value}/{maximum})..."
+        )
+        progress_dialog.setMaximum(maximum)
+        progress_dialog.setValue(value)
+
+        return not progress_dialog.wasCanceled()
+
     def _preferences_ui_save_clicked(self):
         self._load_preferences()
 
@@ -492,93 +634,103 @@ class TextureConnectorUI(QtWidgets.QWidget):
             not self.use_maya_color_space_rules
         )
 
-    def _create_material_network(
-            self,
-            material_network: CreateMaterialNetwork,
-            material_settings_widget: MaterialSettingsWidget,
+    def _set_material_network_settings(
+        self,
+        material_network: CreateMaterialNetwork,
+        material_item: MaterialItem,
     ) -> None:
 
         if self.base_color_settings_widget.is_enabled():
-            base_color_widget = (
-                material_settings_widget.get_base_color_settings_widget()
-            )
+            base_color_item = material_item.get_texture_map_item(TextureMaps.BASE_COLOR)
 
-            if base_color_widget.is_enabled():
+            if base_color_item.enabled:
                 material_network.set_base_color_settings(
-                    color_space=base_color_widget.get_color_space(),
-                    file_path=base_color_widget.get_path(),
+                    color_space=base_color_item.color_space,
+                    file_path=base_color_item.path,
                     suffix=self.base_color_settings_widget.get_text(),
                 )
 
         if self.roughness_settings_widget.is_enabled():
-            roughness_widget = material_settings_widget.get_roughness_settings_widget()
+            roughness_item = material_item.get_texture_map_item(TextureMaps.ROUGHNESS)
 
-            if roughness_widget.is_enabled():
+            if roughness_item.enabled:
                 material_network.set_roughness_settings(
-                    color_space=roughness_widget.get_color_space(),
-                    file_path=roughness_widget.get_path(),
+                    color_space=roughness_item.color_space,
+                    file_path=roughness_item.path,
                     suffix=self.roughness_settings_widget.get_text(),
                 )
 
         if self.metalness_settings_widget.is_enabled():
-            metalness_widget = material_settings_widget.get_metalness_settings_widget()
+            metalness_item = material_item.get_texture_map_item(TextureMaps.METALNESS)
 
-            if metalness_widget.is_enabled():
+            if metalness_item.enabled:
                 material_network.set_metalness_settings(
-                    color_space=metalness_widget.get_color_space(),
-                    file_path=metalness_widget.get_path(),
+                    color_space=metalness_item.color_space,
+                    file_path=metalness_item.path,
                     suffix=self.metalness_settings_widget.get_text(),
                 )
 
         if self.normal_settings_widget.is_enabled():
-            normal_widget = material_settings_widget.get_normal_settings_widget()
+            normal_item = material_item.get_texture_map_item(TextureMaps.NORMAL)
 
-            if normal_widget.is_enabled():
+            if normal_item.enabled:
                 material_network.set_normal_settings(
-                    color_space=normal_widget.get_color_space(),
-                    file_path=normal_widget.get_path(),
+                    color_space=normal_item.color_space,
+                    file_path=normal_item.path,
                     suffix=self.normal_settings_widget.get_text(),
                 )
 
         if self.height_settings_widget.is_enabled():
-            height_widget = material_settings_widget.get_height_settings_widget()
+            height_item = material_item.get_texture_map_item(TextureMaps.HEIGHT)
 
-            if height_widget.is_enabled():
+            if height_item.enabled:
                 material_network.set_height_settings(
-                    color_space=height_widget.get_color_space(),
-                    file_path=height_widget.get_path(),
+                    color_space=height_item.color_space,
+                    file_path=height_item.path,
                     suffix=self.height_settings_widget.get_text(),
                 )
 
         if self.emissive_settings_widget.is_enabled():
-            emissive_widget = material_settings_widget.get_emissive_settings_widget()
+            emissive_item = material_item.get_texture_map_item(TextureMaps.EMISSIVE)
 
-            if emissive_widget.is_enabled():
+            if emissive_item.enabled:
                 material_network.set_emissive_settings(
-                    color_space=emissive_widget.get_color_space(),
-                    file_path=emissive_widget.get_path(),
+                    color_space=emissive_item.color_space,
+                    file_path=emissive_item.path,
                     suffix=self.emissive_settings_widget.get_text(),
                 )
 
         if self.opacity_settings_widget.is_enabled():
-            opacity_widget = material_settings_widget.get_opacity_settings_widget()
+            opacity_item = material_item.get_texture_map_item(TextureMaps.OPACITY)
 
-            if opacity_widget.is_enabled():
+            if opacity_item.enabled:
                 material_network.set_opacity_settings(
-                    color_space=opacity_widget.get_color_space(),
-                    file_path=opacity_widget.get_path(),
+                    color_space=opacity_item.color_space,
+                    file_path=opacity_item.path,
                     suffix=self.opacity_settings_widget.get_text(),
                 )
 
-        triplanar = self.settings_widget.is_use_triplanar_checked()
-        uv_tiling_mode = self.settings_widget.get_uv_tiling_mode()
+    def _create_texture_converter(
+        self, render_engine: str
+    ) -> Optional[TextureConverter]:
 
-        material_network.create(
-            name=material_settings_widget.get_material_name(),
-            use_maya_color_space_rules=self.use_maya_color_space_rules,
-            use_triplanar=triplanar,
-            uv_tiling_mode=uv_tiling_mode,
-        )
+        texture_converter = TextureConverter()
+        texture_converter.set_render_engine(render_engine)
+
+        if self.texture_converter_command:
+            texture_converter.set_command(
+                self.texture_converter_command,
+                self.texture_converter_extension or texture_converter.output_extension,
+            )
+
+        if not texture_converter.is_enabled():
+            utils.Logger.warning(
+                f"No texture converter for {render_engine!r}, the original textures "
+                f"are used."
+            )
+            return None
+
+        return texture_converter
 
     def _create_material_settings_widgets(self) -> None:
         self.material_settings_list_widget.set_texture_maps_suffix(
@@ -615,14 +767,21 @@ class TextureConnectorUI(QtWidgets.QWidget):
     def closeEvent(self, event: QtGui.QCloseEvent) -> None:
         super().closeEvent(event)
 
+        self.material_settings_list_widget.cancel_scan()
+
         self._delete_script_jobs()
 
+        # Config changes are no longer tracked once the script jobs are gone.
+        utils.ColorSpaceCatalog.invalidate()
+
         self.settings_widget.delete_call_backs()
+        self.material_settings_list_widget.delete_call_backs()
 
     def showEvent(self, event: QtGui.QShowEvent) -> None:
         super().showEvent(event)
 
         self.settings_widget.create_call_backs()
+        self.material_settings_list_widget.create_call_backs()
 
         self._create_script_jobs()
         self._load_preferences()
@@ -2,14 +2,58 @@
 ========================================================================================
 Name: __init__.py
 Author: Mauricio Gonzalez Soto
-Updated Date: 12-17-2024
+Updated Date: 10-17-2026
 
 Copyright (C) 2024 Mauricio Gonzalez Soto. All rights reserved.
 ========================================================================================
 """
 
-from texture_connector.utils.logger import Logger
+from __future__ import annotations
 
-from texture_connector.utils.utils import get_preferences_path
-from texture_connector.utils.utils import get_settings_path
-from texture_connector.utils.utils import remove_prefix
+from typing import TYPE_CHECKING
+from typing import Any
+import importlib
+
+if TYPE_CHECKING:
+    from texture_connector.utils.logger import Logger
+
+    from texture_connector.utils.color_space_catalog import ColorSpaceCatalog
+
+    from texture_connector.utils.performance import PerformanceMonitor
+
+    from texture_connector.utils.profiler import Profiler
+    from texture_connector.utils.profiler import profile
+
+    from texture_connector.utils.utils import get_preferences_path
+    from texture_connector.utils.utils import get_scan_cache_path
+    from texture_connector.utils.utils import get_settings_path
+    from texture_connector.utils.utils import remove_prefix
+
+# Some of these modules pull in maya.cmds, so they are only imported when first used.
+_LAZY_ATTRIBUTES = {
+    "Logger": "texture_connector.utils.logger",
+    "ColorSpaceCatalog": "texture_connector.utils.color_space_catalog",
+    "PerformanceMonitor": "texture_connector.utils.performance",
+    "Profiler": "texture_connector.utils.profiler",
+    "profile": "texture_connector.utils.profiler",
+    "get_preferences_path": "texture_connector.utils.utils",
+    "get_scan_cache_path": "texture_connector.utils.utils",
+    "get_settings_path": "texture_connector.utils.utils",
+    "remove_prefix": "texture_connector.utils.utils",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_ATTRIBUTES.get(name)
+
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(_LAZY_ATTRIBUTES))
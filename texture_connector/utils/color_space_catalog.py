@@ -0,0 +1,82 @@
+"""
+========================================================================================
+Name: color_space_catalog.py
+Author: Mauricio Gonzalez Soto
+Updated Date: 10-16-2026
+
+Copyright (C) 2024 Mauricio Gonzalez Soto. All rights reserved.
+========================================================================================
+"""
+
+from __future__ import annotations
+
+import maya.cmds as cmds
+
+from texture_connector.utils.performance import PerformanceMonitor
+from texture_connector.utils.logger import Logger
+
+
+class ColorSpaceCatalog:
+    _color_spaces = None
+    _color_space_names = None
+    _color_space_families = None
+
+    @classmethod
+    def _load(cls) -> None:
+        if cls._color_spaces is not None:
+            return
+
+        with PerformanceMonitor.timer(PerformanceMonitor.QUERY_COLOR_SPACES):
+            color_spaces = cmds.colorManagementFileRules(
+                colorSpaceNames=True, query=True
+            )
+            color_spaces = tuple(color_spaces or ())
+
+            color_space_families = {}
+
+            for color_space in color_spaces:
+                color_space_family = cmds.colorManagementFileRules(
+                    colorSpaceFamilies=color_space, query=True
+                )
+
+                if color_space_family:
+                    color_space_families.setdefault(color_space_family[0], []).append(
+                        color_space
+                    )
+
+        PerformanceMonitor.set_counter(
+            PerformanceMonitor.COLOR_SPACES, len(color_spaces)
+        )
+
+        cls._color_spaces = color_spaces
+        cls._color_space_names = frozenset(color_spaces)
+        cls._color_space_families = {
+            family: tuple(family_color_spaces)
+            for family, family_color_spaces in color_space_families.items()
+        }
+
+        Logger.debug(f"Color space catalog loaded with {len(color_spaces)} entries.")
+
+    @classmethod
+    def get_color_spaces(cls) -> tuple[str, ...]:
+        cls._load()
+
+        return cls._color_spaces
+
+    @classmethod
+    def get_color_space_families(cls) -> dict[str, tuple[str, ...]]:
+        cls._load()
+
+        return dict(cls._color_space_families)
+
+    @classmethod
+    def has_color_space(cls, color_space: str) -> bool:
+        cls._load()
+
+        return color_space in cls._color_space_names
+
+    @classmethod
+    def invalidate(cls) -> None:
+        cls._color_spaces = None
+        cls._color_space_names = None
+        cls._color_space_families = None
@@ -2,14 +2,12 @@
 ========================================================================================
 Name: logger.py
 Author: Mauricio Gonzalez Soto
-Updated Date: 12-17-2024
+Updated Date: 10-17-2026
 
 Copyright (C) 2024 Mauricio Gonzalez Soto. All rights reserved.
 ========================================================================================
 """
 
-from maya.api.OpenMaya import MGlobal
-
 import logging
 import sys
 
@@ -48,12 +46,18 @@ class Logger:
 
     @classmethod
     def info(cls, msg: str) -> None:
+        from maya.api.OpenMaya import MGlobal
+
         MGlobal.displayInfo(f"[Texture Connector] {msg}")
 
     @classmethod
     def warning(cls, msg: str) -> None:
+        from maya.api.OpenMaya import MGlobal
+
         MGlobal.displayWarning(f"[Texture Connector] {msg}")
 
     @classmethod
     def error(cls, msg: str) -> None:
+        from maya.api.OpenMaya import MGlobal
+
         MGlobal.displayError(f"[Texture Connector] {msg}")
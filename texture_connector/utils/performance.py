@@ -0,0 +1,157 @@
+"""
+========================================================================================
+Name: performance.py
+Author: Mauricio Gonzalez Soto
+Updated Date: 10-16-2026
+
+Copyright (C) 2024 Mauricio Gonzalez Soto. All rights reserved.
+========================================================================================
+"""
+
+from __future__ import annotations
+
+from typing import Any
+import threading
+import copy
+import datetime
+import json
+import time
+
+
+class PhaseStats:
+    __slots__ = ("count", "total_time", "last_time", "max_time")
+
+    def __init__(self) -> None:
+        self.count = 0
+        self.total_time = 0.0
+        self.last_time = 0.0
+        self.max_time = 0.0
+
+    def add(self, elapsed_time: float) -> None:
+        self.count += 1
+        self.total_time += elapsed_time
+        self.last_time = elapsed_time
+        self.max_time = max(self.max_time, elapsed_time)
+
+    def get_average_time(self) -> float:
+        return self.total_time / self.count if self.count else 0.0
+
+
+class PerformanceTimer:
+    __slots__ = ("name", "start_time")
+
+    def __init__(self, name: str) -> None:
+        self.name = name
+        self.start_time = 0.0
+
+    def __enter__(self) -> PerformanceTimer:
+        self.start_time = time.perf_counter()
+
+        return self
+
+    def __exit__(self, *args) -> None:
+        PerformanceMonitor.add_time(self.name, time.perf_counter() - self.start_time)
+
+
+class PerformanceMonitor:
+    SCAN_FOLDER = "Scan folder"
+    CLASSIFY_TEXTURES = "Classify textures"
+    GET_MATERIAL_TEXTURE_PATHS = "Get material texture paths"
+    BUILD_MATERIAL_LIST = "Build material list"
+    CREATE_MATERIAL_SETTINGS_WIDGETS = "Create material settings widgets"
+    UPDATE_MATERIAL_STATUS = "Update material status"
+    QUERY_COLOR_SPACES = "Query color spaces"
+    CREATE_MATERIAL_NETWORK = "Create material network"
+    UPDATE_MATERIAL_NETWORK = "Update material network"
+
+    TEXTURES_CLASSIFIED = "Textures classified"
+    DIRECTORIES_SCANNED = "Directories scanned"
+    MATERIALS_LISTED = "Materials listed"
+    MATERIAL_STATUS_CHECKS = "Material status checks"
+    COLOR_SPACES = "Color spaces"
+
+    enabled = True
+
+    _phases = {}
+    _counters = {}
+    _lock = threading.Lock()
+    _reset_time = time.time()
+
+    @classmethod
+    def add_time(cls, name: str, elapsed_time: float) -> None:
+        if not cls.enabled:
+            return
+
+        with cls._lock:
+            phase = cls._phases.get(name)
+
+            if phase is None:
+                phase = cls._phases[name] = PhaseStats()
+
+            phase.add(elapsed_time)
+
+    @classmethod
+    def export(cls, file_path: str) -> None:
+        with open(file_path, "w") as f:
+            json.dump(cls.get_report(), f, indent=4)
+
+    @classmethod
+    def get_counters(cls) -> dict[str, int]:
+        with cls._lock:
+            return dict(cls._counters)
+
+    @classmethod
+    def get_phases(cls) -> dict[str, PhaseStats]:
+        with cls._lock:
+            return {name: copy.copy(phase) for name, phase in cls._phases.items()}
+
+    @classmethod
+    def get_report(cls) -> dict[str, Any]:
+        return {
+            "date": datetime.datetime.now().isoformat(timespec="seconds"),
+            "since": datetime.datetime.fromtimestamp(cls._reset_time).isoformat(
+                timespec="seconds"
+            ),
+            "phases": {
+                name: {
+                    "count": phase.count,
+                    "last": phase.last_time,
+                    "total": phase.total_time,
+                    "average": phase.get_average_time(),
+                    "max": phase.max_time,
+                }
+                for name, phase in cls.get_phases().items()
+            },
+            "counters": cls.get_counters(),
+        }
+
+    @classmethod
+    def increment(cls, name: str, value: int = 1) -> None:
+        if not cls.enabled:
+            return
+
+        with cls._lock:
+            cls._counters[name] = cls._counters.get(name, 0) + value
+
+    @classmethod
+    def reset(cls) -> None:
+        with cls._lock:
+            cls._phases = {}
+            cls._counters = {}
+            cls._reset_time = time.time()
+
+    @classmethod
+    def set_counter(cls, name: str, value: int) -> None:
+        if not cls.enabled:
+            return
+
+        with cls._lock:
+            cls._counters[name] = value
+
+    @classmethod
+    def set_enabled(cls, enabled: bool) -> None:
+        cls.enabled = enabled
+
+    @staticmethod
+    def timer(name: str) -> PerformanceTimer:
+        return PerformanceTimer(name)
@@ -0,0 +1,175 @@
+"""
+========================================================================================
+Name: profiler.py
+Author: Mauricio Gonzalez Soto
+Updated Date: 10-16-2026
+
+Copyright (C) 2024 Mauricio Gonzalez Soto. All rights reserved.
+========================================================================================
+"""
+
+from __future__ import annotations
+
+from typing import Callable
+from typing import Any
+from typing import Optional
+import contextlib
+import functools
+import threading
+import json
+import os
+import time
+
+
+class ProfilerEvent:
+    __slots__ = ("name", "start_time", "duration", "thread_id")
+
+    def __init__(
+        self, name: str, start_time: float, duration: float, thread_id: int
+    ) -> None:
+
+        self.name = name
+        self.start_time = start_time
+        self.duration = duration
+        self.thread_id = thread_id
+
+
+class ProfilerScope:
+    __slots__ = ("name", "start_time")
+
+    def __init__(self, name: str) -> None:
+        self.name = name
+        self.start_time = 0.0
+
+    def __enter__(self) -> ProfilerScope:
+        self.start_time = time.perf_counter()
+
+        return self
+
+    def __exit__(self, *args) -> None:
+        Profiler.add_event(
+            self.name, self.start_time, time.perf_counter() - self.start_time
+        )
+
+
+class Profiler:
+    CATEGORY_NAME = "Texture Connector"
+    CATEGORY_DESCRIPTION = "Texture Connector material network creation"
+
+    MAX_EVENTS = 1000000
+
+    recording = False
+
+    _events = []
+    _lock = threading.Lock()
+    _start_time = 0.0
+
+    _maya_loaded = False
+    _maya_category = None
+    _maya_color = 0
+    _maya_scope = None
+
+    _null_scope = contextlib.nullcontext()
+
+    @classmethod
+    def _load_maya_profiler(cls) -> None:
+        cls._maya_loaded = True
+
+        try:
+            import maya.api.OpenMaya as om
+
+            cls._maya_category = om.MProfiler.addCategory(
+                Profiler.CATEGORY_NAME, Profiler.CATEGORY_DESCRIPTION
+            )
+            cls._maya_color = om.MProfiler.kColorC_L1
+            cls._maya_scope = om.MProfilingScope
+        except (ImportError, AttributeError, RuntimeError):
+            cls._maya_category = None
+            cls._maya_scope = None
+
+    @classmethod
+    def add_event(cls, name: str, start_time: float, duration: float) -> None:
+        with cls._lock:
+            if len(cls._events) < Profiler.MAX_EVENTS:
+                cls._events.append(
+                    ProfilerEvent(name, start_time, duration, threading.get_ident())
+                )
+
+    @classmethod
+    def clear(cls) -> None:
+        with cls._lock:
+            cls._events = []
+            cls._start_time = time.perf_counter()
+
+    @classmethod
+    def export_chrome_trace(cls, file_path: str) -> None:
+        with open(file_path, "w") as f:
+            json.dump(cls.get_chrome_trace(), f)
+
+    @classmethod
+    def get_chrome_trace(cls) -> dict[str, Any]:
+        process_id = os.getpid()
+        trace_events = []
+
+        for event in cls.get_events():
+            trace_events.append(
+                {
+                    "name": event.name,
+                    "cat": Profiler.CATEGORY_NAME,
+                    "ph": "X",
+                    "ts": (event.start_time - cls._start_time) * 1000000,
+                    "dur": event.duration * 1000000,
+                    "pid": process_id,
+                    "tid": event.thread_id,
+                }
+            )
+
+        return {"traceEvents": trace_events, "displayTimeUnit": "ms"}
+
+    @classmethod
+    def get_events(cls) -> list[ProfilerEvent]:
+        with cls._lock:
+            return list(cls._events)
+
+    @classmethod
+    def has_maya_profiler(cls) -> bool:
+        if not cls._maya_loaded:
+            cls._load_maya_profiler()
+
+        return cls._maya_scope is not None
+
+    @classmethod
+    def scope(cls, name: str) -> Any:
+        if cls.recording:
+            return ProfilerScope(name)
+
+        if not cls._maya_loaded:
+            cls._load_maya_profiler()
+
+        if cls._maya_scope is not None:
+            return cls._maya_scope(cls._maya_category, cls._maya_color, name)
+
+        return cls._null_scope
+
+    @classmethod
+    def start(cls) -> None:
+        cls.clear()
+        cls.recording = True
+
+    @classmethod
+    def stop(cls) -> None:
+        cls.recording = False
+
+
+def profile(function: Optional[Callable] = None, name: Optional[str] = None) -> Any:
+    if function is None:
+        return functools.partial(profile, name=name)
+
+    event_name = name or function.__qualname__
+
+    @functools.wraps(function)
+    def wrapper(*args, **kwargs):
+        with Profiler.scope(event_name):
+            return function(*args, **kwargs)
+
+    return wrapper
@@ -2,7 +2,7 @@
 ========================================================================================
 Name: __init__.py
 Author: Mauricio Gonzalez Soto
-Updated Date: 12-17-2024
+Updated Date: 10-17-2026
 
 Copyright (C) 2024 Mauricio Gonzalez Soto. All rights reserved.
 ========================================================================================
@@ -23,6 +23,15 @@ def get_preferences_path() -> str:
     return preferences_path
 
 
+def get_scan_cache_path() -> str:
+    user_pref_dir = cmds.internalVar(userPrefDir=True)
+    scan_cache_path = os.path.join(
+        user_pref_dir, "textureConnector", "textureConnectorScanCache.json"
+    )
+
+    return scan_cache_path
+
+
 def get_settings_path() -> str:
     user_pref_dir = cmds.internalVar(userPrefDir=True)
     settings_path = os.path.join(
@@ -37,6 +46,6 @@ def remove_prefix(prefix: str, string: str) -> str:
         if sys.version_info >= (3, 9):
             return string.removeprefix(prefix)
         elif string.startswith(prefix):
-            return string[len(prefix):]
+            return string[len(prefix) :]
 
     return string